@@ -0,0 +1,99 @@
+import argparse
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bson import ObjectId
+
+from orion.api.interactive.request_matching_manager.models.request_matching_models import (
+    MatchAddress,
+    RequestMatchingPreviewPayload,
+)
+from orion.api.interactive.request_matching_manager.request_matching_manager import RequestMatchingManager
+
+
+def _synthetic_guards(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    availability_variants = [
+        {"Monday": [{"start": "06:00", "end": "22:00"}]},
+        {"Monday": [{"start": "09:00", "end": "17:00"}]},
+        {"Monday": [{"start": "8:00 PM", "end": "6:00 AM"}]},
+    ]
+    guards = []
+    for index in range(count):
+        guards.append(SimpleNamespace(
+            id=ObjectId(),
+            ownership_type="platform",
+            profile={
+                "full_name": f"Guard {index:06d}",
+                "home_address": {
+                    "country": "CA",
+                    "province": "ON",
+                    "city": "Toronto",
+                    "latitude": 43.6532 + rng.uniform(-1.5, 1.5),
+                    "longitude": -79.3832 + rng.uniform(-1.5, 1.5),
+                },
+                "operational_region_code": "ON",
+                "operational_city_code": "TORONTO",
+                "max_travel_radius_km": rng.choice([10, 25, 50, 100]),
+                "weekly_availability": availability_variants[index % len(availability_variants)],
+                "preferred_guard_types": ["armed"] if index % 4 else ["unarmed"],
+            },
+        ))
+    return guards
+
+
+def _per_candidate(manager: RequestMatchingManager, guards: list, payload: RequestMatchingPreviewPayload) -> list:
+    results = [
+        manager._candidate_from_guard(str(guard.id), guard.ownership_type, guard.profile, payload)
+        for guard in guards
+    ]
+    results.sort(
+        key=lambda item: (
+            0 if item.eligible else 1,
+            item.distance_km if item.distance_km is not None else 999999,
+            item.candidate_name.lower(),
+        )
+    )
+    return results
+
+
+def _timed(callback) -> tuple:
+    started = time.perf_counter()
+    value = callback()
+    return value, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-candidate and batch guard match scoring")
+    parser.add_argument("--sizes", type=str, default="1000,10000,100000", help="comma separated guard counts")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    manager = object.__new__(RequestMatchingManager)
+    payload = RequestMatchingPreviewPayload(
+        target_type="guard",
+        requested_guard_type="armed",
+        site_address=MatchAddress(country="CA", province="ON", city="Toronto", latitude=43.6532, longitude=-79.3832),
+        requested_start_at=datetime(2026, 4, 27, 10, 0),
+        requested_end_at=datetime(2026, 4, 27, 12, 0),
+        max_results=500,
+    )
+
+    print(f"{'guards':>8} {'per_candidate_s':>16} {'batch_s':>10} {'speedup':>8} {'identical':>10}")
+    for size in [int(value) for value in args.sizes.split(",") if value.strip()]:
+        guards = _synthetic_guards(size, args.seed)
+        baseline, baseline_seconds = _timed(lambda: _per_candidate(manager, guards, payload))
+        batch, batch_seconds = _timed(lambda: manager._score_guard_candidates(guards, payload))
+        identical = [item.model_dump() for item in baseline] == [item.model_dump() for item in batch]
+        speedup = baseline_seconds / batch_seconds if batch_seconds else float("inf")
+        print(f"{size:>8} {baseline_seconds:>16.3f} {batch_seconds:>10.3f} {speedup:>7.2f}x {str(identical):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,16 +19,26 @@ oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/api/token", auto_error=False)
 
 
-async def get_current_role(token: str = Depends(oauth2_scheme)):
-    role = await session_manager.get_instance().get_current_role(token)
+# FastAPI caches dependencies per request, so the role, status and tenant checks below all
+# share the principal resolved once from the token.
+async def get_current_principal(token: str = Depends(oauth2_scheme)):
+    return await session_manager.get_instance().get_current_principal(token)
+
+
+async def get_current_user(principal=Depends(get_current_principal)):
+    return principal["user"]
+
+
+async def get_current_role(current_user=Depends(get_current_user)):
+    role = session_manager.role_of(current_user)
     if role is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User role not found")
 
     return role
 
 
-async def get_current_status(token: str = Depends(oauth2_scheme)):
-    user_status = await session_manager.get_instance().get_current_status(token)
+async def get_current_status(current_user=Depends(get_current_user)):
+    user_status = session_manager.status_of(current_user)
     if user_status is None:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User role not found")
 
@@ -49,11 +59,6 @@ def role_required(required_roles: list[user_role]):
     return verify_role
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
-    session_mgr = session_manager.get_instance()
-    return await session_mgr.get_current_user(token)
-
-
 def status_required(status_required: list[UserStatus], bypass_roles: Optional[list[user_role]] = None):
     async def verify_status(user_status: UserStatus = Depends(get_current_status),
             role: user_role = Depends(get_current_role), ):
@@ -69,7 +74,7 @@ def status_required(status_required: list[UserStatus], bypass_roles: Optional[li
 
 def tenant_status_required(allowed_statuses: list[TenantStatus], bypass_roles: Optional[list[user_role]] = None):
     async def verify_tenant_status(
-        current_user=Depends(get_current_user),
+        principal=Depends(get_current_principal),
         role: user_role = Depends(get_current_role),
     ):
         if bypass_roles and role in bypass_roles:
@@ -81,23 +86,26 @@ def tenant_status_required(allowed_statuses: list[TenantStatus], bypass_roles: O
         if not is_tenant_admin_role(role):
             return True
 
-        tenant_uuid = str(getattr(current_user, "tenant_uuid", "") or "").strip()
+        tenant_uuid = str(getattr(principal["user"], "tenant_uuid", "") or "").strip()
         if not tenant_uuid:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid tenant association")
 
-        try:
-            tenant = await mongo_controller.get_instance().get_engine().find_one(
-                db_tenant_model,
-                db_tenant_model.id == ObjectId(tenant_uuid),
-            )
-        except Exception:
-            tenant = None
+        tenant_status = principal.get("tenant_status")
+        if tenant_status is None:
+            try:
+                tenant = await mongo_controller.get_instance().get_engine().find_one(
+                    db_tenant_model,
+                    db_tenant_model.id == ObjectId(tenant_uuid),
+                )
+            except Exception:
+                tenant = None
 
-        if not tenant:
-            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant not found")
+            if not tenant:
+                raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Tenant not found")
+            tenant_status = tenant.status
 
         allowed_values = {str(getattr(s, "value", s)).strip().lower() for s in (allowed_statuses or [])}
-        tenant_value = str(getattr(tenant.status, "value", tenant.status)).strip().lower()
+        tenant_value = str(getattr(tenant_status, "value", tenant_status)).strip().lower()
         if tenant_value == TenantStatus.PENDING_VERIFICATION.value:
             tenant_value = TenantStatus.PENDING_ACTIVATION.value
 
@@ -0,0 +1,59 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from bson import ObjectId
+from fastapi import HTTPException
+
+
+# Opaque keyset cursors: the sort value and _id of the last row a page returned.
+
+
+def encode_cursor(sort_value: Optional[datetime], doc_id: Any) -> str:
+    payload = {
+        "v": sort_value.isoformat() if isinstance(sort_value, datetime) else None,
+        "id": str(doc_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], ObjectId]:
+    text = str(cursor or "").strip()
+    try:
+        raw = base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+        payload = json.loads(raw.decode("utf-8"))
+        sort_value = datetime.fromisoformat(payload["v"]) if payload.get("v") else None
+        doc_id = ObjectId(str(payload["id"]))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    return sort_value, doc_id
+
+
+# Filter for rows strictly after (sort_value, doc_id) under sort [(field, direction), ("_id", direction)].
+# Mongo orders null/missing values lowest: last when descending, first when ascending.
+def keyset_after(field: str, sort_value: Optional[datetime], doc_id: ObjectId, direction: int) -> Dict[str, Any]:
+    operator = "$lt" if direction < 0 else "$gt"
+    if sort_value is None:
+        same_value = {field: None, "_id": {operator: doc_id}}
+        if direction < 0:
+            return same_value
+        return {"$or": [same_value, {field: {"$ne": None}}]}
+
+    clauses = [
+        {field: {operator: sort_value}},
+        {field: sort_value, "_id": {operator: doc_id}},
+    ]
+    if direction < 0:
+        clauses.append({field: None})
+    return {"$or": clauses}
+
+
+def cursor_pagination(rows: int, cursor: Optional[str], next_cursor: Optional[str]) -> Dict[str, Any]:
+    return {
+        "rows": rows,
+        "cursor": cursor or None,
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    }
@@ -65,7 +65,7 @@ class TokenAuthProvider(AuthProvider):
             user = await session_mgr.get_current_user(token)
             if not user:
                 return False
-            role = await session_mgr.get_current_role(token)
+            role = session_mgr.role_of(user)
             if not is_platform_admin_role(role):
                 return False
             request.state.user = user
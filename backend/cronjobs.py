@@ -1,17 +1,25 @@
 import asyncio
+import signal
 
 from migrations.migration import migration_manager
 from orion.management.managers.service_manager import service_manager
 
 
 async def main():
+    # SIGTERM (container stop, redeploy) unwinds like Ctrl+C so the leases are released below.
+    main_task = asyncio.current_task()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+
     manager = service_manager.get_instance()
     await manager.init_services()
     await manager.init_cronjobs()
-    await migration_manager.get_instance().init_migration()
+    try:
+        await migration_manager.get_instance().init_migration()
 
-    while True:
-        await asyncio.sleep(3600)
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await manager.stop_cronjobs()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from orion.api.interactive.request_manager.request_manager import RequestManager
+from orion.services.mongo_manager.mongo_controller import mongo_controller
+from orion.services.mongo_manager.shared_model.db_request_model import (
+    RequestAssignmentRecord,
+    RequestAssignmentScope,
+    RequestAssignmentStatus,
+)
+
+
+INVOICED_STATUSES = [
+    RequestAssignmentStatus.ACCEPTED.value,
+    RequestAssignmentStatus.RECONFIRMATION_REQUIRED.value,
+    RequestAssignmentStatus.IN_PROGRESS.value,
+    RequestAssignmentStatus.COMPLETED.value,
+]
+
+
+# Run before deploying the payout ledger: the platform finance page now reads the
+# ledger collection only, so every request with payable coverage is rebuilt once here.
+# Re-running it also fills search_tokens on rows written before keyword search used them.
+async def backfill_payout_ledger() -> None:
+    await mongo_controller.get_instance().link_connection()
+    engine = mongo_controller.get_instance().get_engine()
+    assignment_collection = engine.get_collection(RequestAssignmentRecord)
+    request_manager = RequestManager.get_instance()
+
+    request_ids = await assignment_collection.distinct(
+        "request_id",
+        {
+            "assignment_scope": {"$in": [RequestAssignmentScope.REQUEST.value, None]},
+            "assignment_status": {"$in": INVOICED_STATUSES},
+        },
+    )
+    refreshed = 0
+    rows = 0
+    failed = 0
+    for request_id in request_ids:
+        try:
+            rows += await request_manager.refresh_payout_ledger_for_request(str(request_id))
+            refreshed += 1
+        except Exception as ex:
+            failed += 1
+            print(f"Payout ledger refresh failed for request {request_id}: {ex}")
+
+    print("Payout ledger backfill complete")
+    print(f"requests={len(request_ids)} refreshed={refreshed} ledger_rows={rows} failed={failed}")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_payout_ledger())
@@ -0,0 +1,97 @@
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from orion.api.interactive.request_shift_manager.request_shift_manager import RequestShiftManager
+from orion.services.mongo_manager.mongo_controller import mongo_controller
+from orion.services.mongo_manager.shared_model.db_request_model import (
+    ClientRequestRecord,
+    ShiftInstanceRecord,
+    ShiftSlotRecord,
+)
+
+
+BATCH_SIZE = 500
+
+
+# Run before deploying shift lists filtered by visible_tenant_ids: materializes the
+# tenants that can see each shift from its slots, and hides shifts of removed requests.
+async def backfill_shift_visible_tenant_ids() -> None:
+    await mongo_controller.get_instance().link_connection()
+    engine = mongo_controller.get_instance().get_engine()
+    shift_collection = engine.get_collection(ShiftInstanceRecord)
+    slot_collection = engine.get_collection(ShiftSlotRecord)
+    request_collection = engine.get_collection(ClientRequestRecord)
+
+    deleted_at_by_request_id = {
+        str(doc["_id"]): doc["deleted_at"]
+        for doc in await request_collection.find({"deleted_at": {"$ne": None}}, {"_id": 1, "deleted_at": 1}).to_list(length=None)
+    }
+
+    scanned = 0
+    updated = 0
+    last_id = ObjectId("0" * 24)
+
+    while True:
+        shift_docs = await (
+            shift_collection.find(
+                {"_id": {"$gt": last_id}},
+                {"client_tenant_id": 1, "request_id": 1, "visible_tenant_ids": 1, "request_deleted_at": 1},
+            )
+            .sort("_id", 1)
+            .limit(BATCH_SIZE)
+            .to_list(length=BATCH_SIZE)
+        )
+        if not shift_docs:
+            break
+        last_id = shift_docs[-1]["_id"]
+        scanned += len(shift_docs)
+
+        slot_docs = await slot_collection.find(
+            {"shift_instance_id": {"$in": [str(doc["_id"]) for doc in shift_docs]}},
+            {"shift_instance_id": 1, "coverage_tenant_id": 1, "assigned_guard_tenant_id": 1},
+        ).to_list(length=None)
+        slots_by_shift_id = {}
+        for slot_doc in slot_docs:
+            slots_by_shift_id.setdefault(str(slot_doc.get("shift_instance_id")), []).append(slot_doc)
+
+        updates = []
+        for shift_doc in shift_docs:
+            request_deleted_at = deleted_at_by_request_id.get(str(shift_doc.get("request_id") or ""))
+            if request_deleted_at is not None:
+                if shift_doc.get("visible_tenant_ids") or shift_doc.get("request_deleted_at") is None:
+                    updates.append(UpdateOne(
+                        {"_id": shift_doc["_id"]},
+                        {"$set": {"visible_tenant_ids": [], "request_deleted_at": request_deleted_at}},
+                    ))
+                continue
+            visible_tenant_ids = RequestShiftManager._shift_visible_tenant_ids(
+                SimpleNamespace(client_tenant_id=shift_doc.get("client_tenant_id")),
+                [
+                    SimpleNamespace(
+                        coverage_tenant_id=slot_doc.get("coverage_tenant_id"),
+                        assigned_guard_tenant_id=slot_doc.get("assigned_guard_tenant_id"),
+                    )
+                    for slot_doc in slots_by_shift_id.get(str(shift_doc["_id"]), [])
+                ],
+            )
+            if visible_tenant_ids == list(shift_doc.get("visible_tenant_ids") or []):
+                continue
+            updates.append(UpdateOne({"_id": shift_doc["_id"]}, {"$set": {"visible_tenant_ids": visible_tenant_ids}}))
+
+        if updates:
+            await shift_collection.bulk_write(updates, ordered=False)
+            updated += len(updates)
+
+    print("Shift visibility backfill complete")
+    print(f"scanned={scanned} updated={updated}")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_shift_visible_tenant_ids())
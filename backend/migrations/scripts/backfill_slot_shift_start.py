@@ -0,0 +1,82 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from bson import ObjectId
+from pymongo import UpdateMany
+
+from orion.services.mongo_manager.mongo_controller import mongo_controller
+from orion.services.mongo_manager.shared_model.db_request_model import (
+    ClientRequestRecord,
+    ShiftInstanceRecord,
+    ShiftSlotRecord,
+)
+
+
+BATCH_SIZE = 500
+
+
+# Run before deploying the paginated shift exception queue: copies each shift's start
+# time and local date onto its slots so exception slots can be sorted and date-filtered
+# through the slot_exception_queue index, and marks slots of soft-deleted requests with
+# request_deleted_at so the queue can skip them without a request_id exclusion list.
+async def backfill_slot_shift_start() -> None:
+    await mongo_controller.get_instance().link_connection()
+    engine = mongo_controller.get_instance().get_engine()
+    shift_collection = engine.get_collection(ShiftInstanceRecord)
+    slot_collection = engine.get_collection(ShiftSlotRecord)
+    request_collection = engine.get_collection(ClientRequestRecord)
+    deleted_at_by_request_id = {
+        str(doc["_id"]): doc["deleted_at"]
+        for doc in await request_collection.find({"deleted_at": {"$ne": None}}, {"_id": 1, "deleted_at": 1}).to_list(length=None)
+    }
+
+    scanned = 0
+    updated = 0
+    last_id = ObjectId("0" * 24)
+
+    while True:
+        shift_docs = await (
+            shift_collection.find({"_id": {"$gt": last_id}}, {"request_id": 1, "shift_start_at_utc": 1, "shift_date_local": 1})
+            .sort("_id", 1)
+            .limit(BATCH_SIZE)
+            .to_list(length=BATCH_SIZE)
+        )
+        if not shift_docs:
+            break
+        last_id = shift_docs[-1]["_id"]
+        scanned += len(shift_docs)
+
+        updates = []
+        for shift_doc in shift_docs:
+            request_deleted_at = deleted_at_by_request_id.get(str(shift_doc.get("request_id") or ""))
+            updates.append(
+                UpdateMany(
+                    {
+                        "shift_instance_id": str(shift_doc["_id"]),
+                        "$or": [
+                            {"shift_start_at_utc": {"$ne": shift_doc.get("shift_start_at_utc")}},
+                            {"shift_date_local": {"$ne": shift_doc.get("shift_date_local")}},
+                            {"request_deleted_at": {"$ne": request_deleted_at}},
+                        ],
+                    },
+                    {
+                        "$set": {
+                            "shift_start_at_utc": shift_doc.get("shift_start_at_utc"),
+                            "shift_date_local": shift_doc.get("shift_date_local"),
+                            "request_deleted_at": request_deleted_at,
+                        }
+                    },
+                )
+            )
+        result = await slot_collection.bulk_write(updates, ordered=False)
+        updated += int(result.modified_count or 0)
+
+    print("Slot shift start backfill complete")
+    print(f"scanned_shifts={scanned} updated_slots={updated}")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_slot_shift_start())
@@ -0,0 +1,49 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from orion.services.mongo_manager.mongo_controller import mongo_controller
+from orion.services.mongo_manager.shared_model.db_tenant_model import db_tenant_model, TenantType
+from orion.api.interactive.request_matching_manager.request_matching_manager import RequestMatchingManager
+
+
+async def backfill_tenant_match_index() -> None:
+    await mongo_controller.get_instance().link_connection()
+    engine = mongo_controller.get_instance().get_engine()
+    tenant_collection = engine.get_collection(db_tenant_model)
+
+    tenants = await engine.find(
+        db_tenant_model,
+        (db_tenant_model.tenant_type == TenantType.GUARD)
+        | (db_tenant_model.tenant_type == TenantType.SERVICE_PROVIDER),
+    )
+
+    scanned = 0
+    updated = 0
+
+    for tenant in tenants:
+        scanned += 1
+        match_index = RequestMatchingManager.build_match_index(
+            tenant.tenant_type,
+            tenant.ownership_type,
+            tenant.profile,
+        )
+        current_index = {
+            "match_region_codes": list(tenant.match_region_codes or []),
+            "match_geo_point": tenant.match_geo_point,
+            "match_radius_km": tenant.match_radius_km,
+            "match_availability_windows": tenant.match_availability_windows,
+        }
+        if match_index == current_index:
+            continue
+        await tenant_collection.update_one({"_id": tenant.id}, {"$set": match_index})
+        updated += 1
+
+    print("Tenant match index backfill complete")
+    print(f"scanned={scanned} updated={updated}")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_tenant_match_index())
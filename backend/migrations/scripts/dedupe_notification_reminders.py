@@ -0,0 +1,42 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from orion.services.mongo_manager.mongo_controller import mongo_controller
+from orion.services.mongo_manager.shared_model.db_notification_model import NotificationRecord
+
+
+# Run before deploying the unique_notification_reminder_per_recipient index: keeps the
+# oldest reminder notification per recipient and reminder key, preferring a read copy.
+# The index reconciler logs and skips the index while duplicates remain.
+async def dedupe_notification_reminders() -> None:
+    await mongo_controller.get_instance().link_connection()
+    engine = mongo_controller.get_instance().get_engine()
+    notification_collection = engine.get_collection(NotificationRecord)
+
+    duplicate_groups = await notification_collection.aggregate([
+        {"$match": {"metadata.reminder_key": {"$exists": True}}},
+        {"$sort": {"is_read": -1, "created_at": 1, "_id": 1}},
+        {
+            "$group": {
+                "_id": {"recipient_user_id": "$recipient_user_id", "reminder_key": "$metadata.reminder_key"},
+                "notification_ids": {"$push": "$_id"},
+            }
+        },
+        {"$match": {"notification_ids.1": {"$exists": True}}},
+    ]).to_list(length=None)
+
+    deleted = 0
+    for group in duplicate_groups:
+        removable_ids = list(group["notification_ids"])[1:]
+        result = await notification_collection.delete_many({"_id": {"$in": removable_ids}})
+        deleted += int(result.deleted_count or 0)
+
+    print("Notification reminder dedupe complete")
+    print(f"groups={len(duplicate_groups)} deleted={deleted}")
+
+
+if __name__ == "__main__":
+    asyncio.run(dedupe_notification_reminders())
@@ -0,0 +1,57 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from orion.services.mongo_manager.mongo_controller import mongo_controller
+from orion.services.mongo_manager.shared_model.db_request_model import ShiftInstanceRecord, ShiftSlotRecord
+
+
+# Run before deploying the unique_shift_per_template_date index: removes duplicate
+# shift instances for the same schedule template and local date that have no slots.
+# The index reconciler logs and skips the index while unresolved duplicates remain.
+async def dedupe_shift_instances_per_template_date() -> None:
+    await mongo_controller.get_instance().link_connection()
+    engine = mongo_controller.get_instance().get_engine()
+    shift_collection = engine.get_collection(ShiftInstanceRecord)
+    slot_collection = engine.get_collection(ShiftSlotRecord)
+
+    duplicate_groups = await shift_collection.aggregate([
+        {"$sort": {"created_at": 1, "_id": 1}},
+        {
+            "$group": {
+                "_id": {"schedule_template_id": "$schedule_template_id", "shift_date_local": "$shift_date_local"},
+                "shift_ids": {"$push": "$_id"},
+            }
+        },
+        {"$match": {"shift_ids.1": {"$exists": True}}},
+    ]).to_list(length=None)
+
+    deleted = 0
+    unresolved = 0
+
+    for group in duplicate_groups:
+        shift_ids = list(group["shift_ids"])
+        slotted_ids = set(await slot_collection.distinct(
+            "shift_instance_id",
+            {"shift_instance_id": {"$in": [str(shift_id) for shift_id in shift_ids]}},
+        ))
+        keep_id = next((shift_id for shift_id in shift_ids if str(shift_id) in slotted_ids), shift_ids[0])
+        removable_ids = [
+            shift_id for shift_id in shift_ids
+            if shift_id != keep_id and str(shift_id) not in slotted_ids
+        ]
+        if removable_ids:
+            result = await shift_collection.delete_many({"_id": {"$in": removable_ids}})
+            deleted += int(result.deleted_count or 0)
+        if len(shift_ids) - len(removable_ids) > 1:
+            unresolved += 1
+            print(f"unresolved duplicate with slots: {group['_id']}")
+
+    print("Shift instance dedupe complete")
+    print(f"groups={len(duplicate_groups)} deleted={deleted} unresolved={unresolved}")
+
+
+if __name__ == "__main__":
+    asyncio.run(dedupe_shift_instances_per_template_date())
@@ -0,0 +1,53 @@
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from bson import ObjectId
+
+from orion.services.mongo_manager.mongo_controller import mongo_controller
+from orion.services.mongo_manager.shared_model.db_request_model import (
+    ClientRequestRecord,
+    RequestAssignmentRecord,
+    RequestAssignmentScope,
+    RequestAssignmentStatus,
+)
+
+
+COMMITTED_STATUSES = [
+    RequestAssignmentStatus.ACCEPTED.value,
+    RequestAssignmentStatus.RECONFIRMATION_REQUIRED.value,
+    RequestAssignmentStatus.IN_PROGRESS.value,
+    RequestAssignmentStatus.COMPLETED.value,
+]
+
+
+# Run when deploying event-driven slot reconciliation: shift lists no longer sync every
+# request on read, so requests with committed coverage are flagged once and the
+# maintenance slot_sync job reconciles them in the background.
+async def mark_request_shift_slots_dirty() -> None:
+    await mongo_controller.get_instance().link_connection()
+    engine = mongo_controller.get_instance().get_engine()
+    assignment_collection = engine.get_collection(RequestAssignmentRecord)
+    request_collection = engine.get_collection(ClientRequestRecord)
+
+    request_ids = await assignment_collection.distinct(
+        "request_id",
+        {
+            "assignment_scope": RequestAssignmentScope.REQUEST.value,
+            "assignment_status": {"$in": COMMITTED_STATUSES},
+        },
+    )
+    object_ids = [ObjectId(request_id) for request_id in request_ids if ObjectId.is_valid(str(request_id))]
+    result = await request_collection.update_many(
+        {"_id": {"$in": object_ids}, "deleted_at": None, "shift_slots_dirty": {"$ne": True}},
+        {"$set": {"shift_slots_dirty": True}},
+    )
+
+    print("Request shift slot dirty flag backfill complete")
+    print(f"requests_with_coverage={len(object_ids)} flagged={result.modified_count}")
+
+
+if __name__ == "__main__":
+    asyncio.run(mark_request_shift_slots_dirty())
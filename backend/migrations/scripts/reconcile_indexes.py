@@ -0,0 +1,31 @@
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from orion.services.mongo_manager.mongo_controller import mongo_controller
+
+
+async def run_index_reconciliation(dry_run: bool) -> None:
+    await mongo_controller.get_instance().link_connection()
+    reports = await mongo_controller.get_instance().reconcile_indexes(dry_run=dry_run)
+
+    for report in reports:
+        print(f"[{report['collection']}]")
+        print(f"  missing={report['missing']}")
+        print(f"  created={report['created']}")
+        print(f"  redundant={report['redundant']}")
+        print(f"  unused={report['unused']}")
+        print(f"  unmanaged={report['unmanaged']}")
+
+    print("Index reconciliation complete")
+    print(f"collections={len(reports)} created={sum(len(report['created']) for report in reports)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Create missing model indexes and report redundant or unused ones.")
+    parser.add_argument("--dry-run", action="store_true", help="Only report missing indexes without creating them.")
+    arguments = parser.parse_args()
+    asyncio.run(run_index_reconciliation(arguments.dry_run))
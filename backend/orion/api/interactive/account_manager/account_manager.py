@@ -19,6 +19,7 @@ from orion.api.interactive.account_manager.models.platform_admin_model import (
     PlatformAdminUpdateRequest,
     PlatformAdminStatusReasonRequest,
 )
+from orion.api.interactive.notification_manager.recipient_directory import RecipientDirectory
 from orion.api.interactive.tenant_manager.models.tenant_param_model import tenant_param_model
 from orion.services.mongo_manager.mongo_controller import mongo_controller
 from orion.services.mongo_manager.shared_model.db_auth_models import (
@@ -211,6 +212,7 @@ class AccountManager:
                 licenses=data.licenses, )
 
             await engine.save(user)
+            await RecipientDirectory.get_instance().invalidate_user(user)
             await KeyManager.get_instance().create_user_dek(user.id)
 
             return {"message": "User created successfully", "username": username, "email": email}
@@ -331,6 +333,8 @@ class AccountManager:
         user.status_changed_by = getattr(current_user, "username", "system")
         user.status_changed_at = datetime.now(timezone.utc)
         await self._engine.save(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
 
         await self._send_platform_admin_invite_mail(
             username=user.username,
@@ -370,6 +374,8 @@ class AccountManager:
             user.licenses = data.licenses
 
         await self._engine.save(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
 
         return {
             "id": str(user.id),
@@ -405,6 +411,8 @@ class AccountManager:
             reason=data.reason,
         )
         await self._engine.save(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
 
         return {"message": "Platform user deleted", "id": str(user.id), "status": UserStatus.DELETED.value}
 
@@ -429,6 +437,8 @@ class AccountManager:
             reason="Restored by admin",
         )
         await self._engine.save(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
 
         return {
             "message": "Platform user restored",
@@ -460,6 +470,8 @@ class AccountManager:
             image_path.unlink()
 
         await self._engine.delete(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
 
         return {"message": "Platform user permanently deleted", "id": user_id}
 
@@ -485,6 +497,8 @@ class AccountManager:
             image_path.unlink()
 
         await self._engine.delete(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
 
         return {"message": "User deleted successfully"}
 
@@ -519,6 +533,8 @@ class AccountManager:
 
         user.licenses = request.licenses
         await self._engine.save(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
 
 
         return {"message": "User updated successfully", "id": str(user.id)}
@@ -540,6 +556,7 @@ class AccountManager:
             user.twofa_enabled = request.twofa_enabled
 
         await self._engine.save(user)
+        await session_manager.invalidate_principal(user)
 
         return {"message": "User updated successfully"}
 
@@ -10,6 +10,7 @@ import pyotp
 from orion.constants import constant
 from orion.services.mail_manager.mail_enums import MailSubject, MailUrlHeading
 from orion.constants.constant import CONSTANTS
+from orion.api.interactive.notification_manager.recipient_directory import RecipientDirectory
 from orion.services.mongo_manager.mongo_controller import mongo_controller
 from orion.services.mongo_manager.shared_model.db_auth_models import (
     db_user_account,
@@ -137,6 +138,8 @@ class auth_manager:
         user.verification_token = None
         user.verification_expiry = None
         await engine.save(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
 
         return {"message": "Email verified successfully. You may continue onboarding."}
 
@@ -238,6 +241,8 @@ class auth_manager:
         user.verification_expiry = None
 
         await engine.save(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
         return {"message": "Account activated successfully."}
 
     @staticmethod
@@ -281,6 +286,8 @@ class auth_manager:
                 setattr(user, field, value)
 
         await engine.save(user)
+        await RecipientDirectory.get_instance().invalidate_user(user)
+        await session_manager.invalidate_principal(user)
 
 
         if old_status != "onboarding" and new_status == "onboarding":
@@ -1,10 +1,16 @@
+import asyncio
 import threading
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 from bson import ObjectId
 from fastapi import HTTPException
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
 
+from orion.api.interactive.notification_manager.notification_stream import NotificationStreamHub, format_sse
+from orion.api.interactive.notification_manager.recipient_directory import RecipientDirectory
+from orion.api.interactive.notification_manager.unread_counter_store import UnreadCounterStore
 from orion.services.mongo_manager.mongo_controller import mongo_controller
 from orion.services.mongo_manager.shared_model.db_notification_model import NotificationRecord
 from orion.services.mongo_manager.shared_model.db_auth_models import (
@@ -21,6 +27,8 @@ class NotificationManager:
     __instance = None
     __lock = threading.Lock()
 
+    _STREAM_REPLAY_LIMIT = 100
+
     @staticmethod
     def get_instance() -> "NotificationManager":
         if NotificationManager.__instance is None:
@@ -50,16 +58,26 @@ class NotificationManager:
     def _normalized_status_value(status_value: Any) -> str:
         return str(getattr(status_value, "value", status_value) or "").strip().lower()
 
+    async def _user_access_docs(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        collection = self._engine.get_collection(db_user_account)
+        return await collection.find(query, {"_id": 1, "role": 1, "status": 1}).to_list(length=None)
+
     async def _active_tenant_user_ids(self, tenant_id: str, *, admin_only: bool = False) -> List[str]:
-        users = await self._engine.find(db_user_account, db_user_account.tenant_uuid == str(tenant_id))
+        return await RecipientDirectory.get_instance().get_or_load(
+            RecipientDirectory.tenant_key(tenant_id, admin_only=admin_only),
+            lambda: self._load_active_tenant_user_ids(tenant_id, admin_only=admin_only),
+        )
+
+    async def _load_active_tenant_user_ids(self, tenant_id: str, *, admin_only: bool) -> List[str]:
+        user_docs = await self._user_access_docs({"tenant_uuid": str(tenant_id)})
         user_ids: List[str] = []
-        for user in users:
-            user_id = getattr(user, "id", None)
+        for user_doc in user_docs:
+            user_id = user_doc.get("_id")
             if user_id is None:
                 continue
 
-            role_value = normalize_role_value(getattr(user, "role", ""))
-            status_value = self._normalized_status_value(getattr(user, "status", ""))
+            role_value = normalize_role_value(user_doc.get("role", ""))
+            status_value = self._normalized_status_value(user_doc.get("status", ""))
             if admin_only and role_value not in TENANT_ADMIN_ROLES:
                 continue
             if status_value != UserStatus.ACTIVE.value:
@@ -72,14 +90,21 @@ class NotificationManager:
         return await self._active_tenant_user_ids(tenant_id, admin_only=True)
 
     async def _active_platform_admin_user_ids(self) -> List[str]:
-        users = await self._engine.find(db_user_account, {})
+        return await RecipientDirectory.get_instance().get_or_load(
+            RecipientDirectory.PLATFORM_ADMINS_KEY,
+            self._load_active_platform_admin_user_ids,
+        )
+
+    async def _load_active_platform_admin_user_ids(self) -> List[str]:
+        # Legacy "super_admin" rows normalize to admin, so they are matched explicitly.
+        user_docs = await self._user_access_docs({"role": {"$in": sorted(PLATFORM_ADMIN_ROLES | {"super_admin"})}})
         user_ids: List[str] = []
-        for user in users:
-            user_id = getattr(user, "id", None)
+        for user_doc in user_docs:
+            user_id = user_doc.get("_id")
             if user_id is None:
                 continue
-            role_value = normalize_role_value(getattr(user, "role", ""))
-            status_value = self._normalized_status_value(getattr(user, "status", ""))
+            role_value = normalize_role_value(user_doc.get("role", ""))
+            status_value = self._normalized_status_value(user_doc.get("status", ""))
             if role_value not in PLATFORM_ADMIN_ROLES:
                 continue
             if status_value != UserStatus.ACTIVE.value:
@@ -138,11 +163,16 @@ class NotificationManager:
         if not recipient_user_id:
             return
 
+        counters = UnreadCounterStore.get_instance()
+        if await counters.is_seeded(recipient_user_id):
+            return
+
         existing = await self._engine.find_one(
             NotificationRecord,
             NotificationRecord.recipient_user_id == recipient_user_id,
         )
         if existing:
+            await counters.mark_seeded(recipient_user_id)
             return
 
         await self.create_for_user(
@@ -156,9 +186,21 @@ class NotificationManager:
             action_label="Open Notifications",
             metadata={"seeded": True},
         )
+        await counters.mark_seeded(recipient_user_id)
 
-    async def create_for_user(
-        self,
+    async def _unread_count(self, recipient_user_id: str) -> int:
+        counters = UnreadCounterStore.get_instance()
+        cached = await counters.get(recipient_user_id)
+        if cached is not None:
+            return cached
+
+        collection = self._engine.get_collection(NotificationRecord)
+        unread_count = await collection.count_documents({"recipient_user_id": recipient_user_id, "is_read": False})
+        await counters.set(recipient_user_id, unread_count)
+        return unread_count
+
+    @staticmethod
+    def _build_record(
         recipient_user_id: str,
         title: str,
         message: str,
@@ -169,7 +211,7 @@ class NotificationManager:
         metadata: Optional[Dict[str, Any]] = None,
         recipient_tenant_id: Optional[str] = None,
     ) -> NotificationRecord:
-        record = NotificationRecord(
+        return NotificationRecord(
             recipient_user_id=str(recipient_user_id),
             recipient_tenant_id=recipient_tenant_id,
             title=(title or "").strip(),
@@ -180,7 +222,34 @@ class NotificationManager:
             action_label=(action_label or "").strip() or None,
             metadata=metadata or {},
         )
-        return await self._engine.save(record)
+
+    async def create_for_user(
+        self,
+        recipient_user_id: str,
+        title: str,
+        message: str,
+        category: str = "info",
+        source_module: Optional[str] = None,
+        action_url: Optional[str] = None,
+        action_label: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        recipient_tenant_id: Optional[str] = None,
+    ) -> NotificationRecord:
+        record = self._build_record(
+            recipient_user_id=recipient_user_id,
+            recipient_tenant_id=recipient_tenant_id,
+            title=title,
+            message=message,
+            category=category,
+            source_module=source_module,
+            action_url=action_url,
+            action_label=action_label,
+            metadata=metadata,
+        )
+        saved = await self._engine.save(record)
+        unread_counts = await UnreadCounterStore.get_instance().increment([saved.recipient_user_id])
+        await self._publish_created([saved], unread_counts)
+        return saved
 
     async def create_for_users(
         self,
@@ -193,15 +262,18 @@ class NotificationManager:
         action_label: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         recipient_tenant_id: Optional[str] = None,
+        reminder_key: Optional[str] = None,
     ) -> int:
-        saved_count = 0
+        if reminder_key:
+            metadata = {**(metadata or {}), "reminder_key": str(reminder_key)}
+        records: List[NotificationRecord] = []
         seen = set()
         for recipient_user_id in recipient_user_ids:
             normalized = str(recipient_user_id or "").strip()
             if not normalized or normalized in seen:
                 continue
             seen.add(normalized)
-            await self.create_for_user(
+            records.append(self._build_record(
                 recipient_user_id=normalized,
                 recipient_tenant_id=recipient_tenant_id,
                 title=title,
@@ -211,9 +283,57 @@ class NotificationManager:
                 action_url=action_url,
                 action_label=action_label,
                 metadata=metadata,
+            ))
+        if not records:
+            return 0
+
+        collection = self._engine.get_collection(NotificationRecord)
+        if reminder_key:
+            records = await self._upsert_reminders(collection, records, str(reminder_key))
+            if not records:
+                return 0
+        else:
+            await collection.insert_many([record.model_dump_doc() for record in records], ordered=False)
+        unread_counts = await UnreadCounterStore.get_instance().increment([record.recipient_user_id for record in records])
+        await self._publish_created(records, unread_counts)
+        return len(records)
+
+    @staticmethod
+    async def _upsert_reminders(collection, records: List[NotificationRecord], reminder_key: str) -> List[NotificationRecord]:
+        # Recipients that already hold this reminder are matched and left untouched; the unique
+        # reminder index turns a concurrent duplicate insert into a per-row error instead.
+        operations = [
+            UpdateOne(
+                {"recipient_user_id": record.recipient_user_id, "metadata.reminder_key": reminder_key},
+                {"$setOnInsert": record.model_dump_doc()},
+                upsert=True,
             )
-            saved_count += 1
-        return saved_count
+            for record in records
+        ]
+        try:
+            result = await collection.bulk_write(operations, ordered=False)
+            upserted = set((result.upserted_ids or {}).keys())
+        except BulkWriteError as ex:
+            upserted = {int(item["index"]) for item in (ex.details or {}).get("upserted", [])}
+        return [record for index, record in enumerate(records) if index in upserted]
+
+    async def _publish_created(self, records: List[NotificationRecord], unread_counts: Dict[str, Optional[int]]) -> None:
+        await NotificationStreamHub.get_instance().publish([
+            {
+                "user_id": record.recipient_user_id,
+                "event": "notification",
+                "id": str(record.id),
+                "data": {"item": self._serialize(record), "unread_count": unread_counts.get(record.recipient_user_id)},
+            }
+            for record in records
+        ])
+
+    async def _publish_unread_count(self, recipient_user_id: str, unread_count: Optional[int]) -> None:
+        if unread_count is None:
+            unread_count = await self._unread_count(recipient_user_id)
+        await NotificationStreamHub.get_instance().publish([
+            {"user_id": recipient_user_id, "event": "unread_count", "data": {"unread_count": unread_count}},
+        ])
 
     async def create_for_tenant_users(
         self,
@@ -226,8 +346,9 @@ class NotificationManager:
         action_label: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> int:
-        users = await self._engine.find(db_user_account, db_user_account.tenant_uuid == str(tenant_id))
-        user_ids = [str(user.id) for user in users if getattr(user, "id", None) is not None]
+        collection = self._engine.get_collection(db_user_account)
+        user_docs = await collection.find({"tenant_uuid": str(tenant_id)}, {"_id": 1}).to_list(length=None)
+        user_ids = [str(user_doc["_id"]) for user_doc in user_docs if user_doc.get("_id") is not None]
         return await self.create_for_users(
             recipient_user_ids=user_ids,
             recipient_tenant_id=str(tenant_id),
@@ -250,6 +371,7 @@ class NotificationManager:
         action_url: Optional[str] = None,
         action_label: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        reminder_key: Optional[str] = None,
     ) -> int:
         user_ids = await self._active_tenant_admin_user_ids(str(tenant_id))
         if not user_ids:
@@ -266,6 +388,7 @@ class NotificationManager:
             action_url=action_url,
             action_label=action_label,
             metadata=metadata,
+            reminder_key=reminder_key,
         )
 
     async def create_for_platform_admin_users(
@@ -299,7 +422,7 @@ class NotificationManager:
         collection = self._engine.get_collection(NotificationRecord)
         docs = await collection.find({"recipient_user_id": recipient_user_id}).sort("created_at", -1).limit(safe_limit).to_list(length=safe_limit)
         items = [self._serialize(doc) for doc in docs]
-        unread_count = await collection.count_documents({"recipient_user_id": recipient_user_id, "is_read": False})
+        unread_count = await self._unread_count(recipient_user_id)
         return {"items": items, "unread_count": unread_count}
 
     async def list_notifications(self, current_user, page: int = 1, rows: int = 20, status: str = "all") -> Dict[str, Any]:
@@ -324,7 +447,7 @@ class NotificationManager:
         docs = await collection.find(query).sort("created_at", -1).skip(skip).limit(safe_rows).to_list(length=safe_rows)
         items = [self._serialize(doc) for doc in docs]
 
-        unread_count = await collection.count_documents({"recipient_user_id": recipient_user_id, "is_read": False})
+        unread_count = await self._unread_count(recipient_user_id)
         return {
             "items": items,
             "pagination": {
@@ -341,11 +464,14 @@ class NotificationManager:
 
     async def get_unread_count(self, current_user) -> Dict[str, Any]:
         await self._ensure_active_tenant_for_current_user(current_user)
-        await self._ensure_default_notification(current_user)
         recipient_user_id = self._user_id(current_user)
-        collection = self._engine.get_collection(NotificationRecord)
-        unread_count = await collection.count_documents({"recipient_user_id": recipient_user_id, "is_read": False})
-        return {"unread_count": unread_count}
+        # A cached counter is only ever written after the welcome notification was seeded.
+        cached = await UnreadCounterStore.get_instance().get(recipient_user_id)
+        if cached is not None:
+            return {"unread_count": cached}
+
+        await self._ensure_default_notification(current_user)
+        return {"unread_count": await self._unread_count(recipient_user_id)}
 
     async def mark_read(self, notification_id: str, current_user) -> Dict[str, Any]:
         await self._ensure_active_tenant_for_current_user(current_user)
@@ -362,7 +488,15 @@ class NotificationManager:
         if not record.is_read:
             record.is_read = True
             record.read_at = datetime.utcnow()
-            await self._engine.save(record)
+            collection = self._engine.get_collection(NotificationRecord)
+            # Conditional on is_read so concurrent mark-reads decrement the counter only once.
+            result = await collection.update_one(
+                {"_id": object_id, "is_read": False},
+                {"$set": {"is_read": True, "read_at": record.read_at}},
+            )
+            if result.modified_count:
+                unread_counts = await UnreadCounterStore.get_instance().increment([recipient_user_id], -1)
+                await self._publish_unread_count(recipient_user_id, unread_counts.get(recipient_user_id))
 
         return {
             "message": "Notification marked as read",
@@ -377,8 +511,69 @@ class NotificationManager:
             {"recipient_user_id": recipient_user_id, "is_read": False},
             {"$set": {"is_read": True, "read_at": datetime.utcnow()}},
         )
+        # Recount rather than zero the cache: notifications can land between the update and this read.
         unread_count = await collection.count_documents({"recipient_user_id": recipient_user_id, "is_read": False})
+        await UnreadCounterStore.get_instance().set(recipient_user_id, unread_count)
+        await self._publish_unread_count(recipient_user_id, unread_count)
         return {
             "message": "All notifications marked as read",
             "unread_count": unread_count,
         }
+
+    async def open_stream(
+        self,
+        current_user,
+        last_event_id: Optional[str] = None,
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+    ) -> AsyncIterator[str]:
+        # Access checks run before the response starts so they still surface as HTTP errors.
+        await self._ensure_active_tenant_for_current_user(current_user)
+        recipient_user_id = self._user_id(current_user)
+        if not recipient_user_id:
+            raise HTTPException(status_code=401, detail="Invalid user")
+        resume_after = None
+        if last_event_id:
+            try:
+                resume_after = ObjectId(last_event_id)
+            except Exception:
+                raise HTTPException(status_code=400, detail="Invalid last event id")
+        return self._stream_events(recipient_user_id, resume_after, is_disconnected)
+
+    async def _stream_events(
+        self,
+        recipient_user_id: str,
+        resume_after: Optional[ObjectId],
+        is_disconnected: Optional[Callable[[], Awaitable[bool]]],
+    ) -> AsyncIterator[str]:
+        hub = NotificationStreamHub.get_instance()
+        # Subscribe before replaying so nothing created in between is lost; replayed ids are skipped live.
+        queue = hub.subscribe(recipient_user_id)
+        try:
+            yield f"retry: {hub.HEARTBEAT_SECONDS * 1000}\n\n"
+            replayed = set()
+            if resume_after is not None:
+                collection = self._engine.get_collection(NotificationRecord)
+                docs = await collection.find(
+                    {"recipient_user_id": recipient_user_id, "_id": {"$gt": resume_after}}
+                ).sort("_id", 1).limit(self._STREAM_REPLAY_LIMIT).to_list(length=self._STREAM_REPLAY_LIMIT)
+                for doc in docs:
+                    item = self._serialize(doc)
+                    replayed.add(item["id"])
+                    yield format_sse("notification", {"item": item, "unread_count": None}, event_id=item["id"])
+            yield format_sse("unread_count", {"unread_count": await self._unread_count(recipient_user_id)})
+
+            while True:
+                if is_disconnected is not None and await is_disconnected():
+                    break
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=hub.HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                if event is None:
+                    break
+                if event.get("id") in replayed:
+                    continue
+                yield format_sse(event["event"], event["data"], event_id=event.get("id"))
+        finally:
+            hub.unsubscribe(recipient_user_id, queue)
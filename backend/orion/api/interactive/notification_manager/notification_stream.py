@@ -0,0 +1,115 @@
+import asyncio
+import json
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from orion.services.log_manager.log_controller import log
+from orion.services.redis_manager.redis_controller import redis_controller
+from orion.services.redis_manager.redis_enums import REDIS_COMMANDS
+
+
+def format_sse(event: str, data: Any, event_id: Optional[str] = None) -> str:
+    lines = []
+    if event_id:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class NotificationStreamHub:
+    __instance = None
+    __lock = threading.Lock()
+
+    # Every worker subscribes once and fans messages out to its own connections, so
+    # open dashboard tabs never hold a Redis connection each.
+    CHANNEL = "notification_stream"
+    HEARTBEAT_SECONDS = 15
+    _QUEUE_SIZE = 100
+    _RETRY_SECONDS = 2
+
+    @staticmethod
+    def get_instance() -> "NotificationStreamHub":
+        if NotificationStreamHub.__instance is None:
+            with NotificationStreamHub.__lock:
+                if NotificationStreamHub.__instance is None:
+                    NotificationStreamHub.__instance = NotificationStreamHub()
+        return NotificationStreamHub.__instance
+
+    def __init__(self):
+        if NotificationStreamHub.__instance is not None:
+            raise Exception("NotificationStreamHub is a singleton")
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._listener_task: Optional[asyncio.Task] = None
+
+    async def publish(self, events: List[Dict[str, Any]]) -> None:
+        if not events:
+            return
+        try:
+            await redis_controller.getInstance().invoke_trigger(
+                REDIS_COMMANDS.S_PUBLISH,
+                [self.CHANNEL, json.dumps(events, default=str)],
+            )
+        except Exception as ex:
+            log.g().w(f"NOTIFICATION STREAM PUBLISH ERROR: {ex}")
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._QUEUE_SIZE)
+        self._subscribers.setdefault(str(user_id), set()).add(queue)
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen(), name="notification_stream_listener")
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(str(user_id))
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            self._subscribers.pop(str(user_id), None)
+
+    async def stop(self) -> None:
+        task, self._listener_task = self._listener_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+
+    def dispatch(self, payload: str) -> None:
+        try:
+            events = json.loads(payload)
+        except (TypeError, ValueError):
+            return
+        for event in events:
+            for queue in list(self._subscribers.get(str(event.get("user_id")), ())):
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    # A stalled client is cut off; it reconnects with Last-Event-ID and catches up from Mongo.
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(None)
+
+    async def _listen(self) -> None:
+        while self._subscribers:
+            pubsub = None
+            try:
+                pubsub = await redis_controller.getInstance().invoke_trigger(REDIS_COMMANDS.S_SUBSCRIBE, [self.CHANNEL])
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.dispatch(message.get("data"))
+                    if not self._subscribers:
+                        break
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                log.g().w(f"NOTIFICATION STREAM LISTENER ERROR: {ex}")
+                await asyncio.sleep(self._RETRY_SECONDS)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
@@ -0,0 +1,101 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Tuple
+
+from orion.services.redis_manager.redis_controller import redis_controller
+from orion.services.redis_manager.redis_enums import REDIS_COMMANDS
+
+
+class RecipientDirectory:
+    __instance = None
+    __lock = threading.Lock()
+
+    PLATFORM_ADMINS_KEY = "recipient_directory:platform_admins"
+    _REDIS_TTL_SECONDS = 300
+    # Other workers only learn about invalidations through Redis, so local entries stay short-lived.
+    _LOCAL_TTL_SECONDS = 30
+    _LOCAL_MAX_ENTRIES = 1024
+
+    @staticmethod
+    def get_instance() -> "RecipientDirectory":
+        if RecipientDirectory.__instance is None:
+            with RecipientDirectory.__lock:
+                if RecipientDirectory.__instance is None:
+                    RecipientDirectory.__instance = RecipientDirectory()
+        return RecipientDirectory.__instance
+
+    def __init__(self):
+        if RecipientDirectory.__instance is not None:
+            raise Exception("RecipientDirectory is a singleton")
+        self._local: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+
+    @staticmethod
+    def tenant_key(tenant_id: str, *, admin_only: bool) -> str:
+        scope = "admins" if admin_only else "active"
+        return f"recipient_directory:tenant:{str(tenant_id)}:{scope}"
+
+    def _local_get(self, key: str):
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        expires_at, user_ids = entry
+        if expires_at <= time.monotonic():
+            self._local.pop(key, None)
+            return None
+        self._local.move_to_end(key)
+        return list(user_ids)
+
+    def _local_set(self, key: str, user_ids: List[str]) -> None:
+        self._local[key] = (time.monotonic() + self._LOCAL_TTL_SECONDS, list(user_ids))
+        self._local.move_to_end(key)
+        while len(self._local) > self._LOCAL_MAX_ENTRIES:
+            self._local.popitem(last=False)
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[List[str]]]) -> List[str]:
+        user_ids = self._local_get(key)
+        if user_ids is not None:
+            return user_ids
+
+        redis = redis_controller.getInstance()
+        try:
+            cached = await redis.invoke_trigger(REDIS_COMMANDS.S_GET_STRING, [key, None, None])
+            user_ids = json.loads(cached) if cached is not None else None
+        except Exception:
+            user_ids = None
+
+        if user_ids is None:
+            user_ids = [str(user_id) for user_id in await loader()]
+            try:
+                await redis.invoke_trigger(REDIS_COMMANDS.S_SET_STRING, [key, json.dumps(user_ids), self._REDIS_TTL_SECONDS])
+            except Exception:
+                pass
+
+        self._local_set(key, user_ids)
+        return list(user_ids)
+
+    async def invalidate(self, *keys: str) -> None:
+        for key in keys:
+            self._local.pop(key, None)
+        try:
+            await redis_controller.getInstance().invoke_trigger(REDIS_COMMANDS.S_DELETE_KEYS, list(keys))
+        except Exception:
+            pass
+
+    async def invalidate_tenant(self, tenant_id: str) -> None:
+        await self.invalidate(
+            self.tenant_key(tenant_id, admin_only=True),
+            self.tenant_key(tenant_id, admin_only=False),
+        )
+
+    async def invalidate_user(self, user) -> None:
+        # A role or status change can move a user into or out of both tenant and platform-admin lists.
+        keys = [self.PLATFORM_ADMINS_KEY]
+        tenant_id = str(getattr(user, "tenant_uuid", "") or "").strip()
+        if tenant_id:
+            keys.extend([self.tenant_key(tenant_id, admin_only=True), self.tenant_key(tenant_id, admin_only=False)])
+        await self.invalidate(*keys)
+
+    def clear_local(self) -> None:
+        self._local.clear()
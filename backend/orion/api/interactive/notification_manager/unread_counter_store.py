@@ -0,0 +1,99 @@
+import threading
+from typing import Dict, List, Optional
+
+from orion.services.redis_manager.redis_controller import redis_controller
+from orion.services.redis_manager.redis_enums import REDIS_COMMANDS
+
+
+class UnreadCounterStore:
+    __instance = None
+    __lock = threading.Lock()
+
+    # Counters expire so every user's badge is periodically rebuilt from Mongo.
+    _COUNTER_TTL_SECONDS = 15 * 60
+
+    @staticmethod
+    def get_instance() -> "UnreadCounterStore":
+        if UnreadCounterStore.__instance is None:
+            with UnreadCounterStore.__lock:
+                if UnreadCounterStore.__instance is None:
+                    UnreadCounterStore.__instance = UnreadCounterStore()
+        return UnreadCounterStore.__instance
+
+    def __init__(self):
+        if UnreadCounterStore.__instance is not None:
+            raise Exception("UnreadCounterStore is a singleton")
+
+    @staticmethod
+    def _counter_key(user_id: str) -> str:
+        return f"notification_unread:{str(user_id)}"
+
+    @staticmethod
+    def _seeded_key(user_id: str) -> str:
+        return f"notification_seeded:{str(user_id)}"
+
+    async def get(self, user_id: str) -> Optional[int]:
+        try:
+            value = await redis_controller.getInstance().invoke_trigger(
+                REDIS_COMMANDS.S_GET_STRING,
+                [self._counter_key(user_id), None, None],
+            )
+            return int(value) if value is not None else None
+        except Exception:
+            return None
+
+    async def set(self, user_id: str, count: int) -> None:
+        try:
+            await redis_controller.getInstance().invoke_trigger(
+                REDIS_COMMANDS.S_SET_STRING,
+                [self._counter_key(user_id), int(count), self._COUNTER_TTL_SECONDS],
+            )
+        except Exception:
+            pass
+
+    async def increment(self, user_ids: List[str], amount: int = 1) -> Dict[str, Optional[int]]:
+        # Only counters that are already cached move; missing ones are rebuilt on the next read.
+        user_ids = [str(user_id) for user_id in user_ids if str(user_id or "").strip()]
+        if not user_ids:
+            return {}
+        try:
+            values = await redis_controller.getInstance().invoke_trigger(
+                REDIS_COMMANDS.S_INCR_EXISTING,
+                [[self._counter_key(user_id) for user_id in user_ids], int(amount)],
+            )
+        except Exception:
+            await self.invalidate(user_ids)
+            return {user_id: None for user_id in user_ids}
+        values = list(values or [])
+        return {
+            user_id: int(values[index]) if index < len(values) and values[index] is not None and int(values[index]) >= 0 else None
+            for index, user_id in enumerate(user_ids)
+        }
+
+    async def invalidate(self, user_ids: List[str]) -> None:
+        try:
+            await redis_controller.getInstance().invoke_trigger(
+                REDIS_COMMANDS.S_DELETE_KEYS,
+                [self._counter_key(user_id) for user_id in user_ids],
+            )
+        except Exception:
+            pass
+
+    async def is_seeded(self, user_id: str) -> bool:
+        try:
+            value = await redis_controller.getInstance().invoke_trigger(
+                REDIS_COMMANDS.S_GET_STRING,
+                [self._seeded_key(user_id), None, None],
+            )
+        except Exception:
+            return False
+        return value is not None
+
+    async def mark_seeded(self, user_id: str) -> None:
+        try:
+            await redis_controller.getInstance().invoke_trigger(
+                REDIS_COMMANDS.S_SET_STRING,
+                [self._seeded_key(user_id), "1", None],
+            )
+        except Exception:
+            pass
@@ -1,3 +1,5 @@
+import hashlib
+import json
 import threading
 import re
 from datetime import date, datetime, time, timedelta, timezone
@@ -8,6 +10,7 @@ from zoneinfo import ZoneInfo
 
 from bson import ObjectId
 from fastapi import HTTPException
+from pymongo import UpdateOne
 
 from orion.api.interactive.activity_manager.activity_manager import ActivityManager
 from orion.api.interactive.billing_manager.billing_manager import BillingManager
@@ -19,6 +22,7 @@ from orion.api.interactive.request_matching_manager.models.request_matching_mode
 )
 from orion.api.interactive.request_matching_manager.request_matching_manager import RequestMatchingManager
 from configs.metadata_constants import CANADIAN_CITIES_BY_PROVINCE_OPTIONS, CANADIAN_PROVINCE_OPTIONS
+from configs.pagination_cursor import cursor_pagination, decode_cursor, encode_cursor, keyset_after
 from orion.constants import constant
 from orion.services.mail_manager.mail_manager import mail_manager
 from orion.services.mongo_manager.mongo_controller import mongo_controller
@@ -53,6 +57,7 @@ from orion.services.mongo_manager.shared_model.db_request_model import (
     RequestPayoutAdjustmentDecisionPayload,
     RequestPayoutAdjustmentRecord,
     RequestPayoutAdjustmentUpdatePayload,
+    RequestPayoutLedgerRecord,
     RequestPublishPayload,
     RequestPublishUpdatePayload,
     RequestPricingPreviewPayload,
@@ -64,6 +69,7 @@ from orion.services.mongo_manager.shared_model.db_request_model import (
     RequestWaveReviewPayload,
     RequestWaveStatus,
     RequestWaveTrigger,
+    RequestWeeklyPayoutRecord,
     ShiftAttendanceEventType,
     ShiftCoverageSourceType,
     ShiftInstanceRecord,
@@ -114,6 +120,9 @@ AUTO_COMPLETE_ELAPSED_ASSIGNMENT_STATUSES = {
     RequestAssignmentStatus.IN_PROGRESS,
 }
 
+# Keyset batches a cursor page of list_jobs may scan before returning a short page.
+JOBS_CURSOR_MAX_SCAN_BATCHES = 5
+
 _FINANCE_SNAPSHOT_UNSET = object()
 PAYOUT_ADJUSTMENT_STATUS_DRAFT = "draft"
 PAYOUT_ADJUSTMENT_STATUS_APPROVED = "approved"
@@ -1597,6 +1606,30 @@ class RequestManager:
 
         return items
 
+    @classmethod
+    def _weekly_payout_input_state(
+        cls,
+        request_summary: Dict[str, Any],
+        assignment_entry: Dict[str, Any],
+        assignee_tenant_type: str,
+    ) -> str:
+        payout_hourly_rate = (
+            request_summary.get("provider_hourly_pay")
+            if assignee_tenant_type == RequestTargetType.SERVICE_PROVIDER.value
+            else request_summary.get("guard_hourly_pay")
+        )
+        parts = [
+            assignee_tenant_type,
+            str(request_summary.get("title") or "").strip(),
+            str(request_summary.get("site_name") or "").strip(),
+            str(request_summary.get("timezone") or "").strip(),
+            str(request_summary.get("currency") or "").strip(),
+            str(request_summary.get("guards_required") or ""),
+            str(assignment_entry.get("committed_slots") or ""),
+            str(cls._as_float(payout_hourly_rate)),
+        ]
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
     async def _build_long_term_assignee_weekly_invoice_items(
         self,
         *,
@@ -1609,20 +1642,138 @@ class RequestManager:
         normalized_request_ids = [
             str(request_id or "").strip()
             for request_id in request_ids
-            if str(request_id or "").strip()
+            if str(request_id or "").strip() in request_lookup
         ]
         if not normalized_request_ids:
             return []
 
-        shift_collection = self._engine.get_collection(ShiftInstanceRecord)
+        started_at = datetime.utcnow()
+        # A week that ended before yesterday in UTC has closed in every timezone, so its
+        # slots only need to be read again when one of them or its parent shift changes.
+        closed_through = self._week_bounds((started_at - timedelta(days=1)).date())[0] - timedelta(days=1)
+        closed_through_local = closed_through.isoformat()
+        assignee_field = (
+            "service_provider_tenant_id"
+            if assignee_tenant_type == RequestTargetType.SERVICE_PROVIDER.value
+            else "assigned_guard_tenant_id"
+        )
+        weekly_collection = self._engine.get_collection(RequestWeeklyPayoutRecord)
         slot_collection = self._engine.get_collection(ShiftSlotRecord)
-        shift_docs = await shift_collection.find({
-            "request_id": {"$in": normalized_request_ids},
-        }).to_list(length=None)
-        slot_docs = await slot_collection.find({
+        shift_collection = self._engine.get_collection(ShiftInstanceRecord)
+        weekly_docs = await weekly_collection.find({
+            "assignee_tenant_id": assignee_tenant_id,
             "request_id": {"$in": normalized_request_ids},
         }).to_list(length=None)
+        weekly_lookup = {str(doc.get("request_id") or "").strip(): doc for doc in weekly_docs}
 
+        items: List[Dict[str, Any]] = []
+        for request_id in normalized_request_ids:
+            input_state = self._weekly_payout_input_state(
+                request_lookup[request_id],
+                assignment_map.get(request_id) or {},
+                assignee_tenant_type,
+            )
+            weekly_doc = weekly_lookup.get(request_id) or {}
+            built_at = self._as_datetime(weekly_doc.get("built_at"))
+            previous_closed_through = str(weekly_doc.get("closed_through_local") or "")
+            weeks: Dict[str, Dict[str, Any]] = dict(weekly_doc.get("weeks") or {})
+            slot_query: Dict[str, Any] = {"request_id": request_id, assignee_field: assignee_tenant_id}
+
+            if weekly_doc.get("input_state") != input_state or built_at is None:
+                rebuild_all = True
+                touched_weeks: set[str] = set()
+            else:
+                rebuild_all = False
+                changed_docs = await slot_collection.find(
+                    {
+                        "request_id": request_id,
+                        "$or": [
+                            {"updated_at": {"$gt": built_at}},
+                            {"shift_date_local": {"$gt": previous_closed_through}},
+                        ],
+                    },
+                    {"shift_date_local": 1},
+                ).to_list(length=None)
+                # Totals also read the shift's date, timezone and scheduled times, which change without touching slots.
+                changed_docs.extend(await shift_collection.find(
+                    {"request_id": request_id, "updated_at": {"$gt": built_at}},
+                    {"shift_date_local": 1},
+                ).to_list(length=None))
+                touched_weeks = {week_start for week_start in weeks if week_start > previous_closed_through}
+                for doc in changed_docs:
+                    try:
+                        touched_weeks.add(self._week_bounds(date.fromisoformat(str(doc.get("shift_date_local") or "").strip()))[0].isoformat())
+                    except ValueError:
+                        continue
+                if not touched_weeks and previous_closed_through == closed_through_local:
+                    items.extend(dict(item) for item in weeks.values())
+                    continue
+                slot_query["$or"] = [
+                    {"shift_date_local": {"$gte": week_start, "$lte": (date.fromisoformat(week_start) + timedelta(days=6)).isoformat()}}
+                    for week_start in sorted(touched_weeks)
+                ]
+
+            slot_docs = (
+                await slot_collection.find(slot_query).to_list(length=None)
+                if rebuild_all or slot_query.get("$or")
+                else []
+            )
+            shift_object_ids = [
+                ObjectId(shift_id)
+                for shift_id in {str(doc.get("shift_instance_id") or "").strip() for doc in slot_docs}
+                if ObjectId.is_valid(shift_id)
+            ]
+            shift_docs = (
+                await shift_collection.find({"_id": {"$in": shift_object_ids}}).to_list(length=None)
+                if shift_object_ids
+                else []
+            )
+            rebuilt = {
+                str(item.get("billing_period_start_local") or ""): item
+                for item in self._compute_long_term_weekly_payout_items(
+                    slot_docs=slot_docs,
+                    shift_docs=shift_docs,
+                    assignment_map=assignment_map,
+                    request_lookup=request_lookup,
+                    assignee_tenant_id=assignee_tenant_id,
+                    assignee_tenant_type=assignee_tenant_type,
+                    now_utc=started_at,
+                )
+            }
+            if rebuild_all:
+                weeks = rebuilt
+            else:
+                for week_start in touched_weeks:
+                    weeks.pop(week_start, None)
+                    if week_start in rebuilt:
+                        weeks[week_start] = rebuilt[week_start]
+
+            await weekly_collection.update_one(
+                {"assignee_tenant_id": assignee_tenant_id, "request_id": request_id},
+                {"$set": {
+                    "assignee_tenant_type": assignee_tenant_type,
+                    "input_state": input_state,
+                    "closed_through_local": closed_through_local,
+                    "weeks": weeks,
+                    "built_at": started_at,
+                }},
+                upsert=True,
+            )
+            items.extend(dict(item) for item in weeks.values())
+
+        return items
+
+    def _compute_long_term_weekly_payout_items(
+        self,
+        *,
+        slot_docs: List[Dict[str, Any]],
+        shift_docs: List[Dict[str, Any]],
+        assignment_map: Dict[str, Dict[str, Any]],
+        request_lookup: Dict[str, Dict[str, Any]],
+        assignee_tenant_id: str,
+        assignee_tenant_type: str,
+        now_utc: datetime,
+    ) -> List[Dict[str, Any]]:
         shift_lookup = {
             str(shift_doc.get("_id") or "").strip(): shift_doc
             for shift_doc in shift_docs
@@ -1630,7 +1781,6 @@ class RequestManager:
         }
 
         grouped: Dict[tuple[str, str], Dict[str, Any]] = {}
-        now_utc = datetime.utcnow()
 
         for slot_doc in slot_docs:
             request_id = str(slot_doc.get("request_id") or "").strip()
@@ -2338,9 +2488,19 @@ class RequestManager:
             "voided_payout_adjustment_count": voided_adjustment_count,
         }
 
-    async def _collect_platform_assignee_invoice_scopes(self) -> List[Dict[str, Any]]:
+    async def _collect_platform_assignee_invoice_scopes(
+        self,
+        *,
+        request_id: Optional[str] = None,
+        assignee_tenant_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        query: Dict[str, Any] = {}
+        if request_id:
+            query["request_id"] = str(request_id).strip()
+        if assignee_tenant_id:
+            query["assignee_tenant_id"] = str(assignee_tenant_id).strip()
         assignment_collection = self._engine.get_collection(RequestAssignmentRecord)
-        assignment_docs = await assignment_collection.find({}).to_list(length=None)
+        assignment_docs = await assignment_collection.find(query).to_list(length=None)
         allowed_statuses = self._assignee_invoice_allowed_statuses()
         scopes: Dict[tuple[str, str], Dict[str, Any]] = {}
 
@@ -2372,6 +2532,159 @@ class RequestManager:
 
         return list(scopes.values())
 
+    async def _build_platform_payout_items(self, scopes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        tenant_labels = await self._build_tenant_label_lookup([scope["tenant_id"] for scope in scopes]) if scopes else {}
+        items: List[Dict[str, Any]] = []
+        for scope in scopes:
+            assignee_id = str(scope.get("tenant_id") or "").strip()
+            scope_items = await self._build_assignee_invoice_items(
+                assignee_tenant_id=assignee_id,
+                assignee_tenant_type=str(scope.get("assignee_tenant_type") or "").strip().lower(),
+                assignment_map=cast(Dict[str, Dict[str, Any]], scope.get("assignment_map") or {}),
+            )
+            assignee_label = tenant_labels.get(assignee_id, assignee_id)
+            for item in scope_items:
+                item["assignee_tenant_id"] = assignee_id
+                item["assignee_label"] = assignee_label
+                items.append(item)
+
+        request_lookup, invoice_lookup, client_labels = await self._build_platform_finance_context([
+            str(item.get("request_id") or "").strip()
+            for item in items
+        ])
+        return [
+            self._enrich_platform_payout_invoice_item(
+                item,
+                request_summary=request_lookup.get(str(item.get("request_id") or "").strip(), {}),
+                candidate_invoices=invoice_lookup.get(str(item.get("request_id") or "").strip(), []),
+                client_label=client_labels.get(
+                    str(request_lookup.get(str(item.get("request_id") or "").strip(), {}).get("client_tenant_id") or "").strip(),
+                    "",
+                ),
+            )
+            for item in items
+        ]
+
+    @classmethod
+    def _search_tokens(cls, *values: Any) -> List[str]:
+        tokens = set()
+        for value in values:
+            tokens.update(re.findall(r"\w+", cls._normalize_text(value)))
+        return sorted(tokens)
+
+    @classmethod
+    def _payout_ledger_fields(cls, item: Dict[str, Any]) -> Dict[str, Any]:
+        payout = float(cls._as_float(item.get("estimated_amount")) or 0.0)
+        earning = float(cls._as_float(item.get("estimated_platform_earning")) or 0.0)
+        search_tokens = cls._search_tokens(*(
+            item.get(key)
+            for key in (
+                "invoice_number",
+                "request_title",
+                "site_name",
+                "assignee_label",
+                "assignee_tenant_id",
+                "client_label",
+                "linked_client_invoice_number",
+            )
+        ))
+        return {
+            "invoice_id": str(item.get("id") or "").strip(),
+            "request_id": str(item.get("request_id") or "").strip(),
+            "assignee_tenant_id": str(item.get("assignee_tenant_id") or "").strip(),
+            "assignee_tenant_type": str(item.get("assignee_tenant_type") or "").strip().lower(),
+            "search_tokens": search_tokens,
+            "invoice_created_at": cls._as_datetime(item.get("created_at")),
+            "estimated_total_hours": float(cls._as_float(item.get("estimated_total_hours")) or 0.0),
+            "estimated_client_revenue": float(cls._as_float(item.get("estimated_client_revenue")) or 0.0),
+            "estimated_amount": payout,
+            "baseline_estimated_amount": float(cls._as_float(item.get("baseline_estimated_amount")) or payout),
+            "payout_adjustment_total": float(cls._as_float(item.get("payout_adjustment_total")) or 0.0),
+            "estimated_platform_earning": earning,
+            "baseline_estimated_platform_earning": float(cls._as_float(item.get("baseline_estimated_platform_earning")) or earning),
+            "payout_adjustment_draft_count": int(item.get("payout_adjustment_draft_count") or 0),
+            "payout_adjustment_count": int(item.get("payout_adjustment_count") or 0),
+            "payout_adjustment_voided_count": int(item.get("payout_adjustment_voided_count") or 0),
+            "item": item,
+        }
+
+    async def _upsert_payout_ledger_items(self, items: List[Dict[str, Any]]) -> int:
+        now = datetime.utcnow()
+        updates = []
+        for item in items:
+            fields = self._payout_ledger_fields(item)
+            if not fields["invoice_id"]:
+                continue
+            fields["refreshed_at"] = now
+            updates.append(UpdateOne({"invoice_id": fields["invoice_id"]}, {"$set": fields}, upsert=True))
+        if updates:
+            await self._engine.get_collection(RequestPayoutLedgerRecord).bulk_write(updates, ordered=False)
+        return len(updates)
+
+    async def _set_payout_ledger_dirty(self, request_record: ClientRequestRecord, dirty: bool) -> None:
+        request_record.payout_ledger_dirty = dirty
+        request_collection = self._engine.get_collection(ClientRequestRecord)
+        await request_collection.update_one({"_id": request_record.id}, {"$set": {"payout_ledger_dirty": dirty}})
+
+    async def mark_payout_ledger_dirty(self, request_record: ClientRequestRecord) -> None:
+        if not getattr(request_record, "payout_ledger_dirty", False):
+            await self._set_payout_ledger_dirty(request_record, True)
+
+    async def _mark_payout_ledger_dirty_by_request_id(self, request_id: str) -> None:
+        if not ObjectId.is_valid(request_id):
+            return
+        await self._engine.get_collection(ClientRequestRecord).update_one(
+            {"_id": ObjectId(request_id), "payout_ledger_dirty": {"$ne": True}},
+            {"$set": {"payout_ledger_dirty": True}},
+        )
+
+    async def refresh_payout_ledger_for_request(self, request_id: str) -> int:
+        normalized_request_id = str(request_id or "").strip()
+        request_collection = self._engine.get_collection(ClientRequestRecord)
+        object_id = ObjectId(normalized_request_id) if ObjectId.is_valid(normalized_request_id) else None
+        # Cleared before rebuilding so a change that lands mid-refresh marks the request again.
+        if object_id is not None:
+            await request_collection.update_one({"_id": object_id}, {"$set": {"payout_ledger_dirty": False}})
+        try:
+            scopes = await self._collect_platform_assignee_invoice_scopes(request_id=normalized_request_id)
+            items = [
+                item
+                for item in await self._build_platform_payout_items(scopes)
+                if str(item.get("request_id") or "").strip() == normalized_request_id
+            ]
+            written = await self._upsert_payout_ledger_items(items)
+            await self._engine.get_collection(RequestPayoutLedgerRecord).delete_many({
+                "request_id": normalized_request_id,
+                "invoice_id": {"$nin": [str(item.get("id") or "").strip() for item in items]},
+            })
+        except Exception:
+            if object_id is not None:
+                await request_collection.update_one({"_id": object_id}, {"$set": {"payout_ledger_dirty": True}})
+            raise
+        return written
+
+    @classmethod
+    def _fold_platform_payout_summary(cls, groups: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # Mirrors _build_platform_payout_summary over per-type totals pre-aggregated in Mongo.
+        summary = cls._build_platform_payout_summary([
+            {
+                "assignee_tenant_type": group.get("_id"),
+                "estimated_client_revenue": group.get("estimated_client_revenue"),
+                "estimated_amount": group.get("estimated_amount"),
+                "baseline_estimated_amount": group.get("baseline_estimated_amount"),
+                "payout_adjustment_total": group.get("payout_adjustment_total"),
+                "estimated_platform_earning": group.get("estimated_platform_earning"),
+                "baseline_estimated_platform_earning": group.get("baseline_estimated_platform_earning"),
+                "estimated_total_hours": group.get("estimated_total_hours"),
+                "payout_adjustment_draft_count": group.get("payout_adjustment_draft_count"),
+                "payout_adjustment_count": group.get("payout_adjustment_count"),
+                "payout_adjustment_voided_count": group.get("payout_adjustment_voided_count"),
+            }
+            for group in groups
+        ])
+        summary["invoice_count"] = sum(int(group.get("invoice_count") or 0) for group in groups)
+        return summary
+
     async def _get_tenant(self, tenant_id: str):
         try:
             return await self._engine.find_one(db_tenant_model, db_tenant_model.id == ObjectId(tenant_id))
@@ -2869,6 +3182,7 @@ class RequestManager:
         *,
         schedule_record: RequestScheduleTemplateRecord,
         trigger: RequestInvoiceTrigger,
+        existing_invoices: Optional[List[RequestInvoiceRecord]] = None,
     ) -> Optional[tuple[date, date]]:
         try:
             schedule_start = date.fromisoformat(str(getattr(schedule_record, "start_date_local", "") or "").strip())
@@ -2891,10 +3205,11 @@ class RequestManager:
         target_week_start = current_week_start
 
         if trigger == RequestInvoiceTrigger.WEEKLY_ADVANCE:
-            existing_invoices = await self._list_request_invoices_for_contract(
-                request_id=str(record.id),
-                contract_type="long_term",
-            )
+            if existing_invoices is None:
+                existing_invoices = await self._list_request_invoices_for_contract(
+                    request_id=str(record.id),
+                    contract_type="long_term",
+                )
             current_week_key = current_week_start.isoformat()
             current_week_exists = any(
                 str(getattr(invoice, "billing_period_start_local", "") or "").strip() == current_week_key
@@ -2915,13 +3230,14 @@ class RequestManager:
         *,
         schedule_record: RequestScheduleTemplateRecord,
         trigger: RequestInvoiceTrigger,
+        period: Optional[tuple[date, date]] = None,
     ) -> Optional[Dict[str, Any]]:
         pricing_snapshot = record.pricing_snapshot if isinstance(getattr(record, "pricing_snapshot", None), dict) else {}
         client_hourly_quote = self._as_float(pricing_snapshot.get("client_hourly_quote"))
         if client_hourly_quote is None:
             return None
 
-        resolved_period = await self._resolve_long_term_invoice_period(
+        resolved_period = period or await self._resolve_long_term_invoice_period(
             record,
             schedule_record=schedule_record,
             trigger=trigger,
@@ -3046,6 +3362,45 @@ class RequestManager:
             "note": invoice_record.note,
         }
 
+    @classmethod
+    def _advance_invoice_input_state(
+        cls,
+        record: ClientRequestRecord,
+        *,
+        schedule_record: RequestScheduleTemplateRecord,
+        period: tuple[date, date],
+        trigger: RequestInvoiceTrigger,
+    ) -> str:
+        invoicing_snapshot = record.invoicing_snapshot if isinstance(getattr(record, "invoicing_snapshot", None), dict) else {}
+        parts = [
+            period[0].isoformat(),
+            period[1].isoformat(),
+            cls._enum_value(trigger),
+            str(getattr(record, "request_revision", "") or ""),
+            str(getattr(record, "title", "") or ""),
+            str(getattr(record, "guards_required", "") or ""),
+            str(getattr(record, "timezone", "") or ""),
+            json.dumps(getattr(record, "pricing_snapshot", None) or {}, sort_keys=True, default=str),
+            json.dumps(
+                {
+                    key: invoicing_snapshot.get(key)
+                    for key in ("contract_type", "billing_cycle", "charge_timing", "monthly_cutoff_day", "invoice_recipient_email")
+                },
+                sort_keys=True,
+                default=str,
+            ),
+            str(getattr(schedule_record, "id", "") or ""),
+            str(getattr(schedule_record, "timezone", "") or ""),
+            cls._enum_value(getattr(schedule_record, "schedule_type", None)),
+            str(getattr(schedule_record, "start_date_local", "") or ""),
+            str(getattr(schedule_record, "end_date_local", "") or ""),
+            str(getattr(schedule_record, "start_time_local", "") or ""),
+            str(getattr(schedule_record, "end_time_local", "") or ""),
+            str(bool(getattr(schedule_record, "is_overnight", False))),
+            ",".join(sorted(str(day) for day in list(getattr(schedule_record, "recurrence_days", []) or []))),
+        ]
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
     async def _sync_request_invoice_state(self, record: ClientRequestRecord, *, current_user, reason: Any) -> Dict[str, Any]:
         pricing_snapshot = record.pricing_snapshot if isinstance(getattr(record, "pricing_snapshot", None), dict) else {}
         invoicing_snapshot = record.invoicing_snapshot if isinstance(getattr(record, "invoicing_snapshot", None), dict) else {}
@@ -3055,6 +3410,7 @@ class RequestManager:
         schedule_record = await self._get_active_schedule_template(str(record.id))
 
         invoice_details: Optional[Dict[str, Any]] = None
+        advance_invoice_state: Optional[str] = None
         if contract_type == "long_term":
             if schedule_record is None:
                 return {"action": "skipped", "invoice": None}
@@ -3069,10 +3425,36 @@ class RequestManager:
                 if trigger == RequestInvoiceTrigger.MONTHLY_ADVANCE
                 else trigger
             )
+            period = await self._resolve_long_term_invoice_period(
+                record,
+                schedule_record=schedule_record,
+                trigger=effective_trigger,
+                existing_invoices=existing_long_term_invoices,
+            )
+            if not period:
+                return {"action": "skipped", "invoice": None}
+            advance_invoice_state = self._advance_invoice_input_state(
+                record,
+                schedule_record=schedule_record,
+                period=period,
+                trigger=trigger,
+            )
+            if getattr(record, "advance_invoice_state", None) == advance_invoice_state:
+                # Inputs match the last build for this period, so its invoice is already current.
+                # Looked up by the same key the rebuild path uses, so both settle on one invoice.
+                existing_invoice = await self._find_existing_invoice(
+                    request_id=str(record.id),
+                    contract_type=contract_type,
+                    billing_period_start_local=period[0].isoformat(),
+                    billing_period_end_local=period[1].isoformat(),
+                )
+                if existing_invoice is not None:
+                    return {"action": "unchanged", "invoice": existing_invoice}
             invoice_details = await self._build_long_term_invoice_details(
                 record,
                 schedule_record=schedule_record,
                 trigger=effective_trigger,
+                period=period,
             )
         else:
             invoice_details = self._build_short_term_invoice_details(record, schedule_record=schedule_record)
@@ -3142,6 +3524,8 @@ class RequestManager:
             latest_snapshot["last_invoice_issued_at"] = existing_invoice.updated_at or existing_invoice.created_at
             latest_snapshot["email_delivery_status"] = self._enum_value(existing_invoice.email_delivery_status)
             record.invoicing_snapshot = latest_snapshot
+            if advance_invoice_state is not None:
+                record.advance_invoice_state = advance_invoice_state
             record.updated_at = datetime.utcnow()
             await self._engine.save(record)
             return {"action": "unchanged", "invoice": existing_invoice}
@@ -3213,6 +3597,9 @@ class RequestManager:
         next_invoicing_snapshot["last_invoice_issued_at"] = issued_at
         next_invoicing_snapshot["email_delivery_status"] = self._enum_value(saved_invoice.email_delivery_status)
         record.invoicing_snapshot = next_invoicing_snapshot
+        if advance_invoice_state is not None:
+            record.advance_invoice_state = advance_invoice_state
+        record.payout_ledger_dirty = True
         record.updated_at = issued_at
         await self._engine.save(record)
 
@@ -3667,18 +4054,18 @@ class RequestManager:
             raise HTTPException(status_code=403, detail="Tenant must be active")
         return tenant
 
-    async def _resolve_request_docs_for_role(self, current_user) -> List[Dict[str, Any]]:
+    # Returns the Mongo filter bounding what the user may list (None: nothing visible) and viewer assignments by request id.
+    async def _request_list_scope_for_role(self, current_user) -> tuple[Optional[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
         role_value = self._role_value(current_user)
-        request_collection = self._engine.get_collection(ClientRequestRecord)
 
         if self._is_platform_role(role_value):
-            return await request_collection.find({"deleted_at": None}).to_list(length=None)
+            return {"deleted_at": None}, {}
 
         session_tenant = await self._get_session_tenant(current_user)
         tenant_id = str(session_tenant.id)
 
         if role_value == "client_admin" and session_tenant.tenant_type == TenantType.CLIENT:
-            return await request_collection.find({"client_tenant_id": tenant_id, "deleted_at": None}).to_list(length=None)
+            return {"client_tenant_id": tenant_id, "deleted_at": None}, {}
 
         if role_value in {"guard_admin", "sp_admin"} and session_tenant.tenant_type in {TenantType.GUARD, TenantType.SERVICE_PROVIDER}:
             assignment_collection = self._engine.get_collection(RequestAssignmentRecord)
@@ -3687,26 +4074,83 @@ class RequestManager:
                 assignment_docs,
                 statuses=REQUEST_TAB_ASSIGNMENT_STATUSES,
             )
-            request_ids = [request_id for request_id in relevant_assignments.keys() if request_id]
-            if not request_ids:
-                return []
 
             object_ids = []
-            for request_id in request_ids:
+            for request_id in relevant_assignments.keys():
+                if not request_id:
+                    continue
                 try:
                     object_ids.append(ObjectId(str(request_id)))
                 except Exception:
                     continue
             if not object_ids:
-                return []
-            request_docs = await request_collection.find({"_id": {"$in": object_ids}, "deleted_at": None}).to_list(length=None)
-            for request_doc in request_docs:
-                serialized_assignment = relevant_assignments.get(str(request_doc.get("_id") or ""))
-                request_doc["viewer_assignment"] = self._serialize_assignment(serialized_assignment) if serialized_assignment else None
-            return request_docs
+                return None, {}
+            return {"_id": {"$in": object_ids}, "deleted_at": None}, relevant_assignments
 
         raise HTTPException(status_code=403, detail="Access forbidden")
 
+    def _attach_viewer_assignments(self, request_docs: List[Dict[str, Any]], viewer_assignments: Dict[str, Dict[str, Any]]) -> None:
+        if not viewer_assignments:
+            return
+        for request_doc in request_docs:
+            serialized_assignment = viewer_assignments.get(str(request_doc.get("_id") or ""))
+            request_doc["viewer_assignment"] = self._serialize_assignment(serialized_assignment) if serialized_assignment else None
+
+    async def _resolve_request_docs_for_role(self, current_user) -> List[Dict[str, Any]]:
+        scope_query, viewer_assignments = await self._request_list_scope_for_role(current_user)
+        if scope_query is None:
+            return []
+        request_collection = self._engine.get_collection(ClientRequestRecord)
+        request_docs = await request_collection.find(scope_query).to_list(length=None)
+        self._attach_viewer_assignments(request_docs, viewer_assignments)
+        return request_docs
+
+    @classmethod
+    def _request_list_filter_query(
+        cls,
+        scope_query: Dict[str, Any],
+        *,
+        keyword: str = "",
+        request_status: str = "",
+        fulfillment_mode: str = "",
+        client_tenant_id: str = "",
+    ) -> Dict[str, Any]:
+        clauses: List[Dict[str, Any]] = [scope_query]
+
+        normalized_status = cls._normalize_text(request_status)
+        if normalized_status:
+            clauses.append({"request_status": normalized_status})
+
+        normalized_fulfillment_mode = cls._normalize_text(fulfillment_mode)
+        if normalized_fulfillment_mode:
+            # Legacy requests without a stored mode fall back to the mode implied by target_type.
+            legacy_target_types = {
+                RequestFulfillmentMode.SERVICE_PROVIDER_ONLY.value: {"$eq": RequestTargetType.SERVICE_PROVIDER.value},
+                RequestFulfillmentMode.INDIVIDUAL_ONLY.value: {"$ne": RequestTargetType.SERVICE_PROVIDER.value},
+            }
+            mode_clauses: List[Dict[str, Any]] = [{"fulfillment_mode": normalized_fulfillment_mode}]
+            if normalized_fulfillment_mode in legacy_target_types:
+                mode_clauses.append({
+                    "fulfillment_mode": {"$in": [None, ""]},
+                    "target_type": legacy_target_types[normalized_fulfillment_mode],
+                })
+            clauses.append({"$or": mode_clauses})
+
+        normalized_client_tenant_id = str(client_tenant_id or "").strip()
+        if normalized_client_tenant_id:
+            clauses.append({"client_tenant_id": normalized_client_tenant_id})
+
+        normalized_keyword = cls._normalize_text(keyword)
+        if normalized_keyword:
+            keyword_pattern = {"$regex": re.escape(normalized_keyword), "$options": "i"}
+            clauses.append({"$or": [
+                {"title": keyword_pattern},
+                {"site_snapshot.site_name": keyword_pattern},
+                {"requested_guard_type": keyword_pattern},
+            ]})
+
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
     async def _request_ids_with_active_schedules(self, request_ids: List[str]) -> set[str]:
         normalized_ids = [str(request_id).strip() for request_id in request_ids if str(request_id or "").strip()]
         if not normalized_ids:
@@ -4410,6 +4854,18 @@ class RequestManager:
                 },
             )
 
+    @classmethod
+    def _payout_ledger_state(cls, assignments: List[RequestAssignmentRecord]) -> str:
+        allowed_statuses = cls._assignee_invoice_allowed_statuses()
+        entries = sorted(
+            f"{cls._enum_value(getattr(assignment, 'assignee_tenant_type', None))}:{getattr(assignment, 'assignee_tenant_id', '')}:"
+            f"{cls._enum_value(assignment.assignment_status)}:{cls._assignment_slots(assignment)}"
+            for assignment in assignments
+            if cls._assignment_scope_value(assignment) == RequestAssignmentScope.REQUEST.value
+            and cls._enum_value(assignment.assignment_status) in allowed_statuses
+        )
+        return hashlib.sha1("|".join(entries).encode("utf-8")).hexdigest()
+
     async def _sync_request_runtime_state(self, record: ClientRequestRecord) -> ClientRequestRecord:
         now = datetime.utcnow()
 
@@ -4440,8 +4896,15 @@ class RequestManager:
                 accepted_slots += self._assignment_slots(assignment)
 
         previous_open_slots = record.open_slots
+        previous_slot_counts = (record.accepted_slots, record.open_slots)
         record.accepted_slots = accepted_slots
         record.open_slots = max(int(record.guards_required or 0) - accepted_slots, 0)
+        if (record.accepted_slots, record.open_slots) != previous_slot_counts:
+            record.shift_slots_dirty = True
+        payout_ledger_state = self._payout_ledger_state(assignments)
+        if payout_ledger_state != getattr(record, "payout_ledger_state", None):
+            record.payout_ledger_state = payout_ledger_state
+            record.payout_ledger_dirty = True
         should_auto_close_request = self._should_auto_close_request(
             record,
             assignments,
@@ -4925,6 +5388,7 @@ class RequestManager:
 
             if "title" in provided and payload.title is not None:
                 record.title = self._validate_trimmed_title(payload.title)
+                record.payout_ledger_dirty = True
             if "request_expires_at" in provided:
                 self._validate_request_expiry(payload.request_expires_at, record.requested_start_at, require_value=False)
                 record.request_expires_at = payload.request_expires_at
@@ -4971,6 +5435,7 @@ class RequestManager:
 
         max_results = payload.max_match_results if payload.max_match_results is not None else 25
         await self._refresh_request_matching(record, max_results)
+        record.payout_ledger_dirty = True
         record.updated_at = datetime.utcnow()
         await self._engine.save(record)
         if str((record.site_snapshot or {}).get("site_source") or "").strip().lower() == "request":
@@ -5004,40 +5469,49 @@ class RequestManager:
         request_status: str = "",
         fulfillment_mode: str = "",
         client_tenant_id: str = "",
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        docs = await self._resolve_request_docs_for_role(current_user)
-        normalized_keyword = self._normalize_text(keyword)
-        normalized_status = self._normalize_text(request_status)
-        normalized_fulfillment_mode = self._normalize_text(fulfillment_mode)
-        normalized_client_tenant_id = str(client_tenant_id or "").strip()
-
-        filtered_docs: List[Dict[str, Any]] = []
-        for doc in docs:
-            title = self._normalize_text(doc.get("title"))
-            current_status = self._normalize_text(doc.get("request_status"))
-            current_mode = self._normalize_text(doc.get("fulfillment_mode")) or self._normalize_text(self._resolve_fulfillment_mode_from_record(doc).value)
-            site_name = self._normalize_text((doc.get("site_snapshot") or {}).get("site_name"))
-            guard_type = self._normalize_text(doc.get("requested_guard_type"))
-
-            if normalized_status and current_status != normalized_status:
-                continue
-            if normalized_fulfillment_mode and current_mode != normalized_fulfillment_mode:
-                continue
-            if normalized_client_tenant_id and str(doc.get("client_tenant_id") or "") != normalized_client_tenant_id:
-                continue
-            if normalized_keyword and normalized_keyword not in " ".join([title, site_name, guard_type]):
-                continue
-            filtered_docs.append(doc)
-
-        filtered_docs.sort(key=lambda item: item.get("created_at") or datetime.min, reverse=True)
-
         safe_rows = rows if rows and rows > 0 else 20
         safe_page = page if page and page > 0 else 1
-        total_items = len(filtered_docs)
+
+        scope_query, viewer_assignments = await self._request_list_scope_for_role(current_user)
+        page_docs: List[Dict[str, Any]] = []
+        total_items = 0
+        next_cursor: Optional[str] = None
+        if scope_query is not None:
+            request_collection = self._engine.get_collection(ClientRequestRecord)
+            query = self._request_list_filter_query(
+                scope_query,
+                keyword=keyword,
+                request_status=request_status,
+                fulfillment_mode=fulfillment_mode,
+                client_tenant_id=client_tenant_id,
+            )
+            if cursor is None:
+                total_items = await request_collection.count_documents(query)
+                page_docs = await (
+                    request_collection.find(query)
+                    .sort([("created_at", -1), ("_id", -1)])
+                    .skip((safe_page - 1) * safe_rows)
+                    .limit(safe_rows)
+                    .to_list(length=safe_rows)
+                )
+            else:
+                if cursor:
+                    cursor_created_at, cursor_id = decode_cursor(cursor)
+                    query = {"$and": [query, keyset_after("created_at", cursor_created_at, cursor_id, -1)]}
+                page_docs = await (
+                    request_collection.find(query)
+                    .sort([("created_at", -1), ("_id", -1)])
+                    .limit(safe_rows + 1)
+                    .to_list(length=safe_rows + 1)
+                )
+                if len(page_docs) > safe_rows:
+                    page_docs = page_docs[:safe_rows]
+                    next_cursor = encode_cursor(page_docs[-1].get("created_at"), page_docs[-1].get("_id"))
+            self._attach_viewer_assignments(page_docs, viewer_assignments)
+
         total_pages = (total_items + safe_rows - 1) // safe_rows if total_items > 0 else 0
-        start = (safe_page - 1) * safe_rows
-        end = start + safe_rows
-        page_docs = filtered_docs[start:end]
         for doc in page_docs:
             if isinstance(doc, dict):
                 await self._ensure_request_doc_finance_snapshot(doc)
@@ -5052,7 +5526,7 @@ class RequestManager:
 
         return {
             "items": sanitized_items,
-            "pagination": {
+            "pagination": cursor_pagination(safe_rows, cursor, next_cursor) if cursor is not None else {
                 "page": safe_page,
                 "rows": safe_rows,
                 "total_items": total_items,
@@ -5234,65 +5708,46 @@ class RequestManager:
             raise HTTPException(status_code=403, detail="Access forbidden")
 
         normalized_type = str(assignee_tenant_type or "").strip().lower()
-        scopes = await self._collect_platform_assignee_invoice_scopes()
-        tenant_labels = await self._build_tenant_label_lookup([scope["tenant_id"] for scope in scopes])
+        query: Dict[str, Any] = {}
+        if normalized_type:
+            query["assignee_tenant_type"] = normalized_type
+        keyword_tokens = self._search_tokens(keyword)
+        if keyword_tokens:
+            # Every keyword word must start one of the row's tokens; anchored, case-sensitive
+            # prefixes on the lower-cased tokens are index range scans on search_tokens.
+            query["$and"] = [{"search_tokens": {"$regex": f"^{re.escape(token)}"}} for token in keyword_tokens]
 
-        items: List[Dict[str, Any]] = []
-        for scope in scopes:
-            scope_type = str(scope.get("assignee_tenant_type") or "").strip().lower()
-            if normalized_type and scope_type != normalized_type:
-                continue
-            scope_items = await self._build_assignee_invoice_items(
-                assignee_tenant_id=str(scope.get("tenant_id") or "").strip(),
-                assignee_tenant_type=scope_type,
-                assignment_map=cast(Dict[str, Dict[str, Any]], scope.get("assignment_map") or {}),
-            )
-            assignee_label = tenant_labels.get(str(scope.get("tenant_id") or "").strip(), str(scope.get("tenant_id") or "").strip())
-            for item in scope_items:
-                item["assignee_tenant_id"] = str(scope.get("tenant_id") or "").strip()
-                item["assignee_label"] = assignee_label
-                items.append(item)
-
-        request_lookup, invoice_lookup, client_labels = await self._build_platform_finance_context([
-            str(item.get("request_id") or "").strip()
-            for item in items
-        ])
-        items = [
-            self._enrich_platform_payout_invoice_item(
-                item,
-                request_summary=request_lookup.get(str(item.get("request_id") or "").strip(), {}),
-                candidate_invoices=invoice_lookup.get(str(item.get("request_id") or "").strip(), []),
-                client_label=client_labels.get(
-                    str(request_lookup.get(str(item.get("request_id") or "").strip(), {}).get("client_tenant_id") or "").strip(),
-                    "",
-                ),
-            )
-            for item in items
-        ]
-
-        normalized_keyword = self._normalize_text(keyword)
-        if normalized_keyword:
-            items = [
-                item for item in items
-                if normalized_keyword in self._normalize_text(item.get("invoice_number"))
-                or normalized_keyword in self._normalize_text(item.get("request_title"))
-                or normalized_keyword in self._normalize_text(item.get("site_name"))
-                or normalized_keyword in self._normalize_text(item.get("assignee_label"))
-                or normalized_keyword in self._normalize_text(item.get("assignee_tenant_id"))
-                or normalized_keyword in self._normalize_text(item.get("client_label"))
-                or normalized_keyword in self._normalize_text(item.get("linked_client_invoice_number"))
-            ]
-
-        items.sort(key=lambda item: str(item.get("created_at") or ""), reverse=True)
-        summary = self._build_platform_payout_summary(items)
         safe_rows = rows if rows and rows > 0 else 20
         safe_page = page if page and page > 0 else 1
-        total_items = len(items)
+        ledger_collection = self._engine.get_collection(RequestPayoutLedgerRecord)
+        total_items = await ledger_collection.count_documents(query)
         total_pages = (total_items + safe_rows - 1) // safe_rows if total_items > 0 else 0
-        start = (safe_page - 1) * safe_rows
-        end = start + safe_rows
+        ledger_docs = await (
+            ledger_collection.find(query, {"item": 1})
+            .sort([("invoice_created_at", -1), ("_id", -1)])
+            .skip((safe_page - 1) * safe_rows)
+            .limit(safe_rows)
+            .to_list(length=safe_rows)
+        )
+        summary_groups = await ledger_collection.aggregate([
+            {"$match": query},
+            {"$group": {
+                "_id": "$assignee_tenant_type",
+                "invoice_count": {"$sum": 1},
+                "estimated_client_revenue": {"$sum": "$estimated_client_revenue"},
+                "estimated_amount": {"$sum": "$estimated_amount"},
+                "baseline_estimated_amount": {"$sum": "$baseline_estimated_amount"},
+                "payout_adjustment_total": {"$sum": "$payout_adjustment_total"},
+                "estimated_platform_earning": {"$sum": "$estimated_platform_earning"},
+                "baseline_estimated_platform_earning": {"$sum": "$baseline_estimated_platform_earning"},
+                "estimated_total_hours": {"$sum": "$estimated_total_hours"},
+                "payout_adjustment_draft_count": {"$sum": "$payout_adjustment_draft_count"},
+                "payout_adjustment_count": {"$sum": "$payout_adjustment_count"},
+                "payout_adjustment_voided_count": {"$sum": "$payout_adjustment_voided_count"},
+            }},
+        ]).to_list(length=None)
         return {
-            "items": items[start:end],
+            "items": [dict(doc.get("item") or {}) for doc in ledger_docs],
             "pagination": {
                 "page": safe_page,
                 "rows": safe_rows,
@@ -5303,9 +5758,46 @@ class RequestManager:
                 "keyword": str(keyword or "").strip(),
                 "assignee_tenant_type": normalized_type,
             },
-            "summary": summary,
+            "summary": self._fold_platform_payout_summary(summary_groups),
         }
 
+    async def _build_platform_payout_invoice(self, invoice_id: str) -> tuple[Dict[str, Any], bool]:
+        """Rebuild one payout invoice without writing; the flag says whether the ledger already has it."""
+        ledger_collection = self._engine.get_collection(RequestPayoutLedgerRecord)
+        ledger_docs = await ledger_collection.find(
+            {"invoice_id": invoice_id},
+            {"request_id": 1, "assignee_tenant_id": 1},
+        ).to_list(length=1)
+        if ledger_docs:
+            request_id = str(ledger_docs[0].get("request_id") or "").strip()
+            assignee_tenant_id = str(ledger_docs[0].get("assignee_tenant_id") or "").strip()
+        else:
+            # Not in the ledger yet: weekly ids are "weekly:<type>:<assignee>:<request>:<week>" and
+            # per-request ids "payout:<type>:<assignee>:<request invoice>", so the scope is one request.
+            id_parts = invoice_id.split(":")
+            if len(id_parts) < 4 or not id_parts[2] or not id_parts[3]:
+                raise HTTPException(status_code=404, detail="Invoice not found")
+            assignee_tenant_id = id_parts[2]
+            request_id = id_parts[3] if id_parts[0] == "weekly" else ""
+            if id_parts[0] == "payout" and ObjectId.is_valid(id_parts[3]):
+                invoice_docs = await self._engine.get_collection(RequestInvoiceRecord).find(
+                    {"_id": ObjectId(id_parts[3])},
+                    {"request_id": 1},
+                ).to_list(length=1)
+                request_id = str(invoice_docs[0].get("request_id") or "").strip() if invoice_docs else ""
+            if not request_id:
+                raise HTTPException(status_code=404, detail="Invoice not found")
+        scopes = await self._collect_platform_assignee_invoice_scopes(
+            request_id=request_id,
+            assignee_tenant_id=assignee_tenant_id,
+        )
+
+        for item in await self._build_platform_payout_items(scopes):
+            if str(item.get("id") or "").strip() == invoice_id:
+                return item, bool(ledger_docs)
+
+        raise HTTPException(status_code=404, detail="Invoice not found")
+
     async def get_platform_payout_invoice_by_id(
         self,
         invoice_id: str,
@@ -5314,34 +5806,17 @@ class RequestManager:
         if not self._is_platform_role(self._role_value(current_user)):
             raise HTTPException(status_code=403, detail="Access forbidden")
 
-        scopes = await self._collect_platform_assignee_invoice_scopes()
-        tenant_labels = await self._build_tenant_label_lookup([scope["tenant_id"] for scope in scopes])
-        normalized_invoice_id = str(invoice_id or "").strip()
+        item, in_ledger = await self._build_platform_payout_invoice(str(invoice_id or "").strip())
+        if not in_ledger:
+            # The payout_ledger maintenance stage writes the missing row.
+            await self._mark_payout_ledger_dirty_by_request_id(str(item.get("request_id") or "").strip())
+        return item
 
-        for scope in scopes:
-            scope_items = await self._build_assignee_invoice_items(
-                assignee_tenant_id=str(scope.get("tenant_id") or "").strip(),
-                assignee_tenant_type=str(scope.get("assignee_tenant_type") or "").strip().lower(),
-                assignment_map=cast(Dict[str, Dict[str, Any]], scope.get("assignment_map") or {}),
-            )
-            assignee_id = str(scope.get("tenant_id") or "").strip()
-            assignee_label = tenant_labels.get(assignee_id, assignee_id)
-            for item in scope_items:
-                if str(item.get("id") or "").strip() != normalized_invoice_id:
-                    continue
-                item["assignee_tenant_id"] = assignee_id
-                item["assignee_label"] = assignee_label
-                request_lookup, invoice_lookup, client_labels = await self._build_platform_finance_context([str(item.get("request_id") or "").strip()])
-                request_summary = request_lookup.get(str(item.get("request_id") or "").strip(), {})
-                client_label = client_labels.get(str(request_summary.get("client_tenant_id") or "").strip(), "")
-                return self._enrich_platform_payout_invoice_item(
-                    item,
-                    request_summary=request_summary,
-                    candidate_invoices=invoice_lookup.get(str(item.get("request_id") or "").strip(), []),
-                    client_label=client_label,
-                )
-
-        raise HTTPException(status_code=404, detail="Invoice not found")
+    async def _refresh_platform_payout_invoice(self, invoice_id: str, current_user) -> Dict[str, Any]:
+        # Adjustment mutations write their invoice's ledger row inline; reads leave it to maintenance.
+        invoice = await self.get_platform_payout_invoice_by_id(invoice_id=invoice_id, current_user=current_user)
+        await self._upsert_payout_ledger_items([invoice])
+        return invoice
 
     async def create_platform_payout_adjustment(
         self,
@@ -5392,10 +5867,7 @@ class RequestManager:
         )
         await self._engine.save(adjustment)
 
-        return await self.get_platform_payout_invoice_by_id(
-            invoice_id=invoice_id,
-            current_user=current_user,
-        )
+        return await self._refresh_platform_payout_invoice(invoice_id, current_user)
 
     async def update_platform_payout_adjustment(
         self,
@@ -5434,9 +5906,9 @@ class RequestManager:
         adjustment.updated_at = datetime.utcnow()
         await self._engine.save(adjustment)
 
-        return await self.get_platform_payout_invoice_by_id(
-            invoice_id=str(adjustment.payout_invoice_id or "").strip(),
-            current_user=current_user,
+        return await self._refresh_platform_payout_invoice(
+            str(adjustment.payout_invoice_id or "").strip(),
+            current_user,
         )
 
     async def approve_platform_payout_adjustment(
@@ -5473,9 +5945,9 @@ class RequestManager:
         adjustment.updated_at = now
         await self._engine.save(adjustment)
 
-        return await self.get_platform_payout_invoice_by_id(
-            invoice_id=str(adjustment.payout_invoice_id or "").strip(),
-            current_user=current_user,
+        return await self._refresh_platform_payout_invoice(
+            str(adjustment.payout_invoice_id or "").strip(),
+            current_user,
         )
 
     async def void_platform_payout_adjustment(
@@ -5502,9 +5974,9 @@ class RequestManager:
         adjustment.updated_at = now
         await self._engine.save(adjustment)
 
-        return await self.get_platform_payout_invoice_by_id(
-            invoice_id=str(adjustment.payout_invoice_id or "").strip(),
-            current_user=current_user,
+        return await self._refresh_platform_payout_invoice(
+            str(adjustment.payout_invoice_id or "").strip(),
+            current_user,
         )
 
     async def list_request_invoices(
@@ -6022,6 +6494,15 @@ class RequestManager:
         record.deleted_reason = reason
         record.updated_at = now
         await self._engine.save(record)
+        # Tenant shift lists filter on visible_tenant_ids, so removed requests drop out of them at once.
+        await self._engine.get_collection(ShiftInstanceRecord).update_many(
+            {"request_id": str(record.id)},
+            {"$set": {"visible_tenant_ids": [], "request_deleted_at": now}},
+        )
+        await self._engine.get_collection(ShiftSlotRecord).update_many(
+            {"request_id": str(record.id)},
+            {"$set": {"request_deleted_at": now}},
+        )
 
         await NotificationManager.get_instance().create_for_tenant_admin_users(
             tenant_id=record.client_tenant_id,
@@ -6214,28 +6695,14 @@ class RequestManager:
         await self._engine.save(assignment)
         return assignment
 
-    async def list_jobs(self, current_user, page: int = 1, rows: int = 20, assignment_status: str = "", keyword: str = "") -> Dict[str, Any]:
-        role_value = self._role_value(current_user)
-        assignment_collection = self._engine.get_collection(RequestAssignmentRecord)
-
-        if self._is_platform_role(role_value):
-            query: Dict[str, Any] = {}
-            session_tenant = None
-        else:
-            session_tenant = await self._get_session_tenant(current_user)
-
-        if role_value == "client_admin" and session_tenant and session_tenant.tenant_type == TenantType.CLIENT:
-            query = {"client_tenant_id": str(session_tenant.id)}
-        elif role_value in {"guard_admin", "sp_admin"} and session_tenant and session_tenant.tenant_type in {TenantType.GUARD, TenantType.SERVICE_PROVIDER}:
-            query = {"assignee_tenant_id": str(session_tenant.id)}
-        elif not self._is_platform_role(role_value):
-            raise HTTPException(status_code=403, detail="Access forbidden")
-
-        normalized_status = self._normalize_text(assignment_status)
-        if normalized_status:
-            query["assignment_status"] = normalized_status
-
-        docs = await assignment_collection.find(query).sort("updated_at", -1).to_list(length=None)
+    async def _job_request_lookup(
+        self,
+        docs: List[Dict[str, Any]],
+        role_value: str,
+        assignment_collection,
+        *,
+        read_only: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
         request_collection = self._engine.get_collection(ClientRequestRecord)
         request_ids: List[ObjectId] = []
         for doc in docs:
@@ -6260,7 +6727,7 @@ class RequestManager:
                 request_doc["has_schedule"] = str(request_doc.get("_id") or "") in active_schedule_request_ids
                 request_lookup[str(request_doc.get("_id"))] = self._request_snapshot(request_doc)
 
-        should_auto_complete_elapsed_jobs = role_value in {"guard_admin", "sp_admin"}
+        should_auto_complete_elapsed_jobs = not read_only and role_value in {"guard_admin", "sp_admin"}
         touched_request_ids: set[str] = set()
         if should_auto_complete_elapsed_jobs:
             touched_request_ids = await self._auto_complete_elapsed_assignment_docs(docs, request_lookup, assignment_collection)
@@ -6276,38 +6743,141 @@ class RequestManager:
             await self._sync_request_runtime_state(request_record)
             setattr(request_record, "has_schedule", request_id in active_schedule_request_ids)
             request_lookup[request_id] = self._request_snapshot(request_record)
+        return request_lookup
 
-        normalized_keyword = self._normalize_text(keyword)
-        filtered_docs: List[Dict[str, Any]] = []
-        default_visible_statuses = (
-            {status.value for status in DEFAULT_GUARD_PROVIDER_JOB_STATUSES}
-            if not normalized_status and role_value in {"client_admin", "guard_admin", "sp_admin"}
-            else None
-        )
-        for doc in docs:
-            if normalized_status and self._enum_value(doc.get("assignment_status")) != normalized_status:
-                continue
-            if default_visible_statuses is not None and self._enum_value(doc.get("assignment_status")) not in default_visible_statuses:
-                continue
-            if str(doc.get("request_id") or "") not in request_lookup:
-                continue
-            request_snapshot = request_lookup.get(str(doc.get("request_id")), {})
-            searchable_text = " ".join([
-                self._normalize_text(request_snapshot.get("title")),
-                self._normalize_text(request_snapshot.get("site_name")),
-                self._normalize_text((doc.get("candidate_snapshot") or {}).get("candidate_name")),
-            ])
-            if normalized_keyword and normalized_keyword not in searchable_text:
-                continue
-            filtered_docs.append(doc)
+    def _job_doc_matches(
+        self,
+        doc: Dict[str, Any],
+        request_lookup: Dict[str, Dict[str, Any]],
+        *,
+        normalized_status: str,
+        default_visible_statuses: Optional[set[str]],
+        normalized_keyword: str,
+    ) -> bool:
+        if normalized_status and self._enum_value(doc.get("assignment_status")) != normalized_status:
+            return False
+        if default_visible_statuses is not None and self._enum_value(doc.get("assignment_status")) not in default_visible_statuses:
+            return False
+        if str(doc.get("request_id") or "") not in request_lookup:
+            return False
+        request_snapshot = request_lookup.get(str(doc.get("request_id")), {})
+        searchable_text = " ".join([
+            self._normalize_text(request_snapshot.get("title")),
+            self._normalize_text(request_snapshot.get("site_name")),
+            self._normalize_text((doc.get("candidate_snapshot") or {}).get("candidate_name")),
+        ])
+        if normalized_keyword and normalized_keyword not in searchable_text:
+            return False
+        return True
+
+    async def _list_jobs_cursor_page(
+        self,
+        query: Dict[str, Any],
+        cursor: str,
+        rows: int,
+        role_value: str,
+        assignment_collection,
+        **match_filters: Any,
+    ) -> tuple[List[Dict[str, Any]], Optional[str], Dict[str, Dict[str, Any]]]:
+        # Visibility depends on the joined request, so scan keyset batches until one row past the page matches.
+        # The scan is capped and read-only; elapsed-job completion and runtime sync stay on the write paths.
+        scan_after = decode_cursor(cursor) if cursor else None
+        batch_size = max(rows * 2, 50)
+        page_docs: List[Dict[str, Any]] = []
+        page_keys: List[tuple[Optional[datetime], Any]] = []
+        request_lookup: Dict[str, Dict[str, Any]] = {}
+        for _ in range(JOBS_CURSOR_MAX_SCAN_BATCHES):
+            batch_query = query if scan_after is None else {"$and": [query, keyset_after("updated_at", scan_after[0], scan_after[1], -1)]}
+            batch = await (
+                assignment_collection.find(batch_query)
+                .sort([("updated_at", -1), ("_id", -1)])
+                .limit(batch_size)
+                .to_list(length=batch_size)
+            )
+            if not batch:
+                return page_docs, None, request_lookup
+            batch_keys = [(doc.get("updated_at"), doc.get("_id")) for doc in batch]
+            scan_after = batch_keys[-1]
+            request_lookup.update(await self._job_request_lookup(batch, role_value, assignment_collection, read_only=True))
+            for doc, doc_key in zip(batch, batch_keys):
+                if not self._job_doc_matches(doc, request_lookup, **match_filters):
+                    continue
+                if len(page_docs) == rows:
+                    return page_docs, encode_cursor(*page_keys[-1]), request_lookup
+                page_docs.append(doc)
+                page_keys.append(doc_key)
+            if len(batch) < batch_size:
+                return page_docs, None, request_lookup
+        # Scan budget spent: hand back a short page that resumes after the last scanned row.
+        return page_docs, encode_cursor(*scan_after), request_lookup
+
+    async def list_jobs(
+        self,
+        current_user,
+        page: int = 1,
+        rows: int = 20,
+        assignment_status: str = "",
+        keyword: str = "",
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        role_value = self._role_value(current_user)
+        assignment_collection = self._engine.get_collection(RequestAssignmentRecord)
+
+        if self._is_platform_role(role_value):
+            query: Dict[str, Any] = {}
+            session_tenant = None
+        else:
+            session_tenant = await self._get_session_tenant(current_user)
+
+        if role_value == "client_admin" and session_tenant and session_tenant.tenant_type == TenantType.CLIENT:
+            query = {"client_tenant_id": str(session_tenant.id)}
+        elif role_value in {"guard_admin", "sp_admin"} and session_tenant and session_tenant.tenant_type in {TenantType.GUARD, TenantType.SERVICE_PROVIDER}:
+            query = {"assignee_tenant_id": str(session_tenant.id)}
+        elif not self._is_platform_role(role_value):
+            raise HTTPException(status_code=403, detail="Access forbidden")
+
+        normalized_status = self._normalize_text(assignment_status)
+        if normalized_status:
+            query["assignment_status"] = normalized_status
+
+        match_filters = {
+            "normalized_status": normalized_status,
+            "default_visible_statuses": (
+                {status.value for status in DEFAULT_GUARD_PROVIDER_JOB_STATUSES}
+                if not normalized_status and role_value in {"client_admin", "guard_admin", "sp_admin"}
+                else None
+            ),
+            "normalized_keyword": self._normalize_text(keyword),
+        }
 
         safe_rows = rows if rows and rows > 0 else 20
         safe_page = page if page and page > 0 else 1
-        total_items = len(filtered_docs)
-        total_pages = (total_items + safe_rows - 1) // safe_rows if total_items > 0 else 0
-        start = (safe_page - 1) * safe_rows
-        end = start + safe_rows
-        page_docs = filtered_docs[start:end]
+        if cursor is not None:
+            page_docs, next_cursor, request_lookup = await self._list_jobs_cursor_page(
+                query,
+                cursor,
+                safe_rows,
+                role_value,
+                assignment_collection,
+                **match_filters,
+            )
+            pagination = cursor_pagination(safe_rows, cursor, next_cursor)
+        else:
+            docs = await assignment_collection.find(query).sort("updated_at", -1).to_list(length=None)
+            request_lookup = await self._job_request_lookup(docs, role_value, assignment_collection)
+            filtered_docs = [doc for doc in docs if self._job_doc_matches(doc, request_lookup, **match_filters)]
+
+            total_items = len(filtered_docs)
+            total_pages = (total_items + safe_rows - 1) // safe_rows if total_items > 0 else 0
+            start = (safe_page - 1) * safe_rows
+            end = start + safe_rows
+            page_docs = filtered_docs[start:end]
+            pagination = {
+                "page": safe_page,
+                "rows": safe_rows,
+                "total_items": total_items,
+                "total_pages": total_pages,
+            }
         await self._attach_assigned_guard_summaries_to_assignment_docs(page_docs)
 
         return {
@@ -6315,12 +6885,7 @@ class RequestManager:
                 self._serialize_assignment(doc, request_snapshot=request_lookup.get(str(doc.get("request_id")), {}))
                 for doc in page_docs
             ],
-            "pagination": {
-                "page": safe_page,
-                "rows": safe_rows,
-                "total_items": total_items,
-                "total_pages": total_pages,
-            },
+            "pagination": pagination,
             "filters": {
                 "assignment_status": assignment_status,
                 "keyword": keyword,
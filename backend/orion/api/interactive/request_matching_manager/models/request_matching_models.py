@@ -15,6 +15,8 @@ ReasonCode = Literal[
     "outside_availability",
     "guard_type_mismatch",
     "insufficient_capacity",
+    "planned_leave_conflict",
+    "managed_profile_incomplete",
 ]
 TargetType = Literal["guard", "service_provider"]
 
@@ -1,8 +1,10 @@
 import math
 import threading
+from bisect import bisect_right
 from datetime import datetime, time, timedelta
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from bson import ObjectId
 
 from orion.api.interactive.request_matching_manager.models.request_matching_models import (
@@ -71,6 +73,9 @@ class RequestMatchingManager:
         "YUKON": "YT",
         "YUKON TERRITORY": "YT",
     }
+    _EARTH_RADIUS_KM = 6371.0
+    # Slack for storage rounding so the Mongo geo bound never drops a guard Python would accept.
+    _GEO_PREFILTER_TOLERANCE_KM = 0.01
     _PROVIDER_COMMITTED_ASSIGNMENT_STATUSES = {
         RequestAssignmentStatus.ACCEPTED.value,
         RequestAssignmentStatus.RECONFIRMATION_REQUIRED.value,
@@ -299,12 +304,51 @@ class RequestMatchingManager:
             merged.append((start_minute, end_minute))
         return merged
 
+    @classmethod
+    def compile_weekly_availability(cls, weekly_availability: Any) -> Dict[str, List[List[int]]]:
+        """Parse ``weekly_availability`` once into sorted, merged minute windows keyed by logical day."""
+        compiled: Dict[str, List[List[int]]] = {}
+        for day_name in cls._WEEKDAY_NAMES:
+            windows = cls._availability_windows_for_day(weekly_availability, day_name)
+            if windows:
+                compiled[day_name] = [[window_start, window_end] for window_start, window_end in windows]
+        return compiled
+
+    @classmethod
+    def _request_availability_segments(cls, start_at: datetime, end_at: datetime) -> List[tuple[str, int, int]]:
+        segments: List[tuple[str, int, int]] = []
+        cursor = start_at
+        while cursor < end_at:
+            segment_day = cls._logical_day_name(cursor)
+            segment_end = min(end_at, cls._next_logical_day_boundary(cursor))
+            start_offset = cls._logical_minutes_since_boundary(cursor)
+            end_offset = cls._logical_minutes_since_boundary(segment_end)
+            if segment_end == end_at and end_offset == 0 and end_at > start_at:
+                end_offset = 24 * 60
+            segments.append((segment_day, start_offset, end_offset))
+            cursor = segment_end
+        return segments
+
+    @staticmethod
+    def _compiled_availability_covers(
+        compiled_availability: Dict[str, List[List[int]]],
+        segments: List[tuple[str, int, int]],
+    ) -> bool:
+        for segment_day, start_offset, end_offset in segments:
+            windows = compiled_availability.get(segment_day) or []
+            # Windows are merged and sorted, so only the last one starting at or before start_offset can cover it.
+            index = bisect_right(windows, [start_offset, math.inf]) - 1
+            if index < 0 or end_offset > windows[index][1]:
+                return False
+        return True
+
     @classmethod
     def _is_request_window_within_weekly_availability(
         cls,
         weekly_availability: Any,
         requested_start_at: Optional[datetime],
         requested_end_at: Optional[datetime],
+        compiled_availability: Optional[Dict[str, List[List[int]]]] = None,
     ) -> bool:
         start_at = cls._normalize_datetime_wall_clock(requested_start_at)
         end_at = cls._normalize_datetime_wall_clock(requested_end_at)
@@ -315,42 +359,42 @@ class RequestMatchingManager:
         if end_at <= start_at:
             return False
 
-        cursor = start_at
-        while cursor < end_at:
-            segment_day = cls._logical_day_name(cursor)
-            segment_end = min(end_at, cls._next_logical_day_boundary(cursor))
-            start_offset = cls._logical_minutes_since_boundary(cursor)
-            end_offset = cls._logical_minutes_since_boundary(segment_end)
-            if segment_end == end_at and end_offset == 0 and end_at > start_at:
-                end_offset = 24 * 60
-            windows = cls._availability_windows_for_day(weekly_availability, segment_day)
-            if not any(window_start <= start_offset and end_offset <= window_end for window_start, window_end in windows):
-                return False
-            cursor = segment_end
-
-        return True
+        if not isinstance(compiled_availability, dict):
+            compiled_availability = cls.compile_weekly_availability(weekly_availability)
+        return cls._compiled_availability_covers(
+            compiled_availability,
+            cls._request_availability_segments(start_at, end_at),
+        )
 
     async def _approved_planned_leave_guard_ids(
         self,
-        guard_tenant_ids: List[str],
+        guard_tenant_ids: Optional[List[str]],
         *,
         requested_start_at: Optional[datetime],
         requested_end_at: Optional[datetime],
     ) -> set[str]:
-        normalized_guard_ids = [
-            str(guard_tenant_id or "").strip()
-            for guard_tenant_id in guard_tenant_ids
-            if str(guard_tenant_id or "").strip()
-        ]
-        if not normalized_guard_ids:
-            return set()
-        if self._normalize_datetime_wall_clock(requested_start_at) is None or self._normalize_datetime_wall_clock(requested_end_at) is None:
+        """Guards with approved leave overlapping the window; ``guard_tenant_ids=None`` checks every guard."""
+        leave_query: Dict[str, Any] = {}
+        if guard_tenant_ids is not None:
+            normalized_guard_ids = [
+                str(guard_tenant_id or "").strip()
+                for guard_tenant_id in guard_tenant_ids
+                if str(guard_tenant_id or "").strip()
+            ]
+            if not normalized_guard_ids:
+                return set()
+            leave_query["guard_tenant_id"] = {"$in": sorted(set(normalized_guard_ids))}
+        normalized_start_at = self._normalize_datetime_wall_clock(requested_start_at)
+        normalized_end_at = self._normalize_datetime_wall_clock(requested_end_at)
+        if normalized_start_at is None or normalized_end_at is None:
             return set()
 
         leave_collection = self._engine.get_collection(GuardPlannedLeaveRecord)
         leave_docs = await leave_collection.find({
-            "guard_tenant_id": {"$in": normalized_guard_ids},
+            **leave_query,
             "request_status": GuardPlannedLeaveStatus.APPROVED.value,
+            "start_at_utc": {"$lt": normalized_end_at},
+            "end_at_utc": {"$gt": normalized_start_at},
         }).to_list(length=None)
 
         overlapping_guard_ids: set[str] = set()
@@ -369,7 +413,7 @@ class RequestMatchingManager:
 
     @staticmethod
     def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-        earth_radius_km = 6371.0
+        earth_radius_km = RequestMatchingManager._EARTH_RADIUS_KM
         phi1 = math.radians(lat1)
         phi2 = math.radians(lat2)
         delta_phi = math.radians(lat2 - lat1)
@@ -382,6 +426,108 @@ class RequestMatchingManager:
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         return earth_radius_km * c
 
+    @staticmethod
+    def _haversine_km_batch(lat1: np.ndarray, lon1: np.ndarray, lat2: float, lon2: float) -> np.ndarray:
+        phi1 = np.radians(lat1)
+        phi2 = math.radians(lat2)
+        delta_phi = np.radians(lat2 - lat1)
+        delta_lambda = np.radians(lon2 - lon1)
+
+        a = (
+            np.sin(delta_phi / 2) ** 2
+            + np.cos(phi1) * math.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+        )
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        return RequestMatchingManager._EARTH_RADIUS_KM * c
+
+    @classmethod
+    def _geo_coordinates(cls, latitude: Any, longitude: Any) -> Optional[List[float]]:
+        lat = cls._as_float(latitude)
+        lon = cls._as_float(longitude)
+        if lat is None or lon is None:
+            return None
+        if not (-90.0 <= lat <= 90.0) or not (-180.0 <= lon <= 180.0):
+            return None
+        return [lon, lat]
+
+    @classmethod
+    def build_match_index(cls, tenant_type: Any, ownership_type: Any, profile: Any) -> Dict[str, Any]:
+        """Derive the persisted prefilter fields (region codes, GeoJSON anchor, radius) for a tenant."""
+        match_index: Dict[str, Any] = {
+            "match_region_codes": [],
+            "match_geo_point": None,
+            "match_radius_km": None,
+            "match_availability_windows": None,
+        }
+        if not isinstance(profile, dict):
+            return match_index
+
+        normalized_type = str(getattr(tenant_type, "value", tenant_type) or "").strip().lower()
+        if normalized_type == TenantType.GUARD.value:
+            normalized_ownership = str(getattr(ownership_type, "value", ownership_type) or "").strip().lower()
+            is_provider_owned = normalized_ownership == GuardOwnershipType.SERVICE_PROVIDER.value
+            home_address = profile.get("home_address") if isinstance(profile.get("home_address"), dict) else {}
+            home_country = cls._normalize_country_code(home_address.get("country") or "CA")
+            region_code = cls._normalize_region_code(
+                profile.get("operational_region_code") if is_provider_owned else (profile.get("operational_region_code") or home_address.get("province")),
+                home_country,
+            )
+            coordinates = cls._geo_coordinates(home_address.get("latitude"), home_address.get("longitude"))
+            match_index["match_region_codes"] = [region_code] if region_code else []
+            match_index["match_geo_point"] = {"type": "Point", "coordinates": coordinates} if coordinates else None
+            match_index["match_radius_km"] = cls._as_float(profile.get("max_travel_radius_km"))
+            match_index["match_availability_windows"] = cls.compile_weekly_availability(profile.get("weekly_availability"))
+            return match_index
+
+        if normalized_type != TenantType.SERVICE_PROVIDER.value:
+            return match_index
+
+        head_office = profile.get("head_office_address") if isinstance(profile.get("head_office_address"), dict) else {}
+        operating_regions = profile.get("operating_regions") if isinstance(profile.get("operating_regions"), list) else []
+        if not operating_regions:
+            operating_regions = [{
+                "province": head_office.get("province"),
+                "latitude": head_office.get("latitude"),
+                "longitude": head_office.get("longitude"),
+            }]
+
+        region_codes: List[str] = []
+        points: List[List[float]] = []
+        for region in operating_regions:
+            if not isinstance(region, dict):
+                continue
+            region_country = cls._normalize_country_code(region.get("country") or "CA")
+            region_code = cls._normalize_region_code(region.get("region_code") or region.get("province"), region_country)
+            if region_code and region_code not in region_codes:
+                region_codes.append(region_code)
+            sources = [entry for entry in region.get("city_entries") or [] if isinstance(entry, dict)] or [region]
+            for source in sources:
+                coordinates = cls._geo_coordinates(source.get("latitude"), source.get("longitude"))
+                if coordinates and coordinates not in points:
+                    points.append(coordinates)
+
+        if not points:
+            coordinates = cls._geo_coordinates(head_office.get("latitude"), head_office.get("longitude"))
+            if coordinates:
+                points.append(coordinates)
+
+        match_index["match_region_codes"] = region_codes
+        match_index["match_geo_point"] = {"type": "MultiPoint", "coordinates": points} if points else None
+        return match_index
+
+    @classmethod
+    def apply_match_index(cls, tenant: db_tenant_model) -> db_tenant_model:
+        match_index = cls.build_match_index(
+            getattr(tenant, "tenant_type", None),
+            getattr(tenant, "ownership_type", None),
+            getattr(tenant, "profile", None),
+        )
+        tenant.match_region_codes = match_index["match_region_codes"]
+        tenant.match_geo_point = match_index["match_geo_point"]
+        tenant.match_radius_km = match_index["match_radius_km"]
+        tenant.match_availability_windows = match_index["match_availability_windows"]
+        return tenant
+
     def _candidate_from_guard(
         self,
         tenant_id: str,
@@ -392,6 +538,7 @@ class RequestMatchingManager:
         allow_provider_owned: bool = False,
         provider_operating_regions: Optional[List[Dict[str, Any]]] = None,
         planned_leave_guard_ids: Optional[set[str]] = None,
+        availability_windows: Optional[Dict[str, List[List[int]]]] = None,
     ) -> RequestMatchCandidate:
         request_address = payload.site_address
         request_country = self._normalize_country_code(request_address.country)
@@ -458,6 +605,7 @@ class RequestMatchingManager:
             profile.get("weekly_availability"),
             payload.requested_start_at,
             payload.requested_end_at,
+            availability_windows,
         ):
             candidate.reason_code = "outside_availability"
             candidate.distance_source = "province_fallback"
@@ -518,12 +666,156 @@ class RequestMatchingManager:
 
         return candidate
 
-    async def _provider_guard_capacity_from_tenants(
+    def _score_guard_candidates(
+        self,
+        tenants: List[Any],
+        payload: RequestMatchingPreviewPayload,
+        *,
+        planned_leave_guard_ids: Optional[set[str]] = None,
+    ) -> List[RequestMatchCandidate]:
+        """Batch form of ``_candidate_from_guard`` (provider-owned excluded); returns candidates already ordered."""
+        request_address = payload.site_address
+        request_country = self._normalize_country_code(request_address.country)
+        request_province = self._normalize_region_code(request_address.province, request_country)
+        requested_guard_type = self._normalize_text(payload.requested_guard_type)
+        req_lat = self._as_float(request_address.latitude)
+        req_lon = self._as_float(request_address.longitude)
+        missing_geo_eligible = bool(payload.fallback_to_province_when_missing_geo)
+        leave_guard_ids = planned_leave_guard_ids or set()
+        request_start_at = self._normalize_datetime_wall_clock(payload.requested_start_at)
+        request_end_at = self._normalize_datetime_wall_clock(payload.requested_end_at)
+        # None: no requested window, so availability is unconstrained; []: inverted window, never available.
+        request_segments = (
+            None
+            if request_start_at is None or request_end_at is None
+            else self._request_availability_segments(request_start_at, request_end_at)
+        )
+        compiled_by_key: Dict[str, Dict[str, List[List[int]]]] = {}
+
+        rows: List[Dict[str, Any]] = []
+        pending_rows: List[int] = []
+        pending_lat: List[float] = []
+        pending_lon: List[float] = []
+
+        for tenant in tenants:
+            tenant_id = str(getattr(tenant, "id", "") or "")
+            profile = tenant.profile if isinstance(getattr(tenant, "profile", None), dict) else {}
+            ownership_type = getattr(tenant, "ownership_type", None)
+            is_provider_owned = str(getattr(ownership_type, "value", ownership_type) or "").strip().lower() == GuardOwnershipType.SERVICE_PROVIDER.value
+            home_address = profile.get("home_address") if isinstance(profile.get("home_address"), dict) else {}
+            home_country = self._normalize_country_code(home_address.get("country") or request_country)
+            max_radius_km = self._as_float(profile.get("max_travel_radius_km"))
+            row: Dict[str, Any] = {
+                "candidate_id": tenant_id,
+                "candidate_name": self._extract_tenant_name(profile, tenant_id),
+                "province": self._normalize_region_code(
+                    profile.get("operational_region_code") if is_provider_owned else (profile.get("operational_region_code") or home_address.get("province")),
+                    home_country,
+                ),
+                "city": self._first_non_empty_string(
+                    [profile.get("operational_city_code")] if is_provider_owned else [profile.get("operational_city_code"), home_address.get("city")]
+                ),
+                "eligible": False,
+                "reason_code": "province_mismatch",
+                "distance_source": "province_fallback",
+                "distance_km": None,
+                "distance_mi": None,
+                "radius_km": max_radius_km,
+            }
+            rows.append(row)
+
+            if is_provider_owned:
+                row["reason_code"] = "ownership_excluded"
+                continue
+            if request_province and row["province"] != request_province:
+                continue
+            if requested_guard_type and requested_guard_type not in self._normalized_text_set(profile.get("preferred_guard_types")):
+                row["reason_code"] = "guard_type_mismatch"
+                continue
+            if tenant_id in leave_guard_ids:
+                row["reason_code"] = "planned_leave_conflict"
+                continue
+
+            if request_segments is not None:
+                compiled_availability = getattr(tenant, "match_availability_windows", None)
+                if not isinstance(compiled_availability, dict):
+                    # Tenant saved before availability was compiled; parse once per distinct schedule.
+                    weekly_availability = profile.get("weekly_availability")
+                    availability_key = repr(weekly_availability)
+                    if availability_key not in compiled_by_key:
+                        compiled_by_key[availability_key] = self.compile_weekly_availability(weekly_availability)
+                    compiled_availability = compiled_by_key[availability_key]
+                if not request_segments or not self._compiled_availability_covers(compiled_availability, request_segments):
+                    row["reason_code"] = "outside_availability"
+                    continue
+
+            if max_radius_km is None:
+                row["eligible"] = True
+                row["reason_code"] = "within_radius"
+                continue
+
+            lat = self._as_float(home_address.get("latitude"))
+            lon = self._as_float(home_address.get("longitude"))
+            if None in [lat, lon, req_lat, req_lon]:
+                row["reason_code"] = "missing_geo"
+                row["eligible"] = missing_geo_eligible
+                continue
+
+            pending_rows.append(len(rows) - 1)
+            pending_lat.append(lat)
+            pending_lon.append(lon)
+
+        if not rows:
+            return []
+
+        distance_km = np.full(len(rows), np.nan, dtype=np.float64)
+        if pending_rows:
+            pending_index = np.asarray(pending_rows, dtype=np.int64)
+            raw_distance_km = self._haversine_km_batch(
+                np.asarray(pending_lat, dtype=np.float64),
+                np.asarray(pending_lon, dtype=np.float64),
+                req_lat,
+                req_lon,
+            )
+            # Python's round() so stored distances match the per-candidate path bit for bit.
+            distance_km[pending_index] = [normalize_km_for_storage(value) for value in raw_distance_km.tolist()]
+            radius_km = np.asarray([rows[index]["radius_km"] for index in pending_rows], dtype=np.float64)
+            within_radius = distance_km[pending_index] <= radius_km
+            for index, distance_value, is_within in zip(pending_rows, distance_km[pending_index].tolist(), within_radius.tolist()):
+                row = rows[index]
+                row["distance_km"] = distance_value
+                row["distance_mi"] = km_to_miles(distance_value)
+                row["distance_source"] = "haversine"
+                row["eligible"] = is_within
+                row["reason_code"] = "within_radius" if is_within else "outside_radius"
+
+        eligible_flags = np.asarray([row["eligible"] for row in rows], dtype=bool)
+        order = np.lexsort((
+            np.asarray([row["candidate_name"].lower() for row in rows], dtype=str),
+            np.where(np.isnan(distance_km), 999999.0, distance_km),
+            ~eligible_flags,
+        ))
+
+        candidates: List[RequestMatchCandidate] = []
+        for index in order.tolist():
+            row = rows[index]
+            max_radius_km = row.pop("radius_km")
+            candidates.append(RequestMatchCandidate(
+                target_type="guard",
+                radius_km=normalize_km_for_storage(max_radius_km) if max_radius_km is not None else None,
+                radius_mi=km_to_miles(max_radius_km) if max_radius_km is not None else None,
+                **row,
+            ))
+        return candidates
+
+    def _provider_guard_capacity(
         self,
         provider_tenant_id: str,
         provider_profile: Dict[str, Any],
         guards: List[db_tenant_model],
         payload: RequestMatchingPreviewPayload,
+        *,
+        planned_leave_guard_ids: set[str],
         reserved_guard_count: int = 0,
     ) -> Dict[str, int]:
         normalized_provider_id = str(provider_tenant_id or "").strip()
@@ -532,16 +824,7 @@ class RequestMatchingManager:
             if isinstance(provider_profile.get("operating_regions"), list)
             else []
         )
-        linked_guards = [
-            guard
-            for guard in guards
-            if str(getattr(guard, "service_provider_tenant_id", "") or "").strip() == normalized_provider_id
-        ]
-        planned_leave_guard_ids = await self._approved_planned_leave_guard_ids(
-            [str(getattr(guard, "id", "") or "").strip() for guard in linked_guards],
-            requested_start_at=payload.requested_start_at,
-            requested_end_at=payload.requested_end_at,
-        )
+        linked_guards = self._linked_provider_guards(normalized_provider_id, guards)
 
         eligible_guard_count = 0
         for guard in linked_guards:
@@ -554,6 +837,7 @@ class RequestMatchingManager:
                 allow_provider_owned=True,
                 provider_operating_regions=provider_operating_regions,
                 planned_leave_guard_ids=planned_leave_guard_ids,
+                availability_windows=getattr(guard, "match_availability_windows", None),
             )
             if candidate.eligible:
                 eligible_guard_count += 1
@@ -568,58 +852,124 @@ class RequestMatchingManager:
             "available_guard_count": available_guard_count,
         }
 
-    async def _provider_reserved_capacity_by_provider(
+    @staticmethod
+    def _linked_provider_guards(provider_tenant_id: str, guards: List[db_tenant_model]) -> List[db_tenant_model]:
+        return [
+            guard
+            for guard in guards
+            if str(getattr(guard, "service_provider_tenant_id", "") or "").strip() == provider_tenant_id
+        ]
+
+    async def _provider_guard_capacity_from_tenants(
         self,
+        provider_tenant_id: str,
+        provider_profile: Dict[str, Any],
+        guards: List[db_tenant_model],
         payload: RequestMatchingPreviewPayload,
+        reserved_guard_count: int = 0,
     ) -> Dict[str, int]:
-        if payload.requested_start_at is None or payload.requested_end_at is None:
-            return {}
+        capacities = await self._provider_guard_capacities(
+            [(provider_tenant_id, provider_profile)],
+            {str(provider_tenant_id or "").strip(): guards},
+            payload,
+            {str(provider_tenant_id or "").strip(): reserved_guard_count},
+        )
+        return capacities[str(provider_tenant_id or "").strip()]
 
-        assignment_collection = self._engine.get_collection(RequestAssignmentRecord)
-        assignment_docs = await assignment_collection.find({
-            "assignee_tenant_type": "service_provider",
-            "assignment_scope": RequestAssignmentScope.REQUEST.value,
-            "assignment_status": {"$in": sorted(self._PROVIDER_COMMITTED_ASSIGNMENT_STATUSES)},
-        }).to_list(length=None)
+    async def _provider_guard_capacities(
+        self,
+        providers: List[tuple[str, Dict[str, Any]]],
+        guards_by_provider_id: Dict[str, List[db_tenant_model]],
+        payload: RequestMatchingPreviewPayload,
+        reserved_capacity_by_provider_id: Dict[str, int],
+    ) -> Dict[str, Dict[str, int]]:
+        """Capacity for many providers with a single planned-leave query across all of their linked guards."""
+        linked_guard_ids: List[str] = []
+        for provider_tenant_id, _ in providers:
+            normalized_provider_id = str(provider_tenant_id or "").strip()
+            for guard in self._linked_provider_guards(normalized_provider_id, guards_by_provider_id.get(normalized_provider_id, [])):
+                linked_guard_ids.append(str(getattr(guard, "id", "") or "").strip())
+
+        planned_leave_guard_ids = await self._approved_planned_leave_guard_ids(
+            linked_guard_ids,
+            requested_start_at=payload.requested_start_at,
+            requested_end_at=payload.requested_end_at,
+        )
+
+        capacities: Dict[str, Dict[str, int]] = {}
+        for provider_tenant_id, provider_profile in providers:
+            normalized_provider_id = str(provider_tenant_id or "").strip()
+            capacities[normalized_provider_id] = self._provider_guard_capacity(
+                normalized_provider_id,
+                provider_profile,
+                guards_by_provider_id.get(normalized_provider_id, []),
+                payload,
+                planned_leave_guard_ids=planned_leave_guard_ids,
+                reserved_guard_count=reserved_capacity_by_provider_id.get(normalized_provider_id, 0),
+            )
+        return capacities
+
+    def _provider_reserved_capacity_pipeline(
+        self,
+        requested_start_at: datetime,
+        requested_end_at: datetime,
+    ) -> List[Dict[str, Any]]:
+        assignment_collection_name = self._engine.get_collection(RequestAssignmentRecord).name
+        return [
+            # Only requests whose window overlaps the preview window; served by request_window_overlap.
+            {"$match": {
+                "requested_start_at": {"$lt": requested_end_at},
+                "requested_end_at": {"$gt": requested_start_at},
+                "$expr": {"$gt": ["$requested_end_at", "$requested_start_at"]},
+            }},
+            {"$project": {"_id": 0, "request_id": {"$toString": "$_id"}}},
+            {"$lookup": {
+                "from": assignment_collection_name,
+                "localField": "request_id",
+                "foreignField": "request_id",
+                "pipeline": [
+                    {"$match": {
+                        "assignee_tenant_type": "service_provider",
+                        "assignment_scope": RequestAssignmentScope.REQUEST.value,
+                        "assignment_status": {"$in": sorted(self._PROVIDER_COMMITTED_ASSIGNMENT_STATUSES)},
+                        "assignee_tenant_id": {"$nin": [None, ""]},
+                    }},
+                    {"$project": {"_id": 0, "assignee_tenant_id": 1, "slots_committed": 1}},
+                ],
+                "as": "assignments",
+            }},
+            {"$unwind": "$assignments"},
+            {"$group": {
+                "_id": "$assignments.assignee_tenant_id",
+                "reserved_slots": {"$sum": {"$cond": [
+                    {"$in": [{"$ifNull": ["$assignments.slots_committed", 0]}, [0]]},
+                    1,
+                    "$assignments.slots_committed",
+                ]}},
+            }},
+        ]
 
-        request_ids = []
-        for assignment_doc in assignment_docs:
-            request_id = str(assignment_doc.get("request_id") or "").strip()
-            if ObjectId.is_valid(request_id):
-                request_ids.append(ObjectId(request_id))
-        if not request_ids:
+    async def _provider_reserved_capacity_by_provider(
+        self,
+        payload: RequestMatchingPreviewPayload,
+    ) -> Dict[str, int]:
+        requested_start_at = self._normalize_datetime_wall_clock(payload.requested_start_at)
+        requested_end_at = self._normalize_datetime_wall_clock(payload.requested_end_at)
+        if requested_start_at is None or requested_end_at is None or requested_end_at <= requested_start_at:
             return {}
 
         request_collection = self._engine.get_collection(ClientRequestRecord)
-        request_docs = await request_collection.find({"_id": {"$in": request_ids}}).to_list(length=None)
-        request_windows: Dict[str, tuple[Optional[datetime], Optional[datetime]]] = {}
-        for request_doc in request_docs:
-            request_id = str(request_doc.get("_id") or "").strip()
-            if not request_id:
-                continue
-            request_windows[request_id] = (
-                request_doc.get("requested_start_at"),
-                request_doc.get("requested_end_at"),
-            )
+        rows = await request_collection.aggregate(
+            self._provider_reserved_capacity_pipeline(requested_start_at, requested_end_at)
+        ).to_list(length=None)
 
         reserved_slots_by_provider: Dict[str, int] = {}
-        for assignment_doc in assignment_docs:
-            provider_id = str(assignment_doc.get("assignee_tenant_id") or "").strip()
-            request_id = str(assignment_doc.get("request_id") or "").strip()
-            if not provider_id or not request_id:
-                continue
-            request_window = request_windows.get(request_id)
-            if not request_window:
-                continue
-            if not self._windows_overlap(
-                payload.requested_start_at,
-                payload.requested_end_at,
-                request_window[0],
-                request_window[1],
-            ):
+        for row in rows:
+            provider_id = str(row.get("_id") or "").strip()
+            if not provider_id:
                 continue
             reserved_slots_by_provider[provider_id] = reserved_slots_by_provider.get(provider_id, 0) + int(
-                assignment_doc.get("slots_committed") or 1
+                row.get("reserved_slots") or 0
             )
 
         return reserved_slots_by_provider
@@ -811,55 +1161,20 @@ class RequestMatchingManager:
 
         return candidate
 
-    async def preview_matches(self, payload: RequestMatchingPreviewPayload) -> RequestMatchingPreviewResult:
-        target_type = payload.target_type
-        requested_type = TenantType.GUARD if target_type == "guard" else TenantType.SERVICE_PROVIDER
-
-        tenants = await self._engine.find(
-            db_tenant_model,
-            (db_tenant_model.tenant_type == requested_type)
-            & (db_tenant_model.status == TenantStatus.ACTIVE),
-        )
-
+    async def _score_provider_candidates(
+        self,
+        tenants: List[db_tenant_model],
+        payload: RequestMatchingPreviewPayload,
+        *,
+        provider_guards_by_provider_id: Dict[str, List[db_tenant_model]],
+        provider_reserved_capacity_by_provider_id: Dict[str, int],
+    ) -> List[RequestMatchCandidate]:
         results: List[RequestMatchCandidate] = []
-        provider_guards_by_provider_id: Dict[str, List[db_tenant_model]] = {}
-        provider_reserved_capacity_by_provider_id: Dict[str, int] = {}
-        planned_leave_guard_ids: set[str] = set()
-
-        if target_type == "service_provider":
-            provider_guards = await self._engine.find(
-                db_tenant_model,
-                (db_tenant_model.tenant_type == TenantType.GUARD)
-                & (db_tenant_model.status == TenantStatus.ACTIVE)
-                & (db_tenant_model.ownership_type == GuardOwnershipType.SERVICE_PROVIDER),
-            )
-            for guard in provider_guards:
-                provider_id = str(getattr(guard, "service_provider_tenant_id", "") or "").strip()
-                if not provider_id:
-                    continue
-                provider_guards_by_provider_id.setdefault(provider_id, []).append(guard)
-            provider_reserved_capacity_by_provider_id = await self._provider_reserved_capacity_by_provider(payload)
-        else:
-            planned_leave_guard_ids = await self._approved_planned_leave_guard_ids(
-                [str(getattr(tenant, "id", "") or "").strip() for tenant in tenants],
-                requested_start_at=payload.requested_start_at,
-                requested_end_at=payload.requested_end_at,
-            )
-
+        capacity_providers: List[tuple[str, Dict[str, Any]]] = []
         for tenant in tenants:
             tenant_id = str(tenant.id)
             profile = tenant.profile if isinstance(tenant.profile, dict) else {}
 
-            if target_type == "guard":
-                results.append(self._candidate_from_guard(
-                    tenant_id,
-                    getattr(tenant, "ownership_type", None),
-                    profile,
-                    payload,
-                    planned_leave_guard_ids=planned_leave_guard_ids,
-                ))
-                continue
-
             operating_regions = profile.get("operating_regions") if isinstance(profile.get("operating_regions"), list) else []
             if not operating_regions:
                 empty_region = {
@@ -897,30 +1212,241 @@ class RequestMatchingManager:
 
             if best_candidate is not None:
                 if best_candidate.eligible:
-                    provider_capacity = await self._provider_guard_capacity_from_tenants(
-                        tenant_id,
-                        profile,
-                        provider_guards_by_provider_id.get(tenant_id, []),
-                        payload,
-                        reserved_guard_count=provider_reserved_capacity_by_provider_id.get(tenant_id, 0),
-                    )
-                    best_candidate.linked_guard_count = provider_capacity["linked_guard_count"]
-                    best_candidate.eligible_guard_count = provider_capacity["eligible_guard_count"]
-                    best_candidate.reserved_guard_count = provider_capacity["reserved_guard_count"]
-                    best_candidate.available_guard_count = provider_capacity["available_guard_count"]
-                    if provider_capacity["available_guard_count"] <= 0:
-                        best_candidate.eligible = False
-                        best_candidate.reason_code = "insufficient_capacity"
+                    capacity_providers.append((tenant_id, profile))
                 results.append(best_candidate)
 
-        results.sort(
-            key=lambda item: (
-                0 if item.eligible else 1,
-                item.distance_km if item.distance_km is not None else 999999,
-                item.candidate_name.lower(),
+        if capacity_providers:
+            capacities = await self._provider_guard_capacities(
+                capacity_providers,
+                provider_guards_by_provider_id,
+                payload,
+                provider_reserved_capacity_by_provider_id,
             )
+            for best_candidate in results:
+                provider_capacity = capacities.get(best_candidate.candidate_id)
+                if provider_capacity is None or not best_candidate.eligible:
+                    continue
+                best_candidate.linked_guard_count = provider_capacity["linked_guard_count"]
+                best_candidate.eligible_guard_count = provider_capacity["eligible_guard_count"]
+                best_candidate.reserved_guard_count = provider_capacity["reserved_guard_count"]
+                best_candidate.available_guard_count = provider_capacity["available_guard_count"]
+                if provider_capacity["available_guard_count"] <= 0:
+                    best_candidate.eligible = False
+                    best_candidate.reason_code = "insufficient_capacity"
+
+        return results
+
+    def _prefilter_scope_expressions(self, requested_type: TenantType, request_province: str) -> Dict[str, Any]:
+        ownership_excluded: Any = False
+        conditions: List[Dict[str, Any]] = []
+        if requested_type == TenantType.GUARD:
+            ownership_excluded = {"$eq": ["$ownership_type", GuardOwnershipType.SERVICE_PROVIDER.value]}
+            conditions.append({"$ne": ["$ownership_type", GuardOwnershipType.SERVICE_PROVIDER.value]})
+        if request_province:
+            conditions.append({"$in": [request_province, {"$ifNull": ["$match_region_codes", []]}]})
+        return {
+            "ownership_excluded": ownership_excluded,
+            "in_scope": {"$and": conditions} if conditions else True,
+        }
+
+    async def _prefilter_counts(self, requested_type: TenantType, request_province: str) -> Dict[str, Any]:
+        expressions = self._prefilter_scope_expressions(requested_type, request_province)
+        tenant_collection = self._engine.get_collection(db_tenant_model)
+        rows = await tenant_collection.aggregate([
+            {"$match": {"tenant_type": requested_type.value, "status": TenantStatus.ACTIVE.value}},
+            {"$group": {
+                "_id": None,
+                "total_count": {"$sum": 1},
+                "ownership_excluded_count": {"$sum": {"$cond": [expressions["ownership_excluded"], 1, 0]}},
+                "in_scope_count": {"$sum": {"$cond": [expressions["in_scope"], 1, 0]}},
+                "max_radius_km": {"$max": {"$cond": [expressions["in_scope"], "$match_radius_km", None]}},
+            }},
+        ]).to_list(length=1)
+        return dict(rows[0]) if rows else {}
+
+    def _prefilter_query(
+        self,
+        requested_type: TenantType,
+        request_province: str,
+        payload: RequestMatchingPreviewPayload,
+        max_radius_km: Optional[float],
+    ) -> Dict[str, Any]:
+        query: Dict[str, Any] = {}
+        if requested_type == TenantType.GUARD:
+            query["ownership_type"] = {"$ne": GuardOwnershipType.SERVICE_PROVIDER.value}
+        if request_province:
+            query["match_region_codes"] = request_province
+
+        req_lat = self._as_float(payload.site_address.latitude)
+        req_lon = self._as_float(payload.site_address.longitude)
+        if requested_type == TenantType.GUARD and req_lat is not None and req_lon is not None and max_radius_km is not None:
+            # Guards without an anchor or radius still need per-candidate evaluation (missing_geo / unconstrained).
+            bound_radians = (max_radius_km + self._GEO_PREFILTER_TOLERANCE_KM) / self._EARTH_RADIUS_KM
+            query["$or"] = [
+                {"match_geo_point": None},
+                {"match_radius_km": None},
+                {"match_geo_point": {"$geoWithin": {"$centerSphere": [[req_lon, req_lat], bound_radians]}}},
+            ]
+        return query
+
+    def _availability_covers_expression(self, payload: RequestMatchingPreviewPayload) -> Any:
+        """Aggregation form of ``_compiled_availability_covers`` over ``match_availability_windows``."""
+        request_start_at = self._normalize_datetime_wall_clock(payload.requested_start_at)
+        request_end_at = self._normalize_datetime_wall_clock(payload.requested_end_at)
+        if request_start_at is None or request_end_at is None:
+            return True
+        segments = self._request_availability_segments(request_start_at, request_end_at)
+        if not segments:
+            return False
+        # Compiled windows are backfilled for every tenant, so a missing day means no availability that day.
+        return {"$and": [
+            {"$anyElementTrue": [{"$map": {
+                "input": {"$ifNull": [f"$match_availability_windows.{segment_day}", []]},
+                "as": "window",
+                "in": {"$and": [
+                    {"$lte": [{"$arrayElemAt": ["$$window", 0]}, start_offset]},
+                    {"$gte": [{"$arrayElemAt": ["$$window", 1]}, end_offset]},
+                ]},
+            }}]}
+            for segment_day, start_offset, end_offset in segments
+        ]}
+
+    async def _geo_prefiltered_guard_reasons(
+        self,
+        prefilter_query: Dict[str, Any],
+        payload: RequestMatchingPreviewPayload,
+    ) -> Dict[str, int]:
+        """Count guards dropped by the geo bound, by the first reason ``_candidate_from_guard`` would report."""
+        requested_guard_type = self._normalize_text(payload.requested_guard_type)
+        planned_leave_guard_ids = await self._approved_planned_leave_guard_ids(
+            None,
+            requested_start_at=payload.requested_start_at,
+            requested_end_at=payload.requested_end_at,
         )
 
+        branches: List[Dict[str, Any]] = []
+        if requested_guard_type:
+            preferred_guard_types = {"$map": {
+                "input": {"$cond": [
+                    {"$isArray": "$profile.preferred_guard_types"},
+                    "$profile.preferred_guard_types",
+                    [],
+                ]},
+                "as": "guard_type",
+                "in": {"$toUpper": {"$trim": {"input": {"$toString": {"$ifNull": ["$$guard_type", ""]}}}}},
+            }}
+            branches.append({
+                "case": {"$not": [{"$in": [requested_guard_type, preferred_guard_types]}]},
+                "then": "guard_type_mismatch",
+            })
+        if planned_leave_guard_ids:
+            branches.append({
+                "case": {"$in": [{"$toString": "$_id"}, sorted(planned_leave_guard_ids)]},
+                "then": "planned_leave_conflict",
+            })
+        branches.append({
+            "case": {"$not": [self._availability_covers_expression(payload)]},
+            "then": "outside_availability",
+        })
+
+        match_query = {key: value for key, value in prefilter_query.items() if key != "$or"}
+        match_query.update({
+            "tenant_type": TenantType.GUARD.value,
+            "status": TenantStatus.ACTIVE.value,
+            "$nor": prefilter_query["$or"],
+        })
+        tenant_collection = self._engine.get_collection(db_tenant_model)
+        rows = await tenant_collection.aggregate([
+            {"$match": match_query},
+            {"$group": {
+                "_id": {"$switch": {"branches": branches, "default": "outside_radius"}},
+                "count": {"$sum": 1},
+            }},
+        ]).to_list(length=None)
+        return {str(row.get("_id")): int(row.get("count") or 0) for row in rows}
+
+    async def preview_matches(self, payload: RequestMatchingPreviewPayload) -> RequestMatchingPreviewResult:
+        target_type = payload.target_type
+        requested_type = TenantType.GUARD if target_type == "guard" else TenantType.SERVICE_PROVIDER
+        request_country = self._normalize_country_code(payload.site_address.country)
+        request_province = self._normalize_region_code(payload.site_address.province, request_country)
+
+        prefilter_counts = await self._prefilter_counts(requested_type, request_province)
+        prefilter_query = self._prefilter_query(
+            requested_type,
+            request_province,
+            payload,
+            self._as_float(prefilter_counts.get("max_radius_km")),
+        )
+        tenants = await self._engine.find(
+            db_tenant_model,
+            (db_tenant_model.tenant_type == requested_type)
+            & (db_tenant_model.status == TenantStatus.ACTIVE),
+            prefilter_query,
+        )
+
+        # Tenants rejected by the Mongo prefilter are never hydrated; their reason codes come from aggregates:
+        # the scope counts above and, for the geo bound, a grouped count over the guards the bound excluded.
+        prefiltered_counts = {
+            "ownership_excluded": 0,
+            "province_mismatch": 0,
+            "guard_type_mismatch": 0,
+            "planned_leave_conflict": 0,
+            "outside_availability": 0,
+            "outside_radius": 0,
+        }
+        if prefilter_counts:
+            total_count = int(prefilter_counts.get("total_count") or 0)
+            ownership_excluded_count = int(prefilter_counts.get("ownership_excluded_count") or 0)
+            in_scope_count = int(prefilter_counts.get("in_scope_count") or 0)
+            prefiltered_counts["ownership_excluded"] = ownership_excluded_count
+            prefiltered_counts["province_mismatch"] = max(total_count - ownership_excluded_count - in_scope_count, 0)
+        if "$or" in prefilter_query:
+            for reason_code, count in (await self._geo_prefiltered_guard_reasons(prefilter_query, payload)).items():
+                if reason_code in prefiltered_counts:
+                    prefiltered_counts[reason_code] += count
+
+        provider_guards_by_provider_id: Dict[str, List[db_tenant_model]] = {}
+        provider_reserved_capacity_by_provider_id: Dict[str, int] = {}
+
+        if target_type == "service_provider":
+            provider_guards = await self._engine.find(
+                db_tenant_model,
+                (db_tenant_model.tenant_type == TenantType.GUARD)
+                & (db_tenant_model.status == TenantStatus.ACTIVE)
+                & (db_tenant_model.ownership_type == GuardOwnershipType.SERVICE_PROVIDER),
+            )
+            for guard in provider_guards:
+                provider_id = str(getattr(guard, "service_provider_tenant_id", "") or "").strip()
+                if not provider_id:
+                    continue
+                provider_guards_by_provider_id.setdefault(provider_id, []).append(guard)
+            provider_reserved_capacity_by_provider_id = await self._provider_reserved_capacity_by_provider(payload)
+            results = await self._score_provider_candidates(
+                tenants,
+                payload,
+                provider_guards_by_provider_id=provider_guards_by_provider_id,
+                provider_reserved_capacity_by_provider_id=provider_reserved_capacity_by_provider_id,
+            )
+            results.sort(
+                key=lambda item: (
+                    0 if item.eligible else 1,
+                    item.distance_km if item.distance_km is not None else 999999,
+                    item.candidate_name.lower(),
+                )
+            )
+        else:
+            planned_leave_guard_ids = await self._approved_planned_leave_guard_ids(
+                [str(getattr(tenant, "id", "") or "").strip() for tenant in tenants],
+                requested_start_at=payload.requested_start_at,
+                requested_end_at=payload.requested_end_at,
+            )
+            results = self._score_guard_candidates(
+                tenants,
+                payload,
+                planned_leave_guard_ids=planned_leave_guard_ids,
+            )
+
         full_results = list(results)
 
         if len(results) > payload.max_results:
@@ -928,15 +1454,15 @@ class RequestMatchingManager:
 
         summary = {
             "target_type": target_type,
-            "total_candidates": len(full_results),
+            "total_candidates": len(full_results) + sum(prefiltered_counts.values()),
             "eligible_count": len([r for r in full_results if r.eligible]),
-            "ownership_excluded_count": len([r for r in full_results if r.reason_code == "ownership_excluded"]),
-            "planned_leave_conflict_count": len([r for r in full_results if r.reason_code == "planned_leave_conflict"]),
-            "outside_availability_count": len([r for r in full_results if r.reason_code == "outside_availability"]),
-            "outside_radius_count": len([r for r in full_results if r.reason_code == "outside_radius"]),
-            "province_mismatch_count": len([r for r in full_results if r.reason_code == "province_mismatch"]),
+            "ownership_excluded_count": len([r for r in full_results if r.reason_code == "ownership_excluded"]) + prefiltered_counts["ownership_excluded"],
+            "planned_leave_conflict_count": len([r for r in full_results if r.reason_code == "planned_leave_conflict"]) + prefiltered_counts["planned_leave_conflict"],
+            "outside_availability_count": len([r for r in full_results if r.reason_code == "outside_availability"]) + prefiltered_counts["outside_availability"],
+            "outside_radius_count": len([r for r in full_results if r.reason_code == "outside_radius"]) + prefiltered_counts["outside_radius"],
+            "province_mismatch_count": len([r for r in full_results if r.reason_code == "province_mismatch"]) + prefiltered_counts["province_mismatch"],
             "city_mismatch_count": len([r for r in full_results if r.reason_code == "city_mismatch"]),
-            "guard_type_mismatch_count": len([r for r in full_results if r.reason_code == "guard_type_mismatch"]),
+            "guard_type_mismatch_count": len([r for r in full_results if r.reason_code == "guard_type_mismatch"]) + prefiltered_counts["guard_type_mismatch"],
             "insufficient_capacity_count": len([r for r in full_results if r.reason_code == "insufficient_capacity"]),
             "missing_geo_count": len([r for r in full_results if r.reason_code == "missing_geo"]),
             "returned_count": len(results),
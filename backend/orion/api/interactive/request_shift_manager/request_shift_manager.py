@@ -6,9 +6,11 @@ from zoneinfo import ZoneInfo
 
 from bson import ObjectId
 from fastapi import HTTPException
+from pymongo import UpdateOne
 
 from orion.api.interactive.notification_manager.notification_manager import NotificationManager
 from orion.api.interactive.request_manager.request_manager import RequestManager
+from configs.pagination_cursor import cursor_pagination, decode_cursor, encode_cursor, keyset_after
 from orion.services.mongo_manager.mongo_controller import mongo_controller
 from orion.services.mongo_manager.shared_model.db_request_model import (
     AssignmentLockReason,
@@ -129,6 +131,8 @@ _DEFAULT_CHECKIN_GEOFENCE_METERS = 200
 class RequestShiftManager:
     __instance = None
     __lock = threading.Lock()
+    # Last schedule template _id handled by the horizon maintenance pass; None restarts from the beginning.
+    _schedule_generation_resume_after: Optional[ObjectId] = None
 
     @staticmethod
     def get_instance() -> "RequestShiftManager":
@@ -1135,6 +1139,14 @@ class RequestShiftManager:
 
         return tzinfo, start_clock, end_clock, recurrence_days, is_overnight
 
+    @staticmethod
+    def _generation_window(payload: RequestScheduleUpsertPayload, tzinfo: ZoneInfo) -> Tuple[date, date]:
+        today_local = datetime.now(tzinfo).date()
+        generation_start = max(payload.start_date, today_local)
+        effective_end = payload.end_date or payload.start_date
+        generation_end = min(effective_end, generation_start + timedelta(days=max(int(payload.generation_horizon_days or 1) - 1, 0)))
+        return generation_start, generation_end
+
     @classmethod
     def _iter_occurrence_dates(
         cls,
@@ -1142,10 +1154,7 @@ class RequestShiftManager:
         tzinfo: ZoneInfo,
         recurrence_days: List[str],
     ) -> List[date]:
-        today_local = datetime.now(tzinfo).date()
-        generation_start = max(payload.start_date, today_local)
-        effective_end = payload.end_date or payload.start_date
-        generation_end = min(effective_end, generation_start + timedelta(days=max(int(payload.generation_horizon_days or 1) - 1, 0)))
+        generation_start, generation_end = cls._generation_window(payload, tzinfo)
         if generation_end < generation_start:
             return []
 
@@ -1189,10 +1198,13 @@ class RequestShiftManager:
         end_clock: time,
         recurrence_days: List[str],
         is_overnight: bool,
+        generated_after: Optional[date] = None,
     ) -> List[ShiftInstanceRecord]:
         occurrence_dates = self._iter_occurrence_dates(payload, tzinfo, recurrence_days)
         if not occurrence_dates and bool(payload.active):
             raise HTTPException(status_code=400, detail="Schedule must generate at least one upcoming shift in the configured horizon")
+        if generated_after is not None:
+            occurrence_dates = [occurrence_date for occurrence_date in occurrence_dates if occurrence_date > generated_after]
 
         slots_required = max(int(getattr(request_record, "guards_required", 1) or 1), 1)
         instances: List[ShiftInstanceRecord] = []
@@ -1221,6 +1233,7 @@ class RequestShiftManager:
                     slots_completed=0,
                     client_action_required=False,
                     roster_due_at=roster_due_at,
+                    visible_tenant_ids=[request_record.client_tenant_id],
                     created_from_revision=int(getattr(request_record, "request_revision", 0) or 0),
                 )
             )
@@ -1324,6 +1337,7 @@ class RequestShiftManager:
         )
         schedule_record.active = True
         schedule_record.system_generated = True
+        schedule_record.generated_through_date = None
         schedule_record.updated_at = now
         return await self._engine.save(schedule_record)
 
@@ -1357,6 +1371,7 @@ class RequestShiftManager:
             slots_completed=0,
             client_action_required=False,
             roster_due_at=start_at - timedelta(minutes=int(getattr(schedule_record, "roster_due_offset_minutes", 0) or 0)),
+            visible_tenant_ids=[request_record.client_tenant_id],
             created_from_revision=int(getattr(request_record, "request_revision", 0) or 0),
         )
 
@@ -1536,6 +1551,8 @@ class RequestShiftManager:
                 service_provider_tenant_id=spec["service_provider_tenant_id"],
                 assigned_guard_tenant_id=preserved_assigned_guard,
                 slot_status=preserved_status,
+                shift_start_at_utc=shift_record.shift_start_at_utc,
+                shift_date_local=shift_record.shift_date_local,
                 rostered_at=preserved_rostered_at,
                 roster_due_at=spec["roster_due_at"],
                 guard_unavailable_reported_at=preserved_guard_unavailable_reported_at,
@@ -1556,6 +1573,11 @@ class RequestShiftManager:
         for slot in existing_slots:
             slot_key = self._slot_key(getattr(slot, "parent_assignment_id", None), getattr(slot, "coverage_slot_index", 0))
             if getattr(slot, "replacement_of_slot_id", None):
+                if (slot.shift_start_at_utc, slot.shift_date_local) != (shift_record.shift_start_at_utc, shift_record.shift_date_local):
+                    slot.shift_start_at_utc = shift_record.shift_start_at_utc
+                    slot.shift_date_local = shift_record.shift_date_local
+                    slot.updated_at = now
+                    await self._engine.save(slot)
                 continue
             if slot_key in desired_keys:
                 continue
@@ -1564,6 +1586,7 @@ class RequestShiftManager:
         saved_slots = await self._engine.find(ShiftSlotRecord, ShiftSlotRecord.shift_instance_id == str(shift_record.id))
         staffed_slots = len([slot for slot in saved_slots if self._is_staffed_slot_status(getattr(slot, "slot_status", None))])
         shift_record.slots_staffed = staffed_slots
+        shift_record.visible_tenant_ids = self._shift_visible_tenant_ids(shift_record, saved_slots)
         shift_record.updated_at = now
         if shift_record.instance_status in {
             ShiftInstanceStatus.SCHEDULED,
@@ -1589,11 +1612,29 @@ class RequestShiftManager:
             }
         )
 
+    async def _set_shift_slots_dirty(self, request_record: ClientRequestRecord, dirty: bool) -> None:
+        request_record.shift_slots_dirty = dirty
+        request_collection = self._engine.get_collection(ClientRequestRecord)
+        await request_collection.update_one({"_id": request_record.id}, {"$set": {"shift_slots_dirty": dirty}})
+
     async def sync_shift_slots_for_request(self, request_record: ClientRequestRecord | str) -> Dict[str, int]:
         request_manager = RequestManager.get_instance()
         if isinstance(request_record, str):
             request_record = await request_manager._get_request_or_404(request_record)
 
+        # Cleared before reconciling so a change that lands mid-sync marks the request again.
+        was_dirty = bool(getattr(request_record, "shift_slots_dirty", False))
+        if was_dirty:
+            await self._set_shift_slots_dirty(request_record, False)
+        try:
+            return await self._sync_shift_slots_for_request(request_record)
+        except Exception:
+            if was_dirty:
+                await self._set_shift_slots_dirty(request_record, True)
+            raise
+
+    async def _sync_shift_slots_for_request(self, request_record: ClientRequestRecord) -> Dict[str, int]:
+        request_manager = RequestManager.get_instance()
         assignments = await request_manager._get_assignments_for_request(str(request_record.id))
         committed_assignments = [
             assignment for assignment in assignments if getattr(assignment, "assignment_status", None) in _COMMITTED_ASSIGNMENT_STATUSES
@@ -1750,8 +1791,26 @@ class RequestShiftManager:
         await self._engine.save(parent_assignment)
         await request_manager._sync_request_runtime_state(request_record)
 
-    async def _refresh_shift_progress(self, shift_record: ShiftInstanceRecord) -> ShiftInstanceRecord:
-        slots = await self._engine.find(ShiftSlotRecord, ShiftSlotRecord.shift_instance_id == str(shift_record.id))
+    @staticmethod
+    def _shift_visible_tenant_ids(shift_record: ShiftInstanceRecord, slots: List[ShiftSlotRecord]) -> List[str]:
+        if getattr(shift_record, "request_deleted_at", None) is not None:
+            return []
+        tenant_ids = {str(getattr(shift_record, "client_tenant_id", "") or "").strip()}
+        for slot in slots:
+            tenant_ids.add(str(getattr(slot, "coverage_tenant_id", "") or "").strip())
+            tenant_ids.add(str(getattr(slot, "assigned_guard_tenant_id", "") or "").strip())
+        tenant_ids.discard("")
+        return sorted(tenant_ids)
+
+    def _apply_shift_progress(self, shift_record: ShiftInstanceRecord, slots: List[ShiftSlotRecord]) -> bool:
+        previous_state = (
+            shift_record.slots_staffed,
+            shift_record.slots_checked_in,
+            shift_record.slots_completed,
+            shift_record.client_action_required,
+            shift_record.instance_status,
+            list(shift_record.visible_tenant_ids or []),
+        )
         staffed_slots = [slot for slot in slots if self._is_staffed_slot_status(getattr(slot, "slot_status", None))]
         checked_in_slots = [slot for slot in slots if getattr(slot, "arrived_at", None) is not None]
         completed_slots = [slot for slot in slots if getattr(slot, "completed_at", None) is not None]
@@ -1772,7 +1831,20 @@ class RequestShiftManager:
             shift_record.instance_status = ShiftInstanceStatus.PARTIALLY_STAFFED
         else:
             shift_record.instance_status = ShiftInstanceStatus.SCHEDULED
+        shift_record.visible_tenant_ids = self._shift_visible_tenant_ids(shift_record, slots)
+
+        return previous_state != (
+            shift_record.slots_staffed,
+            shift_record.slots_checked_in,
+            shift_record.slots_completed,
+            shift_record.client_action_required,
+            shift_record.instance_status,
+            shift_record.visible_tenant_ids,
+        )
 
+    async def _refresh_shift_progress(self, shift_record: ShiftInstanceRecord) -> ShiftInstanceRecord:
+        slots = await self._engine.find(ShiftSlotRecord, ShiftSlotRecord.shift_instance_id == str(shift_record.id))
+        self._apply_shift_progress(shift_record, slots)
         shift_record.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
         return await self._engine.save(shift_record)
 
@@ -1815,153 +1887,227 @@ class RequestShiftManager:
                 metadata=payload,
             )
 
+    @staticmethod
+    def _slot_runtime_exception_transition(
+        slot_record: ShiftSlotRecord,
+        now: datetime,
+        suspected_threshold: datetime,
+        confirmed_threshold: datetime,
+    ) -> Optional[str]:
+        if not slot_record.assigned_guard_tenant_id:
+            return None
+        if slot_record.arrived_at is not None or slot_record.started_at is not None or slot_record.completed_at is not None:
+            return None
+        if slot_record.slot_status in {
+            ShiftSlotStatus.UNAVAILABLE,
+            ShiftSlotStatus.REPLACEMENT_REQUIRED,
+            ShiftSlotStatus.CANCELLED,
+            ShiftSlotStatus.COMPLETED,
+            ShiftSlotStatus.IN_PROGRESS,
+        }:
+            return None
+
+        if slot_record.slot_status == ShiftSlotStatus.NO_SHOW_CONFIRMED:
+            return None
+
+        if now >= confirmed_threshold:
+            return "no_show_confirmed"
+        if now >= suspected_threshold and slot_record.slot_status in {ShiftSlotStatus.RESERVED, ShiftSlotStatus.ROSTERED}:
+            return "late_risk"
+        return None
+
+    async def _apply_slot_runtime_exception_transition(
+        self,
+        transition: str,
+        slot_record: ShiftSlotRecord,
+        shift_record: ShiftInstanceRecord,
+        request_record: ClientRequestRecord,
+        *,
+        now: datetime,
+        grace_minutes: int,
+        cutoff_minutes: int,
+    ) -> None:
+        system_actor = self._system_actor()
+        if slot_record.slot_status not in {ShiftSlotStatus.LATE_RISK, ShiftSlotStatus.NO_SHOW_SUSPECTED}:
+            slot_record.slot_status = ShiftSlotStatus.LATE_RISK
+            slot_record.updated_at = now
+            await self._engine.save(slot_record)
+            await self._record_slot_event(
+                slot_record,
+                shift_record,
+                request_record,
+                system_actor,
+                ShiftAttendanceEventType.LATE_ARRIVAL,
+                metadata={"threshold_minutes": grace_minutes, "ineligible_for_shift": True},
+            )
+            await self._notify_late_arrival_ineligible(
+                slot_record=slot_record,
+                shift_record=shift_record,
+                request_record=request_record,
+                grace_minutes=grace_minutes,
+            )
+        if transition == "no_show_confirmed" and slot_record.slot_status != ShiftSlotStatus.NO_SHOW_CONFIRMED:
+            slot_record.slot_status = ShiftSlotStatus.NO_SHOW_CONFIRMED
+            slot_record.no_show_confirmed_at = slot_record.no_show_confirmed_at or now
+            slot_record.updated_at = now
+            await self._engine.save(slot_record)
+            await self._record_slot_event(
+                slot_record,
+                shift_record,
+                request_record,
+                system_actor,
+                ShiftAttendanceEventType.NO_SHOW_CONFIRMED,
+                metadata={"threshold_minutes": cutoff_minutes},
+            )
+
+    @staticmethod
+    def _runtime_exception_thresholds(
+        shift_record: ShiftInstanceRecord,
+        schedule_record: RequestScheduleTemplateRecord,
+    ) -> tuple[int, int, datetime, datetime]:
+        grace_minutes = int(getattr(schedule_record, "late_grace_minutes", 15) or 0)
+        cutoff_minutes = int(getattr(schedule_record, "no_show_cutoff_minutes", 30) or 0)
+        return (
+            grace_minutes,
+            cutoff_minutes,
+            shift_record.shift_start_at_utc + timedelta(minutes=grace_minutes),
+            shift_record.shift_start_at_utc + timedelta(minutes=cutoff_minutes),
+        )
+
     async def _sync_shift_runtime_exception_states(self, shift_record: ShiftInstanceRecord) -> ShiftInstanceRecord:
         schedule_record = await self._get_schedule_template_or_404(shift_record.schedule_template_id)
         request_manager = RequestManager.get_instance()
         request_record = await request_manager._get_request_or_404(shift_record.request_id)
         slots = await self._engine.find(ShiftSlotRecord, ShiftSlotRecord.shift_instance_id == str(shift_record.id))
         now = datetime.now(timezone.utc).replace(tzinfo=None)
-        suspected_threshold = shift_record.shift_start_at_utc + timedelta(minutes=int(getattr(schedule_record, "late_grace_minutes", 15) or 0))
-        confirmed_threshold = shift_record.shift_start_at_utc + timedelta(minutes=int(getattr(schedule_record, "no_show_cutoff_minutes", 30) or 0))
+        grace_minutes, cutoff_minutes, suspected_threshold, confirmed_threshold = self._runtime_exception_thresholds(
+            shift_record,
+            schedule_record,
+        )
         changed = False
-        system_actor = self._system_actor()
-        grace_minutes = int(getattr(schedule_record, "late_grace_minutes", 15) or 0)
-        cutoff_minutes = int(getattr(schedule_record, "no_show_cutoff_minutes", 30) or 0)
 
         for slot_record in slots:
-            if not slot_record.assigned_guard_tenant_id:
-                continue
-            if slot_record.arrived_at is not None or slot_record.started_at is not None or slot_record.completed_at is not None:
-                continue
-            if slot_record.slot_status in {
-                ShiftSlotStatus.UNAVAILABLE,
-                ShiftSlotStatus.REPLACEMENT_REQUIRED,
-                ShiftSlotStatus.CANCELLED,
-                ShiftSlotStatus.COMPLETED,
-                ShiftSlotStatus.IN_PROGRESS,
-            }:
+            transition = self._slot_runtime_exception_transition(slot_record, now, suspected_threshold, confirmed_threshold)
+            if transition is None:
                 continue
+            await self._apply_slot_runtime_exception_transition(
+                transition,
+                slot_record,
+                shift_record,
+                request_record,
+                now=now,
+                grace_minutes=grace_minutes,
+                cutoff_minutes=cutoff_minutes,
+            )
+            changed = True
 
-            if slot_record.slot_status == ShiftSlotStatus.NO_SHOW_CONFIRMED:
-                continue
+        if changed:
+            return await self._refresh_shift_progress(shift_record)
+        return shift_record
 
-            if now >= confirmed_threshold:
-                if slot_record.slot_status not in {ShiftSlotStatus.LATE_RISK, ShiftSlotStatus.NO_SHOW_SUSPECTED}:
-                    slot_record.slot_status = ShiftSlotStatus.LATE_RISK
-                    slot_record.updated_at = now
-                    await self._engine.save(slot_record)
-                    await self._record_slot_event(
-                        slot_record,
-                        shift_record,
-                        request_record,
-                        system_actor,
-                        ShiftAttendanceEventType.LATE_ARRIVAL,
-                        metadata={"threshold_minutes": grace_minutes, "ineligible_for_shift": True},
-                    )
-                    await self._notify_late_arrival_ineligible(
-                        slot_record=slot_record,
-                        shift_record=shift_record,
-                        request_record=request_record,
-                        grace_minutes=grace_minutes,
-                    )
-                if slot_record.slot_status != ShiftSlotStatus.NO_SHOW_CONFIRMED:
-                    slot_record.slot_status = ShiftSlotStatus.NO_SHOW_CONFIRMED
-                    slot_record.no_show_confirmed_at = slot_record.no_show_confirmed_at or now
-                    slot_record.updated_at = now
-                    await self._engine.save(slot_record)
-                    await self._record_slot_event(
-                        slot_record,
-                        shift_record,
-                        request_record,
-                        system_actor,
-                        ShiftAttendanceEventType.NO_SHOW_CONFIRMED,
-                        metadata={"threshold_minutes": cutoff_minutes},
-                    )
-                changed = True
+    async def _sync_shift_page_runtime_exception_states(self, shift_records: List[ShiftInstanceRecord]) -> List[ShiftInstanceRecord]:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        # Thresholds are never earlier than the shift start, so shifts that have not started cannot transition.
+        started_shifts = [shift_record for shift_record in shift_records if shift_record.shift_start_at_utc <= now]
+        if not started_shifts:
+            return shift_records
+
+        template_ids = {
+            ObjectId(shift_record.schedule_template_id)
+            for shift_record in started_shifts
+            if ObjectId.is_valid(str(shift_record.schedule_template_id or ""))
+        }
+        schedule_records = await self._engine.find(
+            RequestScheduleTemplateRecord,
+            RequestScheduleTemplateRecord.id.in_(list(template_ids)),
+        )
+        schedules_by_id = {str(schedule_record.id): schedule_record for schedule_record in schedule_records}
+        slots = await self._engine.find(
+            ShiftSlotRecord,
+            ShiftSlotRecord.shift_instance_id.in_([str(shift_record.id) for shift_record in started_shifts]),
+        )
+        slots_by_shift_id: Dict[str, List[ShiftSlotRecord]] = {}
+        for slot_record in slots:
+            slots_by_shift_id.setdefault(str(slot_record.shift_instance_id), []).append(slot_record)
+
+        request_manager = RequestManager.get_instance()
+        progress_updates = []
+        for shift_record in started_shifts:
+            schedule_record = schedules_by_id.get(str(shift_record.schedule_template_id))
+            if schedule_record is None:
+                schedule_record = await self._get_schedule_template_or_404(shift_record.schedule_template_id)
+            grace_minutes, cutoff_minutes, suspected_threshold, confirmed_threshold = self._runtime_exception_thresholds(
+                shift_record,
+                schedule_record,
+            )
+            shift_slots = slots_by_shift_id.get(str(shift_record.id), [])
+            transitions = [
+                (transition, slot_record)
+                for slot_record in shift_slots
+                for transition in [self._slot_runtime_exception_transition(slot_record, now, suspected_threshold, confirmed_threshold)]
+                if transition is not None
+            ]
+            if not transitions:
                 continue
 
-            if now >= suspected_threshold and slot_record.slot_status in {ShiftSlotStatus.RESERVED, ShiftSlotStatus.ROSTERED}:
-                slot_record.slot_status = ShiftSlotStatus.LATE_RISK
-                slot_record.updated_at = now
-                await self._engine.save(slot_record)
-                await self._record_slot_event(
+            request_record = await request_manager._get_request_or_404(shift_record.request_id)
+            for transition, slot_record in transitions:
+                await self._apply_slot_runtime_exception_transition(
+                    transition,
                     slot_record,
                     shift_record,
                     request_record,
-                    system_actor,
-                    ShiftAttendanceEventType.LATE_ARRIVAL,
-                    metadata={"threshold_minutes": grace_minutes, "ineligible_for_shift": True},
-                )
-                await self._notify_late_arrival_ineligible(
-                    slot_record=slot_record,
-                    shift_record=shift_record,
-                    request_record=request_record,
+                    now=now,
                     grace_minutes=grace_minutes,
+                    cutoff_minutes=cutoff_minutes,
                 )
-                changed = True
-
-        if changed:
-            return await self._refresh_shift_progress(shift_record)
-        return shift_record
-
-    async def _visible_shift_ids_for_user(self, current_user) -> Optional[set[str]]:
+            if not self._apply_shift_progress(shift_record, shift_slots):
+                continue
+            shift_record.updated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+            progress_updates.append(UpdateOne(
+                {"_id": shift_record.id},
+                {"$set": {
+                    "slots_staffed": shift_record.slots_staffed,
+                    "slots_checked_in": shift_record.slots_checked_in,
+                    "slots_completed": shift_record.slots_completed,
+                    "client_action_required": shift_record.client_action_required,
+                    "instance_status": shift_record.instance_status.value,
+                    "visible_tenant_ids": shift_record.visible_tenant_ids,
+                    "updated_at": shift_record.updated_at,
+                }},
+            ))
+
+        if progress_updates:
+            await self._engine.get_collection(ShiftInstanceRecord).bulk_write(progress_updates, ordered=False)
+        return shift_records
+
+    async def _visible_tenant_id_for_user(self, current_user) -> Optional[str]:
+        # Shift visibility is materialized on ShiftInstanceRecord.visible_tenant_ids, so tenant
+        # roles filter on their own tenant id; platform roles see every shift.
         request_manager = RequestManager.get_instance()
         role_value = request_manager._role_value(current_user)
         if request_manager._is_platform_role(role_value):
             return None
 
         session_tenant = await request_manager._get_session_tenant(current_user)
-        tenant_id = str(session_tenant.id)
-        shift_collection = self._engine.get_collection(ShiftInstanceRecord)
-        slot_collection = self._engine.get_collection(ShiftSlotRecord)
-
-        if role_value == "client_admin" and session_tenant.tenant_type == TenantType.CLIENT:
-            docs = await shift_collection.find({"client_tenant_id": tenant_id}).to_list(length=None)
-            visible_request_ids = await self._non_deleted_request_ids([
-                str(doc.get("request_id") or "").strip()
-                for doc in docs
-            ])
-            return {
-                str(doc.get("_id"))
-                for doc in docs
-                if doc.get("_id") and str(doc.get("request_id") or "").strip() in visible_request_ids
-            }
-
-        if role_value == "sp_admin" and session_tenant.tenant_type == TenantType.SERVICE_PROVIDER:
-            docs = await slot_collection.find({"coverage_tenant_id": tenant_id}).to_list(length=None)
-            visible_request_ids = await self._non_deleted_request_ids([
-                str(doc.get("request_id") or "").strip()
-                for doc in docs
-            ])
-            return {
-                str(doc.get("shift_instance_id"))
-                for doc in docs
-                if doc.get("shift_instance_id") and str(doc.get("request_id") or "").strip() in visible_request_ids
-            }
-
-        if role_value == "guard_admin" and session_tenant.tenant_type == TenantType.GUARD:
-            docs = await slot_collection.find(
-                {"$or": [{"assigned_guard_tenant_id": tenant_id}, {"coverage_tenant_id": tenant_id}]}
-            ).to_list(length=None)
-            visible_request_ids = await self._non_deleted_request_ids([
-                str(doc.get("request_id") or "").strip()
-                for doc in docs
-            ])
-            return {
-                str(doc.get("shift_instance_id"))
-                for doc in docs
-                if doc.get("shift_instance_id") and str(doc.get("request_id") or "").strip() in visible_request_ids
-            }
+        if (
+            (role_value == "client_admin" and session_tenant.tenant_type == TenantType.CLIENT)
+            or (role_value == "sp_admin" and session_tenant.tenant_type == TenantType.SERVICE_PROVIDER)
+            or (role_value == "guard_admin" and session_tenant.tenant_type == TenantType.GUARD)
+        ):
+            return str(session_tenant.id)
 
         raise HTTPException(status_code=403, detail="Access forbidden")
 
-    async def _ensure_implicit_shift_slots_for_current_view(
+    async def _sync_dirty_shift_slots_for_current_view(
         self,
         current_user,
         *,
         request_id: str = "",
-        limit: int = 200,
+        limit: int = 20,
     ) -> None:
+        # Assignment and request changes reconcile slots eagerly and the maintenance sweeper
+        # retries anything left dirty; reads only catch up requests still flagged.
         request_manager = RequestManager.get_instance()
         normalized_request_id = str(request_id or "").strip()
         if normalized_request_id:
@@ -1971,39 +2117,39 @@ class RequestShiftManager:
                 return
             if self._request_is_soft_deleted(request_manager, request_record):
                 return
-            await self.sync_shift_slots_for_request(request_record)
+            if getattr(request_record, "shift_slots_dirty", False):
+                await self.sync_shift_slots_for_request(request_record)
             return
 
+        request_query: Dict[str, Any] = {"shift_slots_dirty": True, "deleted_at": None}
         role_value = request_manager._role_value(current_user)
-        assignment_query: Dict[str, Any] = {
-            "assignment_scope": RequestAssignmentScope.REQUEST.value,
-            "assignment_status": {"$in": [status.value for status in _COMMITTED_ASSIGNMENT_STATUSES]},
-        }
         if not request_manager._is_platform_role(role_value):
             session_tenant = await request_manager._get_session_tenant(current_user)
             tenant_id = str(session_tenant.id)
             if role_value == "client_admin" and session_tenant.tenant_type == TenantType.CLIENT:
-                assignment_query["client_tenant_id"] = tenant_id
+                request_query["client_tenant_id"] = tenant_id
             elif role_value in {"guard_admin", "sp_admin"} and session_tenant.tenant_type in {TenantType.GUARD, TenantType.SERVICE_PROVIDER}:
-                assignment_query["assignee_tenant_id"] = tenant_id
+                assignment_collection = self._engine.get_collection(RequestAssignmentRecord)
+                assignment_docs = await assignment_collection.find(
+                    {
+                        "assignee_tenant_id": tenant_id,
+                        "assignment_scope": RequestAssignmentScope.REQUEST.value,
+                        "assignment_status": {"$in": [status.value for status in _COMMITTED_ASSIGNMENT_STATUSES]},
+                    },
+                    {"request_id": 1},
+                ).to_list(length=200)
+                request_ids = {str(doc.get("request_id") or "").strip() for doc in assignment_docs}
+                object_ids = [ObjectId(item) for item in request_ids if ObjectId.is_valid(item)]
+                if not object_ids:
+                    return
+                request_query["_id"] = {"$in": object_ids}
             else:
                 return
 
-        assignment_collection = self._engine.get_collection(RequestAssignmentRecord)
-        assignment_docs = await assignment_collection.find(assignment_query).to_list(length=max(int(limit or 0), 0) or 200)
-        seen_request_ids: set[str] = set()
-        for assignment_doc in assignment_docs:
-            current_request_id = str(assignment_doc.get("request_id") or "").strip()
-            if not current_request_id or current_request_id in seen_request_ids:
-                continue
-            seen_request_ids.add(current_request_id)
-            try:
-                request_record = await request_manager._get_request_or_404(current_request_id)
-            except HTTPException:
-                continue
-            if self._request_is_soft_deleted(request_manager, request_record):
-                continue
-            await self.sync_shift_slots_for_request(request_record)
+        request_collection = self._engine.get_collection(ClientRequestRecord)
+        request_docs = await request_collection.find(request_query, {"_id": 1}).to_list(length=max(int(limit or 0), 0) or 20)
+        for request_doc in request_docs:
+            await self.sync_shift_slots_for_request(str(request_doc.get("_id")))
 
     async def _get_visible_shift_slot_docs(
         self,
@@ -3514,6 +3660,9 @@ class RequestShiftManager:
         template_record.checkin_geofence_meters = int(payload.checkin_geofence_meters or 0)
         template_record.active = bool(payload.active)
         template_record.system_generated = False
+        template_record.generated_through_date = (
+            self._generation_window(payload, tzinfo)[1].isoformat() if template_record.active else None
+        )
         saved_template = await self._engine.save(template_record)
 
         await self._delete_future_shift_instances(str(request_record.id), str(saved_template.id), now)
@@ -3529,8 +3678,7 @@ class RequestShiftManager:
                 recurrence_days=recurrence_days,
                 is_overnight=is_overnight,
             )
-            for instance in generated_instances:
-                await self._engine.save(instance)
+            await self._insert_missing_shift_instances(str(saved_template.id), generated_instances)
         slot_counts = await self.sync_shift_slots_for_request(request_record)
         await request_manager._sync_request_finance_snapshot_for_schedule(request_record, saved_template)
         if request_record.request_status != RequestStatus.DRAFT and saved_template.active:
@@ -3564,85 +3712,150 @@ class RequestShiftManager:
             },
         }
 
-    async def ensure_future_shift_instances_for_active_schedules(self, limit: int = 200) -> Dict[str, int]:
-        request_manager = RequestManager.get_instance()
-        schedule_records = [
-            record
-            for record in await self._engine.find(RequestScheduleTemplateRecord, RequestScheduleTemplateRecord.active == True)
-            if bool(getattr(record, "active", False))
-        ][: max(int(limit or 0), 0) or 200]
+    async def _insert_missing_shift_instances(self, schedule_template_id: str, instances: List[ShiftInstanceRecord]) -> int:
+        instances_by_date = {
+            str(getattr(instance, "shift_date_local", "") or "").strip(): instance
+            for instance in instances
+        }
+        instances_by_date.pop("", None)
+        if not instances_by_date:
+            return 0
 
-        created_shift_count = 0
-        touched_request_ids: set[str] = set()
+        shift_collection = self._engine.get_collection(ShiftInstanceRecord)
+        existing_docs = await shift_collection.find(
+            {"schedule_template_id": schedule_template_id, "shift_date_local": {"$in": list(instances_by_date)}},
+            {"_id": 0, "shift_date_local": 1},
+        ).to_list(length=None)
+        for doc in existing_docs:
+            instances_by_date.pop(str(doc.get("shift_date_local") or "").strip(), None)
+        if not instances_by_date:
+            return 0
 
-        for schedule_record in schedule_records:
-            request_id = str(getattr(schedule_record, "request_id", "") or "").strip()
-            if not request_id:
-                continue
+        # Upserts on the unique (schedule_template_id, shift_date_local) key keep concurrent runs from duplicating shifts.
+        operations = []
+        for shift_date_local, instance in instances_by_date.items():
+            doc = instance.model_dump_doc()
+            doc.pop("schedule_template_id", None)
+            doc.pop("shift_date_local", None)
+            operations.append(UpdateOne(
+                {"schedule_template_id": schedule_template_id, "shift_date_local": shift_date_local},
+                {"$setOnInsert": doc},
+                upsert=True,
+            ))
+        result = await shift_collection.bulk_write(operations, ordered=False)
+        return int(result.upserted_count or 0)
+
+    async def _extend_schedule_horizon(
+        self,
+        schedule_record: RequestScheduleTemplateRecord,
+        request_manager: RequestManager,
+    ) -> Tuple[Optional[str], int]:
+        # Returns the new generated_through_date (None when unchanged) and the number of shifts created.
+        request_id = str(getattr(schedule_record, "request_id", "") or "").strip()
+        if not request_id:
+            return None, 0
 
-            try:
-                request_record = await request_manager._get_request_or_404(request_id)
-            except HTTPException:
-                continue
+        try:
+            tzinfo = self._resolve_timezone(str(getattr(schedule_record, "timezone", "") or "").strip())
+            schedule_payload = SimpleNamespace(
+                start_date=date.fromisoformat(str(getattr(schedule_record, "start_date_local", "") or "").strip()),
+                end_date=(
+                    date.fromisoformat(str(getattr(schedule_record, "end_date_local", "") or "").strip())
+                    if str(getattr(schedule_record, "end_date_local", "") or "").strip()
+                    else None
+                ),
+                schedule_type=getattr(schedule_record, "schedule_type", RequestScheduleType.ONE_TIME),
+                generation_horizon_days=int(getattr(schedule_record, "generation_horizon_days", 30) or 30),
+                active=False,
+            )
+            generated_through = (
+                date.fromisoformat(str(schedule_record.generated_through_date))
+                if getattr(schedule_record, "generated_through_date", None)
+                else None
+            )
+        except Exception:
+            return None, 0
 
-            if request_record.request_status in {RequestStatus.CANCELLED, RequestStatus.CLOSED}:
-                continue
-            if getattr(request_record, "expired_at", None) is not None:
-                continue
+        generation_start, generation_end = self._generation_window(schedule_payload, tzinfo)
+        if generated_through is not None and generated_through >= generation_end:
+            return None, 0
+        if generation_end < generation_start:
+            return generation_end.isoformat(), 0
 
-            try:
-                tzinfo = self._resolve_timezone(str(getattr(schedule_record, "timezone", "") or "").strip())
-                start_clock = self._parse_local_time("start_time_local", getattr(schedule_record, "start_time_local", ""))
-                end_clock = self._parse_local_time("end_time_local", getattr(schedule_record, "end_time_local", ""))
-                recurrence_days = self._normalize_recurrence_days(list(getattr(schedule_record, "recurrence_days", []) or []))
-                schedule_payload = SimpleNamespace(
-                    start_date=date.fromisoformat(str(getattr(schedule_record, "start_date_local", "") or "").strip()),
-                    end_date=(
-                        date.fromisoformat(str(getattr(schedule_record, "end_date_local", "") or "").strip())
-                        if str(getattr(schedule_record, "end_date_local", "") or "").strip()
-                        else None
-                    ),
-                    schedule_type=getattr(schedule_record, "schedule_type", RequestScheduleType.ONE_TIME),
-                    generation_horizon_days=int(getattr(schedule_record, "generation_horizon_days", 30) or 30),
-                )
-                generated_instances = self._build_shift_instances(
-                    request_record=request_record,
-                    template_record=schedule_record,
-                    payload=schedule_payload,
-                    tzinfo=tzinfo,
-                    start_clock=start_clock,
-                    end_clock=end_clock,
-                    recurrence_days=recurrence_days,
-                    is_overnight=bool(getattr(schedule_record, "is_overnight", False)),
-                )
-            except Exception:
-                continue
+        try:
+            request_record = await request_manager._get_request_or_404(request_id)
+        except HTTPException:
+            return None, 0
+
+        if request_record.request_status in {RequestStatus.CANCELLED, RequestStatus.CLOSED}:
+            return None, 0
+        if getattr(request_record, "expired_at", None) is not None:
+            return None, 0
 
-            existing_shifts = await self._engine.find(
-                ShiftInstanceRecord,
-                ShiftInstanceRecord.schedule_template_id == str(schedule_record.id),
+        try:
+            generated_instances = self._build_shift_instances(
+                request_record=request_record,
+                template_record=schedule_record,
+                payload=schedule_payload,
+                tzinfo=tzinfo,
+                start_clock=self._parse_local_time("start_time_local", getattr(schedule_record, "start_time_local", "")),
+                end_clock=self._parse_local_time("end_time_local", getattr(schedule_record, "end_time_local", "")),
+                recurrence_days=self._normalize_recurrence_days(list(getattr(schedule_record, "recurrence_days", []) or [])),
+                is_overnight=bool(getattr(schedule_record, "is_overnight", False)),
+                generated_after=generated_through,
             )
-            existing_dates = {
-                str(getattr(existing_shift, "shift_date_local", "") or "").strip()
-                for existing_shift in existing_shifts
-            }
+        except Exception:
+            return None, 0
 
-            request_touched = False
-            for instance in generated_instances:
-                instance_date = str(getattr(instance, "shift_date_local", "") or "").strip()
-                if not instance_date or instance_date in existing_dates:
-                    continue
-                await self._engine.save(instance)
-                existing_dates.add(instance_date)
-                created_shift_count += 1
-                request_touched = True
+        created_count = await self._insert_missing_shift_instances(str(schedule_record.id), generated_instances)
+        if created_count:
+            await self.sync_shift_slots_for_request(request_record)
+        return generation_end.isoformat(), created_count
 
-            if request_touched:
-                await self.sync_shift_slots_for_request(request_record)
-                touched_request_ids.add(str(request_record.id))
+    async def ensure_future_shift_instances_for_active_schedules(self, limit: int = 200, max_batches: int = 10) -> Dict[str, int]:
+        request_manager = RequestManager.get_instance()
+        schedule_collection = self._engine.get_collection(RequestScheduleTemplateRecord)
+        batch_size = max(int(limit or 0), 0) or 200
+        # Templates whose watermark has reached their last date never need generation again.
+        pending_query = {
+            "active": True,
+            "$or": [
+                {"generated_through_date": None},
+                {"$expr": {"$lt": ["$generated_through_date", {"$ifNull": ["$end_date_local", "$start_date_local"]}]}},
+            ],
+        }
 
+        scanned_schedule_count = 0
+        created_shift_count = 0
+        touched_request_ids: set[str] = set()
+        resume_after = self._schedule_generation_resume_after
+
+        for _ in range(max(int(max_batches or 0), 1)):
+            query = pending_query if resume_after is None else {"$and": [pending_query, {"_id": {"$gt": resume_after}}]}
+            schedule_docs = await schedule_collection.find(query).sort("_id", 1).limit(batch_size).to_list(length=batch_size)
+            watermark_updates = []
+            for schedule_doc in schedule_docs:
+                schedule_record = RequestScheduleTemplateRecord.model_validate_doc(schedule_doc)
+                generated_through_date, created_count = await self._extend_schedule_horizon(schedule_record, request_manager)
+                if generated_through_date is not None:
+                    watermark_updates.append(
+                        UpdateOne({"_id": schedule_record.id}, {"$set": {"generated_through_date": generated_through_date}})
+                    )
+                if created_count:
+                    created_shift_count += created_count
+                    touched_request_ids.add(str(schedule_record.request_id))
+            if watermark_updates:
+                await schedule_collection.bulk_write(watermark_updates, ordered=False)
+
+            scanned_schedule_count += len(schedule_docs)
+            if len(schedule_docs) < batch_size:
+                resume_after = None
+                break
+            resume_after = schedule_docs[-1]["_id"]
+
+        self._schedule_generation_resume_after = resume_after
         return {
-            "active_schedule_count": len(schedule_records),
+            "active_schedule_count": scanned_schedule_count,
             "created_shift_count": created_shift_count,
             "touched_request_count": len(touched_request_ids),
         }
@@ -3674,15 +3887,11 @@ class RequestShiftManager:
         instance_status: str = "",
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         request_manager = RequestManager.get_instance()
-        await self._ensure_implicit_shift_slots_for_current_view(current_user, request_id=request_id)
-        visible_shift_ids = await self._visible_shift_ids_for_user(current_user)
-        if visible_shift_ids is not None and not visible_shift_ids:
-            return {
-                "items": [],
-                "pagination": {"page": max(page, 1), "rows": max(rows, 1), "total_items": 0, "total_pages": 0},
-            }
+        await self._sync_dirty_shift_slots_for_current_view(current_user, request_id=request_id)
+        visible_tenant_id = await self._visible_tenant_id_for_user(current_user)
 
         if request_id:
             record = await request_manager._get_request_or_404(request_id)
@@ -3691,8 +3900,8 @@ class RequestShiftManager:
                 raise HTTPException(status_code=403, detail="Access forbidden")
 
         query: Dict[str, Any] = {}
-        if visible_shift_ids is not None:
-            query["_id"] = {"$in": [ObjectId(shift_id) for shift_id in visible_shift_ids]}
+        if visible_tenant_id is not None:
+            query["visible_tenant_ids"] = visible_tenant_id
         if request_id:
             query["request_id"] = str(record.id)
         if instance_status:
@@ -3710,11 +3919,27 @@ class RequestShiftManager:
             query["shift_date_local"] = date_filter
 
         collection = self._engine.get_collection(ShiftInstanceRecord)
-        total_items = int(await collection.count_documents(query))
         safe_rows = rows if rows and rows > 0 else 20
         safe_page = page if page and page > 0 else 1
-        skip = (safe_page - 1) * safe_rows
-        docs = await collection.find(query).sort("shift_start_at_utc", 1).skip(skip).limit(safe_rows).to_list(length=safe_rows)
+        next_cursor: Optional[str] = None
+        if cursor is None:
+            total_items = int(await collection.count_documents(query))
+            skip = (safe_page - 1) * safe_rows
+            docs = await collection.find(query).sort("shift_start_at_utc", 1).skip(skip).limit(safe_rows).to_list(length=safe_rows)
+        else:
+            total_items = 0
+            if cursor:
+                cursor_start_at, cursor_id = decode_cursor(cursor)
+                query = {"$and": [query, keyset_after("shift_start_at_utc", cursor_start_at, cursor_id, 1)]}
+            docs = await (
+                collection.find(query)
+                .sort([("shift_start_at_utc", 1), ("_id", 1)])
+                .limit(safe_rows + 1)
+                .to_list(length=safe_rows + 1)
+            )
+            if len(docs) > safe_rows:
+                docs = docs[:safe_rows]
+                next_cursor = encode_cursor(docs[-1].get("shift_start_at_utc"), docs[-1].get("_id"))
         request_ids = [str(doc.get("request_id") or "").strip() for doc in docs if str(doc.get("request_id") or "").strip()]
         allowed_request_ids = await self._non_deleted_request_ids(request_ids)
         request_lookup: Dict[str, Dict[str, Any]] = {}
@@ -3726,14 +3951,18 @@ class RequestShiftManager:
             }).to_list(length=None)
             for request_doc in request_docs:
                 request_lookup[str(request_doc.get("_id") or "").strip()] = request_doc
-        items = []
-        for doc in docs:
-            request_id = str(doc.get("request_id") or "").strip()
-            if request_id not in allowed_request_ids:
-                continue
-            shift_record = await self._get_shift_or_404(str(doc.get("_id")))
-            shift_record = await self._sync_shift_runtime_exception_states(shift_record)
-            items.append(self._serialize_shift(shift_record, request_lookup.get(request_id)))
+        shift_records = [
+            ShiftInstanceRecord.model_validate_doc(doc)
+            for doc in docs
+            if str(doc.get("request_id") or "").strip() in allowed_request_ids
+        ]
+        shift_records = await self._sync_shift_page_runtime_exception_states(shift_records)
+        items = [
+            self._serialize_shift(shift_record, request_lookup.get(str(shift_record.request_id or "").strip()))
+            for shift_record in shift_records
+        ]
+        if cursor is not None:
+            return {"items": items, "pagination": cursor_pagination(safe_rows, cursor, next_cursor)}
         total_pages = (total_items + safe_rows - 1) // safe_rows if total_items > 0 else 0
         return {
             "items": items,
@@ -3754,8 +3983,8 @@ class RequestShiftManager:
         await self.sync_shift_slots_for_request(request_record)
         record = await self._get_shift_or_404(shift_id)
         record = await self._sync_shift_runtime_exception_states(record)
-        visible_shift_ids = await self._visible_shift_ids_for_user(current_user)
-        if visible_shift_ids is not None and str(record.id) not in visible_shift_ids:
+        visible_tenant_id = await self._visible_tenant_id_for_user(current_user)
+        if visible_tenant_id is not None and visible_tenant_id not in (record.visible_tenant_ids or []):
             raise HTTPException(status_code=403, detail="Access forbidden")
         slot_docs = await self._get_visible_shift_slot_docs(str(record.id), current_user)
         role_value = request_manager._role_value(current_user)
@@ -3785,10 +4014,10 @@ class RequestShiftManager:
         request_record = await request_manager._get_request_or_404(shift_record.request_id)
         if self._request_is_soft_deleted(request_manager, request_record):
             raise HTTPException(status_code=404, detail="Shift slot not found")
-        await self._sync_shift_runtime_exception_states(shift_record)
+        shift_record = await self._sync_shift_runtime_exception_states(shift_record)
         slot_record = await self._get_shift_slot_or_404(slot_id)
-        visible_shift_ids = await self._visible_shift_ids_for_user(current_user)
-        if visible_shift_ids is not None and slot_record.shift_instance_id not in visible_shift_ids:
+        visible_tenant_id = await self._visible_tenant_id_for_user(current_user)
+        if visible_tenant_id is not None and visible_tenant_id not in (shift_record.visible_tenant_ids or []):
             raise HTTPException(status_code=403, detail="Access forbidden")
         visible_slots = await self._get_visible_shift_slot_docs(slot_record.shift_instance_id, current_user)
         if not any(str(slot.get("_id") or slot.get("id") or "") == str(slot_record.id) for slot in visible_slots):
@@ -3821,76 +4050,81 @@ class RequestShiftManager:
             self._assert_request_not_soft_deleted(request_manager, request_record, detail="Request not found")
             request_filter_id = str(request_record.id)
 
-        shift_query: Dict[str, Any] = {}
+        normalized_status = str(exception_status or "").strip().lower()
+        allowed_statuses = {status.value for status in _SHIFT_EXCEPTION_STATUSES}
+        if normalized_status and normalized_status not in allowed_statuses:
+            raise HTTPException(status_code=400, detail="Invalid shift exception status filter")
+
+        # Runtime no-show/late states are advanced by the maintenance exception sync, so this
+        # read only pages over slots that are already in an exception status.
+        slot_query: Dict[str, Any] = {
+            "slot_status": normalized_status or {"$in": sorted(allowed_statuses)},
+            "request_deleted_at": None,
+        }
         if request_filter_id:
-            shift_query["request_id"] = request_filter_id
+            slot_query["request_id"] = request_filter_id
         if date_from or date_to:
             date_filter: Dict[str, Any] = {}
             if date_from:
                 date_filter["$gte"] = date_from.isoformat()
             if date_to:
                 date_filter["$lte"] = date_to.isoformat()
-            shift_query["shift_date_local"] = date_filter
+            slot_query["shift_date_local"] = date_filter
 
-        shift_collection = self._engine.get_collection(ShiftInstanceRecord)
-        shift_docs = await shift_collection.find(shift_query).sort("shift_start_at_utc", 1).to_list(length=None)
+        safe_rows = rows if rows and rows > 0 else 20
+        safe_page = page if page and page > 0 else 1
+        slot_collection = self._engine.get_collection(ShiftSlotRecord)
+        total_items = int(await slot_collection.count_documents(slot_query))
+        slot_docs = await (
+            slot_collection.find(slot_query)
+            .sort([("shift_start_at_utc", 1), ("_id", 1)])
+            .skip((safe_page - 1) * safe_rows)
+            .limit(safe_rows)
+            .to_list(length=safe_rows)
+        )
+
+        shift_ids = list({str(doc.get("shift_instance_id") or "") for doc in slot_docs if doc.get("shift_instance_id")})
         shift_records: Dict[str, ShiftInstanceRecord] = {}
-        request_cache: Dict[str, ClientRequestRecord] = {}
-        for shift_doc in shift_docs:
-            shift_record = await self._get_shift_or_404(str(shift_doc.get("_id")))
-            shift_record = await self._sync_shift_runtime_exception_states(shift_record)
-            shift_records[str(shift_record.id)] = shift_record
-            if shift_record.request_id not in request_cache:
-                request_record = await request_manager._get_request_or_404(shift_record.request_id)
-                if self._request_is_soft_deleted(request_manager, request_record):
-                    continue
-                request_cache[shift_record.request_id] = request_record
+        if shift_ids:
+            shift_docs = await self._engine.get_collection(ShiftInstanceRecord).find(
+                {"_id": {"$in": [ObjectId(shift_id) for shift_id in shift_ids]}}
+            ).to_list(length=None)
+            for shift_doc in shift_docs:
+                shift_record = ShiftInstanceRecord.model_validate_doc(shift_doc)
+                shift_records[str(shift_record.id)] = shift_record
 
-        normalized_status = str(exception_status or "").strip().lower()
-        allowed_statuses = {status.value for status in _SHIFT_EXCEPTION_STATUSES}
-        if normalized_status and normalized_status not in allowed_statuses:
-            raise HTTPException(status_code=400, detail="Invalid shift exception status filter")
+        request_ids = list({str(doc.get("request_id") or "") for doc in slot_docs if doc.get("request_id")})
+        request_lookup: Dict[str, Dict[str, Any]] = {}
+        if request_ids:
+            request_docs = await self._engine.get_collection(ClientRequestRecord).find(
+                {"_id": {"$in": [ObjectId(request_id) for request_id in request_ids]}, "deleted_at": None},
+                {"title": 1, "client_tenant_id": 1},
+            ).to_list(length=None)
+            for request_doc in request_docs:
+                request_lookup[str(request_doc.get("_id"))] = request_doc
 
-        slot_query: Dict[str, Any] = {"slot_status": {"$in": sorted(allowed_statuses)}}
-        if shift_records:
-            slot_query["shift_instance_id"] = {"$in": list(shift_records.keys())}
-        elif request_filter_id or date_from or date_to:
-            return {
-                "items": [],
-                "pagination": {"page": max(page, 1), "rows": max(rows, 1), "total_items": 0, "total_pages": 0},
-            }
-        slot_docs = await self._get_shift_slot_docs(slot_query)
+        serialized_slots = await self._serialize_slots_with_guard_labels(slot_docs)
         items = []
-        for slot_doc in slot_docs:
-            status_value = str(slot_doc.get("slot_status") or "")
-            if normalized_status and status_value != normalized_status:
-                continue
+        for slot_doc, serialized_slot in zip(slot_docs, serialized_slots):
             shift_record = shift_records.get(str(slot_doc.get("shift_instance_id") or ""))
-            if not shift_record:
-                continue
-            request_record = request_cache.get(shift_record.request_id)
-            if not request_record:
+            request_doc = request_lookup.get(str(slot_doc.get("request_id") or ""))
+            if not shift_record or not request_doc:
                 continue
             items.append(
                 {
-                    "slot": (await self._serialize_slots_with_guard_labels([slot_doc]))[0],
+                    "slot": serialized_slot,
                     "shift": self._serialize_shift(shift_record),
                     "request": {
-                        "id": str(request_record.id) if request_record else shift_record.request_id,
-                        "title": self._request_display_title(request_record) if request_record else "Client request",
-                        "client_tenant_id": request_record.client_tenant_id if request_record else shift_record.client_tenant_id,
+                        "id": str(request_doc.get("_id")),
+                        "title": str(request_doc.get("title") or "Client request"),
+                        "client_tenant_id": request_doc.get("client_tenant_id") or shift_record.client_tenant_id,
                     },
                 }
             )
 
-        safe_rows = rows if rows and rows > 0 else 20
-        safe_page = page if page and page > 0 else 1
-        total_items = len(items)
-        start = (safe_page - 1) * safe_rows
-        page_items = items[start:start + safe_rows]
         total_pages = (total_items + safe_rows - 1) // safe_rows if total_items > 0 else 0
         return {
-            "items": page_items,
+            "items": items,
             "pagination": {
                 "page": safe_page,
                 "rows": safe_rows,
@@ -4170,6 +4404,8 @@ class RequestShiftManager:
             assigned_guard_tenant_id=None,
             slot_status=ShiftSlotStatus.OPEN,
             replacement_of_slot_id=str(original_slot.id),
+            shift_start_at_utc=shift_record.shift_start_at_utc,
+            shift_date_local=shift_record.shift_date_local,
             roster_due_at=shift_record.roster_due_at,
             created_at=now,
             updated_at=now,
@@ -4503,6 +4739,7 @@ class RequestShiftManager:
             shift_record=shift_record,
             request_record=request_record,
         )
+        await request_manager.mark_payout_ledger_dirty(request_record)
         await NotificationManager.get_instance().create_for_tenant_admin_users(
             tenant_id=request_record.client_tenant_id,
             title="Shift checked out",
@@ -12,6 +12,8 @@ from starlette import status
 from cryptography.fernet import Fernet
 
 from orion.api.interactive.account_manager.models.user_model import user_model
+from orion.api.interactive.notification_manager.recipient_directory import RecipientDirectory
+from orion.api.interactive.request_matching_manager.request_matching_manager import RequestMatchingManager
 from orion.services.mongo_manager.mongo_controller import mongo_controller
 from orion.services.mongo_manager.shared_model.db_keys import db_keys
 from orion.services.mongo_manager.shared_model.db_tenant_model import (
@@ -508,6 +510,7 @@ class TenantManager:
             data.status = TenantStatus.ONBOARDING
 
             # Save the tenant
+            RequestMatchingManager.apply_match_index(data)
             await self._engine.save(data)
 
             if data.tenant_type == TenantType.GUARD:
@@ -631,10 +634,12 @@ class TenantManager:
                     if set(allowed_licenses) == {"free"}:
                         u.licenses = ["maintainer"]
                     await self._engine.save(u)
+                    await session_manager.invalidate_principal(u)
                 elif not set(u.licenses or []).issubset(allowed_licenses):
                     u.status = UserStatus.DISABLE
                     u.licenses = ["free"]
                     await self._engine.save(u)
+                    await session_manager.invalidate_principal(u)
 
         active_count = await self._engine.count(
             db_user_account,
@@ -650,7 +655,8 @@ class TenantManager:
             for u in extra_users:
                 u.status = UserStatus.DISABLE.value
                 await self._engine.save(u)
-
+                await session_manager.invalidate_principal(u)
+        await RecipientDirectory.get_instance().invalidate_tenant(tenant_id)
 
         tenant_data = tenant.model_dump()
         tenant_data["id"] = str(tenant.id)
@@ -730,6 +736,7 @@ class TenantManager:
 
         tenant.profile = merged
         tenant.updated_at = tenant.updated_at  # keep field present; odmantic will persist
+        RequestMatchingManager.apply_match_index(tenant)
         await self._engine.save(tenant)
 
         return {"message": "Profile updated", "tenant_id": str(tenant.id), "tenant_type": tenant.tenant_type, "profile": tenant.profile or {}}
@@ -837,6 +844,7 @@ class TenantManager:
         if data.verified and not tenant.verified_date:
             tenant.verified_date = datetime.utcnow()
 
+        RequestMatchingManager.apply_match_index(tenant)
         await self._engine.save(tenant)
 
         # Record status-change side effects on update when lifecycle changed.
@@ -981,6 +989,14 @@ class TenantManager:
         normalized_previous = self._normalized_status_value(previous_status)
         normalized_current = self._normalized_status_value(tenant.status)
 
+        # Cached principals carry the tenant status; drop them so the change applies on the next request.
+        try:
+            tenant_users = await self._engine.find(db_user_account, db_user_account.tenant_uuid == str(tenant.id))
+            for tenant_user in tenant_users:
+                await session_manager.invalidate_principal(tenant_user)
+        except Exception:
+            pass
+
         # Persist audit record
         audit = TenantStatusAudit(
             tenant_id=str(tenant.id),
@@ -1472,6 +1488,7 @@ class TenantManager:
                 tenant_uuid=tenant_uuid, )
 
             await engine.save(user)
+            await RecipientDirectory.get_instance().invalidate_user(user)
 
 
             return {"message": "User created successfully", "username": username, "email": email, "tenant_uuid": tenant_uuid, "allowed_licenses": list(
@@ -1563,6 +1580,7 @@ class TenantManager:
             status_changed_at=datetime.now(timezone.utc),
         )
         await self._engine.save(guard_user)
+        await RecipientDirectory.get_instance().invalidate_user(guard_user)
 
         try:
             app_url = env_handler.get_instance().env("APP_URL")
@@ -1584,6 +1602,7 @@ class TenantManager:
             # Roll back pre-linked guard records when invite email cannot be dispatched.
             try:
                 await self._engine.delete(guard_user)
+                await RecipientDirectory.get_instance().invalidate_user(guard_user)
             except Exception:
                 pass
             try:
@@ -1752,6 +1771,7 @@ class TenantManager:
 
         guard.profile = profile
         guard.updated_at = datetime.utcnow()
+        RequestMatchingManager.apply_match_index(guard)
         await self._engine.save(guard)
 
         await ActivityManager.get_instance().log_event(
@@ -1799,6 +1819,8 @@ class TenantManager:
             raise HTTPException(status_code=400, detail="Invite is not expired")
 
         await self._engine.delete(admin_user)
+        await RecipientDirectory.get_instance().invalidate_user(admin_user)
+        await session_manager.invalidate_principal(admin_user)
         await self._engine.delete(guard)
 
         await ActivityManager.get_instance().log_event(
@@ -2023,6 +2045,7 @@ class TenantManager:
         guard.unlinked_at = None
         guard.unlinked_by = None
         guard.updated_at = datetime.now(timezone.utc)
+        RequestMatchingManager.apply_match_index(guard)
         await self._engine.save(guard)
 
         await ActivityManager.get_instance().log_event(
@@ -2063,6 +2086,7 @@ class TenantManager:
         guard.unlinked_at = datetime.now(timezone.utc)
         guard.unlinked_by = getattr(current_user, "username", None)
         guard.updated_at = datetime.now(timezone.utc)
+        RequestMatchingManager.apply_match_index(guard)
         await self._engine.save(guard)
 
         await ActivityManager.get_instance().log_event(
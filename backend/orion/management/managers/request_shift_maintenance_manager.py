@@ -1,18 +1,22 @@
-import asyncio
 import threading
+import time
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from bson import ObjectId
 
 from orion.api.interactive.notification_manager.notification_manager import NotificationManager
 from orion.api.interactive.request_manager.request_manager import RequestManager
 from orion.api.interactive.request_shift_manager.request_shift_manager import RequestShiftManager
+from orion.management.managers.scheduler import JobScheduler, ScheduledJob, run_bounded
+from orion.services.log_manager.log_controller import log
 from orion.services.mongo_manager.mongo_controller import mongo_controller
 from orion.services.mongo_manager.shared_model.db_notification_model import NotificationRecord
 from orion.services.mongo_manager.shared_model.db_request_model import (
+    ClientRequestRecord,
     RequestInvoiceTrigger,
+    RequestPayoutLedgerRecord,
     RequestScheduleTemplateRecord,
     RequestStatus,
     ShiftInstanceRecord,
@@ -26,6 +30,22 @@ class request_shift_maintenance_manager:
     __instance = None
     __lock = threading.Lock()
 
+    # Stages in the same lane read-modify-write the same documents (generation, slot sync,
+    # leave sync and exception sync all rewrite shift slots and shift progress; the ledger
+    # reads the invoices the advance sync writes), so a lane runs its stages in order.
+    # Lanes themselves are disjoint and overlap; per-document work inside a stage is capped
+    # separately to keep Mongo and Redis pools from being flooded.
+    _STAGE_LANES = {
+        "shift_generation": "shift_state",
+        "slot_sync": "shift_state",
+        "leave_sync": "shift_state",
+        "exception_sync": "shift_state",
+        "advance_invoices": "billing",
+        "payout_ledger": "billing",
+    }
+    _STAGE_CONCURRENCY = 4
+    _ITEM_CONCURRENCY = 8
+
     @staticmethod
     def get_instance():
         if request_shift_maintenance_manager.__instance is None:
@@ -41,43 +61,156 @@ class request_shift_maintenance_manager:
         if controller is None:
             raise RuntimeError("Mongo controller is not initialized")
         self._engine = controller.get_engine()
-        self._task: Optional[asyncio.Task] = None
+        self._scheduler: Optional[JobScheduler] = None
+
+    def _stages(self) -> Dict[str, Callable[[], Awaitable[Any]]]:
+        return {
+            "shift_generation": self._ensure_future_shifts,
+            "slot_sync": self._sync_dirty_request_slots,
+            "leave_sync": self._sync_active_guard_leaves,
+            "exception_sync": self._sync_runtime_exceptions,
+            "advance_invoices": self._sync_advance_request_invoices,
+            "payout_ledger": self._sync_payout_ledger,
+            "provider_roster_reminders": self._send_provider_roster_reminders,
+            "guard_checkin_reminders": self._send_guard_checkin_reminders,
+            "client_confirmation_reminders": self._send_client_arrival_confirmation_reminders,
+        }
+
+    def _jobs(self) -> List[ScheduledJob]:
+        # Each stage runs on its own cadence; reminder windows are minutes wide, horizon
+        # generation and invoice sync only need to keep up over hours.
+        cadence = {
+            "shift_generation": dict(interval=300, jitter=30, timeout=240),
+            "advance_invoices": dict(interval=900, jitter=60, timeout=600),
+            "leave_sync": dict(interval=120, jitter=15, timeout=90),
+            "payout_ledger": dict(interval=120, jitter=15, timeout=90),
+        }
+        return [
+            ScheduledJob(
+                name,
+                func,
+                group=self._STAGE_LANES.get(name),
+                **cadence.get(name, dict(interval=60, jitter=5, timeout=50)),
+            )
+            for name, func in self._stages().items()
+        ]
+
+    def _lanes(self) -> List[List[str]]:
+        lanes: Dict[str, List[str]] = {}
+        for name in self._stages():
+            lanes.setdefault(self._STAGE_LANES.get(name, name), []).append(name)
+        return list(lanes.values())
 
     async def start(self) -> None:
-        if self._task and not self._task.done():
+        if self._scheduler is not None and self._scheduler.is_running():
             return
-        self._task = asyncio.create_task(self._run_forever(), name="request_shift_maintenance")
+        self._scheduler = JobScheduler("request_shift_maintenance", self._jobs())
+        await self._scheduler.start()
+
+    async def stop(self) -> None:
+        if self._scheduler is not None:
+            await self._scheduler.stop()
+
+    async def _ensure_future_shifts(self) -> Dict[str, int]:
+        return await RequestShiftManager.get_instance().ensure_future_shift_instances_for_active_schedules(limit=200)
+
+    async def _sync_dirty_request_slots(self, limit: int = 200) -> int:
+        # Sweeps requests whose committed coverage changed but whose slots were not
+        # reconciled inline, e.g. because the request-side sync raised.
+        shift_manager = RequestShiftManager.get_instance()
+        request_collection = self._engine.get_collection(ClientRequestRecord)
+        request_docs = await request_collection.find(
+            {"shift_slots_dirty": True, "deleted_at": None},
+            {"_id": 1},
+        ).to_list(length=max(int(limit or 0), 0) or 200)
+
+        async def _sync(request_doc: Dict[str, Any]) -> bool:
+            await shift_manager.sync_shift_slots_for_request(str(request_doc.get("_id")))
+            return True
+
+        results = await run_bounded(request_docs, _sync, concurrency=self._ITEM_CONCURRENCY, label="slot_sync")
+        return sum(1 for synced in results if synced)
+
+    async def _sync_payout_ledger(self, limit: int = 200, stale_after: timedelta = timedelta(hours=24)) -> int:
+        # Dirty requests are rebuilt first; rows untouched for a day are swept too so
+        # inputs without a dirty hook (paid leave, tenant renames) still converge.
+        request_manager = RequestManager.get_instance()
+        safe_limit = max(int(limit or 0), 0) or 200
+        request_collection = self._engine.get_collection(ClientRequestRecord)
+        request_docs = await request_collection.find(
+            {"payout_ledger_dirty": True, "deleted_at": None},
+            {"_id": 1},
+        ).to_list(length=safe_limit)
+        request_ids = [str(doc.get("_id")) for doc in request_docs]
+        if len(request_ids) < safe_limit:
+            ledger_collection = self._engine.get_collection(RequestPayoutLedgerRecord)
+            stale_docs = await (
+                ledger_collection.find(
+                    {"refreshed_at": {"$lt": datetime.utcnow() - stale_after}},
+                    {"request_id": 1},
+                )
+                .sort("refreshed_at", 1)
+                .limit(safe_limit)
+                .to_list(length=safe_limit)
+            )
+            for doc in stale_docs:
+                request_id = str(doc.get("request_id") or "").strip()
+                if request_id and request_id not in request_ids and len(request_ids) < safe_limit:
+                    request_ids.append(request_id)
 
-    async def _run_forever(self) -> None:
-        while True:
+        async def _refresh(request_id: str) -> bool:
+            await request_manager.refresh_payout_ledger_for_request(request_id)
+            return True
+
+        results = await run_bounded(request_ids, _refresh, concurrency=self._ITEM_CONCURRENCY, label="payout_ledger")
+        return sum(1 for refreshed in results if refreshed)
+
+    async def _sync_active_guard_leaves(self) -> int:
+        return await RequestShiftManager.get_instance().sync_active_guard_leaves(limit=200)
+
+    async def _sync_runtime_exceptions(self) -> int:
+        return await self._sync_active_shift_runtime_exceptions(RequestShiftManager.get_instance())
+
+    async def run_iteration(self) -> Dict[str, Any]:
+        stages = self._stages()
+        results: Dict[str, Any] = {}
+        timings_ms: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+
+        async def _run_stage(name: str) -> None:
+            started = time.perf_counter()
             try:
-                await self.run_iteration()
+                results[name] = await stages[name]()
             except Exception as exc:
-                print(f"Shift maintenance iteration failed: {exc}")
-            await asyncio.sleep(60)
+                errors[name] = str(exc)
+                log.g().e(f"SHIFT MAINTENANCE STAGE ERROR ({name}): {exc}")
+            finally:
+                timings_ms[name] = round((time.perf_counter() - started) * 1000, 1)
 
-    async def run_iteration(self) -> Dict[str, int]:
-        shift_manager = RequestShiftManager.get_instance()
-        ensured = await shift_manager.ensure_future_shift_instances_for_active_schedules(limit=200)
-        invoice_sync_count = await self._sync_advance_request_invoices(limit=200)
-        synced_leave_count = await shift_manager.sync_active_guard_leaves(limit=200)
-        synced_exception_count = await self._sync_active_shift_runtime_exceptions(shift_manager)
-        roster_reminder_count = await self._send_provider_roster_reminders()
-        guard_reminder_count = await self._send_guard_checkin_reminders()
-        client_reminder_count = await self._send_client_arrival_confirmation_reminders()
-
-        summary = {
+        async def _run_lane(lane: List[str]) -> None:
+            for name in lane:
+                await _run_stage(name)
+
+        await run_bounded(self._lanes(), _run_lane, concurrency=self._STAGE_CONCURRENCY, label="shift_maintenance")
+
+        ensured = results.get("shift_generation") or {}
+        summary: Dict[str, Any] = {
             "created_shift_count": int(ensured.get("created_shift_count") or 0),
             "touched_request_count": int(ensured.get("touched_request_count") or 0),
-            "advance_invoice_sync_count": invoice_sync_count,
-            "leave_sync_count": synced_leave_count,
-            "exception_sync_count": synced_exception_count,
-            "provider_roster_reminders": roster_reminder_count,
-            "guard_checkin_reminders": guard_reminder_count,
-            "client_confirmation_reminders": client_reminder_count,
+            "slot_sync_count": int(results.get("slot_sync") or 0),
+            "advance_invoice_sync_count": int(results.get("advance_invoices") or 0),
+            "payout_ledger_refresh_count": int(results.get("payout_ledger") or 0),
+            "leave_sync_count": int(results.get("leave_sync") or 0),
+            "exception_sync_count": int(results.get("exception_sync") or 0),
+            "provider_roster_reminders": int(results.get("provider_roster_reminders") or 0),
+            "guard_checkin_reminders": int(results.get("guard_checkin_reminders") or 0),
+            "client_confirmation_reminders": int(results.get("client_confirmation_reminders") or 0),
         }
-        if any(summary.values()):
+        if any(summary.values()) or errors:
             print(f"Shift maintenance summary: {summary}")
+        summary["stage_timings_ms"] = {name: timings_ms[name] for name in stages if name in timings_ms}
+        if errors:
+            summary["stage_errors"] = errors
         return summary
 
     async def _sync_advance_request_invoices(self, limit: int = 200) -> int:
@@ -85,24 +218,23 @@ class request_shift_maintenance_manager:
         schedule_collection = self._engine.get_collection(RequestScheduleTemplateRecord)
         schedule_docs = await schedule_collection.find({"active": True}).to_list(length=max(int(limit or 0), 0) or 200)
         system_user = SimpleNamespace(id=None, username="system", role="admin")
-        synced_count = 0
 
-        for schedule_doc in schedule_docs:
+        async def _sync(schedule_doc: Dict[str, Any]) -> bool:
             request_id = str(schedule_doc.get("request_id") or "").strip()
             if not request_id:
-                continue
+                return False
             try:
                 request_record = await request_manager._get_request_or_404(request_id)
             except Exception:
-                continue
+                return False
             if request_record.request_status in {RequestStatus.DRAFT, RequestStatus.CANCELLED, RequestStatus.CLOSED}:
-                continue
+                return False
             if getattr(request_record, "expired_at", None) is not None:
-                continue
+                return False
 
             invoicing_snapshot = request_record.invoicing_snapshot if isinstance(getattr(request_record, "invoicing_snapshot", None), dict) else {}
             if request_manager._normalize_invoice_contract_type(invoicing_snapshot.get("contract_type")) != "long_term":
-                continue
+                return False
 
             try:
                 result = await request_manager._sync_request_invoice_state(
@@ -112,11 +244,11 @@ class request_shift_maintenance_manager:
                 )
             except Exception as exc:
                 print(f"Advance invoice sync failed for request {request_id}: {exc}")
-                continue
-            if str(result.get("action") or "") in {"created", "updated"}:
-                synced_count += 1
+                return False
+            return str(result.get("action") or "") in {"created", "updated"}
 
-        return synced_count
+        results = await run_bounded(schedule_docs, _sync, concurrency=self._ITEM_CONCURRENCY, label="advance_invoices")
+        return sum(1 for synced in results if synced)
 
     async def _sync_active_shift_runtime_exceptions(self, shift_manager: RequestShiftManager) -> int:
         now = datetime.now(timezone.utc).replace(tzinfo=None)
@@ -136,15 +268,16 @@ class request_shift_maintenance_manager:
             },
         }).to_list(length=500)
 
-        synced = 0
-        for shift_doc in shift_docs:
+        async def _sync(shift_doc: Dict[str, Any]) -> bool:
             shift_id = str(shift_doc.get("_id") or "").strip()
             if not shift_id:
-                continue
+                return False
             shift_record = await shift_manager._get_shift_or_404(shift_id)
             await shift_manager._sync_shift_runtime_exception_states(shift_record)
-            synced += 1
-        return synced
+            return True
+
+        results = await run_bounded(shift_docs, _sync, concurrency=self._ITEM_CONCURRENCY, label="exception_sync")
+        return sum(1 for synced in results if synced)
 
     async def _send_provider_roster_reminders(self) -> int:
         now = datetime.now(timezone.utc).replace(tzinfo=None)
@@ -157,7 +290,7 @@ class request_shift_maintenance_manager:
             "roster_due_at": {"$lte": now + timedelta(minutes=30)},
         }).to_list(length=300)
 
-        sent = 0
+        reminders: List[Dict[str, Any]] = []
         for slot_doc in slot_docs:
             slot_id = str(slot_doc.get("_id") or "").strip()
             provider_tenant_id = str(slot_doc.get("service_provider_tenant_id") or "").strip()
@@ -166,29 +299,23 @@ class request_shift_maintenance_manager:
             if not slot_id or not provider_tenant_id or not shift_id or not request_id:
                 continue
 
-            reminder_key = f"provider-roster:{slot_id}"
-            if await self._notification_exists(reminder_key=reminder_key, recipient_tenant_id=provider_tenant_id):
-                continue
-
-            request_title = await self._request_title(request_id)
-            await NotificationManager.get_instance().create_for_tenant_admin_users(
-                tenant_id=provider_tenant_id,
-                title="Provider guard roster due",
-                message=f"{request_title}: an upcoming provider-backed shift slot still needs a named guard rostered.",
-                category="warning",
-                source_module="requests",
-                action_url=f"/dashboard/requests?tab=shifts&shift={shift_id}",
-                action_label="Open Shift",
-                metadata={
+            reminders.append({
+                "tenant_id": provider_tenant_id,
+                "request_id": request_id,
+                "reminder_key": f"provider-roster:{slot_id}",
+                "title": "Provider guard roster due",
+                "message": "an upcoming provider-backed shift slot still needs a named guard rostered.",
+                "category": "warning",
+                "action_url": f"/dashboard/requests?tab=shifts&shift={shift_id}",
+                "action_label": "Open Shift",
+                "metadata": {
                     "request_id": request_id,
                     "shift_id": shift_id,
                     "slot_id": slot_id,
-                    "reminder_key": reminder_key,
                     "reminder_type": "provider_roster_due",
                 },
-            )
-            sent += 1
-        return sent
+            })
+        return await self._send_reminders(reminders, label="provider_roster_reminders")
 
     async def _send_guard_checkin_reminders(self) -> int:
         now = datetime.now(timezone.utc).replace(tzinfo=None)
@@ -218,8 +345,7 @@ class request_shift_maintenance_manager:
             "arrived_at": None,
         }).to_list(length=500)
 
-        shift_lookup = {str(shift_doc.get("_id")): shift_doc for shift_doc in shift_docs}
-        sent = 0
+        reminders: List[Dict[str, Any]] = []
         for slot_doc in slot_docs:
             slot_id = str(slot_doc.get("_id") or "").strip()
             guard_tenant_id = str(slot_doc.get("assigned_guard_tenant_id") or "").strip()
@@ -228,30 +354,23 @@ class request_shift_maintenance_manager:
             if not slot_id or not guard_tenant_id or not shift_id or not request_id:
                 continue
 
-            reminder_key = f"guard-checkin:{slot_id}"
-            if await self._notification_exists(reminder_key=reminder_key, recipient_tenant_id=guard_tenant_id):
-                continue
-
-            shift_doc = shift_lookup.get(shift_id, {})
-            request_title = await self._request_title(request_id)
-            await NotificationManager.get_instance().create_for_tenant_admin_users(
-                tenant_id=guard_tenant_id,
-                title="Shift starts in less than 5 minutes",
-                message=f"{request_title}: your shift is about to start. Open the shift slot now and complete check-in.",
-                category="info",
-                source_module="requests",
-                action_url=f"/dashboard/requests?tab=shifts&slot={slot_id}",
-                action_label="Open Shift Slot",
-                metadata={
+            reminders.append({
+                "tenant_id": guard_tenant_id,
+                "request_id": request_id,
+                "reminder_key": f"guard-checkin:{slot_id}",
+                "title": "Shift starts in less than 5 minutes",
+                "message": "your shift is about to start. Open the shift slot now and complete check-in.",
+                "category": "info",
+                "action_url": f"/dashboard/requests?tab=shifts&slot={slot_id}",
+                "action_label": "Open Shift Slot",
+                "metadata": {
                     "request_id": request_id,
                     "shift_id": shift_id,
                     "slot_id": slot_id,
-                    "reminder_key": reminder_key,
                     "reminder_type": "guard_checkin_due",
                 },
-            )
-            sent += 1
-        return sent
+            })
+        return await self._send_reminders(reminders, label="guard_checkin_reminders")
 
     async def _send_client_arrival_confirmation_reminders(self) -> int:
         now = datetime.now(timezone.utc).replace(tzinfo=None)
@@ -263,7 +382,7 @@ class request_shift_maintenance_manager:
             "started_at": None,
         }).to_list(length=300)
 
-        sent = 0
+        reminders: List[Dict[str, Any]] = []
         for slot_doc in slot_docs:
             slot_id = str(slot_doc.get("_id") or "").strip()
             client_tenant_id = str(slot_doc.get("client_tenant_id") or "").strip()
@@ -272,43 +391,81 @@ class request_shift_maintenance_manager:
             if not slot_id or not client_tenant_id or not shift_id or not request_id:
                 continue
 
-            reminder_key = f"client-confirm-arrival:{slot_id}"
-            if await self._notification_exists(reminder_key=reminder_key, recipient_tenant_id=client_tenant_id):
-                continue
-
-            request_title = await self._request_title(request_id)
-            await NotificationManager.get_instance().create_for_tenant_admin_users(
-                tenant_id=client_tenant_id,
-                title="Arrival confirmation pending",
-                message=f"{request_title}: a guard checked in and is still waiting for client arrival confirmation.",
-                category="warning",
-                source_module="requests",
-                action_url=f"/dashboard/requests?tab=shifts&slot={slot_id}",
-                action_label="Confirm Arrival",
-                metadata={
+            reminders.append({
+                "tenant_id": client_tenant_id,
+                "request_id": request_id,
+                "reminder_key": f"client-confirm-arrival:{slot_id}",
+                "title": "Arrival confirmation pending",
+                "message": "a guard checked in and is still waiting for client arrival confirmation.",
+                "category": "warning",
+                "action_url": f"/dashboard/requests?tab=shifts&slot={slot_id}",
+                "action_label": "Confirm Arrival",
+                "metadata": {
                     "request_id": request_id,
                     "shift_id": shift_id,
                     "slot_id": slot_id,
-                    "reminder_key": reminder_key,
                     "reminder_type": "client_arrival_confirmation_due",
                 },
+            })
+        return await self._send_reminders(reminders, label="client_confirmation_reminders")
+
+    async def _send_reminders(self, reminders: List[Dict[str, Any]], *, label: str) -> int:
+        # One dedup query and one title query per pass; the per-recipient upsert in
+        # NotificationManager still catches a reminder that lands between the two.
+        sent_keys = await self._sent_reminder_keys(reminders)
+        pending = [reminder for reminder in reminders if (reminder["tenant_id"], reminder["reminder_key"]) not in sent_keys]
+        if not pending:
+            return 0
+        request_titles = await self._request_titles([reminder["request_id"] for reminder in pending])
+        notification_manager = NotificationManager.get_instance()
+
+        async def _remind(reminder: Dict[str, Any]) -> bool:
+            request_title = request_titles.get(reminder["request_id"]) or "Scheduled request"
+            created = await notification_manager.create_for_tenant_admin_users(
+                tenant_id=reminder["tenant_id"],
+                title=reminder["title"],
+                message=f"{request_title}: {reminder['message']}",
+                category=reminder["category"],
+                source_module="requests",
+                action_url=reminder["action_url"],
+                action_label=reminder["action_label"],
+                metadata={**reminder["metadata"], "reminder_key": reminder["reminder_key"]},
+                reminder_key=reminder["reminder_key"],
             )
-            sent += 1
-        return sent
+            return bool(created)
+
+        results = await run_bounded(pending, _remind, concurrency=self._ITEM_CONCURRENCY, label=label)
+        return sum(1 for sent in results if sent)
 
-    async def _notification_exists(self, *, reminder_key: str, recipient_tenant_id: str) -> bool:
+    async def _sent_reminder_keys(self, reminders: List[Dict[str, Any]]) -> Set[Tuple[str, str]]:
+        if not reminders:
+            return set()
         notification_collection = self._engine.get_collection(NotificationRecord)
-        count = await notification_collection.count_documents({
-            "recipient_tenant_id": str(recipient_tenant_id),
-            "source_module": "requests",
-            "metadata.reminder_key": str(reminder_key),
-        })
-        return bool(count)
-
-    async def _request_title(self, request_id: str) -> str:
-        try:
-            request_record = await RequestManager.get_instance()._get_request_or_404(str(request_id))
-        except Exception:
-            return "Scheduled request"
-        title = str(getattr(request_record, "title", "") or "").strip()
-        return title or "Scheduled request"
+        notification_docs = await notification_collection.find(
+            {
+                "recipient_tenant_id": {"$in": sorted({reminder["tenant_id"] for reminder in reminders})},
+                "source_module": "requests",
+                "metadata.reminder_key": {"$in": sorted({reminder["reminder_key"] for reminder in reminders})},
+            },
+            {"recipient_tenant_id": 1, "metadata.reminder_key": 1},
+        ).to_list(length=None)
+        return {
+            (str(doc.get("recipient_tenant_id") or ""), str((doc.get("metadata") or {}).get("reminder_key") or ""))
+            for doc in notification_docs
+        }
+
+    async def _request_titles(self, request_ids: List[str]) -> Dict[str, str]:
+        object_ids = []
+        for request_id in sorted(set(request_ids)):
+            try:
+                object_ids.append(ObjectId(request_id))
+            except Exception:
+                continue
+        if not object_ids:
+            return {}
+        request_collection = self._engine.get_collection(ClientRequestRecord)
+        request_docs = await request_collection.find({"_id": {"$in": object_ids}}, {"title": 1}).to_list(length=None)
+        return {
+            str(doc.get("_id")): str(doc.get("title") or "").strip() or "Scheduled request"
+            for doc in request_docs
+        }
@@ -1,29 +1,194 @@
-from threading import Timer
-
-
-class RepeatedTimer(object):
-    def __init__(self, interval, function, trigger_on_start=True, *args, **kwargs):
-        self._timer = None
-        self.interval = interval
-        self.function = function
-        self.args = args
-        self.kwargs = kwargs
-        self.is_running = False
-        self.start()
-        if trigger_on_start:
-            self.function(*self.args, **self.kwargs)
-
-    def _run(self):
-        self.is_running = False
-        self.start()
-        self.function(*self.args, **self.kwargs)
-
-    def start(self):
-        if not self.is_running:
-            self._timer = Timer(self.interval, self._run)
-            self._timer.start()
-            self.is_running = True
-
-    def stop(self):
-        self._timer.cancel()
-        self.is_running = False
+import asyncio
+import os
+import random
+import socket
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from orion.helper_manager.env_handler import env_handler
+from orion.services.log_manager.log_controller import log
+from orion.services.redis_manager.redis_controller import redis_controller
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def run_bounded(
+    items: Sequence[T],
+    worker: Callable[[T], Awaitable[R]],
+    *,
+    concurrency: int,
+    label: str = "bounded",
+) -> List[Optional[R]]:
+    # Results keep the order of items; a failing item is logged and yields None so it
+    # cannot cancel its siblings inside the task group.
+    items = list(items)
+    results: List[Optional[R]] = [None] * len(items)
+    if not items:
+        return results
+    semaphore = asyncio.Semaphore(max(int(concurrency or 1), 1))
+
+    async def _run(index: int, item: T) -> None:
+        async with semaphore:
+            try:
+                results[index] = await worker(item)
+            except Exception as ex:
+                log.g().e(f"BOUNDED TASK ERROR ({label}): {ex}")
+
+    async with asyncio.TaskGroup() as group:
+        for index, item in enumerate(items):
+            group.create_task(_run(index, item))
+    return results
+
+
+class ScheduledJob:
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval: float,
+        *,
+        jitter: float = 0.0,
+        timeout: Optional[float] = None,
+        initial_delay: float = 0.0,
+        leader_only: bool = True,
+        group: Optional[str] = None,
+    ):
+        self.name = name
+        # Jobs in the same group never run at the same time and share one leader lease,
+        # so they are always serialised on a single replica.
+        self.group = group
+        self.func = func
+        self.interval = float(interval)
+        self.jitter = float(jitter)
+        self.timeout = float(timeout) if timeout is not None else None
+        self.initial_delay = float(initial_delay)
+        self.leader_only = leader_only
+        self.lock = asyncio.Lock()
+        self.last_result: Any = None
+        self.last_error: Optional[str] = None
+        self.last_started_at: Optional[float] = None
+        self.last_duration: Optional[float] = None
+
+    @property
+    def lease_ttl(self) -> int:
+        # Long enough to survive one full run plus the gap to the next one, so a live
+        # leader renews before it expires and a dead one is replaced within a cycle.
+        return int(self.interval + self.jitter + (self.timeout or self.interval)) + 1
+
+
+class JobScheduler:
+    LEASE_PREFIX = "scheduler:lease"
+
+    def __init__(self, name: str, jobs: Optional[List[ScheduledJob]] = None, *, holder_id: Optional[str] = None):
+        self.name = name
+        # A holder id that survives restarts (e.g. the pod or host name) lets a replacement
+        # process renew the leases its crashed predecessor left behind instead of waiting them out.
+        self.holder_id = (
+            holder_id
+            or env_handler.get_instance().env("SCHEDULER_HOLDER_ID")
+            or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._group_locks: Dict[str, asyncio.Lock] = {}
+        for job in jobs or []:
+            self.add_job(job)
+
+    def add_job(self, job: ScheduledJob) -> None:
+        if job.name in self._jobs:
+            raise ValueError(f"Job already registered: {job.name}")
+        self._jobs[job.name] = job
+        if job.group is not None:
+            self._group_locks.setdefault(job.group, asyncio.Lock())
+
+    @property
+    def jobs(self) -> Dict[str, ScheduledJob]:
+        return dict(self._jobs)
+
+    def is_running(self) -> bool:
+        return any(not task.done() for task in self._tasks.values())
+
+    def _lease_key(self, job: ScheduledJob) -> str:
+        return f"{self.LEASE_PREFIX}:{self.name}:{job.group or job.name}"
+
+    async def start(self) -> None:
+        for name, job in self._jobs.items():
+            task = self._tasks.get(name)
+            if task is not None and not task.done():
+                continue
+            self._tasks[name] = asyncio.create_task(self._run_loop(job), name=f"{self.name}:{name}")
+
+    async def stop(self) -> None:
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        lease_keys = {self._lease_key(job) for job in self._jobs.values() if job.leader_only}
+        for lease_key in sorted(lease_keys):
+            try:
+                await redis_controller.getInstance().release_lease(lease_key, self.holder_id)
+            except Exception:
+                pass
+
+    async def _run_loop(self, job: ScheduledJob) -> None:
+        await asyncio.sleep(job.initial_delay + random.uniform(0, job.jitter))
+        while True:
+            started = time.monotonic()
+            await self.run_job(job.name)
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(job.interval - elapsed, 0) + random.uniform(0, job.jitter))
+
+    async def _is_leader(self, job: ScheduledJob) -> bool:
+        if not job.leader_only:
+            return True
+        try:
+            return await redis_controller.getInstance().acquire_lease(self._lease_key(job), self.holder_id, job.lease_ttl)
+        except Exception as ex:
+            # Without Redis no replica can prove leadership, so every one of them skips the run.
+            log.g().w(f"SCHEDULER LEASE ERROR ({self.name}:{job.name}): {ex}")
+            return False
+
+    @staticmethod
+    def _has_activity(result: Any) -> bool:
+        if isinstance(result, dict):
+            return any(result.values())
+        return bool(result)
+
+    async def run_job(self, name: str) -> Any:
+        job = self._jobs[name]
+        if job.lock.locked():
+            log.g().w(f"SCHEDULER SKIPPED OVERLAPPING RUN ({self.name}:{job.name})")
+            return None
+        async with job.lock:
+            if job.group is None:
+                return await self._run_as_leader(job)
+            async with self._group_locks[job.group]:
+                return await self._run_as_leader(job)
+
+    async def _run_as_leader(self, job: ScheduledJob) -> Any:
+        if not await self._is_leader(job):
+            return None
+        job.last_started_at = time.time()
+        started = time.monotonic()
+        try:
+            if job.timeout is not None:
+                job.last_result = await asyncio.wait_for(job.func(), timeout=job.timeout)
+            else:
+                job.last_result = await job.func()
+            job.last_error = None
+            if self._has_activity(job.last_result):
+                log.g().i(f"SCHEDULER JOB ({self.name}:{job.name}): {job.last_result}")
+        except asyncio.TimeoutError:
+            job.last_result = None
+            job.last_error = f"timed out after {job.timeout}s"
+            log.g().e(f"SCHEDULER JOB TIMEOUT ({self.name}:{job.name}): {job.last_error}")
+        except Exception as ex:
+            job.last_result = None
+            job.last_error = str(ex)
+            log.g().e(f"SCHEDULER JOB ERROR ({self.name}:{job.name}): {ex}")
+        finally:
+            job.last_duration = time.monotonic() - started
+        return job.last_result
@@ -30,6 +30,7 @@ class service_manager:
 
         service_manager.__instance = self
         self._is_available = False
+        self._index_task = None
 
     async def init_services(self):
         await test_manager.get_instance().apply_test_overrides()
@@ -39,6 +40,10 @@ class service_manager:
                 await mongo_controller.get_instance().link_connection()
                 await mongo_controller.get_instance().ensure_indexes()
                 await mongo_controller.get_instance().initialize()
+                self._index_task = asyncio.create_task(
+                    mongo_controller.get_instance().reconcile_indexes(),
+                    name="mongo_index_reconciliation",
+                )
 
                 await test_manager.get_instance().reset_test_mongo_and_import_mocks()
 
@@ -58,6 +63,10 @@ class service_manager:
             await sleep(5)
         await request_shift_maintenance_manager.get_instance().start()
 
+    async def stop_cronjobs(self):
+        # Releases the scheduler's leader leases so a replacement process can take over at once.
+        await request_shift_maintenance_manager.get_instance().stop()
+
     def check_status(self):
         return self._is_available
 
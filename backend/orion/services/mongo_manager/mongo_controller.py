@@ -8,6 +8,7 @@ from orion.services.mongo_manager.mongo_enums import MONGO_CONNECTIONS
 from orion.services.mongo_manager.shared_model.db_auth_models import db_user_account, user_role
 from orion.services.mongo_manager.shared_model.db_system_settings import db_system_model
 from orion.services.mongo_manager.shared_model.db_keys import db_keys
+from orion.services.mongo_manager.mongo_index_registry import reconcile_indexes
 from orion.services.mongo_manager.shared_model.db_tenant_model import db_tenant_model
 from orion.services.mongo_manager.shared_views.tenant_admin_view import TenantAdminView
 from orion.services.mongo_manager.shared_views.tenant_key_admin_view import TenantKeyAdminView
@@ -69,6 +70,9 @@ class mongo_controller:
 
         await self.__engine.get_collection(db_system_model).create_index("key", unique=True)
 
+    async def reconcile_indexes(self, dry_run: bool = False):
+        return await reconcile_indexes(self.__engine, dry_run=dry_run)
+
     async def migrate_legacy_admin_role(self):
         user_collection = self.__engine.get_collection(db_user_account)
 
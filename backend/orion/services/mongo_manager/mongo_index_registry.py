@@ -0,0 +1,297 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from odmantic import Model
+from odmantic.index import ODMBaseIndex
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from orion.services.log_manager.log_controller import log
+from orion.services.mongo_manager.shared_model.db_activity_log import ActivityLog
+from orion.services.mongo_manager.shared_model.db_auth_models import db_user_account
+from orion.services.mongo_manager.shared_model.db_billing_model import BillingRate, TravelPricingPolicy
+from orion.services.mongo_manager.shared_model.db_keys import db_keys
+from orion.services.mongo_manager.shared_model.db_notification_model import NotificationRecord
+from orion.services.mongo_manager.shared_model.db_request_model import (
+    ClientRequestRecord,
+    GuardLeaveBalanceRecord,
+    GuardLeavePolicyRecord,
+    GuardPlannedLeaveRecord,
+    RequestAssignmentRecord,
+    RequestBroadcastWaveRecord,
+    RequestInvoiceRecord,
+    RequestPayoutAdjustmentRecord,
+    RequestPayoutLedgerRecord,
+    RequestScheduleTemplateRecord,
+    RequestWeeklyPayoutRecord,
+    ShiftAttendanceEventRecord,
+    ShiftGuardLeaveRecord,
+    ShiftInstanceRecord,
+    ShiftSlotRecord,
+)
+from orion.services.mongo_manager.shared_model.db_system_settings import db_system_model
+from orion.services.mongo_manager.shared_model.db_tenant_model import (
+    GuardStatusChangeRequest,
+    TenantStatusAudit,
+    db_tenant_model,
+)
+
+
+INDEXED_MODELS: Tuple[Type[Model], ...] = (
+    ActivityLog,
+    db_user_account,
+    BillingRate,
+    TravelPricingPolicy,
+    db_keys,
+    NotificationRecord,
+    ClientRequestRecord,
+    RequestAssignmentRecord,
+    RequestBroadcastWaveRecord,
+    RequestScheduleTemplateRecord,
+    RequestInvoiceRecord,
+    RequestPayoutAdjustmentRecord,
+    RequestPayoutLedgerRecord,
+    RequestWeeklyPayoutRecord,
+    ShiftInstanceRecord,
+    ShiftSlotRecord,
+    ShiftAttendanceEventRecord,
+    ShiftGuardLeaveRecord,
+    GuardLeavePolicyRecord,
+    GuardLeaveBalanceRecord,
+    GuardPlannedLeaveRecord,
+    db_system_model,
+    db_tenant_model,
+    TenantStatusAudit,
+    GuardStatusChangeRequest,
+)
+
+# Compound indexes for the query shapes the managers actually run. Single-field
+# indexes come from Field(index=True) / Field(unique=True) on the models.
+COMPOUND_INDEXES: Dict[Type[Model], List[IndexModel]] = {
+    db_tenant_model: [
+        IndexModel(
+            [("tenant_type", ASCENDING), ("status", ASCENDING), ("match_region_codes", ASCENDING)],
+            name="tenant_match_region_prefilter",
+        ),
+        IndexModel([("match_geo_point", "2dsphere")], name="tenant_match_geo_point_2dsphere"),
+    ],
+    ClientRequestRecord: [
+        IndexModel([("requested_start_at", ASCENDING), ("requested_end_at", ASCENDING)], name="request_window_overlap"),
+        IndexModel(
+            [("deleted_at", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="request_list_recent",
+        ),
+        IndexModel(
+            [("deleted_at", ASCENDING), ("client_tenant_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="request_list_by_client",
+        ),
+        IndexModel(
+            [("deleted_at", ASCENDING), ("request_status", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="request_list_by_status",
+        ),
+        IndexModel(
+            [("deleted_at", ASCENDING), ("fulfillment_mode", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="request_list_by_fulfillment_mode",
+        ),
+    ],
+    RequestAssignmentRecord: [
+        IndexModel(
+            [
+                ("request_id", ASCENDING),
+                ("assignee_tenant_type", ASCENDING),
+                ("assignment_scope", ASCENDING),
+                ("assignment_status", ASCENDING),
+            ],
+            name="assignment_request_commitment",
+        ),
+        IndexModel(
+            [("assignee_tenant_id", ASCENDING), ("updated_at", DESCENDING), ("_id", DESCENDING)],
+            name="assignment_jobs_by_assignee",
+        ),
+        IndexModel(
+            [("client_tenant_id", ASCENDING), ("updated_at", DESCENDING), ("_id", DESCENDING)],
+            name="assignment_jobs_by_client",
+        ),
+        IndexModel([("updated_at", DESCENDING), ("_id", DESCENDING)], name="assignment_jobs_recent"),
+    ],
+    RequestScheduleTemplateRecord: [
+        IndexModel([("active", ASCENDING), ("_id", ASCENDING)], name="schedule_generation_scan"),
+    ],
+    RequestPayoutLedgerRecord: [
+        IndexModel(
+            [("invoice_created_at", DESCENDING), ("_id", DESCENDING)],
+            name="payout_ledger_recent",
+        ),
+        IndexModel(
+            [("assignee_tenant_type", ASCENDING), ("invoice_created_at", DESCENDING), ("_id", DESCENDING)],
+            name="payout_ledger_by_type_recent",
+        ),
+    ],
+    RequestWeeklyPayoutRecord: [
+        IndexModel(
+            [("assignee_tenant_id", ASCENDING), ("request_id", ASCENDING)],
+            name="weekly_payout_scope",
+            unique=True,
+        ),
+    ],
+    ShiftInstanceRecord: [
+        # Left unbuilt (and logged) while dedupe_shift_instances_per_template_date has unresolved duplicates.
+        IndexModel(
+            [("schedule_template_id", ASCENDING), ("shift_date_local", ASCENDING)],
+            name="unique_shift_per_template_date",
+            unique=True,
+        ),
+        IndexModel(
+            [("request_id", ASCENDING), ("shift_start_at_utc", ASCENDING), ("_id", ASCENDING)],
+            name="shift_list_by_request_start",
+        ),
+        IndexModel([("shift_start_at_utc", ASCENDING), ("instance_status", ASCENDING)], name="shift_runtime_window"),
+        IndexModel(
+            [("visible_tenant_ids", ASCENDING), ("shift_start_at_utc", ASCENDING), ("_id", ASCENDING)],
+            name="shift_list_by_visible_tenant_start",
+        ),
+        IndexModel(
+            [("request_id", ASCENDING), ("updated_at", ASCENDING)],
+            name="shift_by_request_updated",
+        ),
+    ],
+    ShiftSlotRecord: [
+        IndexModel([("shift_instance_id", ASCENDING), ("slot_status", ASCENDING)], name="slot_by_shift_status"),
+        IndexModel([("slot_status", ASCENDING), ("roster_due_at", ASCENDING)], name="slot_roster_due"),
+        IndexModel([("slot_status", ASCENDING), ("arrived_at", ASCENDING)], name="slot_arrival_confirmation"),
+        IndexModel(
+            [("slot_status", ASCENDING), ("shift_start_at_utc", ASCENDING), ("_id", ASCENDING)],
+            name="slot_exception_queue",
+        ),
+        IndexModel(
+            [("request_id", ASCENDING), ("shift_date_local", ASCENDING)],
+            name="slot_by_request_date",
+        ),
+        IndexModel(
+            [("request_id", ASCENDING), ("updated_at", ASCENDING)],
+            name="slot_by_request_updated",
+        ),
+    ],
+    NotificationRecord: [
+        IndexModel(
+            [("recipient_user_id", ASCENDING), ("is_read", ASCENDING), ("created_at", DESCENDING)],
+            name="notification_recipient_unread_recent",
+        ),
+        IndexModel(
+            [("recipient_user_id", ASCENDING), ("created_at", DESCENDING)],
+            name="notification_recipient_recent",
+        ),
+        IndexModel(
+            [("recipient_tenant_id", ASCENDING), ("source_module", ASCENDING), ("metadata.reminder_key", ASCENDING)],
+            name="notification_reminder_lookup",
+        ),
+        # Left unbuilt (and logged) until dedupe_notification_reminders has removed legacy duplicates.
+        IndexModel(
+            [("recipient_user_id", ASCENDING), ("metadata.reminder_key", ASCENDING)],
+            name="unique_notification_reminder_per_recipient",
+            unique=True,
+            partialFilterExpression={"metadata.reminder_key": {"$exists": True}},
+        ),
+    ],
+    GuardPlannedLeaveRecord: [
+        IndexModel(
+            [("guard_tenant_id", ASCENDING), ("request_status", ASCENDING), ("start_at_utc", ASCENDING), ("end_at_utc", ASCENDING)],
+            name="planned_leave_guard_window",
+        ),
+    ],
+}
+
+
+def _index_key(document: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    return tuple((str(field), direction) for field, direction in dict(document["key"]).items())
+
+
+def desired_indexes(model: Type[Model]) -> List[IndexModel]:
+    indexes: List[IndexModel] = []
+    for index in model.__indexes__():
+        indexes.append(index.get_pymongo_index() if isinstance(index, ODMBaseIndex) else index)
+    indexes.extend(COMPOUND_INDEXES.get(model, []))
+    return indexes
+
+
+def _redundant_index_names(existing: Dict[str, Dict[str, Any]]) -> List[str]:
+    # A plain index whose key is a strict prefix of another index's key is already served by the longer one.
+    keys = {name: tuple((str(field), direction) for field, direction in info.get("key", [])) for name, info in existing.items()}
+    redundant = []
+    for name, key in keys.items():
+        info = existing[name]
+        if name == "_id_" or info.get("unique") or info.get("partialFilterExpression") or info.get("sparse"):
+            continue
+        if any(other_name != name and len(other) > len(key) and other[: len(key)] == key for other_name, other in keys.items()):
+            redundant.append(name)
+    return sorted(redundant)
+
+
+async def _unused_index_names(collection) -> List[str]:
+    try:
+        stats = await collection.aggregate([{"$indexStats": {}}]).to_list(length=None)
+    except Exception:
+        return []
+    return sorted(
+        str(item.get("name"))
+        for item in stats
+        if item.get("name") != "_id_" and int((item.get("accesses") or {}).get("ops") or 0) == 0
+    )
+
+
+async def reconcile_model_indexes(engine, model: Type[Model], *, dry_run: bool = False) -> Dict[str, Any]:
+    collection = engine.get_collection(model)
+    existing = await collection.index_information()
+    existing_keys = {tuple((str(field), direction) for field, direction in info.get("key", [])) for info in existing.values()}
+
+    missing: List[IndexModel] = []
+    desired_names = set()
+    for index in desired_indexes(model):
+        desired_names.add(index.document["name"])
+        key = _index_key(index.document)
+        if key in existing_keys:
+            continue
+        existing_keys.add(key)
+        missing.append(index)
+
+    created: List[str] = []
+    failed: List[str] = []
+    if missing and not dry_run:
+        # One at a time so an unbuildable index (e.g. unique over legacy duplicates) doesn't block the rest.
+        for index in missing:
+            name = index.document["name"]
+            try:
+                await collection.create_indexes([index])
+            except Exception as ex:
+                log.g().e(f"INDEX CREATION ERROR ({collection.name}.{name}): {ex}")
+                failed.append(name)
+                continue
+            created.append(name)
+        existing = await collection.index_information()
+
+    return {
+        "collection": collection.name,
+        "missing": [index.document["name"] for index in missing],
+        "created": created,
+        "failed": failed,
+        "unmanaged": sorted(name for name in existing if name != "_id_" and name not in desired_names),
+        "redundant": _redundant_index_names(existing),
+        "unused": await _unused_index_names(collection),
+    }
+
+
+async def reconcile_indexes(
+    engine,
+    models: Optional[Sequence[Type[Model]]] = None,
+    *,
+    dry_run: bool = False,
+) -> List[Dict[str, Any]]:
+    reports = []
+    for model in models or INDEXED_MODELS:
+        try:
+            report = await reconcile_model_indexes(engine, model, dry_run=dry_run)
+        except Exception as ex:
+            log.g().e(f"INDEX RECONCILIATION ERROR ({model.__name__}): {ex}")
+            continue
+        reports.append(report)
+        if report["missing"] or report["redundant"] or report["failed"]:
+            log.g().i(f"INDEX RECONCILIATION: {report}")
+    return reports
@@ -258,6 +258,12 @@ class ClientRequestRecord(Model):
     expired_at: Optional[datetime] = Field(default=None, index=True)
     match_summary: Dict[str, Any] = {}
     matched_candidates: List[Dict[str, Any]] = []
+    # Set when committed coverage changes; cleared once shift slots are reconciled.
+    shift_slots_dirty: bool = Field(default=False, index=True)
+    # Set when assignments, attendance or invoices behind this request's payouts change.
+    payout_ledger_dirty: bool = Field(default=False, index=True)
+    payout_ledger_state: Optional[str] = None
+    advance_invoice_state: Optional[str] = None
     cancelled_at: Optional[datetime] = None
     closed_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = Field(default=None, index=True)
@@ -353,6 +359,7 @@ class RequestScheduleTemplateRecord(Model):
     checkin_geofence_meters: int = 200
     active: bool = True
     system_generated: bool = False
+    generated_through_date: Optional[str] = Field(default=None, index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
     updated_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
@@ -419,6 +426,41 @@ class RequestPayoutAdjustmentRecord(Model):
     updated_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
 
+class RequestPayoutLedgerRecord(Model):
+    # One row per platform payout invoice, rebuilt per request so the finance list is an indexed query.
+    invoice_id: str = Field(unique=True)
+    request_id: str = Field(index=True)
+    assignee_tenant_id: str = Field(index=True)
+    assignee_tenant_type: str = Field(index=True)
+    # Lower-cased word tokens of the searchable labels; keyword search is an anchored prefix match per token.
+    search_tokens: List[str] = Field(default_factory=list, index=True)
+    invoice_created_at: Optional[datetime] = Field(default=None, index=True)
+    estimated_total_hours: float = 0.0
+    estimated_client_revenue: float = 0.0
+    estimated_amount: float = 0.0
+    baseline_estimated_amount: float = 0.0
+    payout_adjustment_total: float = 0.0
+    estimated_platform_earning: float = 0.0
+    baseline_estimated_platform_earning: float = 0.0
+    payout_adjustment_draft_count: int = 0
+    payout_adjustment_count: int = 0
+    payout_adjustment_voided_count: int = 0
+    item: Dict[str, Any] = {}
+    refreshed_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+
+class RequestWeeklyPayoutRecord(Model):
+    # Weekly payout items for one assignee on a long-term request, keyed by week start.
+    # Closed weeks are rebuilt only when their slots or the request's payout inputs change.
+    request_id: str = Field(index=True)
+    assignee_tenant_id: str = Field(index=True)
+    assignee_tenant_type: str = ""
+    input_state: str = ""
+    closed_through_local: Optional[str] = None
+    weeks: Dict[str, Dict[str, Any]] = {}
+    built_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class ShiftInstanceRecord(Model):
     request_id: str = Field(index=True)
     client_tenant_id: str = Field(index=True)
@@ -434,6 +476,10 @@ class ShiftInstanceRecord(Model):
     slots_completed: int = 0
     client_action_required: bool = False
     roster_due_at: Optional[datetime] = Field(default=None, index=True)
+    # Client tenant plus every provider/guard tenant currently covering a slot; kept in sync by the shift manager.
+    visible_tenant_ids: List[str] = Field(default_factory=list)
+    # Copied from the request on soft delete so progress recomputes keep the shift hidden.
+    request_deleted_at: Optional[datetime] = None
     created_from_revision: int = Field(default=0, index=True)
     cancel_reason: Optional[str] = None
     reduction_reason: Optional[str] = None
@@ -454,6 +500,11 @@ class ShiftSlotRecord(Model):
     assigned_guard_tenant_id: Optional[str] = Field(default=None, index=True)
     slot_status: ShiftSlotStatus = Field(default=ShiftSlotStatus.OPEN, index=True)
     replacement_of_slot_id: Optional[str] = Field(default=None, index=True)
+    # Copied from the parent shift so the exception queue can sort and date-filter slots without a join.
+    shift_start_at_utc: Optional[datetime] = None
+    shift_date_local: Optional[str] = None
+    # Copied from the request on soft delete so the exception queue can skip removed requests.
+    request_deleted_at: Optional[datetime] = None
     rostered_at: Optional[datetime] = None
     roster_due_at: Optional[datetime] = Field(default=None, index=True)
     guard_unavailable_reported_at: Optional[datetime] = None
@@ -346,6 +346,13 @@ class db_tenant_model(Model):
     unlinked_at: Optional[datetime] = None
     unlinked_by: Optional[str] = None
 
+    # Matching prefilter (derived from profile on save; see RequestMatchingManager.build_match_index)
+    match_region_codes: List[str] = Field(default_factory=list)
+    match_geo_point: Optional[Dict[str, Any]] = Field(default=None)
+    match_radius_km: Optional[float] = Field(default=None)
+    # Guard weekly availability as merged [start, end) minute windows per logical day (see compile_weekly_availability)
+    match_availability_windows: Optional[Dict[str, List[List[int]]]] = Field(default=None)
+
     # Auditing/metadata
     created_at: Optional[datetime] = Field(default=None)
     updated_at: Optional[datetime] = Field(default=None)
@@ -1,8 +1,44 @@
+from typing import Any, Dict, List, Optional, Sequence
+
 import redis.asyncio as redis
 
 from orion.services.redis_manager.redis_enums import REDIS_CONNECTIONS, REDIS_COMMANDS
 
 
+# Adjusts counters that are already cached; a negative result drops the key so it is rebuilt from source.
+_INCR_EXISTING_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('DEL', KEYS[1])
+end
+return value
+"""
+
+# Takes a lease when it is free and renews it when the caller already holds it.
+_ACQUIRE_LEASE_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if holder == ARGV[1] then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+if holder then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+_RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
 class redis_controller:
     __redis = None
     __instance = None
@@ -19,67 +55,110 @@ class redis_controller:
 
     async def initialize(self):
         """Initialize the Redis connection asynchronously."""
-        self.__redis = redis.Redis(
+        # A blocking pool waits for a free connection instead of failing when a burst exceeds the cap.
+        pool = redis.BlockingConnectionPool(
             host=REDIS_CONNECTIONS.S_DATABASE_IP,
             port=REDIS_CONNECTIONS.S_DATABASE_PORT,
             password=REDIS_CONNECTIONS.S_DATABASE_PASSWORD,
+            max_connections=REDIS_CONNECTIONS.S_MAX_CONNECTIONS,
+            timeout=REDIS_CONNECTIONS.S_POOL_TIMEOUT,
+            health_check_interval=REDIS_CONNECTIONS.S_HEALTH_CHECK_INTERVAL,
             decode_responses=True)
+        self.__redis = redis.Redis(connection_pool=pool)
 
     @classmethod
     async def destroy_instance(cls):
         cls.__instance = None
 
     async def close_connection(self):
-        await self.__redis.close()
+        await self.__redis.aclose()
+        await self.__redis.connection_pool.disconnect()
+
+    # Typed API: every call is a single round trip.
+
+    async def get(self, p_key: str) -> Optional[str]:
+        return await self.__redis.get(p_key)
+
+    async def get_or_set(self, p_key: str, p_default: Any, expiry: Optional[int] = None) -> Any:
+        # SET NX GET writes the default only when the key is missing and returns the prior value.
+        previous = await self.__redis.set(p_key, p_default, ex=expiry, nx=True, get=True)
+        return str(p_default) if previous is None else previous
+
+    async def get_and_touch(self, p_key: str, expiry: int) -> Optional[str]:
+        return await self.__redis.getex(p_key, ex=expiry)
+
+    async def set(self, p_key: str, p_val: Any, expiry: Optional[int] = None) -> None:
+        await self.__redis.set(p_key, p_val, ex=expiry)
+
+    async def mget(self, p_keys: Sequence[str]) -> List[Optional[str]]:
+        if not p_keys:
+            return []
+        return await self.__redis.mget(list(p_keys))
+
+    async def set_many(self, p_values: Dict[str, Any], expiry: Optional[int] = None) -> None:
+        if not p_values:
+            return
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            for key, value in p_values.items():
+                pipe.set(key, value, ex=expiry)
+            await pipe.execute()
+
+    async def delete(self, *p_keys: str) -> int:
+        if not p_keys:
+            return 0
+        return await self.__redis.delete(*p_keys)
+
+    def pipeline(self, transaction: bool = False):
+        return self.__redis.pipeline(transaction=transaction)
+
+    async def incr_existing(self, p_keys: Sequence[str], p_amount: int) -> List[Optional[int]]:
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            for key in p_keys:
+                pipe.eval(_INCR_EXISTING_SCRIPT, 1, key, int(p_amount))
+            return await pipe.execute()
+
+    async def acquire_lease(self, p_key: str, p_holder: str, ttl: int) -> bool:
+        return bool(await self.__redis.eval(_ACQUIRE_LEASE_SCRIPT, 1, p_key, p_holder, int(ttl)))
+
+    async def release_lease(self, p_key: str, p_holder: str) -> bool:
+        return bool(await self.__redis.eval(_RELEASE_LEASE_SCRIPT, 1, p_key, p_holder))
+
+    async def publish(self, p_channel: str, p_message: str) -> int:
+        return await self.__redis.publish(p_channel, p_message)
+
+    async def subscribe(self, *p_channels: str):
+        pubsub = self.__redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(*p_channels)
+        return pubsub
+
+    # Legacy command handlers behind invoke_trigger.
 
     async def __set_bool(self, p_key, p_val):
-        await self.__redis.set(p_key, int(p_val))
+        await self.set(p_key, int(p_val))
 
     async def __get_bool(self, p_key, p_val=None):
-        exists = await self.__redis.exists(p_key)
-        if not exists:
-            if p_val is not None:
-                await self.__set_bool(p_key, p_val)
-            else:
-                return None
-        return bool(int(await self.__redis.get(p_key)))
-
-    async def __set_int(self, p_key, p_val, expiry=None):
-        await self.__redis.set(p_key, p_val, ex=expiry)
+        if p_val is None:
+            value = await self.get(p_key)
+            return None if value is None else bool(int(value))
+        return bool(int(await self.get_or_set(p_key, int(p_val))))
 
     async def __get_int(self, p_key, p_val, expiry=None):
-        exists = await self.__redis.exists(p_key)
-        if not exists:
-            await self.__set_int(p_key, p_val, expiry)
-        return await self.__redis.get(p_key)
-
-    async def __set_float(self, p_key, p_val, expiry=None):
-        await self.__redis.set(p_key, p_val, ex=expiry)
+        return await self.get_or_set(p_key, p_val, expiry)
 
     async def __get_float(self, p_key, p_val, expiry=None):
-        exists = await self.__redis.exists(p_key)
-        if not exists:
-            await self.__set_float(p_key, p_val, expiry)
-        return float(await self.__redis.get(p_key))
-
-    async def __set_string(self, p_key, p_val, expiry=None):
-        await self.__redis.set(p_key, p_val, ex=expiry)
+        return float(await self.get_or_set(p_key, p_val, expiry))
 
     async def __get_string(self, p_key, p_val=None, expiry=None):
-        exists = await self.__redis.exists(p_key)
-        if not exists:
-            if p_val is not None:
-                await self.__set_string(p_key, p_val)
-                if expiry is not None:
-                    await self.__redis.expire(p_key, expiry)
-            else:
-                return None
-        return await self.__redis.get(p_key)
+        if p_val is None:
+            return await self.get(p_key)
+        return await self.get_or_set(p_key, p_val, expiry)
 
     async def __set_list(self, p_key, p_val, expiry=None):
-        await self.__redis.sadd(p_key, p_val)
-        if expiry is not None:
-            await self.__redis.expire(p_key, expiry)
+        async with self.__redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(p_key, p_val)
+            if expiry is not None:
+                pipe.expire(p_key, expiry)
+            await pipe.execute()
 
     async def __get_list(self, p_key, p_val, expiry=None):
         exists = await self.__redis.exists(p_key)
@@ -106,7 +185,7 @@ class redis_controller:
         if p_commands == REDIS_COMMANDS.S_GET_INT:
             return await self.__get_int(p_data[0], p_data[1], p_data[2])
         elif p_commands == REDIS_COMMANDS.S_SET_INT:
-            return await self.__set_int(p_data[0], p_data[1], p_data[2])
+            return await self.set(p_data[0], p_data[1], p_data[2])
         elif p_commands == REDIS_COMMANDS.S_GET_BOOL:
             return await self.__get_bool(p_data[0], p_data[1])
         elif p_commands == REDIS_COMMANDS.S_SET_BOOL:
@@ -114,7 +193,7 @@ class redis_controller:
         elif p_commands == REDIS_COMMANDS.S_GET_STRING:
             return await self.__get_string(p_data[0], p_data[1], p_data[2])
         elif p_commands == REDIS_COMMANDS.S_SET_STRING:
-            return await self.__set_string(p_data[0], p_data[1], p_data[2])
+            return await self.set(p_data[0], p_data[1], p_data[2])
         elif p_commands == REDIS_COMMANDS.S_SET_LIST:
             return await self.__set_list(p_data[0], p_data[1], p_data[2])
         elif p_commands == REDIS_COMMANDS.S_GET_LIST:
@@ -124,10 +203,18 @@ class redis_controller:
         elif p_commands == REDIS_COMMANDS.S_GET_FLOAT:
             return await self.__get_float(p_data[0], p_data[1], p_data[2])
         elif p_commands == REDIS_COMMANDS.S_SET_FLOAT:
-            return await self.__set_float(p_data[0], p_data[1], p_data[2])
+            return await self.set(p_data[0], p_data[1], p_data[2])
         elif p_commands == REDIS_COMMANDS.S_FLUSH_ALL:
             await self.__flush_all()
         elif p_commands == REDIS_COMMANDS.S_ACQUIRE_LOCK:
             return await self.__acquire_lock(p_data[0], p_data[1], p_data[2])
         elif p_commands == REDIS_COMMANDS.S_RELEASE_LOCK:
             await self.__release_lock(p_data[0])
+        elif p_commands == REDIS_COMMANDS.S_DELETE_KEYS:
+            await self.delete(*(p_data or []))
+        elif p_commands == REDIS_COMMANDS.S_INCR_EXISTING:
+            return await self.incr_existing(p_data[0], p_data[1])
+        elif p_commands == REDIS_COMMANDS.S_PUBLISH:
+            return await self.publish(p_data[0], p_data[1])
+        elif p_commands == REDIS_COMMANDS.S_SUBSCRIBE:
+            return await self.subscribe(*p_data)
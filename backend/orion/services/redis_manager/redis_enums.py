@@ -5,6 +5,9 @@ class REDIS_CONNECTIONS:
     S_DATABASE_IP = 'redis_server'
     S_DATABASE_PORT = 6379
     S_DATABASE_PASSWORD = env_handler.get_instance().env('REDIS_PASSWORD')
+    S_MAX_CONNECTIONS = int(env_handler.get_instance().env('REDIS_MAX_CONNECTIONS', 64))
+    S_POOL_TIMEOUT = float(env_handler.get_instance().env('REDIS_POOL_TIMEOUT', 5))
+    S_HEALTH_CHECK_INTERVAL = 30
 
 
 class REDIS_KEYS:
@@ -30,3 +33,7 @@ class REDIS_COMMANDS:
     S_FLUSH_ALL = 12
     S_ACQUIRE_LOCK = 13
     S_RELEASE_LOCK = 14
+    S_DELETE_KEYS = 15
+    S_INCR_EXISTING = 16
+    S_PUBLISH = 17
+    S_SUBSCRIBE = 18
@@ -5,16 +5,24 @@ import secrets
 
 import jwt
 import pyotp
-from bson import ObjectId
+from bson import ObjectId, json_util
 from fastapi import HTTPException, status
 from starlette.responses import JSONResponse
 
 from orion.constants.constant import CONSTANTS
 from orion.services.mongo_manager.mongo_controller import mongo_controller
-from orion.services.mongo_manager.shared_model.db_auth_models import user_role, db_user_account, UserStatus
+from orion.services.mongo_manager.shared_model.db_auth_models import (
+    user_role,
+    db_user_account,
+    UserStatus,
+    is_tenant_admin_role,
+)
 from orion.services.mongo_manager.shared_model.db_tenant_model import db_tenant_model, TenantStatus
 from orion.services.redis_manager.redis_controller import redis_controller
-from orion.services.redis_manager.redis_enums import REDIS_COMMANDS
+
+
+# Stands in for the password hash, which is never cached; it is a valid stored value that matches no password.
+_CACHED_PASSWORD_PLACEHOLDER = "$2b$REDACTED"
 
 
 class session_manager:
@@ -36,8 +44,83 @@ class session_manager:
         self._engine = mongo_controller.get_instance().get_engine()
         self._redis = redis_controller.getInstance()
         self._session_ttl = 30 * 60
+        # Authenticated principals are shared across workers briefly so repeat requests skip Mongo.
+        self._principal_ttl = 30
+
+    @staticmethod
+    def _principal_key(session_id: str) -> str:
+        return f"principal:{session_id}"
+
+    async def _load_cached_principal(self, session_id: str, username: str):
+        try:
+            cached = await self._redis.get(self._principal_key(session_id))
+            if cached is None:
+                return None
+            snapshot = json_util.loads(cached)
+            user = db_user_account.model_validate_doc({**snapshot["user"], "password": _CACHED_PASSWORD_PLACEHOLDER})
+        except Exception:
+            return None
+        # Like a document loaded by the engine: a later save only writes fields the caller changes,
+        # so the placeholder and the stripped secrets never reach Mongo.
+        object.__setattr__(user, "__fields_modified__", set())
+        if user.username != username or user.current_session_id != session_id:
+            return None
+        return {"user": user, "tenant_status": snapshot.get("tenant_status")}
+
+    async def _cache_principal(self, session_id: str, principal: dict) -> None:
+        doc = principal["user"].model_dump_doc()
+        # Secrets that are only needed by the flows that re-read the account stay out of Redis.
+        doc.pop("password", None)
+        doc.pop("twofa_secret", None)
+        doc.pop("verification_token", None)
+        try:
+            await self._redis.set(
+                self._principal_key(session_id),
+                json_util.dumps({"user": doc, "tenant_status": principal["tenant_status"]}),
+                self._principal_ttl)
+        except Exception:
+            pass
+
+    @staticmethod
+    async def invalidate_principal(user) -> None:
+        session_id = getattr(user, "current_session_id", None)
+        if not session_id:
+            return
+        try:
+            await redis_controller.getInstance().delete(session_manager._principal_key(session_id))
+        except Exception:
+            pass
+
+    async def _validate_session(self, user, session_id: str, detail: str) -> None:
+        redis_key = f"session:{str(user.id)}"
+        # GETEX reads the active session id and slides its TTL in one round trip.
+        redis_sid = await self._redis.get_and_touch(redis_key, self._session_ttl)
+        if redis_sid is None:
+            if user.current_session_id != session_id:
+                raise HTTPException(status_code=401, detail=detail)
+            await self._redis.set(redis_key, session_id, self._session_ttl)
+        elif redis_sid != user.current_session_id or redis_sid != session_id:
+            raise HTTPException(status_code=401, detail=detail)
+
+    async def _tenant_status(self, user):
+        if not is_tenant_admin_role(user.role):
+            return None
+        tenant_uuid = str(getattr(user, "tenant_uuid", "") or "").strip()
+        if not tenant_uuid:
+            return None
+        try:
+            tenant = await self._engine.find_one(db_tenant_model, db_tenant_model.id == ObjectId(tenant_uuid))
+        except Exception:
+            return None
+        if not tenant:
+            return None
+        return str(getattr(tenant.status, "value", tenant.status))
 
     async def get_current_user(self, token: str):
+        principal = await self.get_current_principal(token)
+        return principal["user"]
+
+    async def get_current_principal(self, token: str) -> dict:
         if not token:
             raise HTTPException(status_code=401, detail="Missing or invalid token")
 
@@ -55,33 +138,27 @@ class session_manager:
             if not username:
                 raise HTTPException(status_code=401, detail="Missing or invalid token")
 
+            session_id = payload.get("sid")
+            if session_id and payload.get("free") is not True:
+                cached = await self._load_cached_principal(session_id, username)
+                if cached is not None:
+                    return cached
+
             user = await self._engine.find_one(db_user_account, db_user_account.username == username)
             if payload.get("free") is True:
-                return user
+                return {"user": user, "tenant_status": None}
 
             if not user:
                 raise HTTPException(status_code=401, detail="Missing or invalid token")
 
-            session_id = payload.get("sid")
-
             if not session_id:
                 raise HTTPException(status_code=401, detail="Missing or invalid token")
 
-            redis_key = f"session:{str(user.id)}"
-            redis_sid = await self._redis.invoke_trigger(REDIS_COMMANDS.S_GET_STRING, [redis_key, None, None])
-
-            if redis_sid is None:
-                if user.current_session_id != session_id:
-                    raise HTTPException(status_code=401, detail="Logged out due to multiple active sessions")
-                await self._redis.invoke_trigger(
-                    REDIS_COMMANDS.S_SET_STRING,
-                    [redis_key, session_id, self._session_ttl])
-            else:
-                if redis_sid != user.current_session_id or redis_sid != session_id:
-                    raise HTTPException(status_code=401, detail="Logged out due to multiple active sessions")
-                await self._redis.invoke_trigger(REDIS_COMMANDS.S_SET_STRING, [redis_key, redis_sid, self._session_ttl])
+            await self._validate_session(user, session_id, "Logged out due to multiple active sessions")
 
-            return user
+            principal = {"user": user, "tenant_status": await self._tenant_status(user)}
+            await self._cache_principal(session_id, principal)
+            return principal
 
         except jwt.ExpiredSignatureError:
             raise HTTPException(status_code=401, detail="Token has expired")
@@ -89,7 +166,10 @@ class session_manager:
             raise HTTPException(status_code=401, detail="Invalid token")
 
     async def get_current_role(self, token: str) -> str:
-        user = await self.get_current_user(token)
+        return self.role_of(await self.get_current_user(token))
+
+    @staticmethod
+    def role_of(user) -> str:
         if not user or isinstance(user, JSONResponse):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
 
@@ -101,7 +181,10 @@ class session_manager:
         return role
 
     async def get_current_status(self, token: str) -> str:
-        user = await self.get_current_user(token)
+        return self.status_of(await self.get_current_user(token))
+
+    @staticmethod
+    def status_of(user) -> str:
         if not user or isinstance(user, JSONResponse):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access forbidden")
 
@@ -132,11 +215,12 @@ class session_manager:
 
         session_id = None
         if user and not free:
+            await self.invalidate_principal(user)
             session_id = secrets.token_urlsafe(32)
             user.current_session_id = session_id
             await self._engine.save(user)
             redis_key = f"session:{str(user.id)}"
-            await self._redis.invoke_trigger(REDIS_COMMANDS.S_SET_STRING, [redis_key, session_id, self._session_ttl])
+            await self._redis.set(redis_key, session_id, self._session_ttl)
 
         if session_id:
             to_encode.update({"exp": expire.timestamp(), "sid": session_id})
@@ -225,21 +309,7 @@ class session_manager:
             if not session_id:
                 raise HTTPException(status_code=401, detail="Invalid token")
 
-            redis_key = f"session:{str(user.id)}"
-            redis_sid = await self._redis.invoke_trigger(REDIS_COMMANDS.S_GET_STRING, [redis_key, None, None])
-
-            if redis_sid is None:
-                if user.current_session_id != session_id:
-                    raise HTTPException(status_code=401, detail="Invalid token")
-                await self._redis.invoke_trigger(
-                    REDIS_COMMANDS.S_SET_STRING,
-                    [redis_key, session_id, self._session_ttl])
-            else:
-                if redis_sid != user.current_session_id or redis_sid != session_id:
-                    raise HTTPException(status_code=401, detail="Invalid token")
-                await self._redis.invoke_trigger(
-                    REDIS_COMMANDS.S_SET_STRING,
-                    [redis_key, redis_sid, self._session_ttl])
+            await self._validate_session(user, session_id, "Invalid token")
 
             role_name = (getattr(user.role, "value", str(user.role))).split(".")[-1].lower()
             acct_at = user.account_verify_at
@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
 
 from configs.app_dependency import get_current_user, status_required
 from orion.api.interactive.notification_manager.notification_manager import NotificationManager
@@ -35,6 +38,34 @@ async def get_unread_notification_count(current_user=Depends(get_current_user)):
     return await NotificationManager.get_instance().get_unread_count(current_user=current_user)
 
 
+@notification_routes.get(
+    "/api/notifications/stream",
+    summary="Stream notifications",
+    description=(
+        "Server-sent event stream of new notifications and unread-count changes for the current authenticated user. "
+        "Reconnecting clients send Last-Event-ID (or last_event_id) to replay notifications they missed."
+    ),
+    tags=["Notifications"],
+    operation_id="streamNotifications",
+    response_description="text/event-stream of notification and unread_count events.",
+)
+async def stream_notifications(
+    request: Request,
+    last_event_id: Optional[str] = None,
+    current_user=Depends(get_current_user),
+):
+    events = await NotificationManager.get_instance().open_stream(
+        current_user=current_user,
+        last_event_id=request.headers.get("last-event-id") or last_event_id,
+        is_disconnected=request.is_disconnected,
+    )
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @notification_routes.get(
     "/api/notifications",
     summary="List notifications",
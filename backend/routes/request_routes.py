@@ -47,7 +47,7 @@ request_routes = APIRouter(
 @request_routes.get(
     "/api/requests",
     summary="List client requests",
-    description="Return paginated requests in the current role scope.",
+    description="Return paginated requests in the current role scope. Pass `cursor` (empty for the first page, then `next_cursor`) for keyset pagination without totals.",
     tags=["Client Requests"],
     operation_id="listClientRequests",
     response_description="Paginated client requests.",
@@ -69,6 +69,7 @@ async def list_client_requests(
     request_status: str = "",
     fulfillment_mode: str = "",
     client_tenant_id: str = "",
+    cursor: str | None = None,
     current_user=Depends(get_current_user),
 ):
     return await RequestManager.get_instance().list_requests(
@@ -79,6 +80,7 @@ async def list_client_requests(
         request_status=request_status,
         fulfillment_mode=fulfillment_mode,
         client_tenant_id=client_tenant_id,
+        cursor=cursor,
     )
 
 
@@ -557,7 +559,7 @@ async def update_request_schedule(
 @request_routes.get(
     "/api/shifts",
     summary="List shifts",
-    description="Return paginated shift instances visible to the current user.",
+    description="Return paginated shift instances visible to the current user. Pass `cursor` (empty for the first page, then `next_cursor`) for keyset pagination without totals.",
     tags=["Client Requests"],
     operation_id="listRequestShifts",
     response_description="Paginated shift instances.",
@@ -579,6 +581,7 @@ async def list_request_shifts(
     instance_status: str = "",
     date_from: date | None = None,
     date_to: date | None = None,
+    cursor: str | None = None,
     current_user=Depends(get_current_user),
 ):
     return await RequestShiftManager.get_instance().list_shifts(
@@ -589,6 +592,7 @@ async def list_request_shifts(
         instance_status=instance_status,
         date_from=date_from,
         date_to=date_to,
+        cursor=cursor,
     )
 
 
@@ -1490,7 +1494,7 @@ async def assign_client_request(request_id: str, payload: RequestAssignmentCreat
 @request_routes.get(
     "/api/jobs",
     summary="List request jobs",
-    description="List request assignments/jobs for the current role scope.",
+    description="List request assignments/jobs for the current role scope. Pass `cursor` (empty for the first page, then `next_cursor`) for keyset pagination without totals.",
     tags=["Client Requests"],
     operation_id="listRequestJobs",
     response_description="Paginated assignment jobs.",
@@ -1510,6 +1514,7 @@ async def list_request_jobs(
     rows: int = 20,
     assignment_status: str = "",
     keyword: str = "",
+    cursor: str | None = None,
     current_user=Depends(get_current_user),
 ):
     return await RequestManager.get_instance().list_jobs(
@@ -1518,6 +1523,7 @@ async def list_request_jobs(
         rows=rows,
         assignment_status=assignment_status,
         keyword=keyword,
+        cursor=cursor,
     )
 
 
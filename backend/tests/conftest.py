@@ -1,7 +1,18 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
+
+from orion.api.interactive.notification_manager.recipient_directory import RecipientDirectory  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _clear_recipient_directory():
+    RecipientDirectory.get_instance().clear_local()
+    yield
+    RecipientDirectory.get_instance().clear_local()
@@ -0,0 +1,200 @@
+import asyncio
+
+import pytest
+
+from orion.management.managers.scheduler import JobScheduler, ScheduledJob, run_bounded
+
+
+class _FakeLeaseRedis:
+    def __init__(self):
+        self.leases = {}
+        self.fail = False
+
+    async def acquire_lease(self, key, holder, ttl):
+        if self.fail:
+            raise ConnectionError("redis down")
+        current = self.leases.get(key)
+        if current not in (None, holder):
+            return False
+        self.leases[key] = holder
+        return True
+
+    async def release_lease(self, key, holder):
+        if self.leases.get(key) == holder:
+            del self.leases[key]
+            return True
+        return False
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeLeaseRedis()
+    monkeypatch.setattr("orion.management.managers.scheduler.redis_controller.getInstance", lambda: redis)
+    return redis
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_only_the_lease_holder_runs_a_job_until_it_stops(fake_redis, anyio_backend):
+    runs = []
+
+    def _scheduler(label):
+        async def _job():
+            runs.append(label)
+            return 1
+        return JobScheduler("maintenance", [ScheduledJob("reminders", _job, interval=60, timeout=5)])
+
+    first, second = _scheduler("first"), _scheduler("second")
+
+    assert await first.run_job("reminders") == 1
+    assert await second.run_job("reminders") is None
+    assert await first.run_job("reminders") == 1
+    await first.stop()
+    assert await second.run_job("reminders") == 1
+
+    assert runs == ["first", "first", "second"]
+    assert fake_redis.leases == {"scheduler:lease:maintenance:reminders": second.holder_id}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_job_runs_are_bounded_by_timeout_and_never_overlap(fake_redis, anyio_backend):
+    release = asyncio.Event()
+
+    async def _slow():
+        await release.wait()
+        return "done"
+
+    scheduler = JobScheduler("maintenance", [
+        ScheduledJob("slow", _slow, interval=60, timeout=5),
+        ScheduledJob("stuck", lambda: asyncio.sleep(10), interval=60, timeout=0.01),
+    ])
+
+    running = asyncio.create_task(scheduler.run_job("slow"))
+    await asyncio.sleep(0)
+    assert await scheduler.run_job("slow") is None
+    release.set()
+    assert await running == "done"
+
+    assert await scheduler.run_job("stuck") is None
+    assert scheduler.jobs["stuck"].last_error == "timed out after 0.01s"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_jobs_are_skipped_when_leadership_cannot_be_checked(fake_redis, anyio_backend):
+    runs = []
+
+    async def _job():
+        runs.append(1)
+
+    scheduler = JobScheduler("maintenance", [
+        ScheduledJob("leader_job", _job, interval=60),
+        ScheduledJob("local_job", _job, interval=60, leader_only=False),
+    ])
+    fake_redis.fail = True
+
+    await scheduler.run_job("leader_job")
+    await scheduler.run_job("local_job")
+
+    assert runs == [1]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_scheduler_loops_each_job_on_its_own_cadence(fake_redis, anyio_backend):
+    counts = {"fast": 0, "slow": 0}
+
+    def _counter(name):
+        async def _job():
+            counts[name] += 1
+        return _job
+
+    scheduler = JobScheduler("maintenance", [
+        ScheduledJob("fast", _counter("fast"), interval=0.01),
+        ScheduledJob("slow", _counter("slow"), interval=10),
+    ])
+    await scheduler.start()
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    assert counts["fast"] > 2
+    assert counts["slow"] == 1
+    assert not scheduler.is_running()
+    assert fake_redis.leases == {}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_run_bounded_keeps_order_and_isolates_failures(anyio_backend):
+    in_flight = 0
+    peak = 0
+
+    async def worker(value):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001 * (5 - value % 5))
+        in_flight -= 1
+        if value == 3:
+            raise ValueError("bad item")
+        return value * 10
+
+    results = await run_bounded(range(10), worker, concurrency=3)
+
+    assert results == [0, 10, 20, None, 40, 50, 60, 70, 80, 90]
+    assert peak == 3
+    assert await run_bounded([], worker, concurrency=3) == []
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_a_restarted_scheduler_with_the_same_holder_id_keeps_the_lease(fake_redis, anyio_backend):
+    async def _job():
+        return 1
+
+    crashed = JobScheduler("maintenance", [ScheduledJob("reminders", _job, interval=60)], holder_id="cron-0")
+    assert await crashed.run_job("reminders") == 1
+
+    # The crashed process never released its lease; its replacement renews it instead of waiting.
+    replacement = JobScheduler("maintenance", [ScheduledJob("reminders", _job, interval=60)], holder_id="cron-0")
+    other = JobScheduler("maintenance", [ScheduledJob("reminders", _job, interval=60)])
+    assert await other.run_job("reminders") is None
+    assert await replacement.run_job("reminders") == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_grouped_jobs_share_a_lease_and_never_run_together(fake_redis, anyio_backend):
+    release = asyncio.Event()
+    in_flight = []
+    overlapped = []
+
+    async def _generation():
+        in_flight.append("generation")
+        await release.wait()
+        in_flight.remove("generation")
+        return 1
+
+    async def _leave_sync():
+        overlapped.extend(in_flight)
+        return 2
+
+    scheduler = JobScheduler("maintenance", [
+        ScheduledJob("generation", _generation, interval=300, timeout=5, group="shift_state"),
+        ScheduledJob("leave_sync", _leave_sync, interval=60, timeout=5, group="shift_state"),
+    ])
+
+    generation = asyncio.create_task(scheduler.run_job("generation"))
+    await asyncio.sleep(0)
+    leave_sync = asyncio.create_task(scheduler.run_job("leave_sync"))
+    await asyncio.sleep(0)
+    assert not leave_sync.done()
+    release.set()
+
+    assert await generation == 1
+    assert await leave_sync == 2
+    assert overlapped == []
+    assert fake_redis.leases == {"scheduler:lease:maintenance:shift_state": scheduler.holder_id}
+    await scheduler.stop()
+    assert fake_redis.leases == {}
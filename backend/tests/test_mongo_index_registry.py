@@ -0,0 +1,110 @@
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from orion.services.mongo_manager.mongo_index_registry import COMPOUND_INDEXES, desired_indexes, reconcile_indexes
+from orion.services.mongo_manager.shared_model.db_notification_model import NotificationRecord
+
+
+class FakeAggregateCursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    async def to_list(self, length=None):
+        return list(self._docs)
+
+
+class FakeIndexCollection:
+    def __init__(self, name, existing, ops=None, failing=()):
+        self.name = name
+        self.existing = dict(existing)
+        self.ops = dict(ops or {})
+        self.failing = set(failing)
+        self.created = []
+
+    async def index_information(self):
+        return dict(self.existing)
+
+    async def create_indexes(self, indexes):
+        for index in indexes:
+            document = index.document
+            if document["name"] in self.failing:
+                raise DuplicateKeyError("E11000 duplicate key error")
+            self.created.append(document["name"])
+            self.existing[document["name"]] = {"key": list(document["key"].items())}
+
+    def aggregate(self, pipeline):
+        assert pipeline == [{"$indexStats": {}}]
+        return FakeAggregateCursor([
+            {"name": name, "accesses": {"ops": self.ops.get(name, 0)}}
+            for name in self.existing
+        ])
+
+
+class FakeEngine:
+    def __init__(self, collection):
+        self.collection = collection
+
+    def get_collection(self, model):
+        assert model is NotificationRecord
+        return self.collection
+
+
+def test_desired_indexes_combine_model_fields_and_compound_registry():
+    names = [index.document["name"] for index in desired_indexes(NotificationRecord)]
+
+    assert "recipient_user_id_1" in names
+    assert "is_read_1" in names
+    assert names[-len(COMPOUND_INDEXES[NotificationRecord]):] == [
+        index.document["name"] for index in COMPOUND_INDEXES[NotificationRecord]
+    ]
+
+
+@pytest.mark.anyio
+async def test_reconcile_indexes_creates_missing_and_reports_redundant_and_unused():
+    collection = FakeIndexCollection(
+        "notification_record",
+        {
+            "_id_": {"key": [("_id", 1)]},
+            "legacy_recipient": {"key": [("recipient_user_id", 1)]},
+            "legacy_recipient_read": {"key": [("recipient_user_id", 1), ("is_read", 1)]},
+        },
+        ops={"legacy_recipient_read": 12},
+    )
+
+    reports = await reconcile_indexes(FakeEngine(collection), [NotificationRecord])
+
+    assert len(reports) == 1
+    report = reports[0]
+    assert "recipient_user_id_1" not in report["created"]
+    assert "notification_recipient_unread_recent" in report["created"]
+    assert report["created"] == collection.created
+    assert {"legacy_recipient", "legacy_recipient_read", "recipient_tenant_id_1"} <= set(report["redundant"])
+    assert report["unmanaged"] == ["legacy_recipient", "legacy_recipient_read"]
+    assert "legacy_recipient" in report["unused"]
+    assert "legacy_recipient_read" not in report["unused"]
+
+
+@pytest.mark.anyio
+async def test_reconcile_indexes_dry_run_only_reports_missing():
+    collection = FakeIndexCollection("notification_record", {"_id_": {"key": [("_id", 1)]}})
+
+    reports = await reconcile_indexes(FakeEngine(collection), [NotificationRecord], dry_run=True)
+
+    assert collection.created == []
+    assert reports[0]["created"] == []
+    assert "notification_reminder_lookup" in reports[0]["missing"]
+
+
+@pytest.mark.anyio
+async def test_reconcile_indexes_skips_an_unbuildable_index_and_creates_the_rest():
+    collection = FakeIndexCollection(
+        "notification_record",
+        {"_id_": {"key": [("_id", 1)]}},
+        failing={"unique_notification_reminder_per_recipient"},
+    )
+
+    reports = await reconcile_indexes(FakeEngine(collection), [NotificationRecord])
+
+    assert reports[0]["failed"] == ["unique_notification_reminder_per_recipient"]
+    assert "unique_notification_reminder_per_recipient" not in reports[0]["created"]
+    assert "notification_reminder_lookup" in reports[0]["created"]
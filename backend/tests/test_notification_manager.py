@@ -1,17 +1,129 @@
+import asyncio
 from types import SimpleNamespace
 
 import pytest
 
 from orion.api.interactive.notification_manager.notification_manager import NotificationManager
-from orion.services.mongo_manager.shared_model.db_auth_models import UserStatus, user_role
+from orion.api.interactive.notification_manager.notification_stream import NotificationStreamHub
+from orion.api.interactive.notification_manager.recipient_directory import RecipientDirectory
+from orion.services.mongo_manager.shared_model.db_auth_models import UserStatus, db_user_account, user_role
+from orion.services.mongo_manager.shared_model.db_notification_model import NotificationRecord
+from orion.services.redis_manager.redis_enums import REDIS_COMMANDS
+
+
+class _FakeCursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, field, direction):
+        self._docs = sorted(self._docs, key=lambda doc: doc[field], reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self._docs = self._docs[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return list(self._docs)
+
+
+class _FakeUserCollection:
+    def __init__(self, users):
+        self._users = users
+        self.projections = []
+
+    def find(self, query, projection=None):
+        self.projections.append(projection)
+        role_filter = query.get("role", {}).get("$in")
+        docs = []
+        for user in self._users:
+            role_value = getattr(user.role, "value", user.role)
+            if role_filter is not None and role_value not in role_filter:
+                continue
+            doc = {"_id": user.id, "role": role_value, "status": getattr(user.status, "value", user.status)}
+            docs.append({key: value for key, value in doc.items() if key in (projection or doc)})
+        return _FakeCursor(docs)
+
+
+class _FakeNotificationCollection:
+    def __init__(self):
+        self.insert_calls = []
+        self.docs = []
+        self.count_calls = 0
+
+    async def insert_many(self, docs, ordered=True):
+        self.insert_calls.append((list(docs), ordered))
+        self.docs.extend(dict(doc) for doc in docs)
+        return SimpleNamespace(inserted_ids=[doc["_id"] for doc in docs])
+
+    def _matches(self, doc, query):
+        for key, value in query.items():
+            if isinstance(value, dict) and "$gt" in value:
+                if not doc.get(key) > value["$gt"]:
+                    return False
+            elif doc.get(key) != value:
+                return False
+        return True
+
+    def find(self, query):
+        return _FakeCursor([dict(doc) for doc in self.docs if self._matches(doc, query)])
+
+    async def count_documents(self, query):
+        self.count_calls += 1
+        return sum(1 for doc in self.docs if self._matches(doc, query))
+
+    async def bulk_write(self, operations, ordered=True):
+        upserted_ids = {}
+        for index, operation in enumerate(operations):
+            query, update = operation._filter, operation._doc
+            reminder_key = query["metadata.reminder_key"]
+            if any(
+                doc.get("recipient_user_id") == query["recipient_user_id"]
+                and (doc.get("metadata") or {}).get("reminder_key") == reminder_key
+                for doc in self.docs
+            ):
+                continue
+            self.docs.append(dict(update["$setOnInsert"]))
+            upserted_ids[index] = update["$setOnInsert"]["_id"]
+        return SimpleNamespace(upserted_ids=upserted_ids)
+
+    async def update_one(self, query, update):
+        for doc in self.docs:
+            if self._matches(doc, query):
+                doc.update(update["$set"])
+                return SimpleNamespace(modified_count=1)
+        return SimpleNamespace(modified_count=0)
+
+    async def update_many(self, query, update):
+        matched = [doc for doc in self.docs if self._matches(doc, query)]
+        for doc in matched:
+            doc.update(update["$set"])
+        return SimpleNamespace(modified_count=len(matched))
 
 
 class _FakeNotificationEngine:
     def __init__(self, users):
         self._users = users
+        self.user_collection = _FakeUserCollection(users)
+        self.notification_collection = _FakeNotificationCollection()
+        self.saved = []
+
+    def get_collection(self, model):
+        if model is db_user_account:
+            return self.user_collection
+        if model is NotificationRecord:
+            return self.notification_collection
+        raise AssertionError(f"Unexpected collection request: {model}")
+
+    async def save(self, record):
+        self.saved.append(record)
+        self.notification_collection.docs.append(record.model_dump_doc())
+        return record
 
-    async def find(self, *_args, **_kwargs):
-        return list(self._users)
+    async def find_one(self, model, *queries):
+        assert model is NotificationRecord
+        self.find_one_calls = getattr(self, "find_one_calls", 0) + 1
+        return None
 
 
 @pytest.mark.anyio
@@ -97,3 +209,223 @@ async def test_create_for_platform_admin_users_targets_active_platform_roles():
     assert saved_count == 2
     assert captured["recipient_user_ids"] == ["admin-1", "ops-1"]
     assert captured["recipient_tenant_id"] is None
+
+
+@pytest.mark.anyio
+async def test_create_for_tenant_users_inserts_all_recipients_in_one_batch():
+    manager = object.__new__(NotificationManager)
+    manager._engine = _FakeNotificationEngine([
+        SimpleNamespace(id="guard-user-1", role=user_role.GUARD_ADMIN, status=UserStatus.ACTIVE),
+        SimpleNamespace(id="guard-user-2", role=user_role.GUARD_ADMIN, status=UserStatus.INACTIVE),
+        SimpleNamespace(id="guard-user-1", role=user_role.GUARD_ADMIN, status=UserStatus.ACTIVE),
+    ])
+
+    saved_count = await manager.create_for_tenant_users(
+        tenant_id="guard-tenant-1",
+        title=" Shift updated ",
+        message="Your shift time changed.",
+        category="INFO",
+        source_module="Requests",
+        metadata={"request_id": "req-1"},
+    )
+
+    assert saved_count == 2
+    assert manager._engine.saved == []
+    assert manager._engine.user_collection.projections == [{"_id": 1}]
+    [(docs, ordered)] = manager._engine.notification_collection.insert_calls
+    assert ordered is False
+    assert [doc["recipient_user_id"] for doc in docs] == ["guard-user-1", "guard-user-2"]
+    assert {doc["title"] for doc in docs} == {"Shift updated"}
+    assert {doc["source_module"] for doc in docs} == {"requests"}
+    assert all(doc["recipient_tenant_id"] == "guard-tenant-1" and doc["is_read"] is False for doc in docs)
+
+
+@pytest.mark.anyio
+async def test_create_for_users_skips_insert_without_recipients():
+    manager = object.__new__(NotificationManager)
+    manager._engine = _FakeNotificationEngine([])
+
+    saved_count = await manager.create_for_users(recipient_user_ids=["", None], title="Ignored", message="Ignored")
+
+    assert saved_count == 0
+    assert manager._engine.notification_collection.insert_calls == []
+
+
+@pytest.mark.anyio
+async def test_create_for_users_with_reminder_key_only_inserts_missing_recipients():
+    manager = object.__new__(NotificationManager)
+    manager._engine = _FakeNotificationEngine([])
+    manager._engine.notification_collection.docs.append(
+        {"recipient_user_id": "guard-user-1", "metadata": {"reminder_key": "guard-checkin:slot-1"}, "is_read": True}
+    )
+
+    created = await manager.create_for_users(
+        recipient_user_ids=["guard-user-1", "guard-user-2"],
+        title="Shift starts in less than 5 minutes",
+        message="Check in now.",
+        source_module="requests",
+        metadata={"slot_id": "slot-1"},
+        reminder_key="guard-checkin:slot-1",
+    )
+    repeated = await manager.create_for_users(
+        recipient_user_ids=["guard-user-2"],
+        title="Shift starts in less than 5 minutes",
+        message="Check in now.",
+        reminder_key="guard-checkin:slot-1",
+    )
+
+    assert (created, repeated) == (1, 0)
+    assert manager._engine.notification_collection.insert_calls == []
+    inserted = manager._engine.notification_collection.docs[-1]
+    assert inserted["recipient_user_id"] == "guard-user-2"
+    assert inserted["metadata"] == {"slot_id": "slot-1", "reminder_key": "guard-checkin:slot-1"}
+
+
+class _FakePubSub:
+    def __init__(self, messages):
+        self._messages = messages
+
+    async def listen(self):
+        while True:
+            yield {"type": "message", "data": await self._messages.get()}
+
+    async def aclose(self):
+        return None
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.deleted = []
+        self.published = []
+        self._messages = None
+
+    async def invoke_trigger(self, command, data=None):
+        if command == REDIS_COMMANDS.S_GET_STRING:
+            return self.values.get(data[0])
+        if command == REDIS_COMMANDS.S_SET_STRING:
+            self.values[data[0]] = data[1]
+            return None
+        if command == REDIS_COMMANDS.S_DELETE_KEYS:
+            self.deleted.extend(data)
+            for key in data:
+                self.values.pop(key, None)
+            return None
+        if command == REDIS_COMMANDS.S_INCR_EXISTING:
+            keys, amount = data
+            results = []
+            for key in keys:
+                if key in self.values:
+                    self.values[key] = int(self.values[key]) + amount
+                results.append(self.values.get(key))
+            return results
+        if command == REDIS_COMMANDS.S_PUBLISH:
+            self.published.append(data)
+            if self._messages is not None:
+                self._messages.put_nowait(data[1])
+            return 1
+        if command == REDIS_COMMANDS.S_SUBSCRIBE:
+            self._messages = asyncio.Queue()
+            return _FakePubSub(self._messages)
+        raise AssertionError(f"Unexpected redis command: {command}")
+
+
+@pytest.mark.anyio
+async def test_recipient_directory_serves_repeat_lookups_from_cache_until_user_changes(monkeypatch):
+    fake_redis = _FakeRedis()
+    monkeypatch.setattr(
+        "orion.api.interactive.notification_manager.recipient_directory.redis_controller.getInstance",
+        lambda: fake_redis,
+    )
+    users = [SimpleNamespace(id="guard-user-1", role=user_role.GUARD_ADMIN, status=UserStatus.ACTIVE)]
+    manager = object.__new__(NotificationManager)
+    manager._engine = _FakeNotificationEngine(users)
+
+    assert await manager._active_tenant_admin_user_ids("guard-tenant-1") == ["guard-user-1"]
+    users.append(SimpleNamespace(id="guard-user-2", role=user_role.GUARD_ADMIN, status=UserStatus.ACTIVE))
+    assert await manager._active_tenant_admin_user_ids("guard-tenant-1") == ["guard-user-1"]
+    assert len(manager._engine.user_collection.projections) == 1
+
+    RecipientDirectory.get_instance().clear_local()
+    assert await manager._active_tenant_admin_user_ids("guard-tenant-1") == ["guard-user-1"]
+    assert len(manager._engine.user_collection.projections) == 1
+
+    await RecipientDirectory.get_instance().invalidate_user(SimpleNamespace(tenant_uuid="guard-tenant-1"))
+    assert await manager._active_tenant_admin_user_ids("guard-tenant-1") == ["guard-user-1", "guard-user-2"]
+    assert len(manager._engine.user_collection.projections) == 2
+    assert RecipientDirectory.PLATFORM_ADMINS_KEY in fake_redis.deleted
+    assert RecipientDirectory.tenant_key("guard-tenant-1", admin_only=True) in fake_redis.deleted
+
+
+@pytest.mark.anyio
+async def test_unread_counter_serves_badge_from_cache_and_tracks_reads(monkeypatch):
+    fake_redis = _FakeRedis()
+    monkeypatch.setattr(
+        "orion.api.interactive.notification_manager.unread_counter_store.redis_controller.getInstance",
+        lambda: fake_redis,
+    )
+    manager = object.__new__(NotificationManager)
+    manager._engine = _FakeNotificationEngine([])
+    collection = manager._engine.notification_collection
+    current_user = SimpleNamespace(id="user-1", role=user_role.OPS_ADMIN, tenant_uuid=None)
+
+    assert await manager.get_unread_count(current_user) == {"unread_count": 1}
+    assert manager._engine.find_one_calls == 1
+    assert collection.count_calls == 1
+
+    await manager.create_for_users(recipient_user_ids=["user-1", "user-2"], title="Shift", message="Updated")
+    assert await manager.get_unread_count(current_user) == {"unread_count": 2}
+    assert manager._engine.find_one_calls == 1
+    assert collection.count_calls == 1
+
+    welcome = manager._engine.saved[0]
+    monkeypatch.setattr(manager._engine, "find_one", _return_record(welcome), raising=False)
+    await manager.mark_read(str(welcome.id), current_user)
+    await manager.mark_read(str(welcome.id), current_user)
+    assert await manager.get_unread_count(current_user) == {"unread_count": 1}
+
+    assert (await manager.mark_all_read(current_user))["unread_count"] == 0
+    assert await manager.get_unread_count(current_user) == {"unread_count": 0}
+    assert collection.count_calls == 2
+
+
+def _return_record(record):
+    async def _find_one(model, *queries):
+        return record.model_copy()
+    return _find_one
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_notification_stream_replays_after_last_event_id_then_pushes_published_events(monkeypatch, anyio_backend):
+    fake_redis = _FakeRedis()
+    for module in ("unread_counter_store", "notification_stream"):
+        monkeypatch.setattr(
+            f"orion.api.interactive.notification_manager.{module}.redis_controller.getInstance",
+            lambda: fake_redis,
+        )
+    manager = object.__new__(NotificationManager)
+    manager._engine = _FakeNotificationEngine([])
+    await manager.create_for_users(recipient_user_ids=["user-1"], title="Seen", message="Already delivered")
+    await manager.create_for_users(recipient_user_ids=["user-1", "user-2"], title="Missed", message="While offline")
+    seen_id, missed_id = [str(doc["_id"]) for doc in manager._engine.notification_collection.docs[:2]]
+    current_user = SimpleNamespace(id="user-1", role=user_role.OPS_ADMIN, tenant_uuid=None)
+
+    events = await manager.open_stream(current_user, last_event_id=seen_id)
+    try:
+        assert (await events.__anext__()).startswith("retry: ")
+        replayed = await events.__anext__()
+        assert replayed.startswith(f"id: {missed_id}\nevent: notification\n")
+        assert '"unread_count": 2' in await events.__anext__()
+
+        await asyncio.sleep(0)
+        await manager.create_for_users(recipient_user_ids=["user-1", "user-2"], title="Live", message="Pushed")
+        live_id = str(manager._engine.notification_collection.docs[-2]["_id"])
+        pushed = await asyncio.wait_for(events.__anext__(), timeout=1)
+        assert pushed.startswith(f"id: {live_id}\nevent: notification\n")
+        assert '"title": "Live"' in pushed and '"unread_count": 3' in pushed
+    finally:
+        await events.aclose()
+        await NotificationStreamHub.get_instance().stop()
+
+    assert NotificationStreamHub.get_instance()._subscribers == {}
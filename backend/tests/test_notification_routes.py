@@ -97,3 +97,30 @@ async def test_mark_all_notifications_read_calls_manager(monkeypatch):
 
     assert response.status_code == 200
     assert response.json()["unread_count"] == 0
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_stream_notifications_forwards_last_event_id_and_streams_events(monkeypatch, anyio_backend):
+    captured = {}
+
+    class FakeManager:
+        async def open_stream(self, current_user, last_event_id, is_disconnected):
+            captured["user"] = current_user.username
+            captured["last_event_id"] = last_event_id
+
+            async def _events():
+                yield 'event: unread_count\ndata: {"unread_count": 2}\n\n'
+
+            return _events()
+
+    monkeypatch.setattr(NotificationManager, "get_instance", staticmethod(lambda: FakeManager()))
+
+    async with AsyncClient(transport=ASGITransport(app=_app()), base_url="http://test") as client:
+        response = await client.get("/api/notifications/stream", headers={"Last-Event-ID": "notif-9"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text == 'event: unread_count\ndata: {"unread_count": 2}\n\n'
+    assert captured == {"user": "tenantadmin", "last_event_id": "notif-9"}
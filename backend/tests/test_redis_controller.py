@@ -0,0 +1,80 @@
+import pytest
+
+from orion.services.redis_manager.redis_controller import redis_controller
+from orion.services.redis_manager.redis_enums import REDIS_COMMANDS
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def set(self, key, value, ex=None):
+        self._ops.append((key, value, ex))
+
+    async def execute(self):
+        self._client.round_trips += 1
+        for key, value, ex in self._ops:
+            self._client.values[key] = str(value)
+        return [True] * len(self._ops)
+
+
+class _FakeClient:
+    def __init__(self):
+        self.values = {}
+        self.round_trips = 0
+        self.set_calls = []
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, nx=False, get=False):
+        self.round_trips += 1
+        self.set_calls.append({"key": key, "ex": ex, "nx": nx, "get": get})
+        previous = self.values.get(key)
+        if not (nx and previous is not None):
+            self.values[key] = str(value)
+        return previous if get else True
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.values.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+def _controller():
+    controller = object.__new__(redis_controller)
+    client = _FakeClient()
+    controller._redis_controller__redis = client
+    return controller, client
+
+
+@pytest.mark.anyio
+async def test_get_with_default_is_a_single_set_nx_get_round_trip():
+    controller, client = _controller()
+
+    assert await controller.invoke_trigger(REDIS_COMMANDS.S_GET_INT, ["rate:1", 0, 60]) == "0"
+    client.values["rate:1"] = "1"
+    assert await controller.invoke_trigger(REDIS_COMMANDS.S_GET_INT, ["rate:1", 0, 60]) == "1"
+    assert await controller.invoke_trigger(REDIS_COMMANDS.S_GET_BOOL, ["flag", False]) is False
+
+    assert client.round_trips == 3
+    assert client.set_calls[0] == {"key": "rate:1", "ex": 60, "nx": True, "get": True}
+
+
+@pytest.mark.anyio
+async def test_batch_helpers_use_one_round_trip():
+    controller, client = _controller()
+
+    await controller.set_many({"a": 1, "b": 2}, expiry=30)
+    assert await controller.mget(["a", "missing", "b"]) == ["1", None, "2"]
+    assert client.round_trips == 2
@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+import re
+from datetime import date, datetime, time, timedelta
 from types import SimpleNamespace
 
 import pytest
@@ -28,6 +29,7 @@ from orion.services.mongo_manager.shared_model.db_request_model import (
     RequestPayoutAdjustmentDecisionPayload,
     RequestPayoutAdjustmentRecord,
     RequestPayoutAdjustmentUpdatePayload,
+    RequestPayoutLedgerRecord,
     RequestPricingPreviewPayload,
     RequestPublishUpdatePayload,
     RequestScheduleTemplateRecord,
@@ -36,6 +38,7 @@ from orion.services.mongo_manager.shared_model.db_request_model import (
     RequestTargetType,
     RequestWaveTrigger,
     RequestWaveStatus,
+    RequestWeeklyPayoutRecord,
     ShiftCoverageSourceType,
     ShiftInstanceRecord,
     ShiftSlotRecord,
@@ -60,16 +63,26 @@ class _FakeCursor:
         self._docs = docs
 
     def sort(self, key=None, direction=1):
-        reverse = direction == -1
-        sort_key = str(key or "").strip()
-        if sort_key:
+        sort_spec = key if isinstance(key, list) else [(key, direction)]
+        for sort_key, sort_direction in reversed(sort_spec):
+            sort_key = str(sort_key or "").strip()
+            if not sort_key:
+                continue
             self._docs = sorted(
                 self._docs,
-                key=lambda item: item.get(sort_key) or datetime.min,
-                reverse=reverse,
+                key=lambda item: item.get(sort_key) or (datetime.min if sort_key != "_id" else ObjectId("0" * 24)),
+                reverse=sort_direction == -1,
             )
         return self
 
+    def skip(self, value):
+        self._docs = self._docs[value:]
+        return self
+
+    def limit(self, value):
+        self._docs = self._docs[:value]
+        return self
+
     async def to_list(self, length=None):
         return list(self._docs)
 
@@ -79,34 +92,109 @@ class _FakeCollection:
         self._docs = docs
 
     @staticmethod
-    def _matches(doc, query):
+    def _value(doc, key):
+        value = doc
+        for part in key.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        return value
+
+    @classmethod
+    def _matches(cls, doc, query):
         for key, expected in (query or {}).items():
-            actual = doc.get(key)
+            if key == "$and":
+                if not all(cls._matches(doc, clause) for clause in expected):
+                    return False
+                continue
+            if key == "$or":
+                if not any(cls._matches(doc, clause) for clause in expected):
+                    return False
+                continue
+            actual = cls._value(doc, key)
             if isinstance(expected, dict):
-                if "$in" in expected:
-                    if actual not in expected["$in"]:
+                for operator, operand in expected.items():
+                    if operator == "$in" and actual not in operand:
                         return False
-                    continue
-                return False
+                    if operator == "$nin" and actual in operand:
+                        return False
+                    if operator == "$eq" and actual != operand:
+                        return False
+                    if operator == "$ne" and actual == operand:
+                        return False
+                    if operator == "$regex":
+                        flags = re.IGNORECASE if "i" in expected.get("$options", "") else 0
+                        values = actual if isinstance(actual, list) else [actual]
+                        if not any(re.search(operand, str(value or ""), flags) for value in values):
+                            return False
+                    if operator == "$lt" and (actual is None or not actual < operand):
+                        return False
+                    if operator == "$gt" and (actual is None or not actual > operand):
+                        return False
+                    if operator == "$gte" and (actual is None or not actual >= operand):
+                        return False
+                    if operator == "$lte" and (actual is None or not actual <= operand):
+                        return False
+                    if operator not in {"$in", "$nin", "$eq", "$ne", "$regex", "$options", "$lt", "$gt", "$gte", "$lte"}:
+                        return False
+                continue
             if actual != expected:
                 return False
         return True
 
-    def find(self, query):
+    def find(self, query, projection=None):
         return _FakeCursor([doc for doc in self._docs if self._matches(doc, query)])
 
-    async def update_one(self, query, update):
-        target_id = query.get("_id")
+    async def count_documents(self, query):
+        return len([doc for doc in self._docs if self._matches(doc, query)])
+
+    async def update_one(self, query, update, upsert=False):
         set_values = (update or {}).get("$set", {})
         for doc in self._docs:
-            if doc.get("_id") == target_id:
+            if self._matches(doc, query):
                 doc.update(set_values)
-                break
+                return
+        if upsert:
+            self._docs.append({"_id": ObjectId(), **query, **set_values})
+
+    async def update_many(self, query, update):
+        set_values = (update or {}).get("$set", {})
+        for doc in self._docs:
+            if self._matches(doc, query):
+                doc.update(set_values)
+
+    async def bulk_write(self, requests, ordered=True):
+        for request in requests:
+            matches = [doc for doc in self._docs if self._matches(doc, request._filter)]
+            if not matches and request._upsert:
+                matches = [{"_id": ObjectId(), **request._filter}]
+                self._docs.append(matches[0])
+            for doc in matches:
+                doc.update(request._doc["$set"])
+
+    async def delete_many(self, query):
+        self._docs[:] = [doc for doc in self._docs if not self._matches(doc, query)]
+
+    def aggregate(self, pipeline):
+        match = next(stage["$match"] for stage in pipeline if "$match" in stage)
+        group = next(stage["$group"] for stage in pipeline if "$group" in stage)
+        groups = {}
+        for doc in self._docs:
+            if not self._matches(doc, match):
+                continue
+            key = self._value(doc, group["_id"][1:])
+            row = groups.setdefault(key, {"_id": key})
+            for field, accumulator in group.items():
+                if field == "_id":
+                    continue
+                operand = accumulator["$sum"]
+                row[field] = row.get(field, 0) + (operand if isinstance(operand, int) else self._value(doc, operand[1:]) or 0)
+        return _FakeCursor(list(groups.values()))
 
 
 class _FakeListJobsEngine(FakeEngine):
-    def __init__(self, assignment_docs, request_docs, schedule_docs=None, invoice_docs=None, shift_docs=None, slot_docs=None, adjustment_docs=None, planned_leave_docs=None):
+    def __init__(self, assignment_docs, request_docs, schedule_docs=None, invoice_docs=None, shift_docs=None, slot_docs=None, adjustment_docs=None, planned_leave_docs=None, ledger_docs=None):
         super().__init__()
+        self._ledger_docs = ledger_docs if ledger_docs is not None else []
+        self._weekly_payout_docs = []
         self._assignment_docs = assignment_docs
         self._request_docs = request_docs
         self._schedule_docs = schedule_docs or []
@@ -133,6 +221,10 @@ class _FakeListJobsEngine(FakeEngine):
             return _FakeCollection(self._shift_docs)
         if model is ShiftSlotRecord:
             return _FakeCollection(self._slot_docs)
+        if model is RequestPayoutLedgerRecord:
+            return _FakeCollection(self._ledger_docs)
+        if model is RequestWeeklyPayoutRecord:
+            return _FakeCollection(self._weekly_payout_docs)
         raise AssertionError(f"Unexpected collection request: {model}")
 
 
@@ -172,6 +264,8 @@ def _make_request_record(**overrides):
         "guards_required": 2,
         "accepted_slots": 0,
         "open_slots": 2,
+        "payout_ledger_dirty": False,
+        "payout_ledger_state": None,
         "created_at": None,
         "updated_at": None,
     }
@@ -186,9 +280,9 @@ async def _async_return(value):
 @pytest.mark.anyio
 async def test_list_requests_filters_client_tenant_and_sets_tenant_label():
     manager = object.__new__(RequestManager)
-
-    async def _resolve_request_docs_for_role(_current_user):
-        return [
+    manager._engine = _FakeListJobsEngine(
+        assignment_docs=[],
+        request_docs=[
             {
                 "_id": ObjectId(),
                 "client_tenant_id": "client-1",
@@ -225,7 +319,10 @@ async def test_list_requests_filters_client_tenant_and_sets_tenant_label():
                 "created_at": datetime(2026, 5, 19, 11, 0),
                 "updated_at": datetime(2026, 5, 19, 11, 0),
             },
-        ]
+        ],
+    )
+    manager._role_value = lambda _user: "ops_admin"
+    manager._is_platform_role = lambda _role: True
 
     async def _build_client_tenant_label_lookup(_tenant_ids):
         return {
@@ -233,7 +330,6 @@ async def test_list_requests_filters_client_tenant_and_sets_tenant_label():
             "client-2": "Coastal Client",
         }
 
-    manager._resolve_request_docs_for_role = _resolve_request_docs_for_role
     manager._build_client_tenant_label_lookup = _build_client_tenant_label_lookup
 
     result = await manager.list_requests(
@@ -252,6 +348,192 @@ async def test_list_requests_filters_client_tenant_and_sets_tenant_label():
     assert result["items"][0]["client_tenant_label"] == "Coastal Client"
 
 
+@pytest.mark.anyio
+async def test_list_requests_pages_in_mongo_and_matches_legacy_fulfillment_mode():
+    request_docs = [
+        {
+            "_id": ObjectId(),
+            "client_tenant_id": "client-1",
+            "title": f"Provider Request {index}",
+            "target_type": "service_provider",
+            "request_status": "submitted",
+            "site_snapshot": {"site_name": "Depot"},
+            "created_at": datetime(2026, 5, 1, 8, 0) + timedelta(hours=index),
+            "deleted_at": None,
+        }
+        for index in range(25)
+    ]
+    request_docs.append({
+        "_id": ObjectId(),
+        "client_tenant_id": "client-1",
+        "title": "Guard Request",
+        "fulfillment_mode": "individual_only",
+        "target_type": "guard",
+        "request_status": "submitted",
+        "created_at": datetime(2026, 6, 1, 8, 0),
+        "deleted_at": None,
+    })
+    manager = object.__new__(RequestManager)
+    manager._engine = _FakeListJobsEngine(assignment_docs=[], request_docs=request_docs)
+    manager._role_value = lambda _user: "ops_admin"
+    manager._is_platform_role = lambda _role: True
+    manager._ensure_request_doc_finance_snapshot = _async_return
+
+    async def _serialize_requests_with_client_tenant_labels(docs):
+        return [{"title": doc["title"]} for doc in docs]
+
+    manager._serialize_requests_with_client_tenant_labels = _serialize_requests_with_client_tenant_labels
+
+    result = await manager.list_requests(
+        current_user=SimpleNamespace(username="platform", role="ops_admin"),
+        page=2,
+        rows=10,
+        keyword="PROVIDER req",
+        fulfillment_mode="service_provider_only",
+    )
+
+    assert result["pagination"] == {"page": 2, "rows": 10, "total_items": 25, "total_pages": 3}
+    assert [item["title"] for item in result["items"]] == [f"Provider Request {index}" for index in range(14, 4, -1)]
+
+
+@pytest.mark.anyio
+async def test_list_requests_cursor_mode_walks_every_page_once():
+    shared_created_at = datetime(2026, 5, 1, 8, 0)
+    request_docs = [
+        {
+            "_id": ObjectId(),
+            "client_tenant_id": "client-1",
+            "title": f"Request {index}",
+            "request_status": "submitted",
+            "created_at": shared_created_at if index < 4 else shared_created_at + timedelta(hours=index),
+            "deleted_at": None,
+        }
+        for index in range(12)
+    ]
+    request_docs.append({"_id": ObjectId(), "title": "Undated", "request_status": "submitted", "created_at": None, "deleted_at": None})
+    manager = object.__new__(RequestManager)
+    manager._engine = _FakeListJobsEngine(assignment_docs=[], request_docs=request_docs)
+    manager._role_value = lambda _user: "ops_admin"
+    manager._is_platform_role = lambda _role: True
+    manager._ensure_request_doc_finance_snapshot = _async_return
+
+    async def _serialize_requests_with_client_tenant_labels(docs):
+        return [{"title": doc["title"]} for doc in docs]
+
+    manager._serialize_requests_with_client_tenant_labels = _serialize_requests_with_client_tenant_labels
+
+    titles = []
+    cursor = ""
+    pages = 0
+    while cursor is not None:
+        result = await manager.list_requests(current_user=SimpleNamespace(role="ops_admin"), rows=5, cursor=cursor)
+        titles.extend(item["title"] for item in result["items"])
+        assert "total_items" not in result["pagination"]
+        cursor = result["pagination"]["next_cursor"]
+        pages += 1
+
+    assert pages == 3
+    assert len(titles) == 13
+    assert len(set(titles)) == 13
+    assert titles[0] == "Request 11"
+    assert titles[-1] == "Undated"
+
+    with pytest.raises(HTTPException) as exc_info:
+        await manager.list_requests(current_user=SimpleNamespace(role="ops_admin"), rows=5, cursor="not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_list_jobs_cursor_mode_skips_hidden_rows_across_scan_batches():
+    live_request_id = ObjectId()
+    deleted_request_id = ObjectId()
+    assignment_docs = []
+    for index in range(130):
+        assignment_docs.append({
+            "_id": ObjectId(),
+            "request_id": str(live_request_id if index % 3 == 0 else deleted_request_id),
+            "assignee_tenant_id": f"guard-{index}",
+            "assignment_status": "offered",
+            "updated_at": datetime(2026, 5, 1, 8, 0) + timedelta(minutes=index),
+        })
+    manager = object.__new__(RequestManager)
+    manager._engine = _FakeListJobsEngine(
+        assignment_docs=assignment_docs,
+        request_docs=[
+            {"_id": live_request_id, "title": "Live", "deleted_at": None},
+            {"_id": deleted_request_id, "title": "Deleted", "deleted_at": datetime(2026, 5, 1)},
+        ],
+    )
+    manager._role_value = lambda _user: "ops_admin"
+    manager._is_platform_role = lambda _role: True
+    manager._ensure_request_doc_finance_snapshot = _async_return
+    manager._attach_assigned_guard_summaries_to_assignment_docs = _async_return
+    manager._serialize_assignment = lambda doc, request_snapshot=None: {"id": str(doc["_id"])}
+
+    seen = []
+    cursor = ""
+    while cursor is not None:
+        result = await manager.list_jobs(current_user=SimpleNamespace(role="ops_admin"), rows=20, cursor=cursor)
+        seen.extend(item["id"] for item in result["items"])
+        cursor = result["pagination"]["next_cursor"]
+
+    expected = [str(doc["_id"]) for doc in reversed(assignment_docs) if doc["request_id"] == str(live_request_id)]
+    assert seen == expected
+
+
+@pytest.mark.anyio
+async def test_list_jobs_cursor_mode_caps_scan_and_does_not_write():
+    live_request_id = ObjectId()
+    deleted_request_id = ObjectId()
+    elapsed_job = {
+        "_id": ObjectId(),
+        "request_id": str(live_request_id),
+        "assignee_tenant_id": "guard-1",
+        "assignment_scope": "request",
+        "assignment_status": "accepted",
+        "updated_at": datetime(2026, 5, 1, 7, 0),
+    }
+    assignment_docs = [elapsed_job] + [
+        {
+            "_id": ObjectId(),
+            "request_id": str(deleted_request_id),
+            "assignee_tenant_id": "guard-1",
+            "assignment_status": "accepted",
+            "updated_at": datetime(2026, 5, 1, 8, 0) + timedelta(minutes=index),
+        }
+        for index in range(300)
+    ]
+    manager = object.__new__(RequestManager)
+    manager._engine = _FakeListJobsEngine(
+        assignment_docs=assignment_docs,
+        request_docs=[
+            {"_id": live_request_id, "title": "Live", "deleted_at": None, "requested_end_at": datetime(2026, 5, 1)},
+            {"_id": deleted_request_id, "title": "Deleted", "deleted_at": datetime(2026, 5, 1)},
+        ],
+    )
+    manager._role_value = lambda _user: "guard_admin"
+    manager._is_platform_role = lambda _role: False
+    manager._get_session_tenant = lambda _user: _async_return(SimpleNamespace(id="guard-1", tenant_type=TenantType.GUARD))
+    manager._ensure_request_doc_finance_snapshot = _async_return
+    manager._attach_assigned_guard_summaries_to_assignment_docs = _async_return
+    manager._serialize_assignment = lambda doc, request_snapshot=None: {"id": str(doc["_id"])}
+
+    async def _unexpected_sync(_record):
+        raise AssertionError("cursor pages must not sync request runtime state")
+
+    manager._sync_request_runtime_state = _unexpected_sync
+    current_user = SimpleNamespace(role="guard_admin")
+
+    first = await manager.list_jobs(current_user=current_user, rows=20, cursor="")
+    assert first["items"] == []
+    assert first["pagination"]["next_cursor"] is not None
+
+    second = await manager.list_jobs(current_user=current_user, rows=20, cursor=first["pagination"]["next_cursor"])
+    assert second["items"] == [{"id": str(elapsed_job["_id"])}]
+    assert second["pagination"]["next_cursor"] is None
+    assert elapsed_job["assignment_status"] == "accepted"
+
+
 @pytest.mark.anyio
 async def test_get_request_by_id_strips_matching_candidates_for_provider_viewer():
     manager = object.__new__(RequestManager)
@@ -521,9 +803,9 @@ async def test_get_request_wave_by_id_strips_candidate_snapshots_for_platform_vi
 @pytest.mark.anyio
 async def test_list_requests_backfills_missing_pricing_snapshot_for_response_docs():
     manager = object.__new__(RequestManager)
-
-    async def _resolve_request_docs_for_role(_current_user):
-        return [
+    manager._engine = _FakeListJobsEngine(
+        assignment_docs=[],
+        request_docs=[
             {
                 "_id": ObjectId(),
                 "client_tenant_id": "client-1",
@@ -542,7 +824,11 @@ async def test_list_requests_backfills_missing_pricing_snapshot_for_response_doc
                 "updated_at": datetime(2026, 5, 19, 11, 0),
                 "invoicing_snapshot": {"contract_type": "short_term"},
             },
-        ]
+        ],
+    )
+
+    async def _request_list_scope_for_role(_current_user):
+        return {"deleted_at": None}, {}
 
     async def _build_client_tenant_label_lookup(_tenant_ids):
         return {"client-1": "Alpha Client"}
@@ -561,7 +847,7 @@ async def test_list_requests_backfills_missing_pricing_snapshot_for_response_doc
             },
         }
 
-    manager._resolve_request_docs_for_role = _resolve_request_docs_for_role
+    manager._request_list_scope_for_role = _request_list_scope_for_role
     manager._build_client_tenant_label_lookup = _build_client_tenant_label_lookup
     manager._build_request_pricing_and_invoicing = _build_request_pricing_and_invoicing
 
@@ -1029,6 +1315,95 @@ async def test_get_my_invoice_by_id_returns_provider_weekly_completed_share(monk
     assert result["billing_period_end_local"] == "2026-06-14"
 
 
+@pytest.mark.anyio
+async def test_weekly_payout_items_rebuild_only_weeks_with_changed_slots_or_shifts(monkeypatch):
+    manager = object.__new__(RequestManager)
+    request_id = str(ObjectId())
+    shift_docs = []
+    slot_docs = []
+    for shift_date in ("2026-06-02", "2026-06-09"):
+        shift_id = ObjectId()
+        day = date.fromisoformat(shift_date)
+        shift_docs.append({
+            "_id": shift_id,
+            "request_id": request_id,
+            "shift_date_local": shift_date,
+            "shift_start_at_utc": datetime.combine(day, time(8, 0)),
+            "shift_end_at_utc": datetime.combine(day, time(16, 0)),
+            "timezone": "UTC",
+        })
+        slot_docs.append({
+            "_id": ObjectId(),
+            "request_id": request_id,
+            "shift_instance_id": str(shift_id),
+            "shift_date_local": shift_date,
+            "service_provider_tenant_id": "sp-tenant-1",
+            "completed_at": datetime.combine(day, time(16, 5)),
+            "actual_start_at": datetime.combine(day, time(8, 0)),
+            "actual_end_at": datetime.combine(day, time(16, 0)),
+            "updated_at": datetime.combine(day, time(16, 5)),
+        })
+
+    class _FrozenDateTime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return datetime(2026, 6, 16, 12, 0)
+
+    monkeypatch.setattr(
+        "orion.api.interactive.request_manager.request_manager.datetime",
+        _FrozenDateTime,
+    )
+    manager._engine = _FakeListJobsEngine([], [], shift_docs=shift_docs, slot_docs=slot_docs)
+    request_lookup = {request_id: {
+        "title": "Night Desk",
+        "site_name": "Tower",
+        "timezone": "UTC",
+        "currency": "CAD",
+        "guards_required": 1,
+        "provider_hourly_pay": 20,
+        "contract_type": "long_term",
+    }}
+    build_kwargs = dict(
+        request_ids=[request_id],
+        assignment_map={request_id: {"committed_slots": 1, "statuses": {"accepted"}}},
+        request_lookup=request_lookup,
+        assignee_tenant_id="sp-tenant-1",
+        assignee_tenant_type="service_provider",
+    )
+
+    def _amounts(items):
+        return {item["billing_period_start_local"]: item["estimated_amount"] for item in items}
+
+    assert _amounts(await manager._build_long_term_assignee_weekly_invoice_items(**build_kwargs)) == {
+        "2026-06-01": 160.0,
+        "2026-06-08": 160.0,
+    }
+    assert manager._engine._weekly_payout_docs[0]["closed_through_local"] == "2026-06-14"
+
+    # Only the first slot is marked as changed, so the second week's stored item is reused.
+    slot_docs[0].update(actual_end_at=datetime(2026, 6, 2, 18, 0), updated_at=datetime(2026, 6, 16, 13, 0))
+    slot_docs[1].update(actual_end_at=datetime(2026, 6, 9, 18, 0))
+    assert _amounts(await manager._build_long_term_assignee_weekly_invoice_items(**build_kwargs)) == {
+        "2026-06-01": 200.0,
+        "2026-06-08": 160.0,
+    }
+
+    # A shift-only change (the slot now falls back to the shift start) still rebuilds its week.
+    slot_docs[1].pop("actual_start_at")
+    shift_docs[1].update(shift_start_at_utc=datetime(2026, 6, 9, 11, 0), updated_at=datetime(2026, 6, 16, 13, 0))
+    assert _amounts(await manager._build_long_term_assignee_weekly_invoice_items(**build_kwargs)) == {
+        "2026-06-01": 200.0,
+        "2026-06-08": 140.0,
+    }
+
+    request_lookup[request_id]["provider_hourly_pay"] = 25
+    assert _amounts(await manager._build_long_term_assignee_weekly_invoice_items(**build_kwargs)) == {
+        "2026-06-01": 250.0,
+        "2026-06-08": 175.0,
+    }
+    assert len(manager._engine._weekly_payout_docs) == 1
+
+
 @pytest.mark.anyio
 async def test_list_platform_payout_invoices_returns_enriched_items(monkeypatch):
     manager = object.__new__(RequestManager)
@@ -1118,6 +1493,7 @@ async def test_list_platform_payout_invoices_returns_enriched_items(monkeypatch)
     manager._is_platform_role = lambda role: role in {"admin", "ops_admin", "support_admin", "compliance_admin", "read_only_admin"}
     manager._build_tenant_label_lookup = lambda tenant_ids: _async_return({"guard-tenant-1": "Guard One"})
 
+    assert await manager.refresh_payout_ledger_for_request(str(request_id)) == 1
     result = await manager.list_platform_payout_invoices(
         current_user=SimpleNamespace(role="ops_admin"),
         page=1,
@@ -1138,6 +1514,131 @@ async def test_list_platform_payout_invoices_returns_enriched_items(monkeypatch)
     assert result["summary"]["total_platform_earning"] == 108.0
 
 
+@pytest.mark.anyio
+async def test_payout_ledger_refresh_replaces_request_rows_and_lists_from_ledger():
+    manager = object.__new__(RequestManager)
+    request_id = ObjectId()
+    request_docs = [{
+        "_id": request_id,
+        "client_tenant_id": "client-1",
+        "title": "Lobby Watch",
+        "timezone": "UTC",
+        "guards_required": 1,
+        "site_snapshot": {"site_name": "Harbour"},
+        "pricing_snapshot": {"currency": "CAD", "guard_hourly_pay": 20, "client_hourly_quote": 30, "guards_required": 1},
+        "invoicing_snapshot": {"contract_type": "short_term"},
+        "payout_ledger_dirty": True,
+    }]
+    assignment_docs = [{
+        "_id": ObjectId(),
+        "request_id": str(request_id),
+        "assignee_tenant_id": "guard-tenant-1",
+        "assignee_tenant_type": "guard",
+        "assignment_scope": "request",
+        "assignment_status": "accepted",
+        "slots_committed": 1,
+    }]
+    invoice_docs = [{
+        "_id": ObjectId(),
+        "request_id": str(request_id),
+        "client_tenant_id": "client-1",
+        "request_revision": 1,
+        "trigger": "initial_publish",
+        "invoice_number": "INV-LEDGER-1",
+        "contract_type": "short_term",
+        "billing_cycle": "per_request",
+        "charge_timing": "on_the_go",
+        "billing_period_start_local": "2026-06-12",
+        "billing_period_end_local": "2026-06-12",
+        "billing_period_label": "Jun 12, 2026",
+        "currency": "CAD",
+        "client_hourly_quote": 30,
+        "estimated_total_hours": 8,
+        "estimated_guard_payout": 160,
+        "invoice_status": "issued",
+        "payment_status": "pending_capture",
+        "line_items": [],
+        "created_at": datetime(2026, 6, 10, 10, 0),
+        "updated_at": datetime(2026, 6, 10, 10, 0),
+    }]
+    ledger_docs = [
+        {"_id": ObjectId(), "invoice_id": "payout:guard:guard-tenant-1:gone", "request_id": str(request_id), "assignee_tenant_type": "guard"},
+        {
+            "_id": ObjectId(),
+            "invoice_id": "payout:service_provider:sp-1:other",
+            "request_id": str(ObjectId()),
+            "assignee_tenant_type": "service_provider",
+            "search_tokens": ["inv", "other"],
+            "invoice_created_at": datetime(2026, 5, 1),
+            "estimated_client_revenue": 100.0,
+            "estimated_amount": 70.0,
+            "baseline_estimated_amount": 70.0,
+            "estimated_platform_earning": 30.0,
+            "baseline_estimated_platform_earning": 30.0,
+            "estimated_total_hours": 4.0,
+            "item": {"id": "payout:service_provider:sp-1:other"},
+        },
+    ]
+    shift_id = ObjectId()
+    shift_docs = [{
+        "_id": shift_id,
+        "request_id": str(request_id),
+        "shift_date_local": "2026-06-12",
+        "shift_start_at_utc": datetime(2026, 6, 12, 8, 0),
+        "shift_end_at_utc": datetime(2026, 6, 12, 16, 0),
+        "timezone": "UTC",
+    }]
+    slot_docs = [{
+        "_id": ObjectId(),
+        "request_id": str(request_id),
+        "shift_instance_id": str(shift_id),
+        "assigned_guard_tenant_id": "guard-tenant-1",
+        "completed_at": datetime(2026, 6, 12, 16, 5),
+        "actual_start_at": datetime(2026, 6, 12, 8, 0),
+        "actual_end_at": datetime(2026, 6, 12, 16, 0),
+    }]
+    manager._engine = _FakeListJobsEngine(
+        assignment_docs,
+        request_docs,
+        invoice_docs=invoice_docs,
+        shift_docs=shift_docs,
+        slot_docs=slot_docs,
+        ledger_docs=ledger_docs,
+    )
+    manager._role_value = lambda _user: "ops_admin"
+    manager._is_platform_role = lambda role: role == "ops_admin"
+    manager._build_tenant_label_lookup = lambda tenant_ids: _async_return({"guard-tenant-1": "Guard One"})
+
+    assert await manager.refresh_payout_ledger_for_request(str(request_id)) == 1
+    assert request_docs[0]["payout_ledger_dirty"] is False
+    assert sorted(doc["invoice_id"] for doc in ledger_docs) == [
+        "payout:guard:guard-tenant-1:" + str(invoice_docs[0]["_id"]),
+        "payout:service_provider:sp-1:other",
+    ]
+
+    manager._build_assignee_invoice_items = None
+    result = await manager.list_platform_payout_invoices(current_user=SimpleNamespace(role="ops_admin"), page=1, rows=1)
+
+    assert result["pagination"] == {"page": 1, "rows": 1, "total_items": 2, "total_pages": 2}
+    assert result["items"][0]["invoice_number"] == "INV-LEDGER-1"
+    assert result["summary"]["invoice_count"] == 2
+    assert result["summary"]["total_client_revenue"] == 340.0
+    assert result["summary"]["total_guard_payout"] == 160.0
+    assert result["summary"]["total_provider_payout"] == 70.0
+    assert result["summary"]["total_platform_earning"] == 110.0
+
+    filtered = await manager.list_platform_payout_invoices(current_user=SimpleNamespace(role="ops_admin"), keyword="harbour")
+    assert [item["invoice_number"] for item in filtered["items"]] == ["INV-LEDGER-1"]
+    assert filtered["summary"]["invoice_count"] == 1
+
+    prefixed = await manager.list_platform_payout_invoices(current_user=SimpleNamespace(role="ops_admin"), keyword="Inv-Led")
+    assert [item["invoice_number"] for item in prefixed["items"]] == ["INV-LEDGER-1"]
+    # Matching is by word prefix, so a fragment from the middle of a word does not match.
+    mid_word = await manager.list_platform_payout_invoices(current_user=SimpleNamespace(role="ops_admin"), keyword="edger")
+    assert mid_word["items"] == []
+    assert mid_word["pagination"]["total_items"] == 0
+
+
 @pytest.mark.anyio
 async def test_get_platform_payout_invoice_by_id_returns_item(monkeypatch):
     manager = object.__new__(RequestManager)
@@ -1229,6 +1730,7 @@ async def test_get_platform_payout_invoice_by_id_returns_item(monkeypatch):
         "client-9": "Client Nine",
     })
 
+    await manager.refresh_payout_ledger_for_request(str(request_id))
     listing = await manager.list_platform_payout_invoices(
         current_user=SimpleNamespace(role="read_only_admin"),
         page=1,
@@ -1250,6 +1752,38 @@ async def test_get_platform_payout_invoice_by_id_returns_item(monkeypatch):
     assert result["estimated_platform_earning"] == 36.0
 
 
+@pytest.mark.anyio
+async def test_get_platform_payout_invoice_by_id_marks_ledger_miss_dirty_without_writing_ledger():
+    manager = object.__new__(RequestManager)
+    request_id = ObjectId()
+    invoice_id = f"weekly:service_provider:sp-tenant-1:{request_id}:2026-06-01"
+    request_docs = [{"_id": request_id, "deleted_at": None}]
+    ledger_docs = []
+    manager._engine = _FakeListJobsEngine([], request_docs, ledger_docs=ledger_docs)
+    manager._role_value = lambda _user: "ops_admin"
+    manager._is_platform_role = lambda _role: True
+    scope_calls = []
+
+    async def _collect_scopes(**kwargs):
+        scope_calls.append(kwargs)
+        return ["scope"]
+
+    manager._collect_platform_assignee_invoice_scopes = _collect_scopes
+    manager._build_platform_payout_items = lambda _scopes: _async_return([
+        {"id": invoice_id, "request_id": str(request_id), "estimated_amount": 120.0},
+    ])
+
+    result = await manager.get_platform_payout_invoice_by_id(
+        invoice_id=invoice_id,
+        current_user=SimpleNamespace(role="ops_admin"),
+    )
+
+    assert result["id"] == invoice_id
+    assert scope_calls == [{"request_id": str(request_id), "assignee_tenant_id": "sp-tenant-1"}]
+    assert ledger_docs == []
+    assert request_docs[0]["payout_ledger_dirty"] is True
+
+
 @pytest.mark.anyio
 async def test_sync_request_runtime_state_preserves_pending_review():
     manager = object.__new__(RequestManager)
@@ -1366,6 +1900,37 @@ async def test_sync_request_runtime_state_closes_request_once_committed_work_is_
     assert updated.lock_reason == RequestLockReason.REQUEST_CLOSED
 
 
+@pytest.mark.anyio
+async def test_sync_request_runtime_state_flags_shift_slots_only_when_coverage_changes():
+    manager = object.__new__(RequestManager)
+    manager._engine = FakeEngine()
+    assignments = [
+        SimpleNamespace(
+            assignment_scope=RequestAssignmentScope.REQUEST,
+            assignment_status=RequestAssignmentStatus.ACCEPTED,
+            slots_committed=1,
+        )
+    ]
+
+    async def _get_assignments(_request_id):
+        return list(assignments)
+
+    async def _close_open_offers(*_args, **_kwargs):
+        return 0
+
+    manager._get_assignments_for_request = _get_assignments
+    manager._close_open_offers_for_request = _close_open_offers
+
+    record = _make_request_record(guards_required=2, accepted_slots=1, open_slots=1, shift_slots_dirty=False)
+    await manager._sync_request_runtime_state(record)
+    assert record.shift_slots_dirty is False
+
+    assignments[0].assignment_status = RequestAssignmentStatus.CANCELLED
+    await manager._sync_request_runtime_state(record)
+    assert record.shift_slots_dirty is True
+    assert (record.accepted_slots, record.open_slots) == (0, 2)
+
+
 @pytest.mark.anyio
 async def test_update_request_status_closed_completes_started_request_scope_job(monkeypatch):
     manager = object.__new__(RequestManager)
@@ -1714,6 +2279,89 @@ async def test_sync_request_invoice_state_creates_and_revises_long_term_invoice(
     assert record.invoicing_snapshot["invoice_status"] == RequestInvoiceStatus.REVISED.value
 
 
+@pytest.mark.anyio
+async def test_sync_request_invoice_state_skips_rebuild_when_long_term_inputs_are_unchanged(monkeypatch):
+    manager = object.__new__(RequestManager)
+    manager._engine = FakeEngine()
+
+    record = _make_request_record(
+        guards_required=1,
+        accepted_slots=1,
+        title="Gate Watch",
+        pricing_snapshot={"currency": "CAD", "guards_required": 1, "client_hourly_quote": 30},
+        invoicing_snapshot={"contract_type": "long_term", "invoice_recipient_email": None},
+    )
+    schedule_record = RequestScheduleTemplateRecord(
+        request_id=str(record.id),
+        client_tenant_id=record.client_tenant_id,
+        timezone="UTC",
+        schedule_type="date_range",
+        start_date_local="2026-06-01",
+        end_date_local="2026-06-30",
+        start_time_local="08:00",
+        end_time_local="16:00",
+        active=True,
+    )
+
+    class _FrozenDateTime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            value = datetime(2026, 6, 3, 10, 0, tzinfo=tz)
+            return value.replace(tzinfo=None) if tz is None else value
+
+        @classmethod
+        def utcnow(cls):
+            return datetime(2026, 6, 3, 10, 0)
+
+    monkeypatch.setattr(
+        "orion.api.interactive.request_manager.request_manager.datetime",
+        _FrozenDateTime,
+    )
+    manager._get_active_schedule_template = lambda _request_id: _async_return(schedule_record)
+    invoice_lookups = []
+
+    def _find_existing_invoice(**kwargs):
+        invoice_lookups.append(kwargs)
+        return _async_return(next(
+            (
+                item
+                for item in reversed(manager._engine.saved)
+                if isinstance(item, RequestInvoiceRecord)
+                and (item.billing_period_start_local, item.billing_period_end_local)
+                == (kwargs["billing_period_start_local"], kwargs["billing_period_end_local"])
+            ),
+            None,
+        ))
+
+    manager._find_existing_invoice = _find_existing_invoice
+
+    first_result = await manager._sync_request_invoice_state(record, current_user=None, reason=RequestInvoiceTrigger.PUBLISH_UPDATE)
+    assert first_result["action"] == "created"
+    assert record.advance_invoice_state
+    invoice_lookups.clear()
+
+    saved_count = len(manager._engine.saved)
+    build_details = manager._build_long_term_invoice_details
+    manager._build_long_term_invoice_details = None
+    second_result = await manager._sync_request_invoice_state(record, current_user=None, reason=RequestInvoiceTrigger.PUBLISH_UPDATE)
+
+    assert second_result == {"action": "unchanged", "invoice": first_result["invoice"]}
+    assert len(manager._engine.saved) == saved_count
+    assert invoice_lookups == [{
+        "request_id": str(record.id),
+        "contract_type": "long_term",
+        "billing_period_start_local": first_result["invoice"].billing_period_start_local,
+        "billing_period_end_local": first_result["invoice"].billing_period_end_local,
+    }]
+
+    manager._build_long_term_invoice_details = build_details
+    record.pricing_snapshot["client_hourly_quote"] = 32
+    third_result = await manager._sync_request_invoice_state(record, current_user=None, reason=RequestInvoiceTrigger.PUBLISH_UPDATE)
+
+    assert third_result["action"] == "updated"
+    assert third_result["invoice"].estimated_amount == 1792.0
+
+
 @pytest.mark.anyio
 async def test_sync_request_invoice_state_skips_first_long_term_invoice_until_full_coverage(monkeypatch):
     manager = object.__new__(RequestManager)
@@ -2358,6 +3006,14 @@ async def test_create_platform_payout_adjustment_persists_and_returns_updated_in
 
     manager.get_platform_payout_invoice_by_id = _get_platform_payout_invoice_by_id
 
+    upserted = []
+
+    async def _upsert_payout_ledger_items(items):
+        upserted.extend(items)
+        return len(items)
+
+    manager._upsert_payout_ledger_items = _upsert_payout_ledger_items
+
     result = await manager.create_platform_payout_adjustment(
         invoice_id="pinv-77",
         payload=RequestPayoutAdjustmentCreatePayload(
@@ -2367,6 +3023,7 @@ async def test_create_platform_payout_adjustment_persists_and_returns_updated_in
         current_user=SimpleNamespace(id="user-1", username="ops", role="ops_admin"),
     )
 
+    assert upserted == [result]
     assert result["payout_adjustment_total"] == 0.0
     assert len(manager._engine.saved) == 1
     saved = manager._engine.saved[0]
@@ -2411,12 +3068,21 @@ async def test_update_platform_payout_adjustment_edits_draft_only():
 
     manager.get_platform_payout_invoice_by_id = _get_platform_payout_invoice_by_id
 
+    upserted = []
+
+    async def _upsert_payout_ledger_items(items):
+        upserted.extend(items)
+        return len(items)
+
+    manager._upsert_payout_ledger_items = _upsert_payout_ledger_items
+
     result = await manager.update_platform_payout_adjustment(
         adjustment_id=str(adjustment.id),
         payload=RequestPayoutAdjustmentUpdatePayload(amount=50.0, reason="Revised provider uplift"),
         current_user=SimpleNamespace(id="user-1", username="ops", role="ops_admin"),
     )
 
+    assert upserted == [result]
     assert result["id"] == "pinv-77"
     assert adjustment.amount == 50.0
     assert adjustment.reason == "Revised provider uplift"
@@ -2467,12 +3133,21 @@ async def test_approve_platform_payout_adjustment_marks_record_approved():
 
     manager.get_platform_payout_invoice_by_id = _get_platform_payout_invoice_by_id
 
+    upserted = []
+
+    async def _upsert_payout_ledger_items(items):
+        upserted.extend(items)
+        return len(items)
+
+    manager._upsert_payout_ledger_items = _upsert_payout_ledger_items
+
     result = await manager.approve_platform_payout_adjustment(
         adjustment_id=str(adjustment.id),
         payload=RequestPayoutAdjustmentDecisionPayload(note="Approved after review"),
         current_user=SimpleNamespace(id="user-1", username="ops", role="ops_admin"),
     )
 
+    assert upserted == [result]
     assert result["payout_adjustment_total"] == 42.5
     assert adjustment.adjustment_status == "approved"
     assert adjustment.approved_by_username == "ops"
@@ -2511,12 +3186,21 @@ async def test_void_platform_payout_adjustment_marks_record_voided():
 
     manager.get_platform_payout_invoice_by_id = _get_platform_payout_invoice_by_id
 
+    upserted = []
+
+    async def _upsert_payout_ledger_items(items):
+        upserted.extend(items)
+        return len(items)
+
+    manager._upsert_payout_ledger_items = _upsert_payout_ledger_items
+
     result = await manager.void_platform_payout_adjustment(
         adjustment_id=str(adjustment.id),
         payload=RequestPayoutAdjustmentDecisionPayload(note="Superseded"),
         current_user=SimpleNamespace(id="user-1", username="ops", role="ops_admin"),
     )
 
+    assert upserted == [result]
     assert result["payout_adjustment_total"] == 0.0
     assert adjustment.adjustment_status == "voided"
     assert adjustment.voided_by_username == "ops"
@@ -2726,7 +3410,15 @@ async def test_request_additional_coverage_recalculates_finance_snapshot(monkeyp
 @pytest.mark.anyio
 async def test_soft_delete_request_marks_terminal_request_deleted(monkeypatch):
     manager = object.__new__(RequestManager)
-    engine = FakeEngine()
+    shift_docs = [
+        {"_id": ObjectId(), "request_id": "507f1f77bcf86cd799439011", "visible_tenant_ids": ["tenant-1", "guard-1"]},
+        {"_id": ObjectId(), "request_id": "other-request", "visible_tenant_ids": ["tenant-1"]},
+    ]
+    slot_docs = [
+        {"_id": ObjectId(), "request_id": "507f1f77bcf86cd799439011", "slot_status": "no_show"},
+        {"_id": ObjectId(), "request_id": "other-request", "slot_status": "no_show"},
+    ]
+    engine = _FakeListJobsEngine([], [], shift_docs=shift_docs, slot_docs=slot_docs)
     manager._engine = engine
     manager._role_value = lambda _user: "admin"
     manager._is_platform_write_role = lambda role: role == "admin"
@@ -2734,6 +3426,7 @@ async def test_soft_delete_request_marks_terminal_request_deleted(monkeypatch):
     manager._write_activity = lambda *args, **kwargs: None
 
     record = _make_request_record(
+        id=ObjectId("507f1f77bcf86cd799439011"),
         request_status=RequestStatus.CLOSED,
         title="Downtown patrol",
         client_tenant_id="tenant-1",
@@ -2778,6 +3471,11 @@ async def test_soft_delete_request_marks_terminal_request_deleted(monkeypatch):
     assert record.deleted_by_username == "admin-user"
     assert isinstance(record.deleted_at, datetime)
     assert engine.saved[-1] is record
+    assert [doc["visible_tenant_ids"] for doc in shift_docs] == [[], ["tenant-1"]]
+    assert shift_docs[0]["request_deleted_at"] == record.deleted_at
+    assert "request_deleted_at" not in shift_docs[1]
+    assert slot_docs[0]["request_deleted_at"] == record.deleted_at
+    assert "request_deleted_at" not in slot_docs[1]
 
 
 @pytest.mark.anyio
@@ -30,23 +30,92 @@ class _FakeCursor:
 
 
 class _FakeCollection:
-    def __init__(self, docs):
+    def __init__(self, docs, aggregate_rows=None, name="fake"):
         self._docs = docs
+        self._aggregate_rows = aggregate_rows or []
+        self.pipelines = []
+        self.queries = []
+        self.name = name
 
-    def find(self, _query):
+    def find(self, _query, *_args):
+        self.queries.append(_query)
         return _FakeCursor(self._docs)
 
+    def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        return _FakeCursor(self._aggregate_rows)
+
+
+class _FakeTenantCollection(_FakeCollection):
+    """Returns scope-count rows for the ungrouped pipeline and reason rows for the geo-dropped breakdown."""
+
+    def __init__(self, aggregate_rows=None, reason_rows=None):
+        super().__init__([], aggregate_rows=aggregate_rows, name="db_tenant_model")
+        self._reason_rows = reason_rows or []
+
+    def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        if pipeline[-1]["$group"]["_id"] is None:
+            return _FakeCursor(self._aggregate_rows)
+        return _FakeCursor(self._reason_rows)
+
+
+class _FakeRequestCollection(_FakeCollection):
+    """Evaluates the provider reserved-capacity pipeline against in-memory requests and assignments."""
+
+    def __init__(self, docs, assignments):
+        super().__init__(docs, name="client_request_record")
+        self._assignments = assignments
+
+    def aggregate(self, pipeline):
+        self.pipelines.append(pipeline)
+        window = pipeline[0]["$match"]
+        window_start = window["requested_end_at"]["$gt"]
+        window_end = window["requested_start_at"]["$lt"]
+        assignment_filter = pipeline[2]["$lookup"]["pipeline"][0]["$match"]
+        reserved = {}
+        for request_doc in self._docs:
+            start_at = request_doc.get("requested_start_at")
+            end_at = request_doc.get("requested_end_at")
+            if start_at is None or end_at is None or not (start_at < window_end and end_at > window_start and end_at > start_at):
+                continue
+            for assignment in self._assignments:
+                if assignment.get("request_id") != str(request_doc["_id"]):
+                    continue
+                if assignment.get("assignee_tenant_type") != assignment_filter["assignee_tenant_type"]:
+                    continue
+                if assignment.get("assignment_scope") != assignment_filter["assignment_scope"]:
+                    continue
+                if assignment.get("assignment_status") not in assignment_filter["assignment_status"]["$in"]:
+                    continue
+                provider_id = assignment.get("assignee_tenant_id")
+                reserved[provider_id] = reserved.get(provider_id, 0) + (assignment.get("slots_committed") or 1)
+        return _FakeCursor([{"_id": provider_id, "reserved_slots": slots} for provider_id, slots in reserved.items()])
+
 
 class FakeEngine:
-    def __init__(self, tenants, *, assignments=None, requests=None, planned_leaves=None):
+    def __init__(
+        self,
+        tenants,
+        *,
+        assignments=None,
+        requests=None,
+        planned_leaves=None,
+        tenant_aggregate_rows=None,
+        tenant_reason_rows=None,
+    ):
         self.tenants = tenants
         self.assignments = assignments or []
         self.requests = requests or []
         self.planned_leaves = planned_leaves or []
+        self.tenant_collection = _FakeTenantCollection(tenant_aggregate_rows, tenant_reason_rows)
+        self.tenant_prefilters = []
+        self.planned_leave_collection_requests = 0
 
     async def find(self, model, query=None, *_args, **_kwargs):
         if model is not db_tenant_model:
             return []
+        self.tenant_prefilters.extend(_args)
 
         query_text = str(query or "")
         items = [tenant for tenant in self.tenants if getattr(tenant, "status", None) == TenantStatus.ACTIVE]
@@ -76,11 +145,14 @@ class FakeEngine:
         return None
 
     def get_collection(self, model):
+        if model is db_tenant_model:
+            return self.tenant_collection
         if model is RequestAssignmentRecord:
-            return _FakeCollection(self.assignments)
+            return _FakeCollection(self.assignments, name="request_assignment_record")
         if model is ClientRequestRecord:
-            return _FakeCollection(self.requests)
+            return _FakeRequestCollection(self.requests, self.assignments)
         if model is GuardPlannedLeaveRecord:
+            self.planned_leave_collection_requests += 1
             return _FakeCollection(self.planned_leaves)
         raise AssertionError(f"Unexpected collection request: {model}")
 
@@ -1093,3 +1165,343 @@ async def test_provider_available_guard_capacity_excludes_linked_guard_on_approv
     assert capacity["linked_guard_count"] == 1
     assert capacity["eligible_guard_count"] == 0
     assert capacity["available_guard_count"] == 0
+
+
+@pytest.mark.anyio
+async def test_preview_matches_pushes_province_and_geo_prefilter_and_adds_aggregated_counts():
+    guard = RequestMatchingManager.apply_match_index(_guard_tenant())
+    manager = object.__new__(RequestMatchingManager)
+    manager._engine = FakeEngine(
+        [guard],
+        tenant_aggregate_rows=[{
+            "_id": None,
+            "total_count": 6,
+            "ownership_excluded_count": 2,
+            "in_scope_count": 3,
+            "max_radius_km": 40,
+        }],
+        tenant_reason_rows=[{"_id": "outside_radius", "count": 2}],
+    )
+
+    result = await manager.preview_matches(
+        RequestMatchingPreviewPayload(
+            target_type="guard",
+            site_address=MatchAddress(
+                country="CA",
+                province="Ontario",
+                city="Toronto",
+                latitude=43.6532,
+                longitude=-79.3832,
+            ),
+            requested_start_at=datetime(2026, 4, 27, 10, 0),
+            requested_end_at=datetime(2026, 4, 27, 12, 0),
+        )
+    )
+
+    prefilter = manager._engine.tenant_prefilters[0]
+    assert prefilter["match_region_codes"] == "ON"
+    assert prefilter["ownership_type"] == {"$ne": "service_provider"}
+    center, bound_radians = prefilter["$or"][2]["match_geo_point"]["$geoWithin"]["$centerSphere"]
+    assert center == [-79.3832, 43.6532]
+    assert bound_radians == pytest.approx(40.01 / 6371.0)
+
+    assert result.summary["total_candidates"] == 6
+    assert result.summary["eligible_count"] == 1
+    assert result.summary["ownership_excluded_count"] == 2
+    assert result.summary["province_mismatch_count"] == 1
+    assert result.summary["outside_radius_count"] == 2
+    assert [candidate.candidate_id for candidate in result.results] == [str(guard.id)]
+
+
+@pytest.mark.anyio
+async def test_preview_matches_attributes_geo_prefiltered_guards_to_earlier_reasons():
+    guard = RequestMatchingManager.apply_match_index(_guard_tenant(preferred_guard_types=["unarmed"]))
+    on_leave_id = ObjectId()
+    manager = object.__new__(RequestMatchingManager)
+    manager._engine = FakeEngine(
+        [guard],
+        tenant_aggregate_rows=[{
+            "_id": None,
+            "total_count": 5,
+            "ownership_excluded_count": 0,
+            "in_scope_count": 5,
+            "max_radius_km": 40,
+        }],
+        tenant_reason_rows=[
+            {"_id": "guard_type_mismatch", "count": 1},
+            {"_id": "planned_leave_conflict", "count": 1},
+            {"_id": "outside_availability", "count": 1},
+            {"_id": "outside_radius", "count": 1},
+        ],
+        planned_leaves=[{
+            "guard_tenant_id": str(on_leave_id),
+            "start_at_utc": datetime(2026, 4, 27, 0, 0),
+            "end_at_utc": datetime(2026, 4, 28, 0, 0),
+        }],
+    )
+
+    result = await manager.preview_matches(
+        RequestMatchingPreviewPayload(
+            target_type="guard",
+            requested_guard_type="unarmed",
+            site_address=MatchAddress(
+                country="CA",
+                province="ON",
+                city="Toronto",
+                latitude=43.6532,
+                longitude=-79.3832,
+            ),
+            requested_start_at=datetime(2026, 4, 27, 10, 0),
+            requested_end_at=datetime(2026, 4, 27, 12, 0),
+        )
+    )
+
+    prefilter = manager._engine.tenant_prefilters[0]
+    reason_match, reason_group = manager._engine.tenant_collection.pipelines[1]
+    assert manager._engine.tenant_collection.queries == []
+    assert "_id" not in reason_match["$match"]
+    assert "$or" not in reason_match["$match"]
+    assert reason_match["$match"]["$nor"] == prefilter["$or"]
+    assert reason_match["$match"]["match_region_codes"] == "ON"
+    branches = reason_group["$group"]["_id"]["$switch"]["branches"]
+    assert [branch["then"] for branch in branches] == [
+        "guard_type_mismatch",
+        "planned_leave_conflict",
+        "outside_availability",
+    ]
+    assert branches[1]["case"] == {"$in": [{"$toString": "$_id"}, [str(on_leave_id)]]}
+    assert reason_group["$group"]["_id"]["$switch"]["default"] == "outside_radius"
+    assert result.summary["total_candidates"] == 5
+    assert result.summary["guard_type_mismatch_count"] == 1
+    assert result.summary["planned_leave_conflict_count"] == 1
+    assert result.summary["outside_availability_count"] == 1
+    assert result.summary["outside_radius_count"] == 1
+    assert result.summary["eligible_count"] == 1
+
+
+@pytest.mark.anyio
+async def test_preview_matches_skips_geo_bound_for_service_providers():
+    provider = RequestMatchingManager.apply_match_index(_provider_tenant())
+    provider_id = str(provider.id)
+    manager = object.__new__(RequestMatchingManager)
+    manager._engine = FakeEngine(
+        [provider, _linked_provider_guard(provider_id)],
+        tenant_aggregate_rows=[{
+            "_id": None,
+            "total_count": 3,
+            "ownership_excluded_count": 0,
+            "in_scope_count": 1,
+            "max_radius_km": None,
+        }],
+    )
+
+    result = await manager.preview_matches(
+        RequestMatchingPreviewPayload(
+            target_type="service_provider",
+            site_address=MatchAddress(
+                country="CA",
+                province="ON",
+                city="Toronto",
+                latitude=43.6532,
+                longitude=-79.3832,
+            ),
+            requested_start_at=datetime(2026, 4, 27, 10, 0),
+            requested_end_at=datetime(2026, 4, 27, 12, 0),
+        )
+    )
+
+    assert manager._engine.tenant_prefilters[0] == {"match_region_codes": "ON"}
+    assert result.summary["total_candidates"] == 3
+    assert result.summary["province_mismatch_count"] == 2
+    assert result.summary["eligible_count"] == 1
+
+
+def test_build_match_index_derives_region_codes_and_geojson_anchors():
+    guard_index = RequestMatchingManager.build_match_index(
+        TenantType.GUARD,
+        GuardOwnershipType.PLATFORM,
+        {
+            "home_address": {"province": "British Columbia", "latitude": 49.28, "longitude": -123.12},
+            "max_travel_radius_km": 30,
+        },
+    )
+    assert guard_index == {
+        "match_region_codes": ["BC"],
+        "match_geo_point": {"type": "Point", "coordinates": [-123.12, 49.28]},
+        "match_radius_km": 30.0,
+        "match_availability_windows": {},
+    }
+
+    provider_index = RequestMatchingManager.build_match_index(
+        TenantType.SERVICE_PROVIDER,
+        None,
+        _provider_tenant().profile,
+    )
+    assert provider_index["match_region_codes"] == ["ON"]
+    assert provider_index["match_geo_point"] == {"type": "MultiPoint", "coordinates": [[-79.3832, 43.6532]]}
+
+    invalid_geo_index = RequestMatchingManager.build_match_index(
+        TenantType.GUARD,
+        GuardOwnershipType.SERVICE_PROVIDER,
+        {"home_address": {"province": "ON", "latitude": 120, "longitude": -79.0}},
+    )
+    assert invalid_geo_index["match_region_codes"] == []
+    assert invalid_geo_index["match_geo_point"] is None
+
+
+def test_score_guard_candidates_matches_per_candidate_evaluation():
+    manager = object.__new__(RequestMatchingManager)
+    tenants = []
+    for index, (latitude, longitude, radius_km) in enumerate([
+        (43.6532, -79.3832, 15),
+        (43.7000, -79.4000, 2),
+        (45.4215, -75.6972, 600),
+        (None, None, 10),
+        (43.6532, -79.3832, None),
+    ]):
+        guard = _guard_tenant()
+        guard.profile["full_name"] = f"Guard {index}"
+        guard.profile["home_address"]["latitude"] = latitude
+        guard.profile["home_address"]["longitude"] = longitude
+        guard.profile["max_travel_radius_km"] = radius_km
+        tenants.append(guard)
+    tenants.append(_guard_tenant(ownership_type=GuardOwnershipType.SERVICE_PROVIDER))
+    tenants.append(_guard_tenant(preferred_guard_types=["unarmed"]))
+    tenants.append(_guard_tenant(weekly_availability={"Monday": []}))
+    payload = RequestMatchingPreviewPayload(
+        target_type="guard",
+        site_address=MatchAddress(country="CA", province="ON", city="Toronto", latitude=43.6500, longitude=-79.3800),
+        requested_guard_type="armed",
+        requested_start_at=datetime(2026, 4, 27, 10, 0),
+        requested_end_at=datetime(2026, 4, 27, 12, 0),
+    )
+
+    expected = [
+        manager._candidate_from_guard(str(tenant.id), tenant.ownership_type, tenant.profile, payload, allow_provider_owned=False)
+        for tenant in tenants
+    ]
+    expected.sort(key=lambda row: (not row.eligible, row.distance_km if row.distance_km is not None else 999999, row.candidate_name.lower()))
+
+    batched = manager._score_guard_candidates(tenants, payload, planned_leave_guard_ids=set())
+
+    assert [row.model_dump() for row in batched] == [row.model_dump() for row in expected]
+    assert {row.reason_code for row in batched} >= {"within_radius", "outside_radius", "missing_geo", "ownership_excluded", "guard_type_mismatch", "outside_availability"}
+
+
+def test_compile_weekly_availability_merges_logical_day_windows():
+    compiled = RequestMatchingManager.compile_weekly_availability({
+        "Monday": [
+            {"start": "09:00", "end": "12:00"},
+            {"start": "11:00 AM", "end": "5:00 PM"},
+            {"start": "8:00 PM", "end": "6:00 AM"},
+        ],
+        "Tuesday": [{"start": "bad", "end": "10:00"}],
+    })
+
+    assert list(compiled) == ["Monday"]
+    assert compiled["Monday"] == [[180, 661], [840, 1440]]
+
+    monday = datetime(2026, 4, 27)
+    assert RequestMatchingManager._is_request_window_within_weekly_availability(
+        None, monday.replace(hour=10), monday.replace(hour=16), compiled,
+    ) is True
+    assert RequestMatchingManager._is_request_window_within_weekly_availability(
+        None, monday.replace(hour=8), monday.replace(hour=10), compiled,
+    ) is False
+    assert RequestMatchingManager._is_request_window_within_weekly_availability(
+        None, monday.replace(hour=21), monday.replace(hour=23), compiled,
+    ) is True
+
+
+@pytest.mark.anyio
+async def test_preview_matches_uses_compiled_availability_windows_from_tenant():
+    guard = _guard_tenant(weekly_availability={"Monday": []})
+    guard.match_availability_windows = RequestMatchingManager.compile_weekly_availability(
+        {"Monday": [{"start": "09:00", "end": "17:00"}]}
+    )
+    stale_guard = _guard_tenant(weekly_availability={"Monday": [{"start": "09:00", "end": "17:00"}]})
+    manager = object.__new__(RequestMatchingManager)
+    manager._engine = FakeEngine([guard, stale_guard])
+
+    result = await manager.preview_matches(
+        RequestMatchingPreviewPayload(
+            target_type="guard",
+            site_address=MatchAddress(country="CA", province="ON", city="Toronto", latitude=43.6532, longitude=-79.3832),
+            requested_start_at=datetime(2026, 4, 27, 10, 0),
+            requested_end_at=datetime(2026, 4, 27, 12, 0),
+        )
+    )
+
+    assert result.summary["eligible_count"] == 2
+    assert {row.reason_code for row in result.results} == {"within_radius"}
+
+
+@pytest.mark.anyio
+async def test_provider_reserved_capacity_pushes_window_overlap_into_single_aggregation():
+    provider = _provider_tenant()
+    overlapping_request = _provider_request_doc(
+        requested_start_at=datetime(2026, 4, 27, 10, 0),
+        requested_end_at=datetime(2026, 4, 27, 14, 0),
+    )
+    earlier_request = _provider_request_doc(
+        requested_start_at=datetime(2026, 4, 20, 10, 0),
+        requested_end_at=datetime(2026, 4, 20, 14, 0),
+    )
+    manager = object.__new__(RequestMatchingManager)
+    manager._engine = FakeEngine(
+        [provider],
+        assignments=[
+            _provider_assignment_doc(provider_tenant_id=str(provider.id), request_id=overlapping_request["_id"], slots_committed=2),
+            _provider_assignment_doc(provider_tenant_id=str(provider.id), request_id=earlier_request["_id"], slots_committed=5),
+        ],
+        requests=[overlapping_request, earlier_request],
+    )
+    payload = RequestMatchingPreviewPayload(
+        target_type="service_provider",
+        site_address=MatchAddress(country="CA", province="ON", city="Toronto"),
+        requested_start_at=datetime(2026, 4, 27, 12, 0),
+        requested_end_at=datetime(2026, 4, 27, 16, 0),
+    )
+
+    reserved = await manager._provider_reserved_capacity_by_provider(payload)
+
+    assert reserved == {str(provider.id): 2}
+    pipeline = manager._provider_reserved_capacity_pipeline(datetime(2026, 4, 27, 12, 0), datetime(2026, 4, 27, 16, 0))
+    assert pipeline[0]["$match"]["requested_start_at"] == {"$lt": datetime(2026, 4, 27, 16, 0)}
+    assert pipeline[0]["$match"]["requested_end_at"] == {"$gt": datetime(2026, 4, 27, 12, 0)}
+    assert pipeline[2]["$lookup"]["from"] == "request_assignment_record"
+    assert [list(stage)[0] for stage in pipeline] == ["$match", "$project", "$lookup", "$unwind", "$group"]
+
+
+@pytest.mark.anyio
+async def test_preview_matches_resolves_provider_planned_leave_in_one_query():
+    first_provider = _provider_tenant()
+    second_provider = _provider_tenant()
+    first_guard = _linked_provider_guard(str(first_provider.id), operational_city_code="TORONTO")
+    second_guard = _linked_provider_guard(str(second_provider.id), operational_city_code="TORONTO")
+    manager = object.__new__(RequestMatchingManager)
+    manager._engine = FakeEngine(
+        [first_provider, second_provider, first_guard, second_guard],
+        planned_leaves=[{
+            "guard_tenant_id": str(second_guard.id),
+            "request_status": "approved",
+            "start_at_utc": datetime(2026, 4, 27, 9, 0),
+            "end_at_utc": datetime(2026, 4, 27, 13, 0),
+        }],
+    )
+
+    result = await manager.preview_matches(
+        RequestMatchingPreviewPayload(
+            target_type="service_provider",
+            site_address=MatchAddress(country="CA", province="ON", city="Toronto", latitude=43.6532, longitude=-79.3832),
+            requested_start_at=datetime(2026, 4, 27, 10, 0),
+            requested_end_at=datetime(2026, 4, 27, 12, 0),
+        )
+    )
+
+    assert manager._engine.planned_leave_collection_requests == 1
+    by_provider = {row.candidate_id: row for row in result.results}
+    assert by_provider[str(first_provider.id)].available_guard_count == 1
+    assert by_provider[str(first_provider.id)].eligible is True
+    assert by_provider[str(second_provider.id)].available_guard_count == 0
+    assert by_provider[str(second_provider.id)].reason_code == "insufficient_capacity"
@@ -52,6 +52,7 @@ async def test_list_client_requests_forwards_filters(monkeypatch):
     assert captured["request_status"] == "draft"
     assert captured["fulfillment_mode"] == "individual_only"
     assert captured["client_tenant_id"] == "tenant-77"
+    assert captured["cursor"] is None
     assert captured["current_user"].username == "tester"
 
 
@@ -254,13 +255,14 @@ async def test_list_request_jobs_forwards_filters(monkeypatch):
     monkeypatch.setattr(RequestManager, "get_instance", staticmethod(lambda: FakeManager()))
 
     async with AsyncClient(transport=ASGITransport(app=_app(user_role.GUARD_ADMIN)), base_url="http://test") as client:
-        response = await client.get("/api/jobs?page=3&rows=10&assignment_status=offered&keyword=night")
+        response = await client.get("/api/jobs?page=3&rows=10&assignment_status=offered&keyword=night&cursor=abc")
 
     assert response.status_code == 200
     assert captured["page"] == 3
     assert captured["rows"] == 10
     assert captured["assignment_status"] == "offered"
     assert captured["keyword"] == "night"
+    assert captured["cursor"] == "abc"
 
 
 @pytest.mark.anyio
@@ -719,6 +721,7 @@ async def test_list_request_shifts_forwards_filters(monkeypatch):
     assert captured["instance_status"] == "scheduled"
     assert captured["date_from"].isoformat() == "2026-06-01"
     assert captured["date_to"].isoformat() == "2026-06-03"
+    assert captured["cursor"] is None
     assert captured["current_user"].username == "tester"
 
 
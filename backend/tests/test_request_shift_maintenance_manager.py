@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
@@ -7,6 +8,8 @@ from bson import ObjectId
 from orion.management.managers.request_shift_maintenance_manager import request_shift_maintenance_manager
 from orion.services.mongo_manager.shared_model.db_notification_model import NotificationRecord
 from orion.services.mongo_manager.shared_model.db_request_model import (
+    ClientRequestRecord,
+    RequestPayoutLedgerRecord,
     RequestScheduleTemplateRecord,
     RequestStatus,
     ShiftInstanceRecord,
@@ -77,8 +80,49 @@ class _FakeSlotCollection:
 
 
 class _FakeNotificationCollection:
-    async def count_documents(self, _query):
-        return 0
+    def __init__(self, docs):
+        self._docs = list(docs)
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+        tenant_ids = set(query["recipient_tenant_id"]["$in"])
+        reminder_keys = set(query["metadata.reminder_key"]["$in"])
+        return _FakeCursor([
+            doc
+            for doc in self._docs
+            if doc.get("recipient_tenant_id") in tenant_ids and doc["metadata"].get("reminder_key") in reminder_keys
+        ])
+
+
+class _FakeRequestCollection:
+    def __init__(self, docs):
+        self._docs = list(docs)
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append((query, projection))
+        request_ids = set(query["_id"]["$in"]) if "_id" in query else None
+        return _FakeCursor([
+            doc
+            for doc in self._docs
+            if (request_ids is None or doc["_id"] in request_ids)
+            and ("shift_slots_dirty" not in query or bool(doc.get("shift_slots_dirty")) == query["shift_slots_dirty"])
+            and ("payout_ledger_dirty" not in query or bool(doc.get("payout_ledger_dirty")) == query["payout_ledger_dirty"])
+            and ("deleted_at" not in query or doc.get("deleted_at") == query["deleted_at"])
+        ])
+
+
+class _FakeLedgerCollection:
+    def __init__(self, docs):
+        self._docs = list(docs)
+
+    def find(self, query, projection=None):
+        cutoff = query["refreshed_at"]["$lt"]
+        return _FakeCursor(sorted(
+            (doc for doc in self._docs if doc["refreshed_at"] < cutoff),
+            key=lambda doc: doc["refreshed_at"],
+        ))
 
 
 class _FakeScheduleCollection:
@@ -96,10 +140,13 @@ class _FakeScheduleCollection:
 
 
 class _FakeEngine:
-    def __init__(self, shift_docs, slot_docs, schedule_docs=None):
+    def __init__(self, shift_docs, slot_docs, schedule_docs=None, notification_docs=None, request_docs=None, ledger_docs=None):
         self._shift_docs = list(shift_docs)
         self._slot_docs = list(slot_docs)
         self._schedule_docs = list(schedule_docs or [])
+        self.notification_collection = _FakeNotificationCollection(notification_docs or [])
+        self.request_collection = _FakeRequestCollection(request_docs or [])
+        self._ledger_docs = list(ledger_docs or [])
 
     def get_collection(self, model):
         if model is ShiftInstanceRecord:
@@ -109,7 +156,11 @@ class _FakeEngine:
         if model is RequestScheduleTemplateRecord:
             return _FakeScheduleCollection(self._schedule_docs)
         if model is NotificationRecord:
-            return _FakeNotificationCollection()
+            return self.notification_collection
+        if model is ClientRequestRecord:
+            return self.request_collection
+        if model is RequestPayoutLedgerRecord:
+            return _FakeLedgerCollection(self._ledger_docs)
         raise AssertionError(f"Unexpected collection request: {model}")
 
 
@@ -124,24 +175,27 @@ class _FrozenDateTime(datetime):
 
 
 @pytest.mark.anyio
-async def test_guard_checkin_reminder_only_targets_slots_in_final_five_minutes(monkeypatch):
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_guard_checkin_reminder_only_targets_slots_in_final_five_minutes(monkeypatch, anyio_backend):
     now = _FrozenDateTime.current.replace(tzinfo=None)
     shift_due_id = str(ObjectId())
     shift_later_id = str(ObjectId())
     slot_due_id = str(ObjectId())
     slot_later_id = str(ObjectId())
+    request_due_id = ObjectId()
+    request_later_id = ObjectId()
 
     engine = _FakeEngine(
         shift_docs=[
             {
                 "_id": shift_due_id,
-                "request_id": "req-due",
+                "request_id": str(request_due_id),
                 "shift_start_at_utc": now + timedelta(minutes=4),
                 "instance_status": ShiftInstanceStatus.STAFFED.value,
             },
             {
                 "_id": shift_later_id,
-                "request_id": "req-later",
+                "request_id": str(request_later_id),
                 "shift_start_at_utc": now + timedelta(minutes=20),
                 "instance_status": ShiftInstanceStatus.STAFFED.value,
             },
@@ -150,7 +204,7 @@ async def test_guard_checkin_reminder_only_targets_slots_in_final_five_minutes(m
             {
                 "_id": slot_due_id,
                 "shift_instance_id": shift_due_id,
-                "request_id": "req-due",
+                "request_id": str(request_due_id),
                 "slot_status": ShiftSlotStatus.RESERVED.value,
                 "assigned_guard_tenant_id": "guard-1",
                 "arrived_at": None,
@@ -158,12 +212,16 @@ async def test_guard_checkin_reminder_only_targets_slots_in_final_five_minutes(m
             {
                 "_id": slot_later_id,
                 "shift_instance_id": shift_later_id,
-                "request_id": "req-later",
+                "request_id": str(request_later_id),
                 "slot_status": ShiftSlotStatus.RESERVED.value,
                 "assigned_guard_tenant_id": "guard-2",
                 "arrived_at": None,
             },
         ],
+        request_docs=[
+            {"_id": request_due_id, "title": "Retail Event Security – Vancouver"},
+            {"_id": request_later_id, "title": "Later Shift"},
+        ],
     )
     sent_notifications = []
 
@@ -172,11 +230,6 @@ async def test_guard_checkin_reminder_only_targets_slots_in_final_five_minutes(m
             sent_notifications.append(kwargs)
             return 1
 
-    class _FakeRequestManager:
-        async def _get_request_or_404(self, request_id):
-            title = "Retail Event Security – Vancouver" if request_id == "req-due" else "Later Shift"
-            return SimpleNamespace(title=title)
-
     monkeypatch.setattr(
         "orion.management.managers.request_shift_maintenance_manager.datetime",
         _FrozenDateTime,
@@ -185,10 +238,6 @@ async def test_guard_checkin_reminder_only_targets_slots_in_final_five_minutes(m
         "orion.management.managers.request_shift_maintenance_manager.NotificationManager.get_instance",
         staticmethod(lambda: _FakeNotificationManager()),
     )
-    monkeypatch.setattr(
-        "orion.management.managers.request_shift_maintenance_manager.RequestManager.get_instance",
-        staticmethod(lambda: _FakeRequestManager()),
-    )
 
     manager = object.__new__(request_shift_maintenance_manager)
     manager._engine = engine
@@ -202,10 +251,73 @@ async def test_guard_checkin_reminder_only_targets_slots_in_final_five_minutes(m
     assert sent_notifications[0]["title"] == "Shift starts in less than 5 minutes"
     assert sent_notifications[0]["action_url"] == f"/dashboard/requests?tab=shifts&slot={slot_due_id}"
     assert sent_notifications[0]["metadata"]["reminder_type"] == "guard_checkin_due"
+    assert sent_notifications[0]["message"].startswith("Retail Event Security – Vancouver: ")
+    assert sent_notifications[0]["reminder_key"] == f"guard-checkin:{slot_due_id}"
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_guard_checkin_reminders_dedupe_and_load_titles_in_one_query_each(monkeypatch, anyio_backend):
+    now = _FrozenDateTime.current.replace(tzinfo=None)
+    shift_id = str(ObjectId())
+    request_id = ObjectId()
+    slot_ids = [str(ObjectId()) for _ in range(5)]
+    engine = _FakeEngine(
+        shift_docs=[{
+            "_id": shift_id,
+            "shift_start_at_utc": now + timedelta(minutes=2),
+            "instance_status": ShiftInstanceStatus.STAFFED.value,
+        }],
+        slot_docs=[
+            {
+                "_id": slot_id,
+                "shift_instance_id": shift_id,
+                "request_id": str(request_id),
+                "slot_status": ShiftSlotStatus.ROSTERED.value,
+                "assigned_guard_tenant_id": f"guard-{index}",
+                "arrived_at": None,
+            }
+            for index, slot_id in enumerate(slot_ids)
+        ],
+        notification_docs=[
+            {"recipient_tenant_id": "guard-0", "metadata": {"reminder_key": f"guard-checkin:{slot_ids[0]}"}},
+            {"recipient_tenant_id": "guard-1", "metadata": {"reminder_key": f"guard-checkin:{slot_ids[0]}"}},
+        ],
+        request_docs=[{"_id": request_id, "title": "Night Patrol"}],
+    )
+    sent_notifications = []
+
+    class _FakeNotificationManager:
+        async def create_for_tenant_admin_users(self, **kwargs):
+            sent_notifications.append(kwargs)
+            return 0 if kwargs["tenant_id"] == "guard-4" else 1
+
+    monkeypatch.setattr(
+        "orion.management.managers.request_shift_maintenance_manager.datetime",
+        _FrozenDateTime,
+    )
+    monkeypatch.setattr(
+        "orion.management.managers.request_shift_maintenance_manager.NotificationManager.get_instance",
+        staticmethod(lambda: _FakeNotificationManager()),
+    )
+
+    manager = object.__new__(request_shift_maintenance_manager)
+    manager._engine = engine
+
+    sent_count = await manager._send_guard_checkin_reminders()
+
+    assert sent_count == 3
+    assert sorted(item["tenant_id"] for item in sent_notifications) == ["guard-1", "guard-2", "guard-3", "guard-4"]
+    assert {item["message"] for item in sent_notifications} == {
+        "Night Patrol: your shift is about to start. Open the shift slot now and complete check-in."
+    }
+    assert len(engine.notification_collection.queries) == 1
+    assert engine.request_collection.queries == [({"_id": {"$in": [request_id]}}, {"title": 1})]
 
 
 @pytest.mark.anyio
-async def test_sync_advance_request_invoices_only_counts_live_long_term_requests(monkeypatch):
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_sync_advance_request_invoices_only_counts_live_long_term_requests(monkeypatch, anyio_backend):
     engine = _FakeEngine(
         shift_docs=[],
         slot_docs=[],
@@ -263,3 +375,179 @@ async def test_sync_advance_request_invoices_only_counts_live_long_term_requests
 
     assert synced_count == 1
     assert synced == [("req-long", "system", "weekly_advance")]
+
+
+def test_maintenance_stages_are_scheduled_as_independent_jobs():
+    manager = object.__new__(request_shift_maintenance_manager)
+
+    jobs = {job.name: job for job in manager._jobs()}
+
+    assert set(jobs) == {
+        "shift_generation",
+        "slot_sync",
+        "advance_invoices",
+        "payout_ledger",
+        "leave_sync",
+        "exception_sync",
+        "provider_roster_reminders",
+        "guard_checkin_reminders",
+        "client_confirmation_reminders",
+    }
+    assert all(job.leader_only and job.timeout < job.interval for job in jobs.values())
+    assert jobs["guard_checkin_reminders"].interval < jobs["shift_generation"].interval
+    assert {jobs[name].group for name in ("shift_generation", "slot_sync", "leave_sync", "exception_sync")} == {"shift_state"}
+    assert {jobs[name].group for name in ("advance_invoices", "payout_ledger")} == {"billing"}
+    assert jobs["guard_checkin_reminders"].group is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_run_iteration_overlaps_lanes_and_reports_timings(anyio_backend):
+    manager = object.__new__(request_shift_maintenance_manager)
+    in_flight = []
+    peak = []
+    overlaps = []
+
+    def _stage(name, result, fail=False):
+        async def run():
+            overlaps.extend((name, other) for other in in_flight)
+            in_flight.append(name)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(name)
+            if fail:
+                raise RuntimeError("leave lookup failed")
+            return result
+        return run
+
+    manager._stages = lambda: {
+        "shift_generation": _stage("shift_generation", {"created_shift_count": 3, "touched_request_count": 1}),
+        "slot_sync": _stage("slot_sync", 5),
+        "advance_invoices": _stage("advance_invoices", 2),
+        "payout_ledger": _stage("payout_ledger", 6),
+        "leave_sync": _stage("leave_sync", 0, fail=True),
+        "exception_sync": _stage("exception_sync", 4),
+        "provider_roster_reminders": _stage("provider_roster_reminders", 0),
+        "guard_checkin_reminders": _stage("guard_checkin_reminders", 1),
+        "client_confirmation_reminders": _stage("client_confirmation_reminders", 0),
+    }
+
+    summary = await manager.run_iteration()
+
+    assert max(peak) == request_shift_maintenance_manager._STAGE_CONCURRENCY
+    lanes = request_shift_maintenance_manager._STAGE_LANES
+    assert not [pair for pair in overlaps if lanes.get(pair[0], pair[0]) == lanes.get(pair[1], pair[1])]
+    assert summary["created_shift_count"] == 3
+    assert summary["slot_sync_count"] == 5
+    assert summary["advance_invoice_sync_count"] == 2
+    assert summary["payout_ledger_refresh_count"] == 6
+    assert summary["exception_sync_count"] == 4
+    assert summary["guard_checkin_reminders"] == 1
+    assert summary["leave_sync_count"] == 0
+    assert summary["stage_errors"] == {"leave_sync": "leave lookup failed"}
+    assert list(summary["stage_timings_ms"]) == list(manager._stages())
+    assert all(value >= 10 for value in summary["stage_timings_ms"].values())
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_runtime_exception_sync_bounds_per_shift_concurrency(anyio_backend):
+    now = _FrozenDateTime.current.replace(tzinfo=None)
+    shift_docs = [
+        {"_id": ObjectId(), "shift_start_at_utc": now, "instance_status": ShiftInstanceStatus.STAFFED.value}
+        for _ in range(20)
+    ]
+    in_flight = []
+    peak = []
+    synced = []
+
+    class _FakeShiftManager:
+        async def _get_shift_or_404(self, shift_id):
+            return SimpleNamespace(id=shift_id)
+
+        async def _sync_shift_runtime_exception_states(self, shift_record):
+            in_flight.append(shift_record.id)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(shift_record.id)
+            if len(synced) == 3:
+                synced.append(None)
+                raise RuntimeError("boom")
+            synced.append(shift_record.id)
+
+    manager = object.__new__(request_shift_maintenance_manager)
+    manager._engine = _FakeEngine(shift_docs=shift_docs, slot_docs=[])
+
+    count = await manager._sync_active_shift_runtime_exceptions(_FakeShiftManager())
+
+    assert count == 19
+    assert max(peak) == request_shift_maintenance_manager._ITEM_CONCURRENCY
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_slot_sync_sweeps_only_dirty_live_requests(monkeypatch, anyio_backend):
+    dirty_id = ObjectId()
+    failing_id = ObjectId()
+    request_docs = [
+        {"_id": dirty_id, "shift_slots_dirty": True, "deleted_at": None},
+        {"_id": failing_id, "shift_slots_dirty": True, "deleted_at": None},
+        {"_id": ObjectId(), "shift_slots_dirty": False, "deleted_at": None},
+        {"_id": ObjectId(), "shift_slots_dirty": True, "deleted_at": datetime(2026, 5, 1)},
+    ]
+    synced = []
+
+    class _FakeShiftManager:
+        async def sync_shift_slots_for_request(self, request_id):
+            if request_id == str(failing_id):
+                raise RuntimeError("assignment lookup failed")
+            synced.append(request_id)
+
+    monkeypatch.setattr(
+        "orion.management.managers.request_shift_maintenance_manager.RequestShiftManager.get_instance",
+        lambda: _FakeShiftManager(),
+    )
+    manager = object.__new__(request_shift_maintenance_manager)
+    manager._engine = _FakeEngine(shift_docs=[], slot_docs=[], request_docs=request_docs)
+
+    count = await manager._sync_dirty_request_slots()
+
+    assert count == 1
+    assert synced == [str(dirty_id)]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_payout_ledger_refreshes_dirty_requests_then_stale_rows(monkeypatch, anyio_backend):
+    dirty_id = ObjectId()
+    stale_request_id = str(ObjectId())
+    request_docs = [
+        {"_id": dirty_id, "payout_ledger_dirty": True, "deleted_at": None},
+        {"_id": ObjectId(), "payout_ledger_dirty": False, "deleted_at": None},
+        {"_id": ObjectId(), "payout_ledger_dirty": True, "deleted_at": datetime(2026, 5, 1)},
+    ]
+    now = datetime.utcnow()
+    ledger_docs = [
+        {"request_id": stale_request_id, "refreshed_at": now - timedelta(days=2)},
+        {"request_id": stale_request_id, "refreshed_at": now - timedelta(days=3)},
+        {"request_id": str(dirty_id), "refreshed_at": now - timedelta(days=2)},
+        {"request_id": str(ObjectId()), "refreshed_at": now - timedelta(hours=1)},
+    ]
+    refreshed = []
+
+    class _FakeRequestManager:
+        async def refresh_payout_ledger_for_request(self, request_id):
+            refreshed.append(request_id)
+            return 1
+
+    monkeypatch.setattr(
+        "orion.management.managers.request_shift_maintenance_manager.RequestManager.get_instance",
+        lambda: _FakeRequestManager(),
+    )
+    manager = object.__new__(request_shift_maintenance_manager)
+    manager._engine = _FakeEngine(shift_docs=[], slot_docs=[], request_docs=request_docs, ledger_docs=ledger_docs)
+
+    count = await manager._sync_payout_ledger()
+
+    assert count == 2
+    assert refreshed == [str(dirty_id), stale_request_id]
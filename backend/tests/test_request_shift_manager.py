@@ -39,6 +39,7 @@ from orion.services.mongo_manager.shared_model.db_request_model import (
     ShiftGuardLeaveStatus,
     ShiftCoverageSourceType,
     ShiftInstanceRecord,
+    ShiftInstanceStatus,
     ShiftSlotCheckInPayload,
     ShiftSlotCheckOutPayload,
     ShiftSlotClientConfirmPayload,
@@ -57,9 +58,10 @@ class FakeCursor:
         self._skip = 0
         self._limit = None
 
-    def sort(self, key, direction):
-        reverse = direction == -1
-        self._docs.sort(key=lambda item: item.get(key), reverse=reverse)
+    def sort(self, key, direction=1):
+        sort_spec = key if isinstance(key, list) else [(key, direction)]
+        for sort_key, sort_direction in reversed(sort_spec):
+            self._docs.sort(key=lambda item: item.get(sort_key), reverse=sort_direction == -1)
         return self
 
     def skip(self, value):
@@ -99,20 +101,65 @@ class FakeShiftCollection:
     async def count_documents(self, query):
         return len(self._matching_docs(query))
 
-    def find(self, query):
-        return FakeCursor(self._matching_docs(query))
+    def find(self, query, projection=None):
+        docs = self._matching_docs(query)
+        if projection:
+            fields = [key for key, include in projection.items() if include]
+            docs = [{key: doc.get(key) for key in fields} for doc in docs]
+        return FakeCursor(docs)
+
+    async def bulk_write(self, requests, ordered=True):
+        self.engine.shift_bulk_writes.append(requests)
+        upserted_count = 0
+        for request in requests:
+            matches = [
+                shift
+                for shift in self.engine.shift_instances
+                if all(getattr(shift, "id" if key == "_id" else key) == value for key, value in request._filter.items())
+            ]
+            if not matches and request._upsert:
+                self.engine.shift_instances.append(
+                    ShiftInstanceRecord.model_validate_doc({**request._filter, **request._doc["$setOnInsert"]})
+                )
+                upserted_count += 1
+            for shift in matches:
+                for key, value in request._doc.get("$set", {}).items():
+                    if key == "instance_status":
+                        value = ShiftInstanceStatus(value)
+                    setattr(shift, key, value)
+        return SimpleNamespace(upserted_count=upserted_count)
+
+    @staticmethod
+    def _after_keyset(doc, keyset):
+        for clause in keyset["$or"]:
+            start_filter = clause["shift_start_at_utc"]
+            if isinstance(start_filter, dict) and doc["shift_start_at_utc"] > start_filter["$gt"]:
+                return True
+            if not isinstance(start_filter, dict) and doc["shift_start_at_utc"] == start_filter and doc["_id"] > clause["_id"]["$gt"]:
+                return True
+        return False
 
     def _matching_docs(self, query):
+        if "$and" in query:
+            base_query, keyset = query["$and"]
+            return [doc for doc in self._matching_docs(base_query) if self._after_keyset(doc, keyset)]
         request_value = query.get("request_id", {})
         request_ids = set(request_value.get("$in", [])) if isinstance(request_value, dict) else set()
         id_filter = query.get("_id", {}).get("$in", [])
         client_tenant_id = query.get("client_tenant_id")
+        visible_tenant_id = query.get("visible_tenant_ids")
+        template_id = query.get("schedule_template_id")
         status_value = query.get("instance_status")
         date_filter = query.get("shift_date_local", {})
         date_gte = date_filter.get("$gte")
         date_lte = date_filter.get("$lte")
+        date_in = date_filter.get("$in")
         docs = []
         for shift in self.engine.shift_instances:
+            if template_id and shift.schedule_template_id != template_id:
+                continue
+            if date_in is not None and shift.shift_date_local not in date_in:
+                continue
             if id_filter and shift.id not in id_filter:
                 continue
             if request_ids and shift.request_id not in request_ids:
@@ -121,6 +168,8 @@ class FakeShiftCollection:
                 continue
             if client_tenant_id and shift.client_tenant_id != client_tenant_id:
                 continue
+            if visible_tenant_id and visible_tenant_id not in shift.visible_tenant_ids:
+                continue
             if status_value and getattr(shift.instance_status, "value", shift.instance_status) != status_value:
                 continue
             if date_gte and shift.shift_date_local < date_gte:
@@ -144,6 +193,7 @@ class FakeShiftCollection:
                     "slots_completed": shift.slots_completed,
                     "client_action_required": shift.client_action_required,
                     "roster_due_at": shift.roster_due_at,
+                    "visible_tenant_ids": list(shift.visible_tenant_ids),
                     "created_from_revision": shift.created_from_revision,
                     "cancel_reason": shift.cancel_reason,
                     "reduction_reason": shift.reduction_reason,
@@ -173,6 +223,7 @@ class FakeSlotCollection:
         request_id = query.get("request_id")
         slot_status = query.get("slot_status")
         slot_status_in = slot_status.get("$in", []) if isinstance(slot_status, dict) else []
+        date_filter = query.get("shift_date_local", {})
         or_filter = query.get("$or") or []
         for slot in self.engine.shift_slots:
             if id_filter and slot.id not in id_filter:
@@ -183,7 +234,13 @@ class FakeSlotCollection:
                 continue
             if coverage_tenant_id and slot.coverage_tenant_id != coverage_tenant_id:
                 continue
-            if request_id and slot.request_id != request_id:
+            if request_id and not isinstance(request_id, dict) and slot.request_id != request_id:
+                continue
+            if "request_deleted_at" in query and slot.request_deleted_at != query["request_deleted_at"]:
+                continue
+            if date_filter.get("$gte") and (slot.shift_date_local or "") < date_filter["$gte"]:
+                continue
+            if date_filter.get("$lte") and (slot.shift_date_local or "") > date_filter["$lte"]:
                 continue
             if slot_status_in and slot.slot_status.value not in slot_status_in:
                 continue
@@ -215,6 +272,8 @@ class FakeSlotCollection:
                     "assigned_guard_tenant_id": slot.assigned_guard_tenant_id,
                     "slot_status": slot.slot_status.value,
                     "replacement_of_slot_id": slot.replacement_of_slot_id,
+                    "shift_start_at_utc": slot.shift_start_at_utc,
+                    "shift_date_local": slot.shift_date_local,
                     "rostered_at": slot.rostered_at,
                     "roster_due_at": slot.roster_due_at,
                     "guard_unavailable_reported_at": slot.guard_unavailable_reported_at,
@@ -271,7 +330,7 @@ class FakeRequestCollection:
     def __init__(self, engine):
         self.engine = engine
 
-    def find(self, query):
+    def find(self, query, projection=None):
         docs = []
         id_filter = query.get("_id", {}).get("$in", [])
         deleted_at = query.get("deleted_at") if isinstance(query, dict) else None
@@ -283,20 +342,66 @@ class FakeRequestCollection:
                 continue
             if deleted_at is None and getattr(record, "deleted_at", None) is not None:
                 continue
+            if isinstance(deleted_at, dict) and getattr(record, "deleted_at", None) is None:
+                continue
+            if "shift_slots_dirty" in query and bool(getattr(record, "shift_slots_dirty", False)) != query["shift_slots_dirty"]:
+                continue
+            if "client_tenant_id" in query and getattr(record, "client_tenant_id", None) != query["client_tenant_id"]:
+                continue
             docs.append({
                 "_id": record.id,
                 "title": getattr(record, "title", None),
+                "client_tenant_id": getattr(record, "client_tenant_id", None),
                 "site_snapshot": getattr(record, "site_snapshot", None),
                 "deleted_at": getattr(record, "deleted_at", None),
             })
         return FakeCursor(docs)
 
+    async def update_one(self, query, update):
+        record = self.engine.request_record
+        if record is not None and record.id == query.get("_id"):
+            for key, value in update.get("$set", {}).items():
+                setattr(record, key, value)
 
-class FakeAssignmentCollection:
+
+class FakeScheduleCollection:
     def __init__(self, engine):
         self.engine = engine
 
+    def _records(self):
+        records = [self.engine.schedule_record] if self.engine.schedule_record else []
+        return records + list(self.engine.additional_schedule_records)
+
     def find(self, query):
+        resume_after = None
+        if "$and" in query:
+            query, resume_filter = query["$and"]
+            resume_after = resume_filter["_id"]["$gt"]
+        docs = []
+        for record in self._records():
+            if query.get("active") and not record.active:
+                continue
+            if resume_after is not None and record.id <= resume_after:
+                continue
+            last_date = record.end_date_local or record.start_date_local
+            if record.generated_through_date is not None and record.generated_through_date >= last_date:
+                continue
+            docs.append(record.model_dump_doc())
+        return FakeCursor(docs)
+
+    async def bulk_write(self, requests, ordered=True):
+        for request in requests:
+            for record in self._records():
+                if record.id == request._filter["_id"]:
+                    for key, value in request._doc["$set"].items():
+                        setattr(record, key, value)
+
+
+class FakeAssignmentCollection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def find(self, query, projection=None):
         docs = []
         assignment_scope = query.get("assignment_scope")
         assignment_status_filter = query.get("assignment_status", {})
@@ -331,7 +436,9 @@ class FakeEngine:
     def __init__(self):
         self.request_record = None
         self.schedule_record = None
+        self.additional_schedule_records = []
         self.shift_instances = []
+        self.shift_bulk_writes = []
         self.shift_slots = []
         self.shift_events = []
         self.shift_guard_leaves = []
@@ -450,6 +557,8 @@ class FakeEngine:
         return None
 
     async def find(self, model, _condition):
+        if model is RequestScheduleTemplateRecord:
+            return [self.schedule_record] if self.schedule_record is not None else []
         if model is ShiftInstanceRecord:
             return list(self.shift_instances)
         if model is ShiftSlotRecord:
@@ -515,6 +624,8 @@ class FakeEngine:
             return FakeEventCollection(self)
         if model is ClientRequestRecord:
             return FakeRequestCollection(self)
+        if model is RequestScheduleTemplateRecord:
+            return FakeScheduleCollection(self)
         if model is RequestAssignmentRecord:
             return FakeAssignmentCollection(self)
         raise AssertionError(f"Unexpected collection request: {model}")
@@ -572,6 +683,9 @@ def _fake_request_manager(
     tenants = dict(tenants or {})
 
     class FakeRequestManager:
+        async def mark_payout_ledger_dirty(self, record):
+            record.payout_ledger_dirty = True
+
         _engine = engine
 
         async def _get_request_or_404(self, _request_id):
@@ -896,6 +1010,7 @@ async def test_list_shifts_filters_by_request_and_date(monkeypatch):
             shift_start_at_utc=datetime.fromisoformat(f"{day}T03:00:00"),
             shift_end_at_utc=datetime.fromisoformat(f"{day}T11:00:00"),
             timezone="Asia/Karachi",
+            visible_tenant_ids=[request_record.client_tenant_id],
         )
         object.__setattr__(shift, "id", ObjectId())
         engine.shift_instances.append(shift)
@@ -913,6 +1028,276 @@ async def test_list_shifts_filters_by_request_and_date(monkeypatch):
     assert response["items"][0]["site_name"] == request_record.site_snapshot["site_name"]
 
 
+@pytest.mark.anyio
+async def test_list_shifts_cursor_mode_pages_by_start_time_and_id(monkeypatch):
+    engine = FakeEngine()
+    request_record = _make_request()
+    engine.request_record = request_record
+    manager = object.__new__(RequestShiftManager)
+    manager._engine = engine
+    monkeypatch.setattr(
+        "orion.api.interactive.request_shift_manager.request_shift_manager.RequestManager.get_instance",
+        lambda: _fake_request_manager(request_record),
+    )
+    template = RequestScheduleTemplateRecord(
+        request_id=str(request_record.id),
+        client_tenant_id=request_record.client_tenant_id,
+        timezone="Asia/Karachi",
+        schedule_type=RequestScheduleType.DATE_RANGE,
+        start_date_local="2026-01-01",
+        end_date_local="2026-01-04",
+        start_time_local="08:00",
+        end_time_local="16:00",
+    )
+    object.__setattr__(template, "id", ObjectId())
+    engine.schedule_record = template
+    for day in ("2026-01-01", "2026-01-01", "2026-01-02", "2026-01-03", "2026-01-04"):
+        shift = ShiftInstanceRecord(
+            request_id=str(request_record.id),
+            client_tenant_id=request_record.client_tenant_id,
+            schedule_template_id=str(template.id),
+            shift_date_local=day,
+            shift_start_at_utc=datetime.fromisoformat(f"{day}T03:00:00"),
+            shift_end_at_utc=datetime.fromisoformat(f"{day}T11:00:00"),
+            timezone="Asia/Karachi",
+            visible_tenant_ids=[request_record.client_tenant_id],
+        )
+        object.__setattr__(shift, "id", ObjectId())
+        engine.shift_instances.append(shift)
+
+    current_user = SimpleNamespace(username="tester", role="client_admin", tenant_uuid=request_record.client_tenant_id)
+    first_page = await manager.list_shifts(current_user=current_user, request_id=str(request_record.id), rows=2, cursor="")
+    second_page = await manager.list_shifts(
+        current_user=current_user,
+        request_id=str(request_record.id),
+        rows=2,
+        cursor=first_page["pagination"]["next_cursor"],
+    )
+    third_page = await manager.list_shifts(
+        current_user=current_user,
+        request_id=str(request_record.id),
+        rows=2,
+        cursor=second_page["pagination"]["next_cursor"],
+    )
+
+    assert [item["shift_date_local"] for item in first_page["items"]] == ["2026-01-01", "2026-01-01"]
+    assert [item["shift_date_local"] for item in second_page["items"]] == ["2026-01-02", "2026-01-03"]
+    assert [item["shift_date_local"] for item in third_page["items"]] == ["2026-01-04"]
+    assert third_page["pagination"] == {"rows": 2, "cursor": second_page["pagination"]["next_cursor"], "next_cursor": None, "has_more": False}
+
+
+@pytest.mark.anyio
+async def test_list_shifts_syncs_page_in_batch_and_bulk_writes_changed_shifts(monkeypatch):
+    engine = FakeEngine()
+    request_record = _make_request()
+    engine.request_record = request_record
+    manager = object.__new__(RequestShiftManager)
+    manager._engine = engine
+    monkeypatch.setattr(
+        "orion.api.interactive.request_shift_manager.request_shift_manager.RequestManager.get_instance",
+        lambda: _fake_request_manager(request_record),
+    )
+    recorded_events = []
+
+    async def _record_slot_event(slot_record, shift_record, request_record, actor, event_type, metadata=None):
+        recorded_events.append((str(slot_record.shift_instance_id), event_type))
+
+    async def _notify_late_arrival_ineligible(**kwargs):
+        return None
+
+    manager._record_slot_event = _record_slot_event
+    manager._notify_late_arrival_ineligible = _notify_late_arrival_ineligible
+    template = RequestScheduleTemplateRecord(
+        request_id=str(request_record.id),
+        client_tenant_id=request_record.client_tenant_id,
+        timezone="Asia/Karachi",
+        schedule_type=RequestScheduleType.DATE_RANGE,
+        start_date_local="2026-01-01",
+        end_date_local="2026-01-03",
+        start_time_local="08:00",
+        end_time_local="16:00",
+    )
+    object.__setattr__(template, "id", ObjectId())
+    engine.schedule_record = template
+    now = datetime.utcnow().replace(microsecond=0)
+    shifts = []
+    for offset_hours in (-5, -3, 24):
+        start_at = now + timedelta(hours=offset_hours)
+        shift = ShiftInstanceRecord(
+            request_id=str(request_record.id),
+            client_tenant_id=request_record.client_tenant_id,
+            schedule_template_id=str(template.id),
+            shift_date_local=start_at.date().isoformat(),
+            shift_start_at_utc=start_at,
+            shift_end_at_utc=start_at + timedelta(hours=8),
+            timezone="Asia/Karachi",
+            slots_required=1,
+            visible_tenant_ids=[request_record.client_tenant_id],
+        )
+        object.__setattr__(shift, "id", ObjectId())
+        engine.shift_instances.append(shift)
+        shifts.append(shift)
+    missed_shift, on_time_shift, future_shift = shifts
+    for shift, arrived_at in ((missed_shift, None), (on_time_shift, on_time_shift.shift_start_at_utc), (future_shift, None)):
+        slot = ShiftSlotRecord(
+            shift_instance_id=str(shift.id),
+            request_id=str(request_record.id),
+            client_tenant_id=request_record.client_tenant_id,
+            slot_number=1,
+            coverage_slot_index=1,
+            coverage_source_type=ShiftCoverageSourceType.DIRECT_GUARD,
+            coverage_tenant_id="guard-1",
+            assigned_guard_tenant_id="guard-1",
+            slot_status=ShiftSlotStatus.RESERVED,
+            arrived_at=arrived_at,
+        )
+        object.__setattr__(slot, "id", ObjectId())
+        engine.shift_slots.append(slot)
+
+    engine_find_one = engine.find_one
+
+    async def _find_one_without_shift_refetch(model, _condition):
+        if model is ShiftInstanceRecord:
+            raise AssertionError("Unexpected per-row shift fetch")
+        return await engine_find_one(model, _condition)
+
+    engine.find_one = _find_one_without_shift_refetch
+    current_user = SimpleNamespace(username="tester", role="client_admin", tenant_uuid=request_record.client_tenant_id)
+    response = await manager.list_shifts(current_user=current_user, request_id=str(request_record.id), rows=10)
+
+    assert [item["id"] for item in response["items"]] == [str(shift.id) for shift in shifts]
+    assert recorded_events == [
+        (str(missed_shift.id), ShiftAttendanceEventType.LATE_ARRIVAL),
+        (str(missed_shift.id), ShiftAttendanceEventType.NO_SHOW_CONFIRMED),
+    ]
+    assert len(engine.shift_bulk_writes) == 1
+    assert [request._filter["_id"] for request in engine.shift_bulk_writes[0]] == [missed_shift.id]
+    assert response["items"][0]["client_action_required"] is True
+    assert missed_shift.client_action_required is True
+    assert on_time_shift.client_action_required is False
+
+
+@pytest.mark.anyio
+async def test_ensure_future_shift_instances_bulk_upserts_only_missing_dates(monkeypatch):
+    engine = FakeEngine()
+    request_record = _make_request(request_status=RequestStatus.ASSIGNED)
+    engine.request_record = request_record
+    manager = object.__new__(RequestShiftManager)
+    manager._engine = engine
+    monkeypatch.setattr(
+        "orion.api.interactive.request_shift_manager.request_shift_manager.RequestManager.get_instance",
+        lambda: _fake_request_manager(request_record),
+    )
+    synced_request_ids = []
+
+    async def _sync_shift_slots_for_request(record):
+        synced_request_ids.append(str(record.id))
+        return {}
+
+    manager.sync_shift_slots_for_request = _sync_shift_slots_for_request
+    today = date.today()
+    template = RequestScheduleTemplateRecord(
+        request_id=str(request_record.id),
+        client_tenant_id=request_record.client_tenant_id,
+        timezone="UTC",
+        schedule_type=RequestScheduleType.DATE_RANGE,
+        start_date_local=(today + timedelta(days=1)).isoformat(),
+        end_date_local=(today + timedelta(days=4)).isoformat(),
+        start_time_local="08:00",
+        end_time_local="16:00",
+        active=True,
+    )
+    object.__setattr__(template, "id", ObjectId())
+    engine.schedule_record = template
+    existing_date = today + timedelta(days=2)
+    existing_shift = ShiftInstanceRecord(
+        request_id=str(request_record.id),
+        client_tenant_id=request_record.client_tenant_id,
+        schedule_template_id=str(template.id),
+        shift_date_local=existing_date.isoformat(),
+        shift_start_at_utc=datetime.combine(existing_date, datetime.min.time()).replace(hour=8),
+        shift_end_at_utc=datetime.combine(existing_date, datetime.min.time()).replace(hour=16),
+        timezone="UTC",
+    )
+    object.__setattr__(existing_shift, "id", ObjectId())
+    engine.shift_instances.append(existing_shift)
+
+    async def _no_per_shift_save(model):
+        raise AssertionError(f"Unexpected per-row save: {model}")
+
+    engine.save = _no_per_shift_save
+    first_run = await manager.ensure_future_shift_instances_for_active_schedules()
+    second_run = await manager.ensure_future_shift_instances_for_active_schedules()
+
+    assert first_run["created_shift_count"] == 3
+    assert second_run["created_shift_count"] == 0
+    assert len(engine.shift_bulk_writes) == 1
+    assert all(request._upsert for request in engine.shift_bulk_writes[0])
+    assert sorted(shift.shift_date_local for shift in engine.shift_instances) == [
+        (today + timedelta(days=offset)).isoformat() for offset in range(1, 5)
+    ]
+    assert synced_request_ids == [str(request_record.id)]
+    assert template.generated_through_date == (today + timedelta(days=4)).isoformat()
+
+
+@pytest.mark.anyio
+async def test_ensure_future_shift_instances_generates_delta_after_watermark_in_resumable_batches(monkeypatch):
+    engine = FakeEngine()
+    request_record = _make_request(request_status=RequestStatus.ASSIGNED)
+    engine.request_record = request_record
+    manager = object.__new__(RequestShiftManager)
+    manager._engine = engine
+    monkeypatch.setattr(
+        "orion.api.interactive.request_shift_manager.request_shift_manager.RequestManager.get_instance",
+        lambda: _fake_request_manager(request_record),
+    )
+
+    async def _sync_shift_slots_for_request(record):
+        return {}
+
+    manager.sync_shift_slots_for_request = _sync_shift_slots_for_request
+    today = date.today()
+    templates = []
+    for generated_through_offset in (None, 2, 5):
+        template = RequestScheduleTemplateRecord(
+            request_id=str(request_record.id),
+            client_tenant_id=request_record.client_tenant_id,
+            timezone="UTC",
+            schedule_type=RequestScheduleType.DATE_RANGE,
+            start_date_local=today.isoformat(),
+            end_date_local=(today + timedelta(days=5)).isoformat(),
+            start_time_local="08:00",
+            end_time_local="16:00",
+            generation_horizon_days=4,
+            generated_through_date=(
+                (today + timedelta(days=generated_through_offset)).isoformat() if generated_through_offset is not None else None
+            ),
+        )
+        object.__setattr__(template, "id", ObjectId())
+        templates.append(template)
+    engine.schedule_record = templates[0]
+    engine.additional_schedule_records = templates[1:]
+
+    first_run = await manager.ensure_future_shift_instances_for_active_schedules(limit=1, max_batches=1)
+    assert first_run["active_schedule_count"] == 1
+    assert manager._schedule_generation_resume_after == templates[0].id
+
+    second_run = await manager.ensure_future_shift_instances_for_active_schedules(limit=1, max_batches=5)
+    assert second_run["active_schedule_count"] == 1
+    assert manager._schedule_generation_resume_after is None
+
+    dates_by_template = {}
+    for shift in engine.shift_instances:
+        dates_by_template.setdefault(shift.schedule_template_id, []).append(shift.shift_date_local)
+    assert first_run["created_shift_count"] == 4
+    assert sorted(dates_by_template[str(templates[0].id)]) == [(today + timedelta(days=offset)).isoformat() for offset in range(4)]
+    assert dates_by_template[str(templates[1].id)] == [(today + timedelta(days=3)).isoformat()]
+    assert str(templates[2].id) not in dates_by_template
+    assert [template.generated_through_date for template in templates] == [(today + timedelta(days=3)).isoformat()] * 2 + [
+        (today + timedelta(days=5)).isoformat()
+    ]
+
+
 @pytest.mark.anyio
 async def test_list_shifts_excludes_soft_deleted_requests(monkeypatch):
     engine = FakeEngine()
@@ -1068,6 +1453,7 @@ async def test_list_shifts_platform_creates_and_returns_implicit_shift_for_commi
         requested_end_at=end_at,
     )
     engine.request_record = request_record
+    request_record.shift_slots_dirty = True
     direct_assignment = _make_assignment(
         request_id=str(request_record.id),
         client_tenant_id=request_record.client_tenant_id,
@@ -1093,6 +1479,49 @@ async def test_list_shifts_platform_creates_and_returns_implicit_shift_for_commi
     assert len(engine.shift_instances) == 1
     assert response["pagination"]["total_items"] == 1
     assert response["items"][0]["request_title"] == request_record.title
+    assert request_record.shift_slots_dirty is False
+
+
+@pytest.mark.anyio
+async def test_list_shifts_skips_slot_sync_for_requests_already_in_sync(monkeypatch):
+    engine = FakeEngine()
+    start_at = datetime.utcnow() + timedelta(days=1, hours=2)
+    end_at = start_at + timedelta(hours=2)
+    request_record = _make_request(
+        guards_required=1,
+        request_status=RequestStatus.SUBMITTED,
+        requested_start_at=start_at,
+        requested_end_at=end_at,
+    )
+    engine.request_record = request_record
+    direct_assignment = _make_assignment(
+        request_id=str(request_record.id),
+        client_tenant_id=request_record.client_tenant_id,
+        assignee_tenant_id="guard-direct-1",
+        assignee_tenant_type=RequestTargetType.GUARD,
+        slots_committed=1,
+    )
+    engine.request_assignments = [direct_assignment]
+
+    manager = object.__new__(RequestShiftManager)
+    manager._engine = engine
+    monkeypatch.setattr(
+        "orion.api.interactive.request_shift_manager.request_shift_manager.RequestManager.get_instance",
+        lambda: _fake_request_manager(request_record, assignments=[direct_assignment], engine=engine),
+    )
+    platform_user = SimpleNamespace(username="platform", role="ops_admin")
+
+    clean = await manager.list_shifts(current_user=platform_user)
+    clean_for_request = await manager.list_shifts(current_user=platform_user, request_id=str(request_record.id))
+    assert engine.shift_instances == []
+    assert clean["pagination"]["total_items"] == 0
+    assert clean_for_request["pagination"]["total_items"] == 0
+
+    request_record.shift_slots_dirty = True
+    dirty = await manager.list_shifts(current_user=platform_user, request_id=str(request_record.id))
+    assert len(engine.shift_instances) == 1
+    assert dirty["pagination"]["total_items"] == 1
+    assert request_record.shift_slots_dirty is False
 
 
 @pytest.mark.anyio
@@ -1107,6 +1536,7 @@ async def test_list_shifts_guard_returns_implicit_shift_for_committed_non_schedu
         requested_end_at=end_at,
     )
     engine.request_record = request_record
+    request_record.shift_slots_dirty = True
     direct_assignment = _make_assignment(
         request_id=str(request_record.id),
         client_tenant_id=request_record.client_tenant_id,
@@ -1132,6 +1562,7 @@ async def test_list_shifts_guard_returns_implicit_shift_for_committed_non_schedu
     assert len(engine.shift_instances) == 1
     assert response["pagination"]["total_items"] == 1
     assert response["items"][0]["request_title"] == request_record.title
+    assert request_record.shift_slots_dirty is False
 
 
 @pytest.mark.anyio
@@ -1146,6 +1577,7 @@ async def test_list_shifts_client_returns_implicit_shift_for_committed_non_sched
         requested_end_at=end_at,
     )
     engine.request_record = request_record
+    request_record.shift_slots_dirty = True
     direct_assignment = _make_assignment(
         request_id=str(request_record.id),
         client_tenant_id=request_record.client_tenant_id,
@@ -1171,6 +1603,7 @@ async def test_list_shifts_client_returns_implicit_shift_for_committed_non_sched
     assert len(engine.shift_instances) == 1
     assert response["pagination"]["total_items"] == 1
     assert response["items"][0]["request_title"] == request_record.title
+    assert request_record.shift_slots_dirty is False
 
 
 @pytest.mark.anyio
@@ -1185,6 +1618,7 @@ async def test_list_shifts_service_provider_returns_implicit_shift_for_committed
         requested_end_at=end_at,
     )
     engine.request_record = request_record
+    request_record.shift_slots_dirty = True
     provider_assignment = _make_assignment(
         request_id=str(request_record.id),
         client_tenant_id=request_record.client_tenant_id,
@@ -1210,6 +1644,62 @@ async def test_list_shifts_service_provider_returns_implicit_shift_for_committed
     assert len(engine.shift_instances) == 1
     assert response["pagination"]["total_items"] == 1
     assert response["items"][0]["request_title"] == request_record.title
+    assert request_record.shift_slots_dirty is False
+
+
+@pytest.mark.anyio
+async def test_shift_visibility_is_materialized_from_slots_for_tenant_lists(monkeypatch):
+    engine = FakeEngine()
+    start_at = datetime.utcnow() + timedelta(days=1, hours=2)
+    end_at = start_at + timedelta(hours=2)
+    request_record = _make_request(
+        guards_required=1,
+        request_status=RequestStatus.SUBMITTED,
+        requested_start_at=start_at,
+        requested_end_at=end_at,
+    )
+    engine.request_record = request_record
+    direct_assignment = _make_assignment(
+        request_id=str(request_record.id),
+        client_tenant_id=request_record.client_tenant_id,
+        assignee_tenant_id="guard-direct-1",
+        assignee_tenant_type=RequestTargetType.GUARD,
+        slots_committed=1,
+    )
+    engine.request_assignments = [direct_assignment]
+
+    manager = object.__new__(RequestShiftManager)
+    manager._engine = engine
+    monkeypatch.setattr(
+        "orion.api.interactive.request_shift_manager.request_shift_manager.RequestManager.get_instance",
+        lambda: _fake_request_manager(request_record, assignments=[direct_assignment], engine=engine),
+    )
+
+    await manager.sync_shift_slots_for_request(request_record)
+    [shift] = engine.shift_instances
+    assert shift.visible_tenant_ids == sorted([request_record.client_tenant_id, "guard-direct-1"])
+
+    other_guard = await manager.list_shifts(current_user=SimpleNamespace(username="other", role="guard_admin", tenant_uuid="guard-other"))
+    assert other_guard["items"] == []
+    assert other_guard["pagination"]["total_items"] == 0
+    with pytest.raises(HTTPException) as exc:
+        await manager.get_shift_by_id(str(shift.id), SimpleNamespace(username="other", role="guard_admin", tenant_uuid="guard-other"))
+    assert exc.value.status_code == 403
+
+    [slot] = engine.shift_slots
+    slot.coverage_tenant_id = "provider-1"
+    slot.assigned_guard_tenant_id = "guard-rostered-1"
+    await manager._refresh_shift_progress(shift)
+    assert shift.visible_tenant_ids == sorted([request_record.client_tenant_id, "guard-rostered-1", "provider-1"])
+
+    slot.assigned_guard_tenant_id = None
+    await manager._refresh_shift_progress(shift)
+    assert shift.visible_tenant_ids == sorted([request_record.client_tenant_id, "provider-1"])
+
+    # Once the request is soft-deleted, later progress recomputes keep the shift out of tenant lists.
+    shift.request_deleted_at = datetime.utcnow()
+    await manager._refresh_shift_progress(shift)
+    assert shift.visible_tenant_ids == []
 
 
 @pytest.mark.anyio
@@ -1620,6 +2110,7 @@ async def test_shift_slot_attendance_flow_updates_slot_shift_and_events(monkeypa
     assert slot.completed_at is not None
     assert getattr(shift.instance_status, "value", shift.instance_status) == "completed"
     assert shift.slots_completed == 1
+    assert request_record.payout_ledger_dirty is True
     assert [event.event_type for event in engine.shift_events] == [
         ShiftAttendanceEventType.CHECKIN_ATTEMPTED,
         ShiftAttendanceEventType.ARRIVED,
@@ -1761,6 +2252,9 @@ async def test_completed_shift_marks_parent_assignment_completed_only_after_sche
     sync_calls = []
 
     class FakeRequestManager:
+        async def mark_payout_ledger_dirty(self, record):
+            record.payout_ledger_dirty = True
+
         async def _get_request_or_404(self, _request_id):
             return request_record
 
@@ -1876,6 +2370,9 @@ async def test_completed_one_time_shift_marks_parent_assignment_completed_before
     sync_calls = []
 
     class FakeRequestManager:
+        async def mark_payout_ledger_dirty(self, record):
+            record.payout_ledger_dirty = True
+
         async def _get_request_or_404(self, _request_id):
             return request_record
 
@@ -2594,16 +3091,78 @@ async def test_list_shift_exceptions_returns_runtime_no_show_slots(monkeypatch):
     )
 
     await manager.sync_shift_slots_for_request(request_record)
+    ops_user = SimpleNamespace(username="ops", role="ops_admin", tenant_uuid="ops-tenant")
+    before_sync = await manager.list_shift_exceptions(current_user=ops_user)
+    await manager._sync_shift_runtime_exception_states(shift)
     response = await manager.list_shift_exceptions(
-        current_user=SimpleNamespace(username="ops", role="ops_admin", tenant_uuid="ops-tenant"),
+        current_user=ops_user,
         exception_status=ShiftSlotStatus.NO_SHOW_CONFIRMED.value,
     )
 
+    assert before_sync["pagination"]["total_items"] == 0
+    assert engine.shift_slots[0].shift_start_at_utc == shift.shift_start_at_utc
     assert response["pagination"]["total_items"] == 1
     assert response["items"][0]["slot"]["slot_status"] == ShiftSlotStatus.NO_SHOW_CONFIRMED.value
+    assert response["items"][0]["shift"]["id"] == str(shift.id)
     assert response["items"][0]["request"]["title"] == request_record.title
 
 
+@pytest.mark.anyio
+async def test_list_shift_exceptions_pages_in_shift_start_order_and_skips_deleted_requests(monkeypatch):
+    engine = FakeEngine()
+    request_record = _make_request(guards_required=1, request_status=RequestStatus.SUBMITTED)
+    engine.request_record = request_record
+    now = datetime.utcnow()
+    shifts = []
+    for day_offset in (2, 0, 1):
+        shift = ShiftInstanceRecord(
+            request_id=str(request_record.id),
+            client_tenant_id=request_record.client_tenant_id,
+            schedule_template_id=str(ObjectId()),
+            shift_date_local=(date.today() + timedelta(days=day_offset)).isoformat(),
+            shift_start_at_utc=now + timedelta(days=day_offset),
+            shift_end_at_utc=now + timedelta(days=day_offset, hours=8),
+            timezone="UTC",
+            slots_required=1,
+        )
+        object.__setattr__(shift, "id", ObjectId())
+        engine.shift_instances.append(shift)
+        shifts.append(shift)
+        slot = ShiftSlotRecord(
+            shift_instance_id=str(shift.id),
+            request_id=str(request_record.id),
+            client_tenant_id=request_record.client_tenant_id,
+            slot_number=1,
+            slot_status=ShiftSlotStatus.UNAVAILABLE,
+            shift_start_at_utc=shift.shift_start_at_utc,
+            shift_date_local=shift.shift_date_local,
+        )
+        object.__setattr__(slot, "id", ObjectId())
+        engine.shift_slots.append(slot)
+    manager = object.__new__(RequestShiftManager)
+    manager._engine = engine
+    monkeypatch.setattr(
+        "orion.api.interactive.request_shift_manager.request_shift_manager.RequestManager.get_instance",
+        lambda: _fake_request_manager(request_record),
+    )
+    ops_user = SimpleNamespace(username="ops", role="ops_admin", tenant_uuid="ops-tenant")
+
+    first_page = await manager.list_shift_exceptions(current_user=ops_user, rows=2)
+    second_page = await manager.list_shift_exceptions(current_user=ops_user, page=2, rows=2)
+    dated = await manager.list_shift_exceptions(current_user=ops_user, date_from=date.today() + timedelta(days=1))
+
+    assert [item["shift"]["id"] for item in first_page["items"]] == [str(shifts[1].id), str(shifts[2].id)]
+    assert [item["shift"]["id"] for item in second_page["items"]] == [str(shifts[0].id)]
+    assert first_page["pagination"] == {"page": 1, "rows": 2, "total_items": 3, "total_pages": 2}
+    assert dated["pagination"]["total_items"] == 2
+
+    for slot in engine.shift_slots:
+        slot.request_deleted_at = datetime.utcnow()
+    deleted = await manager.list_shift_exceptions(current_user=ops_user)
+    assert deleted["items"] == []
+    assert deleted["pagination"]["total_items"] == 0
+
+
 @pytest.mark.anyio
 async def test_reopen_shift_slot_creates_replacement_slot_and_wave(monkeypatch):
     _stub_notifications(monkeypatch)
@@ -0,0 +1,140 @@
+import time
+
+import jwt
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from configs.app_dependency import get_current_role, get_current_status, get_current_user
+from orion.constants.constant import CONSTANTS
+from orion.services.mongo_manager.shared_model.db_auth_models import UserStatus, db_user_account, user_role
+from orion.services.session_manager.session_manager import session_manager
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.commands = []
+
+    async def get(self, key):
+        self.commands.append("get")
+        return self.values.get(key)
+
+    async def get_and_touch(self, key, expiry):
+        self.commands.append("getex")
+        return self.values.get(key)
+
+    async def set(self, key, value, expiry=None):
+        self.commands.append("set")
+        self.values[key] = value
+
+    async def delete(self, *keys):
+        self.commands.append("delete")
+        for key in keys:
+            self.values.pop(key, None)
+
+
+class _FakeEngine:
+    def __init__(self, user):
+        self.user = user
+        self.find_one_calls = 0
+
+    async def find_one(self, model, *queries):
+        assert model is db_user_account
+        self.find_one_calls += 1
+        return self.user
+
+
+def _session(monkeypatch, user):
+    monkeypatch.setattr(CONSTANTS, "S_AUTH_SECRET_KEY", "test-secret")
+    fake_redis = _FakeRedis()
+    monkeypatch.setattr(
+        "orion.services.session_manager.session_manager.redis_controller.getInstance",
+        lambda: fake_redis,
+    )
+    manager = object.__new__(session_manager)
+    manager._engine = _FakeEngine(user)
+    manager._redis = fake_redis
+    manager._session_ttl = 30 * 60
+    manager._principal_ttl = 30
+    return manager
+
+
+def _user():
+    return db_user_account(
+        username="platformops1",
+        password="StrongPass1!",
+        role=user_role.OPS_ADMIN,
+        status=UserStatus.ACTIVE,
+        twofa_secret="SECRET",
+        current_session_id="sid-1",
+    )
+
+
+def _token(sid="sid-1"):
+    return jwt.encode({"sub": "platformops1", "sid": sid, "exp": time.time() + 60}, "test-secret", algorithm="HS256")
+
+
+@pytest.mark.anyio
+async def test_get_current_user_serves_repeat_lookups_from_principal_cache(monkeypatch):
+    user = _user()
+    manager = _session(monkeypatch, user)
+
+    first = await manager.get_current_user(_token())
+    assert manager._redis.commands == ["get", "getex", "set", "set"]
+    manager._redis.commands.clear()
+    second = await manager.get_current_user(_token())
+
+    assert first is user
+    assert manager._engine.find_one_calls == 1
+    assert manager._redis.commands == ["get"]
+    assert second.id == user.id and second.role == user_role.OPS_ADMIN
+    assert second.twofa_secret is None
+    assert "SECRET" not in manager._redis.values["principal:sid-1"]
+    assert user.password not in manager._redis.values["principal:sid-1"]
+    assert second.password != user.password
+    # A save of the cached copy must not write back the stripped fields.
+    assert second.__fields_modified__ == set()
+
+    await session_manager.invalidate_principal(user)
+    await manager.get_current_user(_token())
+    assert manager._engine.find_one_calls == 2
+
+
+@pytest.mark.anyio
+async def test_get_current_user_rejects_cached_principal_for_another_session(monkeypatch):
+    manager = _session(monkeypatch, _user())
+    await manager.get_current_user(_token())
+
+    with pytest.raises(Exception) as exc:
+        await manager.get_current_user(_token(sid="sid-2"))
+
+    assert getattr(exc.value, "status_code", None) == 401
+
+
+@pytest.mark.anyio
+async def test_request_dependencies_resolve_the_token_once(monkeypatch):
+    calls = []
+
+    class FakeSession:
+        async def get_current_principal(self, token):
+            calls.append(token)
+            return {"user": _user(), "tenant_status": None}
+
+    monkeypatch.setattr(session_manager, "get_instance", staticmethod(lambda: FakeSession()))
+    app = FastAPI()
+
+    @app.get("/probe")
+    async def probe(
+        current_user=Depends(get_current_user),
+        role=Depends(get_current_role),
+        user_status=Depends(get_current_status),
+    ):
+        return {"username": current_user.username, "role": role, "status": user_status}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/probe", headers={"Authorization": "Bearer token-1"})
+
+    assert response.status_code == 200
+    assert response.json() == {"username": "platformops1", "role": "ops_admin", "status": "active"}
+    assert calls == ["token-1"]